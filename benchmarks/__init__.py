@@ -0,0 +1 @@
+"""Reproducible performance benchmarks (see README.md)."""
@@ -0,0 +1,82 @@
+"""Benchmark: the agent loop against the mock server through the real client.
+
+Each round builds a fresh agent over a small generated repo and runs one
+turn: two parallel file reads, a symbol lookup, then a final answer. The
+``instant`` variants measure the client and loop overhead alone; ``paced``
+adds prefill latency and a token rate closer to a local model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.config.settings import Settings
+from gerdsenai_cli.core.agent import Agent
+from gerdsenai_cli.core.agent_tools import build_default_registry
+from gerdsenai_cli.core.llm_client import ChatMessage, LLMClient
+from gerdsenai_cli.core.tool_registry import LoopResult, run_agent_loop
+from tests.synthetic_repo import SyntheticRepo
+
+from .mock_server import MockServer, ToolStep
+
+PACES = {"instant": (0.0, 0.0), "paced": (0.02, 2000.0)}
+
+
+def _script(repo: SyntheticRepo) -> list[ToolStep]:
+    """Read two modules in parallel, look up a class, then answer."""
+    first, second = [m for m in repo.modules if m.endswith(".py")][:2]
+    symbol = next(name for name, rel in repo.symbols.items() if rel == first)
+    return [
+        [("read_file", {"path": first}), ("read_file", {"path": second})],
+        [("find_definition", {"name": symbol})],
+    ]
+
+
+def _turn(settings: Settings, root: Path, stream: bool) -> LoopResult:
+    async def run() -> LoopResult:
+        async with LLMClient(settings) as client:
+            agent = Agent(client, settings, project_root=root)
+            messages = [
+                ChatMessage(role="system", content="You are a coding assistant."),
+                ChatMessage(
+                    role="user", content="Explain what the first component does."
+                ),
+            ]
+            return await run_agent_loop(
+                client,
+                messages,
+                build_default_registry(agent),
+                use_native_tools=True,
+                stream=stream,
+            )
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("pace", list(PACES))
+@pytest.mark.parametrize("stream", [False, True], ids=["buffered", "streamed"])
+def test_agent_loop(
+    benchmark,
+    make_repo: Callable[..., SyntheticRepo],
+    mock_server: MockServer,
+    mock_settings: Settings,
+    pace: str,
+    stream: bool,
+) -> None:
+    repo = make_repo(200, large_files=0)
+    mock_server.config.tool_script = _script(repo)
+    mock_server.config.latency, mock_server.config.tokens_per_sec = PACES[pace]
+
+    result = benchmark.pedantic(
+        _turn, args=(mock_settings, repo.root, stream), rounds=5, iterations=1
+    )
+    benchmark.extra_info.update(
+        model_calls=result.model_calls, tool_time=round(result.tool_time, 4)
+    )
+    assert result.stopped_reason == "final"
+    assert result.tool_calls_made == 3
+    assert result.model_calls == 3
@@ -0,0 +1,33 @@
+"""Benchmark: context build strategies over a scanned 1k-file repo."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from tests.synthetic_repo import SyntheticRepo
+
+QUERY = "how does Component42 run items, and where is helper_42_0 used"
+
+
+@pytest.fixture(scope="module")
+def context(make_repo: Callable[..., SyntheticRepo]) -> ProjectContext:
+    context = ProjectContext(make_repo(1000).root)
+    asyncio.run(context.scan_directory())
+    return context
+
+
+@pytest.mark.parametrize("strategy", ["smart", "whole_repo", "iterative"])
+def test_build_context(benchmark, context: ProjectContext, strategy: str) -> None:
+    def build() -> str:
+        return asyncio.run(
+            context.build_dynamic_context(QUERY, max_tokens=8000, strategy=strategy)
+        )
+
+    text = benchmark.pedantic(build, rounds=5, iterations=1, warmup_rounds=1)
+    benchmark.extra_info["chars"] = len(text)
+    benchmark.extra_info["files"] = len(context.last_context_files)
+    assert text
@@ -0,0 +1,65 @@
+"""Benchmark: semantic index build and search against the mock Qdrant/Ollama.
+
+Rounds share one event loop because the vector store keeps its connection
+pool between calls, as it does in the CLI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.embeddings import OllamaEmbeddingBackend
+from gerdsenai_cli.core.repo_index import IndexStats, RepoIndexer
+from gerdsenai_cli.core.vector_store import QdrantVectorStore, SearchHit
+from tests.synthetic_repo import SyntheticRepo
+
+from .mock_server import MockServer
+
+
+@pytest.fixture
+def indexer(
+    make_repo: Callable[..., SyntheticRepo], mock_server: MockServer, tmp_path: Path
+) -> Iterator[tuple[asyncio.AbstractEventLoop, RepoIndexer]]:
+    store = QdrantVectorStore(mock_server.url)
+    indexer = RepoIndexer(
+        make_repo(1000).root,
+        store,
+        OllamaEmbeddingBackend("mock-embed", base_url=mock_server.url),
+        manifest_dir=tmp_path,
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop, indexer
+    finally:
+        loop.run_until_complete(store.close())
+        loop.close()
+
+
+def test_index_build(
+    benchmark, indexer: tuple[asyncio.AbstractEventLoop, RepoIndexer]
+) -> None:
+    loop, repo = indexer
+
+    def build() -> IndexStats:
+        return loop.run_until_complete(repo.build())
+
+    stats = benchmark.pedantic(build, rounds=3, iterations=1)
+    benchmark.extra_info.update(files=stats.files, chunks=stats.chunks)
+    assert stats.files and not stats.errors
+
+
+def test_index_search(
+    benchmark, indexer: tuple[asyncio.AbstractEventLoop, RepoIndexer]
+) -> None:
+    loop, repo = indexer
+    loop.run_until_complete(repo.build())
+
+    def search() -> list[SearchHit]:
+        return loop.run_until_complete(repo.search("Component42 run items upper", 10))
+
+    hits = benchmark.pedantic(search, rounds=20, iterations=1)
+    assert len(hits) == 10
@@ -0,0 +1,38 @@
+"""Benchmark: project scan on generated repos (sizes from ``--tree-sizes``)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from tests.synthetic_repo import SyntheticRepo
+
+
+def _scan(repo: SyntheticRepo) -> ProjectContext:
+    context = ProjectContext(repo.root)
+    asyncio.run(context.scan_directory())
+    return context
+
+
+def test_scan(
+    benchmark, make_repo: Callable[..., SyntheticRepo], tree_size: int
+) -> None:
+    repo = make_repo(tree_size)
+    context = benchmark.pedantic(
+        _scan, args=(repo,), rounds=3, iterations=1, warmup_rounds=1
+    )
+    benchmark.extra_info["files"] = context.stats.total_files
+    assert context.stats.total_files == len(repo.scannable(context.max_file_size))
+
+
+def test_scan_gitignore_heavy(
+    benchmark, make_repo: Callable[..., SyntheticRepo]
+) -> None:
+    """Half the directories carry a .gitignore and a third of files are ignored."""
+    repo = make_repo(5000, gitignore_fraction=0.5, ignored_fraction=0.3)
+    context = benchmark.pedantic(
+        _scan, args=(repo,), rounds=3, iterations=1, warmup_rounds=1
+    )
+    benchmark.extra_info["ignored"] = context.stats.ignored_files
+    assert context.stats.total_files == len(repo.scannable(context.max_file_size))
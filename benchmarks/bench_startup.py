@@ -0,0 +1,33 @@
+"""Benchmark: import time of ``gerdsenai --version`` and a headless ``-p`` run.
+
+Measured with ``python -X importtime`` in a subprocess with an empty HOME,
+net of a bare interpreter. Which modules get imported is checked by
+``tests/test_lazy_startup.py``; the budgets here catch a slow import that is
+still on the allowed list.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.test_lazy_startup import _imports
+
+# Import time beyond a bare interpreter, in ms. Generous for slow machines.
+BUDGETS_MS = {"version": 300.0, "headless": 1500.0}
+ARGS = {
+    "version": ["-m", "gerdsenai_cli.cli", "--version"],
+    "headless": ["-m", "gerdsenai_cli.cli", "-p", "hi"],
+}
+
+
+@pytest.mark.parametrize("entry", list(ARGS))
+def test_startup_imports(benchmark, tmp_path: Path, entry: str) -> None:
+    baseline, _ = _imports(["-c", "pass"], tmp_path)
+    total, _ = benchmark.pedantic(
+        _imports, args=(ARGS[entry], tmp_path), rounds=3, iterations=1
+    )
+    import_ms = total - baseline
+    benchmark.extra_info["import_ms"] = round(import_ms, 1)
+    assert import_ms < BUDGETS_MS[entry], f"{entry}: {import_ms:.0f}ms imports"
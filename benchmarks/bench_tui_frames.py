@@ -0,0 +1,54 @@
+"""Benchmark: a synthetic token stream into the running TUI.
+
+Compares frame-coalesced rendering at the default target FPS with a frame
+rate so high that every chunk is drawn (and the screen redrawn) on its own.
+The application runs headlessly (see ``headless_tui``), so each frame pays for
+a real layout and screen render.
+
+Chunks arrive about 1 ms apart, like a fast local model. prompt_toolkit
+already merges redraws while the event loop is saturated, so an unpaced burst
+would hide the cost the frame scheduler saves; paced, every per-chunk frame
+reaches the screen and the stream takes longer than its arrival time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from .headless_tui import HeadlessTUI, running_tui
+
+TOKENS = 2_000
+PACE = 0.001  # seconds between chunks
+
+
+def _stream(fps: float) -> HeadlessTUI:
+    async def run() -> HeadlessTUI:
+        async with running_tui(fps) as session:
+            tui = session.tui
+            for i in range(20):
+                tui.conversation.add_message("user", f"question {i}")
+                tui.conversation.add_message("assistant", f"answer **{i}**\n\n- item")
+            tui.start_streaming_response()
+            for i in range(TOKENS):
+                tui.append_streaming_chunk("\n" if i % 40 == 39 else f"tok{i} ")
+                await asyncio.sleep(PACE)
+            tui.finish_streaming_response()
+        return session
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("fps", [30.0, 1e6], ids=["30fps", "per-chunk"])
+def test_stream_tokens(benchmark, fps: float) -> None:
+    session = benchmark.pedantic(_stream, args=(fps,), rounds=1, iterations=1)
+    stats = session.tui.render_scheduler.stats()
+    benchmark.extra_info.update(stats, redraws=session.redraws)
+    assert stats["requests"] == TOKENS
+    if fps <= 240:
+        assert stats["frames"] < TOKENS / 10
+        assert session.redraws < TOKENS / 10
+    else:
+        assert session.redraws > TOKENS / 10
+    assert f"tok{TOKENS - 2} " in session.tui.conversation.messages[-1][1]
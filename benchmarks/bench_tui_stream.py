@@ -0,0 +1,43 @@
+"""Benchmark: a 10k-token completion streamed from the mock server into the TUI.
+
+Unlike ``bench_tui_frames.py``, which feeds the TUI a synthetic stream, this
+goes through ``LLMClient.stream_chat`` and the SSE parser. The TUI runs
+headlessly (see ``headless_tui``) so its frames are really redrawn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from gerdsenai_cli.config.settings import Settings
+from gerdsenai_cli.core.llm_client import ChatMessage, LLMClient
+
+from .headless_tui import HeadlessTUI, running_tui
+from .mock_server import MockServer
+
+TOKENS = 10_000
+
+
+def _stream(settings: Settings) -> HeadlessTUI:
+    async def run() -> HeadlessTUI:
+        async with running_tui(30) as session, LLMClient(settings) as client:
+            tui = session.tui
+            tui.start_streaming_response()
+            messages = [ChatMessage(role="user", content="Write a long answer.")]
+            async for chunk in client.stream_chat(messages):
+                tui.append_streaming_chunk(chunk)
+            tui.finish_streaming_response()
+        return session
+
+    return asyncio.run(run())
+
+
+def test_stream_into_tui(
+    benchmark, mock_server: MockServer, mock_settings: Settings
+) -> None:
+    mock_server.config.reply_tokens = TOKENS
+    session = benchmark.pedantic(_stream, args=(mock_settings,), rounds=3, iterations=1)
+    stats = session.tui.render_scheduler.stats()
+    benchmark.extra_info.update(stats, redraws=session.redraws)
+    assert stats["requests"] == TOKENS
+    assert f"word{TOKENS - 2} " in session.tui.conversation.messages[-1][1]
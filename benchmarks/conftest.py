@@ -0,0 +1,63 @@
+"""Shared fixtures for the benchmark suite: generated repos and the mock server."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from gerdsenai_cli.config.settings import Settings
+from tests.synthetic_repo import RepoSpec, SyntheticRepo, generate_repo
+
+from .mock_server import MockServer, ServerConfig
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--tree-sizes",
+        default="1000,10000",
+        help="Comma-separated file counts for generated repositories "
+        "(e.g. 1000,10000,100000).",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "tree_size" in metafunc.fixturenames:
+        option = metafunc.config.getoption("--tree-sizes")
+        sizes = [int(s) for s in option.split(",") if s.strip()]
+        metafunc.parametrize("tree_size", sizes, ids=[f"{n}files" for n in sizes])
+
+
+@pytest.fixture(scope="session")
+def make_repo(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., SyntheticRepo]:
+    """Return a function giving a generated repo of N files, built once per run."""
+    repos: dict[str, SyntheticRepo] = {}
+
+    def make(files: int, **options: Any) -> SyntheticRepo:
+        spec = RepoSpec(files=files, **options)
+        key = repr(spec)
+        if key not in repos:
+            root = tmp_path_factory.mktemp(f"repo{files}")
+            repos[key] = generate_repo(root, spec)
+        return repos[key]
+
+    return make
+
+
+@pytest.fixture
+def mock_server() -> Iterator[MockServer]:
+    """An instant mock server; tests adjust ``mock_server.config`` as needed."""
+    with MockServer(ServerConfig()) as server:
+        yield server
+
+
+@pytest.fixture
+def mock_settings(mock_server: MockServer) -> Settings:
+    settings = Settings(
+        llm_server_url=mock_server.url, current_model=mock_server.config.model
+    )
+    settings.set_preference("enable_llm_intent_detection", False)
+    return settings
@@ -0,0 +1,53 @@
+"""Run the real TUI application headlessly for benchmarks.
+
+``app.invalidate()`` only redraws while the prompt_toolkit application is
+running, so a TUI that is merely constructed never pays for a redraw and frame
+coalescing saves nothing measurable. :func:`running_tui` builds the TUI in an
+app session with a pipe input and a ``DummyOutput`` (layout and screen
+rendering run in full; nothing is written to a terminal) and runs it in the
+background while the benchmark streams into it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from gerdsenai_cli.ui.prompt_toolkit_tui import PromptToolkitTUI
+
+
+class HeadlessTUI:
+    """A running TUI and the number of redraws it has done."""
+
+    def __init__(self, tui: PromptToolkitTUI) -> None:
+        self.tui = tui
+        self.redraws = 0
+        tui.app.after_render += self._count
+
+    def _count(self, _app: Any) -> None:
+        self.redraws += 1
+
+
+@asynccontextmanager
+async def running_tui(fps: float = 30.0) -> AsyncIterator[HeadlessTUI]:
+    """Yield a :class:`HeadlessTUI` whose application is running."""
+    with (
+        create_pipe_input() as pipe,
+        create_app_session(input=pipe, output=DummyOutput()),
+    ):
+        session = HeadlessTUI(PromptToolkitTUI(target_fps=fps))
+        app = session.tui.app
+        task = asyncio.create_task(session.tui.run())
+        while not app.is_running:
+            await asyncio.sleep(0)
+        try:
+            yield session
+        finally:
+            session.tui.exit()
+            await task
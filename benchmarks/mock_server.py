@@ -0,0 +1,346 @@
+"""A local stand-in for the servers the CLI talks to, for benchmarks.
+
+:class:`MockServer` speaks just enough HTTP/1.1 (keep-alive, chunked
+responses) to serve:
+
+- the OpenAI-compatible API: ``GET /v1/models`` and
+  ``POST /v1/chat/completions``, buffered or streamed as SSE, with text
+  replies or scripted tool calls;
+- Ollama's ``POST /api/embeddings``, with deterministic bag-of-words vectors;
+- the subset of Qdrant's REST API that ``QdrantVectorStore`` uses, backed by
+  an in-memory collection.
+
+Latency and throughput are configurable through :class:`ServerConfig`, so a
+benchmark can separate the client's own overhead (an instant server) from
+its behaviour against a realistic one (prefill delay, paced tokens).
+
+The server runs its own event loop on a background thread, so it can be used
+from synchronous benchmark code and from code under test that calls
+``asyncio.run``.
+
+Usage::
+
+    config = ServerConfig(latency=0.05, tokens_per_sec=200,
+                          tool_script=[[("read_file", {"path": "a.py"})]])
+    with MockServer(config) as server:
+        settings = Settings(llm_server_url=server.url, current_model="mock")
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+# Tool calls issued in one model turn: (tool name, arguments).
+ToolStep = list[tuple[str, dict[str, Any]]]
+
+_REASONS = {200: "OK", 404: "Not Found", 400: "Bad Request"}
+
+
+@dataclass
+class ServerConfig:
+    """How the mock server answers."""
+
+    model: str = "mock-model"
+    latency: float = 0.0  # seconds before each completion starts (prefill)
+    tokens_per_sec: float = 0.0  # streaming pace; 0 streams as fast as possible
+    reply_tokens: int = 64  # length of the final text answer
+    chunk_tokens: int = 1  # tokens per SSE chunk
+    # One entry per model turn: turn N (N = assistant tool-call messages
+    # already in the request) issues tool_script[N]; past the end it answers.
+    tool_script: list[ToolStep] = field(default_factory=list)
+    embedding_dim: int = 64
+
+    def reply(self) -> list[str]:
+        """The final answer as a list of tokens (words with their spacing)."""
+        return [
+            ("\n" if i % 16 == 15 else f"word{i} ") for i in range(self.reply_tokens)
+        ]
+
+
+class MockServer:
+    """OpenAI-compatible, Ollama-embeddings and Qdrant stand-in on localhost."""
+
+    def __init__(self, config: ServerConfig | None = None) -> None:
+        self.config = config or ServerConfig()
+        self.requests: Counter[str] = Counter()  # "METHOD /path" -> count
+        self.collections: dict[str, dict[Any, tuple[list[float], dict[str, Any]]]] = {}
+        self.url = ""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._server: asyncio.base_events.Server | None = None
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self) -> str:
+        """Start serving on a free port; returns the base URL."""
+        loop = self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=loop.run_forever, name="mock-server", daemon=True
+        )
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), loop
+        ).result()
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is None or self._server is None:
+            return
+        server, loop = self._server, self._loop
+
+        async def shutdown() -> None:
+            server.close()
+            await server.wait_closed()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=5)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            loop.close()
+            self._loop = self._server = None
+
+    def __enter__(self) -> MockServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # -- HTTP -------------------------------------------------------------
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                path = target.split("?", 1)[0]
+                self.requests[f"{method} {path}"] += 1
+                await self._route(method, path, body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send_json(
+        writer: asyncio.StreamWriter, payload: Any, status: int = 200
+    ) -> None:
+        body = json.dumps(payload).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await writer.drain()
+
+    async def _route(
+        self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter
+    ) -> None:
+        data = json.loads(body) if body else {}
+        if path == "/v1/models":
+            models = [{"id": self.config.model, "object": "model", "owned_by": "mock"}]
+            await self._send_json(writer, {"object": "list", "data": models})
+        elif path == "/v1/chat/completions" and method == "POST":
+            await self._completion(data, writer)
+        elif path == "/api/embeddings" and method == "POST":
+            vector = self.embed(str(data.get("prompt", "")))
+            await self._send_json(writer, {"embedding": vector})
+        elif path in ("/health", "/healthz"):
+            await self._send_json(writer, {"status": "ok"})
+        elif path.startswith("/collections/"):
+            await self._qdrant(method, path.split("/")[2:], data, writer)
+        else:
+            await self._send_json(writer, {"error": "not found"}, status=404)
+
+    # -- chat completions -------------------------------------------------
+
+    def _tool_step(self, messages: list[dict[str, Any]]) -> ToolStep | None:
+        turn = sum(
+            1 for m in messages if m.get("role") == "assistant" and m.get("tool_calls")
+        )
+        script = self.config.tool_script
+        return script[turn] if turn < len(script) else None
+
+    async def _completion(
+        self, request: dict[str, Any], writer: asyncio.StreamWriter
+    ) -> None:
+        config = self.config
+        messages = request.get("messages") or []
+        step = self._tool_step(messages) if request.get("tools") else None
+        prompt_tokens = sum(len(str(m.get("content") or "")) for m in messages) // 4
+        if config.latency:
+            await asyncio.sleep(config.latency)
+
+        tokens = [] if step else config.reply()
+        calls = [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(args)},
+            }
+            for i, (name, args) in enumerate(step or [])
+        ]
+        if not request.get("stream"):
+            message: dict[str, Any] = {"role": "assistant", "content": "".join(tokens)}
+            if calls:
+                message["tool_calls"] = calls
+            await self._send_json(
+                writer,
+                {
+                    "id": "mock",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": config.model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": message,
+                            "finish_reason": "tool_calls" if calls else "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": len(tokens),
+                    },
+                },
+            )
+            return
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        deltas: list[dict[str, Any]] = []
+        size = max(1, config.chunk_tokens)
+        for i in range(0, len(tokens), size):
+            deltas.append({"content": "".join(tokens[i : i + size])})
+        for index, (name, args) in enumerate(step or []):
+            # The id and name arrive first, the arguments in a later delta.
+            head = {"name": name, "arguments": ""}
+            deltas.append(
+                {
+                    "tool_calls": [
+                        {"index": index, "id": f"call_{index}", "function": head}
+                    ]
+                }
+            )
+            tail = {"arguments": json.dumps(args)}
+            deltas.append({"tool_calls": [{"index": index, "function": tail}]})
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for n, delta in enumerate(deltas, start=1):
+            if config.tokens_per_sec and "content" in delta:
+                wait = started + n * size / config.tokens_per_sec - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            await self._send_event(writer, {"choices": [{"index": 0, "delta": delta}]})
+        finish = "tool_calls" if calls else "stop"
+        await self._send_event(
+            writer, {"choices": [{"index": 0, "delta": {}, "finish_reason": finish}]}
+        )
+        await self._send_chunk(writer, b"data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _send_event(
+        self, writer: asyncio.StreamWriter, payload: dict[str, Any]
+    ) -> None:
+        await self._send_chunk(writer, f"data: {json.dumps(payload)}\n\n".encode())
+
+    @staticmethod
+    async def _send_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        await writer.drain()
+
+    # -- embeddings and vector store --------------------------------------
+
+    def embed(self, text: str) -> list[float]:
+        """Hashed bag-of-words vector: texts sharing words score higher."""
+        vector = [0.0] * self.config.embedding_dim
+        for word in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(word.encode()) % len(vector)] += 1.0
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    async def _qdrant(
+        self,
+        method: str,
+        parts: list[str],
+        data: dict[str, Any],
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        name, action = parts[0], "/".join(parts[1:])
+        points = self.collections.get(name)
+        if not action:
+            if method == "PUT":
+                self.collections.setdefault(name, {})
+            elif method == "DELETE":
+                self.collections.pop(name, None)
+            elif points is None:
+                await self._send_json(writer, {"status": "not found"}, status=404)
+                return
+            await self._send_json(writer, {"result": True, "status": "ok"})
+            return
+        if points is None:
+            await self._send_json(writer, {"status": "not found"}, status=404)
+            return
+        result: Any = True
+        if action == "points" and method == "PUT":
+            for point in data.get("points", []):
+                points[point["id"]] = (point["vector"], point.get("payload") or {})
+        elif action == "points/search":
+            query = data.get("vector") or []
+            scored = sorted(
+                (
+                    (sum(a * b for a, b in zip(query, vec, strict=False)), pid, payload)
+                    for pid, (vec, payload) in points.items()
+                ),
+                key=lambda item: item[0],
+                reverse=True,
+            )[: int(data.get("limit", 5))]
+            result = [
+                {"id": pid, "score": score, "payload": payload}
+                for score, pid, payload in scored
+            ]
+        elif action == "points/count":
+            result = {"count": len(points)}
+        elif action == "points/delete":
+            must = (data.get("filter") or {}).get("must") or []
+            for cond in must:
+                key, value = cond.get("key"), (cond.get("match") or {}).get("value")
+                for pid in [p for p, (_, pl) in points.items() if pl.get(key) == value]:
+                    del points[pid]
+        await self._send_json(writer, {"result": result, "status": "ok"})
@@ -2,19 +2,17 @@
 """
 GerdsenAI CLI - Main entry point.
 
-This module serves as the main entry point for the CLI application.
+This module serves as the main entry point for the CLI application. It imports
+only typer at module level: the application (``main``), rich and the command
+modules are imported once a flag needs them, so ``--version`` returns
+immediately and headless ``-p`` skips the interactive UI. See
+tests/test_lazy_startup.py for the startup budget.
 """
 
-import asyncio
 import sys
 
 import typer
-from rich.console import Console
 
-from .main import GerdsenAICLI
-from .utils.display import show_error
-
-console = Console()
 app = typer.Typer(
     name="gerdsenai",
     help="GerdsenAI CLI - A terminal-based agentic coding tool for local AI models",
@@ -59,6 +57,12 @@ def main(
         "--mode",
         help="Execution mode for headless -p: chat, architect, execute, or llvl",
     ),
+    perf_json: str | None = typer.Option(
+        None,
+        "--perf-json",
+        help="Headless: write the turn's latency breakdown as JSON to this "
+        "file ('-' for stderr)",
+    ),
 ) -> None:
     """
     Start the GerdsenAI CLI interactive session.
@@ -66,9 +70,14 @@ def main(
     if version:
         from . import __version__
 
-        console.print(f"GerdsenAI CLI v{__version__}")
+        typer.echo(f"GerdsenAI CLI v{__version__}")
         return
 
+    import asyncio
+
+    from .main import GerdsenAICLI, console
+    from .utils.display import show_error
+
     # Headless one-shot mode: run a single turn and exit (no TUI).
     if prompt is not None or stdin_input:
         text = prompt if prompt is not None else sys.stdin.read().strip()
@@ -76,7 +85,7 @@ def main(
             show_error("No prompt provided (use -p TEXT or pipe text with --stdin).")
             sys.exit(2)
         cli = GerdsenAICLI(config_path=config_path, debug=debug, interactive=False)
-        sys.exit(asyncio.run(cli.run_headless(text, mode=mode)))
+        sys.exit(asyncio.run(cli.run_headless(text, mode=mode, perf_json=perf_json)))
 
     try:
         # Initialize and run the CLI (startup sequence shown in run_async)
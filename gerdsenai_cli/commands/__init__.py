@@ -2,66 +2,81 @@
 Command implementations module for GerdsenAI CLI.
 
 This module contains all slash command implementations and the command parser.
+Submodules are imported on first attribute access, so importing the package
+(or the parser) does not load every command and its dependencies.
 """
 
-from .agent import (
-    AgentConfigCommand,
-    AgentStatusCommand,
-    ChatCommand,
-    RefreshContextCommand,
-    ResetCommand,
-)
-from .anthropic_cmd import AnthropicCommand
-from .audio_commands import (
-    AudioStatusCommand,
-    SpeakCommand,
-    TranscribeCommand,
-)
-from .base import BaseCommand
-from .clarify_commands import ClarifyCommand
-from .complexity_commands import ComplexityCommand
-from .delegate import DelegateCommand
-from .discover import DiscoverCommand
-from .files import (
-    CreateFileCommand,
-    EditFileCommand,
-    FilesCommand,
-    ReadCommand,
-    SearchFilesCommand,
-    SessionCommand,
-)
-from .index import IndexCommand
-from .memory import MemoryCommand
-from .model import (
-    ListModelsCommand,
-    ModelInfoCommand,
-    ModelStatsCommand,
-    SwitchModelCommand,
-)
-from .parser import CommandParser
-from .persona import PersonaCommand
-from .planning import PlanCommand
-from .skills import SkillCommand, SkillsCommand
-from .suggest_commands import SuggestCommand
-from .system import (
-    AboutCommand,
-    ConfigCommand,
-    CopyCommand,
-    DebugCommand,
-    DoctorCommand,
-    ExitCommand,
-    HelpCommand,
-    InitCommand,
-    SetupCommand,
-    StatusCommand,
-    ToolsCommand,
-)
-from .undo_commands import UndoCommand
-from .vision_commands import (
-    ImageCommand,
-    OCRCommand,
-    VisionStatusCommand,
-)
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "agent": (
+        "AgentConfigCommand",
+        "AgentStatusCommand",
+        "ChatCommand",
+        "RefreshContextCommand",
+        "ResetCommand",
+    ),
+    "anthropic_cmd": ("AnthropicCommand",),
+    "audio_commands": (
+        "AudioStatusCommand",
+        "SpeakCommand",
+        "TranscribeCommand",
+    ),
+    "base": ("BaseCommand",),
+    "clarify_commands": ("ClarifyCommand",),
+    "complexity_commands": ("ComplexityCommand",),
+    "delegate": ("DelegateCommand",),
+    "discover": ("DiscoverCommand",),
+    "files": (
+        "CreateFileCommand",
+        "EditFileCommand",
+        "FilesCommand",
+        "ReadCommand",
+        "SearchFilesCommand",
+        "SessionCommand",
+    ),
+    "index": ("IndexCommand",),
+    "memory": ("MemoryCommand",),
+    "model": (
+        "ListModelsCommand",
+        "ModelInfoCommand",
+        "ModelStatsCommand",
+        "SwitchModelCommand",
+    ),
+    "parser": ("CommandParser",),
+    "persona": ("PersonaCommand",),
+    "planning": ("PlanCommand",),
+    "skills": (
+        "SkillCommand",
+        "SkillsCommand",
+    ),
+    "suggest_commands": ("SuggestCommand",),
+    "system": (
+        "AboutCommand",
+        "ConfigCommand",
+        "CopyCommand",
+        "DebugCommand",
+        "DoctorCommand",
+        "ExitCommand",
+        "HelpCommand",
+        "InitCommand",
+        "PerfCommand",
+        "ProfileCommand",
+        "SetupCommand",
+        "StatusCommand",
+        "ToolsCommand",
+        "TraceCommand",
+    ),
+    "undo_commands": ("UndoCommand",),
+    "vision_commands": (
+        "ImageCommand",
+        "OCRCommand",
+        "VisionStatusCommand",
+    ),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
 
 __all__ = [
     "BaseCommand",
@@ -77,6 +92,9 @@ __all__ = [
     "InitCommand",
     "SetupCommand",
     "ToolsCommand",
+    "TraceCommand",
+    "PerfCommand",
+    "ProfileCommand",
     "DoctorCommand",
     # Model commands
     "ListModelsCommand",
@@ -118,3 +136,12 @@ __all__ = [
     "SpeakCommand",
     "AudioStatusCommand",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
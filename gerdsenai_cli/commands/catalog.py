@@ -0,0 +1,428 @@
+"""Static table of the built-in slash commands.
+
+Importing every command module costs a large share of startup (the audio,
+vision, MCP and provider commands pull in their own dependencies), yet most
+sessions run only a few commands and a headless ``-p`` run none at all.
+:data:`BUILTIN_COMMANDS` lists each command's name, aliases, category and
+description, which is all the registry needs to route, complete and list
+commands; the module that implements a command is imported the first time
+it runs (see :meth:`CommandRegistry.register_lazy`).
+
+Keep an entry in sync with its command class; ``tests/test_lazy_startup.py``
+checks that they match.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+from .base import BaseCommand, CommandCategory
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """Where a command lives and what the registry shows before loading it."""
+
+    name: str
+    module: str  # submodule of gerdsenai_cli.commands
+    class_name: str
+    category: CommandCategory
+    description: str
+    aliases: tuple[str, ...] = ()
+    needs_agent: bool = False  # constructor takes the Agent
+
+    def load(self, *args: Any) -> BaseCommand:
+        """Import the command's module and instantiate it with ``args``."""
+        module = importlib.import_module(f"{__package__}.{self.module}")
+        command: BaseCommand = getattr(module, self.class_name)(*args)
+        return command
+
+
+BUILTIN_COMMANDS: tuple[CommandSpec, ...] = (
+    CommandSpec(
+        "help",
+        "system",
+        "HelpCommand",
+        CommandCategory.SYSTEM,
+        "Show help for commands",
+        aliases=("h", "?"),
+    ),
+    CommandSpec(
+        "exit",
+        "system",
+        "ExitCommand",
+        CommandCategory.SYSTEM,
+        "Exit the application",
+        aliases=("quit", "q"),
+    ),
+    CommandSpec(
+        "status",
+        "system",
+        "StatusCommand",
+        CommandCategory.SYSTEM,
+        "Show system status and health information",
+        aliases=("stat",),
+    ),
+    CommandSpec(
+        "config",
+        "system",
+        "ConfigCommand",
+        CommandCategory.SYSTEM,
+        "Show current configuration or modify settings",
+    ),
+    CommandSpec(
+        "debug",
+        "system",
+        "DebugCommand",
+        CommandCategory.SYSTEM,
+        "Toggle debug mode on/off",
+    ),
+    CommandSpec(
+        "trace",
+        "system",
+        "TraceCommand",
+        CommandCategory.SYSTEM,
+        "Record tracing spans and export them as a Chrome trace",
+    ),
+    CommandSpec(
+        "perf",
+        "system",
+        "PerfCommand",
+        CommandCategory.SYSTEM,
+        "Show the last turn's latency breakdown or the performance report",
+    ),
+    CommandSpec(
+        "profile",
+        "system",
+        "ProfileCommand",
+        CommandCategory.SYSTEM,
+        "Run the sampling profiler and show the hottest functions",
+    ),
+    CommandSpec(
+        "setup",
+        "system",
+        "SetupCommand",
+        CommandCategory.SYSTEM,
+        "Run interactive setup to change LLM protocol/host/port and optionally model",
+    ),
+    CommandSpec(
+        "about",
+        "system",
+        "AboutCommand",
+        CommandCategory.SYSTEM,
+        "Show version and system information for troubleshooting",
+        aliases=("version", "info"),
+    ),
+    CommandSpec(
+        "copy",
+        "system",
+        "CopyCommand",
+        CommandCategory.SYSTEM,
+        "Copy text or file contents to clipboard for sharing or external use",
+        aliases=("cp", "clip", "clipboard"),
+    ),
+    CommandSpec(
+        "init",
+        "system",
+        "InitCommand",
+        CommandCategory.SYSTEM,
+        "Initialize project with GerdsenAI.md guide and best practices",
+        aliases=("initialize", "setup-project"),
+    ),
+    CommandSpec(
+        "tools",
+        "system",
+        "ToolsCommand",
+        CommandCategory.SYSTEM,
+        "List available tools and capabilities in GerdsenAI CLI",
+        aliases=("capabilities", "features"),
+    ),
+    CommandSpec(
+        "tui",
+        "system",
+        "TuiCommand",
+        CommandCategory.SYSTEM,
+        "Toggle enhanced TUI mode (Text User Interface)",
+        aliases=("ui",),
+    ),
+    CommandSpec(
+        "mcp",
+        "mcp",
+        "MCPCommand",
+        CommandCategory.SYSTEM,
+        "Manage MCP server connections (list, add, remove, connect, status)",
+    ),
+    CommandSpec(
+        "doctor",
+        "system",
+        "DoctorCommand",
+        CommandCategory.SYSTEM,
+        "Run health diagnostics (version, LLM connection, capabilities, extras)",
+        aliases=("health", "diagnose"),
+    ),
+    CommandSpec(
+        "models",
+        "model",
+        "ListModelsCommand",
+        CommandCategory.MODEL,
+        "List all available models from the LLM server",
+        aliases=("list-models", "model-list"),
+    ),
+    CommandSpec(
+        "model",
+        "model",
+        "SwitchModelCommand",
+        CommandCategory.MODEL,
+        "Switch to a specific model",
+        aliases=("switch-model", "use-model"),
+    ),
+    CommandSpec(
+        "model-info",
+        "model",
+        "ModelInfoCommand",
+        CommandCategory.MODEL,
+        "Get detailed information about a specific model",
+        aliases=("describe-model", "minfo"),
+    ),
+    CommandSpec(
+        "model-stats",
+        "model",
+        "ModelStatsCommand",
+        CommandCategory.MODEL,
+        "Show statistics about model usage and performance",
+        aliases=("stats", "model-performance"),
+    ),
+    CommandSpec(
+        "discover",
+        "discover",
+        "DiscoverCommand",
+        CommandCategory.MODEL,
+        "Auto-detect local and Tailscale LLM servers (Ollama, vLLM, LM Studio, TGI)",
+        aliases=("scan", "find-models"),
+    ),
+    CommandSpec(
+        "index",
+        "index",
+        "IndexCommand",
+        CommandCategory.CONTEXT,
+        "Build/search a per-repo semantic index (Qdrant + local embeddings)",
+        aliases=("vector-index",),
+    ),
+    CommandSpec(
+        "anthropic",
+        "anthropic_cmd",
+        "AnthropicCommand",
+        CommandCategory.MODEL,
+        "Manage the Anthropic (Claude) provider: key, model, and chat",
+        aliases=("claude",),
+    ),
+    CommandSpec(
+        "persona",
+        "persona",
+        "PersonaCommand",
+        CommandCategory.AGENT,
+        "Bind named agent personas to a provider/model and switch between them",
+    ),
+    CommandSpec(
+        "agent",
+        "agent",
+        "AgentStatusCommand",
+        CommandCategory.AGENT,
+        "Display current agent status and statistics",
+        aliases=("agent-status", "status-agent"),
+    ),
+    CommandSpec(
+        "chat",
+        "agent",
+        "ChatCommand",
+        CommandCategory.AGENT,
+        "Manage conversation history and context",
+        aliases=("conversation", "conv", "chat-history"),
+    ),
+    CommandSpec(
+        "refresh",
+        "agent",
+        "RefreshContextCommand",
+        CommandCategory.AGENT,
+        "Refresh the project context and file cache",
+        aliases=("refresh-context", "reload-context"),
+    ),
+    CommandSpec(
+        "reset",
+        "agent",
+        "ResetCommand",
+        CommandCategory.AGENT,
+        "Clear the current session and reset agent state",
+        aliases=("clear", "clear-session"),
+    ),
+    CommandSpec(
+        "agent-config",
+        "agent",
+        "AgentConfigCommand",
+        CommandCategory.AGENT,
+        "Configure agent behavior and settings",
+        aliases=("configure-agent", "agent-settings"),
+    ),
+    CommandSpec(
+        "delegate",
+        "delegate",
+        "DelegateCommand",
+        CommandCategory.AGENT,
+        "Hand a focused sub-task to a fresh sub-agent and show its result",
+        aliases=("subagent",),
+    ),
+    CommandSpec(
+        "plan",
+        "planning",
+        "PlanCommand",
+        CommandCategory.AGENT,
+        "Create or manage multi-step execution plans",
+        needs_agent=True,
+    ),
+    CommandSpec(
+        "memory",
+        "memory",
+        "MemoryCommand",
+        CommandCategory.SYSTEM,
+        "Manage project memory (files, topics, preferences)",
+        needs_agent=True,
+    ),
+    CommandSpec(
+        "ls",
+        "files",
+        "FilesCommand",
+        CommandCategory.FILE,
+        "List files in the current project directory",
+        aliases=("list", "files", "listfiles"),
+    ),
+    CommandSpec(
+        "cat",
+        "files",
+        "ReadCommand",
+        CommandCategory.FILE,
+        "Read and display the contents of a file",
+        aliases=("read", "view", "readfile"),
+    ),
+    CommandSpec(
+        "edit",
+        "files",
+        "EditFileCommand",
+        CommandCategory.FILE,
+        "Edit a file with AI assistance",
+        aliases=("modify", "change"),
+    ),
+    CommandSpec(
+        "create",
+        "files",
+        "CreateFileCommand",
+        CommandCategory.FILE,
+        "Create a new file with specified content",
+        aliases=("new", "make"),
+    ),
+    CommandSpec(
+        "search",
+        "files",
+        "SearchFilesCommand",
+        CommandCategory.FILE,
+        "Search for text patterns across project files",
+        aliases=("grep", "find"),
+    ),
+    CommandSpec(
+        "session",
+        "files",
+        "SessionCommand",
+        CommandCategory.SESSION,
+        "Manage work sessions and project state",
+        aliases=("sess",),
+    ),
+    CommandSpec(
+        "run",
+        "terminal",
+        "RunCommand",
+        CommandCategory.SYSTEM,
+        "Execute a terminal command with safety validation",
+        aliases=("exec", "execute", "cmd"),
+    ),
+    CommandSpec(
+        "history",
+        "terminal",
+        "HistoryCommand",
+        CommandCategory.SYSTEM,
+        "Display terminal command execution history",
+        aliases=("hist", "cmd_history"),
+    ),
+    CommandSpec(
+        "clear_history",
+        "terminal",
+        "ClearHistoryCommand",
+        CommandCategory.SYSTEM,
+        "Clear terminal command execution history",
+        aliases=("clear_hist", "reset_history"),
+    ),
+    CommandSpec(
+        "cd",
+        "terminal",
+        "WorkingDirectoryCommand",
+        CommandCategory.SYSTEM,
+        "Display or change working directory for terminal commands",
+        aliases=("cwd", "pwd", "chdir"),
+    ),
+    CommandSpec(
+        "terminal_status",
+        "terminal",
+        "TerminalStatusCommand",
+        CommandCategory.SYSTEM,
+        "Display terminal executor status and configuration",
+        aliases=("term_status", "terminal_info"),
+    ),
+    CommandSpec(
+        "image",
+        "vision_commands",
+        "ImageCommand",
+        CommandCategory.VISION,
+        "Analyze image content using LLaVA vision model",
+        aliases=("img", "vision"),
+    ),
+    CommandSpec(
+        "ocr",
+        "vision_commands",
+        "OCRCommand",
+        CommandCategory.VISION,
+        "Extract text from image using OCR",
+        aliases=("extract", "text"),
+    ),
+    CommandSpec(
+        "vision-status",
+        "vision_commands",
+        "VisionStatusCommand",
+        CommandCategory.VISION,
+        "Check vision plugins status",
+        aliases=("vstatus", "vision-info"),
+    ),
+    CommandSpec(
+        "transcribe",
+        "audio_commands",
+        "TranscribeCommand",
+        CommandCategory.AUDIO,
+        "Transcribe audio to text using Whisper",
+        aliases=("stt", "speech-to-text"),
+    ),
+    CommandSpec(
+        "speak",
+        "audio_commands",
+        "SpeakCommand",
+        CommandCategory.AUDIO,
+        "Generate speech from text using Bark",
+        aliases=("tts", "text-to-speech"),
+    ),
+    CommandSpec(
+        "audio-status",
+        "audio_commands",
+        "AudioStatusCommand",
+        CommandCategory.AUDIO,
+        "Check audio plugins status",
+        aliases=("astatus", "audio-info"),
+    ),
+)
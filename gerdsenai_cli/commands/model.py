@@ -276,6 +276,8 @@ class SwitchModelCommand(BaseCommand):
             # Update LLM client if available in context
             if context and hasattr(context, "llm_client"):
                 context.llm_client.settings.current_model = model_name
+                if config.get_setting("preload_models", True):
+                    context.llm_client.preload_models([(model_name, "chat")])
 
             console.print(
                 f"[green]✓[/green] Switched from [cyan]{old_model or 'none'}[/cyan] to [cyan]{model_name}[/cyan]"
@@ -7,8 +7,9 @@ including command registration, discovery, and execution management.
 
 import inspect
 import re
+from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.table import Table
@@ -16,6 +17,9 @@ from rich.table import Table
 from ..utils.display import show_error, show_info, show_warning
 from .base import BaseCommand, CommandCategory, CommandResult
 
+if TYPE_CHECKING:
+    from .catalog import CommandSpec
+
 console = Console()
 
 
@@ -26,6 +30,8 @@ class CommandRegistry:
         """Initialize command registry."""
         self.commands: dict[str, BaseCommand] = {}
         self.aliases: dict[str, str] = {}  # alias -> command_name
+        # Registered but not yet imported: name -> (spec, factory)
+        self.lazy: dict[str, tuple[CommandSpec, Callable[[], BaseCommand]]] = {}
         self.categories: dict[CommandCategory, list[str]] = {}
 
         # Initialize categories
@@ -39,26 +45,51 @@ class CommandRegistry:
         Args:
             command: Command instance to register
         """
-        if command.name in self.commands:
-            raise ValueError(f"Command '{command.name}' is already registered")
-
-        # Register main command
+        self._reserve(command.name, command.aliases, command.category)
         self.commands[command.name] = command
 
-        # Register aliases
-        for alias in command.aliases:
-            if alias in self.aliases or alias in self.commands:
+        show_info(f"Registered command: /{command.name}")
+
+    def register_lazy(
+        self,
+        spec: "CommandSpec",
+        factory: Callable[[], BaseCommand] | None = None,
+    ) -> None:
+        """
+        Register a command from its catalog entry without importing it.
+
+        The command is created by ``factory`` (default: ``spec.load()``) the
+        first time it is looked up by name or alias.
+
+        Args:
+            spec: Static command metadata
+            factory: Optional callable building the command instance
+        """
+        self._reserve(spec.name, spec.aliases, spec.category)
+        self.lazy[spec.name] = (spec, factory or spec.load)
+
+    def _reserve(
+        self,
+        name: str,
+        aliases: Sequence[str],
+        category: CommandCategory,
+    ) -> None:
+        """Claim a command name and its aliases, rejecting conflicts."""
+        if name in self.commands or name in self.lazy:
+            raise ValueError(f"Command '{name}' is already registered")
+
+        for alias in aliases:
+            if alias in self.aliases or alias in self.commands or alias in self.lazy:
                 raise ValueError(
                     f"Alias '{alias}' conflicts with existing command or alias"
                 )
-            self.aliases[alias] = command.name
+        for alias in aliases:
+            self.aliases[alias] = name
 
         # Add to category
-        if command.category not in self.categories:
-            self.categories[command.category] = []
-        self.categories[command.category].append(command.name)
-
-        show_info(f"Registered command: /{command.name}")
+        if category not in self.categories:
+            self.categories[category] = []
+        self.categories[category].append(name)
 
     def unregister(self, command_name: str) -> bool:
         """
@@ -70,14 +101,13 @@ class CommandRegistry:
         Returns:
             True if command was unregistered, False if not found
         """
-        if command_name not in self.commands:
+        if command_name in self.commands:
+            category = self.commands.pop(command_name).category
+        elif command_name in self.lazy:
+            category = self.lazy.pop(command_name)[0].category
+        else:
             return False
 
-        command = self.commands[command_name]
-
-        # Remove from commands
-        del self.commands[command_name]
-
         # Remove aliases
         aliases_to_remove = [
             alias for alias, name in self.aliases.items() if name == command_name
@@ -86,11 +116,9 @@ class CommandRegistry:
             del self.aliases[alias]
 
         # Remove from category
-        if command.category in self.categories:
-            self.categories[command.category] = [
-                name
-                for name in self.categories[command.category]
-                if name != command_name
+        if category in self.categories:
+            self.categories[category] = [
+                name for name in self.categories[category] if name != command_name
             ]
 
         return True
@@ -105,14 +133,39 @@ class CommandRegistry:
         Returns:
             Command instance or None if not found
         """
-        # Check direct command name
+        name = self.aliases.get(name, name)
         if name in self.commands:
             return self.commands[name]
+        if name in self.lazy:
+            return self._load(name)
+        return None
+
+    def _load(self, name: str) -> BaseCommand:
+        """Import and instantiate a lazily registered command.
+
+        The catalog entry is dropped only once the command is built, so a
+        factory that raises leaves the command registered for a retry.
+        """
+        _, factory = self.lazy[name]
+        command = factory()
+        self.commands[name] = command
+        del self.lazy[name]
+        return command
 
-        # Check aliases
-        if name in self.aliases:
-            return self.commands[self.aliases[name]]
+    def describe(self, name: str) -> "BaseCommand | CommandSpec | None":
+        """
+        Get a command's metadata (name, aliases, description) without loading it.
 
+        Args:
+            name: Command name (not alias)
+
+        Returns:
+            The command instance if loaded, its catalog entry if not, or None
+        """
+        if name in self.commands:
+            return self.commands[name]
+        if name in self.lazy:
+            return self.lazy[name][0]
         return None
 
     def list_commands(
@@ -128,14 +181,17 @@ class CommandRegistry:
             List of command instances
         """
         if category is None:
-            return list(self.commands.values())
-
-        command_names = self.categories.get(category, [])
-        return [self.commands[name] for name in command_names]
+            command_names = [*self.commands, *self.lazy]
+        else:
+            command_names = self.categories.get(category, [])
+        return [
+            command for name in command_names if (command := self.get_command(name))
+        ]
 
     def get_all_names(self) -> set[str]:
         """Get all command names and aliases."""
         names = set(self.commands.keys())
+        names.update(self.lazy.keys())
         names.update(self.aliases.keys())
         return names
 
@@ -178,6 +234,20 @@ class CommandParser:
         """
         self.registry.register(command)
 
+    def register_lazy(
+        self,
+        spec: "CommandSpec",
+        factory: Callable[[], BaseCommand] | None = None,
+    ) -> None:
+        """
+        Register a command that is imported on first use.
+
+        Args:
+            spec: Static command metadata (see commands/catalog.py)
+            factory: Optional callable building the command instance
+        """
+        self.registry.register_lazy(spec, factory)
+
     def register_commands(self, commands: list[BaseCommand]) -> None:
         """
         Register multiple commands.
@@ -338,7 +408,13 @@ class CommandParser:
 
         # Show commands organized by category
         for category in CommandCategory:
-            commands = self.registry.list_commands(category)
+            # Catalog entries describe unloaded commands, so listing them
+            # doesn't import every command module.
+            commands = [
+                command
+                for name in self.registry.categories.get(category, [])
+                if (command := self.registry.describe(name)) is not None
+            ]
             if not commands:
                 continue
 
@@ -379,7 +455,7 @@ class CommandParser:
         Returns:
             Dictionary with parser status
         """
-        total_commands = len(self.registry.commands)
+        total_commands = len(self.registry.commands) + len(self.registry.lazy)
         total_aliases = len(self.registry.aliases)
 
         category_counts = {}
@@ -29,10 +29,6 @@ class PersonaCommand(BaseCommand):
     def category(self) -> CommandCategory:
         return CommandCategory.AGENT
 
-    @property
-    def aliases(self) -> list[str]:
-        return ["profile"]
-
     def parse_arguments(self, args_text: str) -> dict[str, Any]:
         text = args_text.strip()
         if not text:
@@ -10,7 +10,6 @@ from __future__ import annotations
 from typing import Any
 
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.table import Table
 
 from ..core.skill_loader import Skill, discover_skills
@@ -43,6 +42,8 @@ class SkillCommand(BaseCommand):
             f"[dim]({self._skill.kind} · {self._skill.source})[/dim]"
         )
         if self._skill.body:
+            from rich.markdown import Markdown  # deferred: slow to import
+
             console.print(Markdown(self._skill.body))
         return CommandResult(
             success=True,
@@ -115,6 +116,8 @@ class SkillsCommand(BaseCommand):
             console.print(
                 f"[bold cyan]{match.name}[/bold cyan] [dim]({match.kind})[/dim]"
             )
+            from rich.markdown import Markdown
+
             console.print(Markdown(match.body or "_(no content)_"))
             return CommandResult(success=True, message=f"Showed {match.name}")
 
@@ -4,6 +4,7 @@ System-related commands for GerdsenAI CLI.
 This module contains commands for system status, configuration, and general CLI operations.
 """
 
+import json
 import platform
 import sys
 from datetime import datetime
@@ -13,6 +14,7 @@ from typing import Any
 from rich.console import Console
 from rich.panel import Panel
 
+from ..core.model_residency import ModelResidencyManager
 from ..utils.display import show_error, show_info, show_success, show_warning
 from .base import BaseCommand, CommandArgument, CommandCategory, CommandResult
 
@@ -149,6 +151,9 @@ class StatusCommand(BaseCommand):
                 console.print(
                     f"  Error:              [bold red]{health['error']}[/bold red]"
                 )
+
+            for line in await residency_lines(llm_client):
+                console.print(f"  Model Residency:    [bold]{line}[/bold]")
         else:
             console.print("  LLM Client:         [bold red]Not initialized[/bold red]")
 
@@ -185,6 +190,13 @@ class StatusCommand(BaseCommand):
                 "  AI Agent:           [bold red]❌ Not initialized[/bold red]"
             )
 
+        # Startup steps (see core/startup.py)
+        startup = context.get("startup")
+        if startup:
+            console.print("\n🚀 [bold cyan]Startup:[/bold cyan]")
+            for line in startup.status_lines():
+                console.print(f"  {line}")
+
         # Command Parser Status
         parser = context.get("parser")
         if parser and verbose:
@@ -413,6 +425,230 @@ class DebugCommand(BaseCommand):
         return CommandResult(success=True, data={"debug": new_debug})
 
 
+_TRACE_ACTIONS = ("status", "on", "off", "save", "clear")
+
+
+def trace_action(action: str, path: str | None = None) -> str:
+    """Apply a ``/trace`` action to the global tracer and describe the result.
+
+    Shared by :class:`TraceCommand` and the TUI's ``/trace`` handler.
+    """
+    from ..utils.tracing import tracer
+
+    if action == "on":
+        tracer.configure(enabled=True)
+    elif action == "off":
+        tracer.configure(enabled=False)
+    elif action == "clear":
+        tracer.clear()
+    elif action == "save":
+        target = path or f"gerdsenai-trace-{datetime.now():%Y%m%d-%H%M%S}.json"
+        written = tracer.export_chrome_trace(target)
+        return (
+            f"Saved {len(tracer.spans)} spans to {written}\n"
+            "Open it in https://ui.perfetto.dev or chrome://tracing"
+        )
+    stats = tracer.stats()
+    state = "on" if stats["enabled"] else "off"
+    return (
+        f"Tracing {state}: {stats['spans']}/{stats['capacity']} spans buffered, "
+        f"{stats['dropped']} dropped, sample rate {stats['sample_rate']:g}, "
+        f"memory {'on' if stats['memory'] else 'off'}"
+    )
+
+
+class TraceCommand(BaseCommand):
+    """Control span tracing and export traces for Perfetto."""
+
+    @property
+    def name(self) -> str:
+        return "trace"
+
+    @property
+    def description(self) -> str:
+        return "Record tracing spans and export them as a Chrome trace"
+
+    @property
+    def category(self) -> CommandCategory:
+        return CommandCategory.SYSTEM
+
+    def parse_arguments(self, args_text: str) -> dict[str, Any]:
+        parts = args_text.split(maxsplit=1)
+        action = parts[0].lower() if parts else "status"
+        if action not in _TRACE_ACTIONS:
+            raise ValueError(
+                f"Unknown action '{action}': use status, on, off, save [path] or clear"
+            )
+        return {"action": action, "path": parts[1].strip() if len(parts) > 1 else None}
+
+    async def execute(
+        self, args: dict[str, Any], context: dict[str, Any]
+    ) -> CommandResult:
+        """Execute trace command."""
+        action = args.get("action", "status")
+        try:
+            message = trace_action(action, args.get("path"))
+        except OSError as e:
+            show_error(f"Could not save trace: {e}")
+            return CommandResult(success=False, message=str(e))
+        show_info(message)
+        return CommandResult(success=True, message=message)
+
+
+class PerfCommand(BaseCommand):
+    """Show where the last turn's time went."""
+
+    @property
+    def name(self) -> str:
+        return "perf"
+
+    @property
+    def description(self) -> str:
+        return "Show the last turn's latency breakdown or the performance report"
+
+    @property
+    def category(self) -> CommandCategory:
+        return CommandCategory.SYSTEM
+
+    def parse_arguments(self, args_text: str) -> dict[str, Any]:
+        action = args_text.strip().lower() or "last"
+        if action not in ("last", "json", "report"):
+            raise ValueError(f"Unknown action '{action}': use last, json or report")
+        return {"action": action}
+
+    async def execute(
+        self, args: dict[str, Any], context: dict[str, Any]
+    ) -> CommandResult:
+        """Execute perf command."""
+        action = args.get("action", "last")
+        if action == "report":
+            from ..utils.performance import performance_tracker
+
+            performance_tracker.display_performance_report(show_details=True)
+            return CommandResult(success=True)
+
+        message = last_turn_breakdown(context.get("agent"), as_json=action == "json")
+        console.print(message, markup=False, highlight=False)
+        return CommandResult(success=True, message=message)
+
+
+async def residency_lines(llm_client: Any) -> list[str]:
+    """One line per pre-loaded model with its current load state.
+
+    Shared by :class:`StatusCommand` and the TUI's ``/status`` handler; empty
+    when the client has no residency manager or the server has no ``/api/ps``.
+    """
+    residency = getattr(llm_client, "residency", None)
+    if not isinstance(residency, ModelResidencyManager):
+        return []
+    lines = []
+    for entry in await residency.refresh():
+        line = f"{entry.model} ({entry.role}): {entry.state}"
+        if entry.load_seconds is not None:
+            line += f", loaded in {entry.load_seconds:.1f}s"
+        if entry.expires_at:
+            line += f", until {entry.expires_at[11:19]}"
+        if entry.error:
+            line += f" — {entry.error}"
+        lines.append(line)
+    return lines
+
+
+def last_turn_breakdown(agent: Any, as_json: bool = False) -> str:
+    """The agent's last turn timeline as text (or JSON) for ``/perf``.
+
+    Shared by :class:`PerfCommand` and the TUI's ``/perf`` handler.
+    """
+    timeline = getattr(agent, "last_turn_timeline", None)
+    if timeline is None:
+        return "No turn recorded yet. Send a message first."
+    if as_json:
+        return json.dumps(timeline.as_dict(), indent=2)
+    return "\n".join(timeline.breakdown_lines())
+
+
+_PROFILE_ACTIONS = ("status", "start", "stop")
+
+
+def profile_action(action: str, value: str | None = None) -> str:
+    """Apply a ``/profile`` action to the global sampling profiler.
+
+    ``value`` is the sampling interval in ms for ``start`` and the number of
+    hotspots to list for ``stop``. Shared by :class:`ProfileCommand` and the
+    TUI's ``/profile`` handler; call it on the event loop's thread so samples
+    are grouped by asyncio task.
+
+    Raises:
+        ValueError: If ``value`` is not a positive number.
+        OSError: If the profile cannot be written.
+    """
+    from ..utils.profiler import profiler
+
+    number = float(value) if value else None
+    if number is not None and number <= 0:
+        raise ValueError(f"Expected a positive number, got {value}")
+    if action == "start":
+        if profiler.running:
+            return "Profiler is already running; /profile stop to finish."
+        profiler.start(number / 1000 if number else None)
+        return (
+            f"Profiling every {profiler.interval * 1000:g} ms. "
+            "Reproduce the slowness, then /profile stop."
+        )
+    if action == "stop":
+        if not profiler.running:
+            return "Profiler is not running. Start it with /profile start [ms]."
+        result = profiler.stop()
+        if result.samples:
+            result.save()
+        return result.format_table(int(number) if number else 15)
+    status = profiler.status()
+    if not status["running"]:
+        return "Profiler is not running. Start it with /profile start [ms]."
+    return (
+        f"Profiling for {status['elapsed']:.1f}s: {status['samples']} samples "
+        f"every {status['interval_ms']:g} ms"
+    )
+
+
+class ProfileCommand(BaseCommand):
+    """Sample the running session's stacks to find hotspots."""
+
+    @property
+    def name(self) -> str:
+        return "profile"
+
+    @property
+    def description(self) -> str:
+        return "Run the sampling profiler and show the hottest functions"
+
+    @property
+    def category(self) -> CommandCategory:
+        return CommandCategory.SYSTEM
+
+    def parse_arguments(self, args_text: str) -> dict[str, Any]:
+        parts = args_text.split()
+        action = parts[0].lower() if parts else "status"
+        if action not in _PROFILE_ACTIONS or len(parts) > 2:
+            raise ValueError(
+                f"Unknown action '{args_text.strip()}': "
+                "use start [interval_ms], stop [top_n] or status"
+            )
+        return {"action": action, "value": parts[1] if len(parts) > 1 else None}
+
+    async def execute(
+        self, args: dict[str, Any], context: dict[str, Any]
+    ) -> CommandResult:
+        """Execute profile command."""
+        try:
+            message = profile_action(args.get("action", "status"), args.get("value"))
+        except (ValueError, OSError) as e:
+            show_error(f"Profiler: {e}")
+            return CommandResult(success=False, message=str(e))
+        console.print(message, markup=False, highlight=False)
+        return CommandResult(success=True, message=message)
+
+
 class AboutCommand(BaseCommand):
     """Show version and system information for troubleshooting."""
 
@@ -5,7 +5,7 @@ This module contains Pydantic models for configuration validation and management
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -36,6 +36,16 @@ class Settings(BaseModel):
 
     current_model: str = Field(default="", description="Currently selected model name")
 
+    # Model residency (Ollama only; ignored by other servers)
+    preload_models: bool = Field(
+        default=True,
+        description="Pre-load the current (and embedding) model in the background at startup",
+    )
+    ollama_keep_alive: str = Field(
+        default="30m",
+        description="How long Ollama keeps used models loaded (e.g. '30m', '2h', '-1' for forever)",
+    )
+
     api_key: str | None = Field(
         default=None,
         description=(
@@ -73,6 +83,24 @@ class Settings(BaseModel):
         description="Streaming response timeout in seconds",
     )
 
+    # HTTP connection pooling (LLM client and provider clients)
+    http_max_connections: int = Field(
+        default=20, ge=1, le=200, description="Maximum open connections per pool"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10, ge=0, le=200, description="Idle connections kept alive per pool"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds an idle pooled connection is kept open",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 where the server offers it (needs the 'h2' package)",
+    )
+
     # Phase 8c: Dynamic Context Management
     model_context_window: int | None = Field(
         default=None,
@@ -121,6 +149,20 @@ class Settings(BaseModel):
         description="Confidence threshold for requesting clarification (medium confidence)",
     )
 
+    local_intent_classifier: bool = Field(
+        default=True,
+        description=(
+            "Answer confident intent detections with a local keyword classifier "
+            "instead of an LLM call"
+        ),
+    )
+    local_intent_threshold: float = Field(
+        default=0.85,
+        ge=0.5,
+        le=1.0,
+        description="Minimum local classifier probability to skip the LLM",
+    )
+
     # Vector Indexing (per-repo semantic search via Qdrant). All optional and
     # Agentic tool-use loop. When enabled (default), a user turn can call tools
     # (read/edit/run) and observe results across multiple steps; disabling it
@@ -133,6 +175,66 @@ class Settings(BaseModel):
         default=10,
         description="Max tool round-trips per turn before the loop stops",
     )
+    agent_loop_max_parallel_tools: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Max read-only tool calls the agent loop runs concurrently",
+    )
+    tool_cache_scope: Literal["turn", "session", "off"] = Field(
+        default="turn",
+        description=(
+            "Reuse read-only tool results: 'turn' (cleared each user turn), "
+            "'session' (file reads kept across turns), or 'off'"
+        ),
+    )
+    observation_digest_chars: int = Field(
+        default=4000,
+        ge=500,
+        le=100_000,
+        description=(
+            "Tool results longer than this are stored out of the conversation "
+            "and sent to the model as a digest it can drill into"
+        ),
+    )
+    tui_target_fps: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=240.0,
+        description=(
+            "Maximum redraw rate for streamed output in the TUI; chunks that "
+            "arrive between frames are drawn together"
+        ),
+    )
+    tracing: bool = Field(
+        default=False,
+        description=(
+            "Record tracing spans for turns, stages and LLM calls "
+            "(export with /trace save)"
+        ),
+    )
+    trace_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of turns recorded when tracing is on",
+    )
+    trace_buffer_spans: int = Field(
+        default=20_000,
+        ge=100,
+        description="Finished spans kept in the trace ring buffer",
+    )
+    trace_memory: bool = Field(
+        default=False,
+        description="Record process RSS deltas on trace spans (slower)",
+    )
+    stream_agent_loop: bool = Field(
+        default=True,
+        description=(
+            "Stream each agent-loop step, running read-only tools as soon as "
+            "their calls are complete"
+        ),
+    )
     auto_confirm_edits: bool = Field(
         default=False,
         description=(
@@ -212,6 +314,10 @@ class Settings(BaseModel):
             raise ValueError("Protocol must be 'http' or 'https'")
         return v
 
+    @field_validator("tool_cache_scope", mode="before")
+    def validate_tool_cache_scope(cls, v: Any) -> Any:
+        return v.lower().strip() if isinstance(v, str) else v
+
     @field_validator("llm_host")
     def validate_host(cls, v: str) -> str:
         if not v or not v.strip():
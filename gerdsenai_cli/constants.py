@@ -72,6 +72,9 @@ class LLMDefaults:
     INTENT_DETECTION_TIMEOUT_SECONDS: Final[float] = 60.0
     """Timeout for intent detection requests (increased for local AI)"""
 
+    INTENT_LEARN_CONFIDENCE: Final[float] = 0.85
+    """Minimum LLM intent confidence for the local classifier to learn from it"""
+
     # General completion parameters
     DEFAULT_TEMPERATURE: Final[float] = 0.7
     """Default temperature for general completions"""
@@ -5,8 +5,18 @@ This module contains the main business logic including LLM client, agent logic,
 context management, file editing, and terminal integration.
 
 Import specific modules directly (e.g., from gerdsenai_cli.core.agent import Agent).
+``LLMClient`` is re-exported lazily so importing a light core module does not
+load the HTTP client stack.
 """
 
-from .llm_client import LLMClient
+from typing import Any
 
 __all__ = ["LLMClient"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "LLMClient":
+        from .llm_client import LLMClient
+
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
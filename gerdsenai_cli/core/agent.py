@@ -7,6 +7,7 @@ project analysis.
 """
 
 import asyncio
+import hashlib
 import inspect
 import json
 import logging
@@ -22,16 +23,21 @@ from rich.console import Console
 from ..config.settings import Settings
 from ..constants import LLMDefaults
 from ..utils.display import show_error, show_info, show_success, show_warning
+from ..utils.tracing import tracer
 from .context_manager import ProjectContext
+from .conversation_window import SUMMARY_PROMPT, ConversationWindow, render_for_summary
 from .file_editor import EditOperation, FileEditor
 from .input_validator import (
     create_defensive_system_prompt,
     get_validator,
 )
+from .intent_classifier import LocalIntentClassifier
 from .llm_client import ChatMessage, LLMClient
 from .memory import ProjectMemory
 from .planner import TaskPlanner
+from .prompt_layout import PromptLayout
 from .suggestions import ProactiveSuggestor
+from .turn_scheduler import TurnScheduler, TurnTimeline
 from .types import IntelligenceActivity
 
 logger = logging.getLogger(__name__)
@@ -112,11 +118,30 @@ class ConversationContext:
     session_metadata: dict[str, Any] = field(default_factory=dict)
 
 
+# Actions of INTENT_DETECTION_PROMPT (also the local classifier's labels).
+INTENT_ACTIONS = {
+    "read_and_explain": ActionType.READ_FILE,
+    "whole_repo_analysis": ActionType.ANALYZE_PROJECT,
+    "iterative_search": ActionType.SEARCH_FILES,
+    "edit_files": ActionType.EDIT_FILE,
+    "create_files": ActionType.CREATE_FILE,
+    "chat": ActionType.CHAT,
+}
+_INTENT_LABELS = {action: label for label, action in INTENT_ACTIONS.items()}
+
+
 class IntentParser:
     """Parses LLM responses for action intents."""
 
-    def __init__(self) -> None:
-        """Initialize intent parser with patterns and keywords."""
+    def __init__(self, local_classifier: LocalIntentClassifier | None = None) -> None:
+        """Initialize intent parser with patterns and keywords.
+
+        Args:
+            local_classifier: Optional classifier consulted before the LLM; its
+                confident answers skip the LLM round trip, and confident LLM
+                answers are fed back to it as training examples.
+        """
+        self.local_classifier = local_classifier
         # Initialize input validator for security
         from .input_validator import get_validator
 
@@ -183,6 +208,55 @@ class IntentParser:
         Returns:
             ActionIntent with detected action and parameters
         """
+        if self.local_classifier is not None:
+            await self.local_classifier.warm()
+        local = self._classify_locally(user_query, project_files)
+        if local is not None:
+            return local
+        intent = await self._detect_intent_llm(llm_client, user_query, project_files)
+        if (
+            self.local_classifier is not None
+            and intent.action_type in _INTENT_LABELS
+            and intent.confidence >= LLMDefaults.INTENT_LEARN_CONFIDENCE
+        ):
+            self.local_classifier.learn(user_query, _INTENT_LABELS[intent.action_type])
+        return intent
+
+    def _classify_locally(
+        self, user_query: str, project_files: list[str]
+    ) -> ActionIntent | None:
+        """The local classifier's intent, or None to ask the LLM."""
+        if self.local_classifier is None:
+            return None
+        verdict = self.local_classifier.classify(user_query)
+        files = self.extract_file_paths(user_query, project_files) if verdict else []
+        # Reading or editing needs a file the project actually has.
+        if verdict is None or (
+            INTENT_ACTIONS[verdict[0]] in (ActionType.READ_FILE, ActionType.EDIT_FILE)
+            and not files
+        ):
+            self.local_classifier.record(hit=False)
+            return None
+        self.local_classifier.record(hit=True)
+        label, confidence = verdict
+        parameters: dict[str, Any] = {}
+        if files:
+            parameters["file_path"] = files[0]
+            parameters["files"] = files
+        logger.info(f"Local intent classifier: {label} ({confidence:.2f})")
+        return ActionIntent(
+            action_type=INTENT_ACTIONS[label],
+            confidence=confidence,
+            parameters=parameters,
+            reasoning="Local intent classifier",
+        )
+
+    async def _detect_intent_llm(
+        self,
+        llm_client: LLMClient,
+        user_query: str,
+        project_files: list[str],
+    ) -> ActionIntent:
         try:
             # Prepare file list (limit to first N files for token efficiency)
             max_files = LLMDefaults.INTENT_DETECTION_MAX_FILES
@@ -242,16 +316,7 @@ class IntentParser:
                 )
 
             # Map LLM action to ActionType
-            action_map = {
-                "read_and_explain": ActionType.READ_FILE,
-                "whole_repo_analysis": ActionType.ANALYZE_PROJECT,
-                "iterative_search": ActionType.SEARCH_FILES,
-                "edit_files": ActionType.EDIT_FILE,
-                "create_files": ActionType.CREATE_FILE,
-                "chat": ActionType.CHAT,
-            }
-
-            action_type = action_map.get(
+            action_type = INTENT_ACTIONS.get(
                 intent_data.get("action", "chat"), ActionType.CHAT
             )
 
@@ -596,7 +661,7 @@ class Agent:
         # Initialize core components
         self.context_manager = ProjectContext(project_root)
         self.file_editor = FileEditor()
-        self.intent_parser = IntentParser()
+        self.intent_parser = IntentParser(local_classifier=self._local_classifier())
         self.planner = TaskPlanner(llm_client, self)
         self.memory = ProjectMemory(project_root)
 
@@ -604,6 +669,11 @@ class Agent:
         from .clarification import ClarificationEngine
 
         self.clarification = ClarificationEngine(settings, llm_client)
+        if self.intent_parser.local_classifier is not None:
+            for user_input, chosen in self.clarification.chosen_interpretations():
+                self.intent_parser.local_classifier.learn_from_clarification(
+                    user_input, chosen.as_text()
+                )
 
         # Initialize complexity detection system
         from .complexity import ComplexityDetector
@@ -644,12 +714,28 @@ class Agent:
         self.actions_performed = 0
         self.files_modified = 0
         self.context_builds = 0
+        # In-flight project scan, shared by concurrent callers (a background
+        # eager scan at startup and the first turn that needs context).
+        self._scan_task: asyncio.Task[None] | None = None
 
         # Agentic tool loop: registry built lazily; confirmation_callback is set
         # by the app (e.g. the TUI) to drive interactive approval of mutating tools.
         self._tool_registry: Any | None = None
         self._mcp_tools_loaded: bool = False  # MCP tools registered into the loop?
         self.confirmation_callback: Any | None = None
+        # Definitions/references index behind find_definition/find_references;
+        # built on first use and refreshed incrementally per query. Parallel
+        # tool calls share one refresh at a time through the lock.
+        self._symbol_index: Any | None = None
+        self._symbol_index_lock = asyncio.Lock()
+        # Stable prompt prefix (system prompt + pinned context + jump-aligned
+        # history) so prefix-caching servers can reuse their KV cache.
+        self.prompt_layout = PromptLayout()
+        # Token-budgeted history: recent turns verbatim, older turns folded into
+        # a rolling summary computed in the background by the local model.
+        self.conversation_window = ConversationWindow()
+        # Stage timeline of the most recent turn (see TurnScheduler).
+        self.last_turn_timeline: TurnTimeline | None = None
 
     async def initialize(self) -> bool:
         """Initialize the agent.
@@ -1074,6 +1160,10 @@ class Agent:
             chosen = next((i for i in interpretations if i.id == choice_id), None)
             if chosen:
                 logger.info(f"User chose interpretation: {chosen.title}")
+                if self.intent_parser.local_classifier is not None:
+                    self.intent_parser.local_classifier.learn_from_clarification(
+                        user_input, chosen.as_text()
+                    )
 
                 # Process based on chosen interpretation
                 # This could update the intent or trigger specific actions
@@ -1173,6 +1263,14 @@ class Agent:
 
     async def process_user_input(self, user_input: str) -> str:
         """Process user input and return agent response."""
+        sched = TurnScheduler()
+        with tracer.span("turn", "turn"):
+            try:
+                return await self._process_user_input(user_input, sched)
+            finally:
+                self.last_turn_timeline = await sched.close()
+
+    async def _process_user_input(self, user_input: str, sched: TurnScheduler) -> str:
         try:
             # Security: Sanitize user input first
             sanitized_input, warnings = self.input_validator.sanitize_user_input(
@@ -1214,11 +1312,13 @@ class Agent:
                     # User wants to use planning mode
                     return planning_suggestion
 
-            # Try LLM-based intent detection first (Phase 8b feature)
+            # Try LLM-based intent detection first (Phase 8b feature). It runs
+            # concurrently with context assembly and semantic retrieval.
             intent = None
             use_llm_intent = self.settings.get_preference(
                 "enable_llm_intent_detection", True
             )
+            self._start_turn_stages(sched, user_input, use_llm_intent)
 
             if use_llm_intent:
                 try:
@@ -1230,25 +1330,8 @@ class Agent:
                             progress=0.2,
                         )
 
-                    # Get project file list for context. Trigger the lazy scan
-                    # if it hasn't run yet, so first-turn intent detection sees
-                    # the project files (no-op once the index is populated).
-                    if not self.context_manager.files:
-                        await self._analyze_project_structure()
-
-                    project_files = []
-                    if self.context_manager.files:
-                        project_files = [
-                            str(f.relative_path)
-                            for f in self.context_manager.files.values()
-                        ]
-
-                    # Attempt LLM-based intent detection
-                    intent = await self.intent_parser.detect_intent_with_llm(
-                        llm_client=self.llm_client,
-                        user_query=user_input,
-                        project_files=project_files,
-                    )
+                    await sched.result("scan")
+                    intent = await sched.result("intent")
 
                     # Check confidence levels and handle accordingly
                     if intent and intent.confidence >= 0.7:
@@ -1311,20 +1394,18 @@ class Agent:
                     )
                     intent = None
 
-            # Build context for LLM if needed
-            context_prompt = ""
-            if not self.conversation.project_context_built:
-                context_prompt = await self._build_project_context(user_input)
-                self.conversation.project_context_built = True
+            # Build context for LLM if needed (already under way)
+            context_prompt = await self._await_turn_context(sched, intent)
 
             # Prepare messages for LLM
             llm_messages = self._prepare_llm_messages(user_input, context_prompt)
+            sched.begin("completion")
 
             # Agentic tool-use loop (default ON). When enabled and the mode
             # permits tools, the model can call tools and observe results across
             # multiple steps in this one turn. Falls back to the single-shot path
             # below when disabled, in CHAT mode, or if the loop is unavailable.
-            loop_response = await self._maybe_run_agent_loop(llm_messages)
+            loop_response = await self._maybe_run_agent_loop(llm_messages, sched)
             if loop_response:
                 self.conversation.messages.append(
                     ChatMessage(role="assistant", content=loop_response)
@@ -1342,6 +1423,7 @@ class Agent:
                     console.print("[bold cyan]\nGerdsenAI:[/bold cyan]", end=" ")
                     async for chunk in self._stream_response(llm_messages):
                         if chunk:
+                            sched.first_token()
                             llm_response += chunk
                             # Print chunk without newline for live feeling
                             console.print(chunk, end="", style="white")
@@ -1357,6 +1439,7 @@ class Agent:
                 with console.status("[bold green]Thinking...", spinner="dots"):
                     llm_response = await self._complete_response(llm_messages)
 
+            self._record_completion(sched, llm_messages, llm_response)
             if not llm_response.strip():
                 return "I apologize, but I'm having trouble connecting to the AI model. Please try again."
 
@@ -1403,16 +1486,31 @@ class Agent:
             dimmed), or "tool" (a tool-call/result status line). Consumers that
             only care about text can ignore non-"text" kinds.
         """
+        sched = TurnScheduler()
+        with tracer.span("turn", "turn", stream=True):
+            try:
+                async for item in self._process_user_input_stream(
+                    user_input, status_callback, sched
+                ):
+                    yield item
+            finally:
+                self.last_turn_timeline = await sched.close()
+
+    async def _process_user_input_stream(
+        self, user_input: str, status_callback: Any, sched: TurnScheduler
+    ) -> AsyncGenerator[tuple[str, str, str], None]:
         try:
             # Add user message to conversation
             user_message = ChatMessage(role="user", content=user_input)
             self.conversation.messages.append(user_message)
 
-            # Try LLM-based intent detection first
+            # Try LLM-based intent detection first (concurrently with context
+            # assembly and semantic retrieval)
             intent = None
             use_llm_intent = self.settings.get_preference(
                 "enable_llm_intent_detection", True
             )
+            self._start_turn_stages(sched, user_input, use_llm_intent)
 
             if use_llm_intent:
                 try:
@@ -1420,18 +1518,8 @@ class Agent:
                     if status_callback:
                         status_callback("analyzing")
 
-                    project_files = []
-                    if self.context_manager.files:
-                        project_files = [
-                            str(f.relative_path)
-                            for f in self.context_manager.files.values()
-                        ]
-
-                    intent = await self.intent_parser.detect_intent_with_llm(
-                        llm_client=self.llm_client,
-                        user_query=user_input,
-                        project_files=project_files,
-                    )
+                    await sched.result("scan")
+                    intent = await sched.result("intent")
 
                     # For high-confidence file operations, execute directly
                     if intent and intent.confidence >= 0.7:
@@ -1465,21 +1553,18 @@ class Agent:
                     )
                     intent = None
 
-            # Build context for LLM if needed
-            context_prompt = ""
-            if not self.conversation.project_context_built:
+            # Build context for LLM if needed (already under way)
+            if status_callback and sched.has("context"):
                 # Notify: building context
-                if status_callback:
-                    status_callback("contextualizing")
-
-                context_prompt = await self._build_project_context(user_input)
-                self.conversation.project_context_built = True
+                status_callback("contextualizing")
+            context_prompt = await self._await_turn_context(sched, intent)
 
             # Prepare messages for LLM
             if status_callback:
                 status_callback("thinking")
 
             llm_messages = self._prepare_llm_messages(user_input, context_prompt)
+            sched.begin("completion")
 
             # Agentic tool loop (default ON, mode != chat): stream the model's
             # reasoning + tool actions + final answer live as (chunk, accumulated,
@@ -1490,10 +1575,14 @@ class Agent:
                 loop_streamed = False
                 try:
                     async for chunk, _acc, kind in self._run_agent_loop_stream(
-                        llm_messages
+                        llm_messages, sched
                     ):
                         loop_streamed = True
-                        if kind == "text":
+                        if kind == "tool":
+                            # Text streamed before a tool step was its preamble;
+                            # the answer is what follows the last tool step.
+                            loop_text = ""
+                        elif kind == "text":
                             loop_text += chunk
                         yield (chunk, loop_text or chunk, kind)
                 except asyncio.CancelledError:
@@ -1518,8 +1607,10 @@ class Agent:
             llm_response = ""
             async for chunk in self._stream_response(llm_messages):
                 if chunk:
+                    sched.first_token()
                     llm_response += chunk
                     yield (chunk, llm_response, "text")
+            self._record_completion(sched, llm_messages, llm_response)
 
             if not llm_response.strip():
                 error_msg = "I apologize, but I'm having trouble connecting to the AI model. Please try again."
@@ -1560,7 +1651,17 @@ class Agent:
             yield (error_msg, error_msg, "text")
 
     async def _analyze_project_structure(self) -> None:
-        """Analyze the current project structure."""
+        """Analyze the current project structure.
+
+        A call made while a scan is already running waits for that scan
+        instead of starting a second one.
+        """
+        if self._scan_task is None or self._scan_task.done():
+            self._scan_task = asyncio.create_task(self._scan_project())
+        # Shielded: a cancelled turn must not cancel a scan others wait on.
+        await asyncio.shield(self._scan_task)
+
+    async def _scan_project(self) -> None:
         try:
             show_info("Analyzing project structure...")
 
@@ -1577,8 +1678,81 @@ class Agent:
             logger.error(f"Failed to analyze project: {e}")
             show_warning(f"Could not analyze project structure: {e}")
 
-    async def _build_project_context(self, user_query: str = "") -> str:
-        """Build project context for LLM using Phase 8c dynamic context building."""
+    def _start_turn_stages(
+        self, sched: TurnScheduler, user_input: str, use_llm_intent: bool
+    ) -> None:
+        """Start the stages that precede a turn's completion, concurrently.
+
+        The lazy project scan comes first (intent detection and context
+        assembly both need the file list); intent detection, context assembly
+        and semantic retrieval then run side by side. Context is only started
+        when :meth:`_project_context_needed` says so.
+        """
+        context_needed = self._project_context_needed()
+        if not self.context_manager.files and (use_llm_intent or context_needed):
+            sched.start("scan", self._analyze_project_structure)
+        if use_llm_intent:
+            sched.start(
+                "intent",
+                lambda: self.intent_parser.detect_intent_with_llm(
+                    llm_client=self.llm_client,
+                    user_query=user_input,
+                    project_files=[
+                        str(f.relative_path)
+                        for f in self.context_manager.files.values()
+                    ],
+                ),
+                after=("scan",),
+            )
+        if context_needed:
+            sched.start(
+                "context",
+                lambda: self._build_project_context(user_input, semantic=False),
+                after=("scan",),
+            )
+            sched.start("semantic", lambda: self._retrieve_semantic_context(user_input))
+
+    async def _await_turn_context(
+        self, sched: TurnScheduler, intent: ActionIntent | None
+    ) -> str:
+        """Collect the context started by :meth:`_start_turn_stages`.
+
+        For a confident plain-chat turn that names no files, a refresh of an
+        already pinned context is cancelled instead (the pinned one is kept and
+        the next turn that needs context rebuilds it).
+        """
+        if not sched.has("context"):
+            return ""
+        if (
+            intent is not None
+            and intent.action_type == ActionType.CHAT
+            and intent.confidence >= self.settings.intent_confidence_threshold
+            and not intent.parameters.get("files")
+            and self.conversation.project_context_built
+        ):
+            sched.cancel("context", "semantic")
+            return ""
+        context = await sched.result("context", default="")
+        semantic = await sched.result("semantic", default="")
+        self.conversation.project_context_built = True
+        return self._with_semantic_results(context, semantic)
+
+    @staticmethod
+    def _with_semantic_results(context: str, semantic: str) -> str:
+        if not semantic:
+            return context
+        if not context:
+            return semantic
+        return f"{context}\n\n# Semantic Search Results\n{semantic}"
+
+    async def _build_project_context(
+        self, user_query: str = "", *, semantic: bool = True
+    ) -> str:
+        """Build project context for LLM using Phase 8c dynamic context building.
+
+        With ``semantic=False`` the vector-index results are left out; the turn
+        scheduler retrieves them concurrently and merges them itself.
+        """
         try:
             # Show context analysis activity
             if self._console:
@@ -1627,12 +1801,9 @@ class Agent:
 
             # Augment with semantic retrieval from the per-repo vector index,
             # when enabled and available (no-op otherwise).
-            semantic = await self._retrieve_semantic_context(user_query)
             if semantic:
-                context = (
-                    f"{context}\n\n# Semantic Search Results\n{semantic}"
-                    if context
-                    else semantic
+                context = self._with_semantic_results(
+                    context, await self._retrieve_semantic_context(user_query)
                 )
 
             return context
@@ -1686,6 +1857,30 @@ class Agent:
                 blocks.append(f"## {loc}\n{snippet}")
         return "\n\n".join(blocks)
 
+    async def _get_symbol_index(self) -> Any:
+        """Return the symbol index, brought up to date with the project files.
+
+        Built lazily on first use; later calls only re-parse files whose mtime or
+        size changed (edits made through the agent's own tools included). Parsing
+        runs in a worker thread so a cold build never stalls the event loop.
+        Concurrent callers (parallel tool calls) wait for the refresh in flight
+        instead of mutating the index from two threads at once.
+        """
+        from .symbol_index import SymbolIndex
+
+        async with self._symbol_index_lock:
+            if not self.context_manager.files:
+                await self._analyze_project_structure()
+            if self._symbol_index is None:
+                self._symbol_index = SymbolIndex(self.context_manager.project_root)
+            # The index filters by source extension itself; FileInfo.is_text
+            # relies on mimetypes, which misfiles .ts (video/mp2t) and .rs.
+            paths = list(self.context_manager.files)
+            reparsed = await asyncio.to_thread(self._symbol_index.refresh, paths)
+            if reparsed:
+                logger.debug(f"Symbol index refreshed: {reparsed} file(s) re-parsed")
+            return self._symbol_index
+
     def _route_provider(self) -> Any | None:
         """Return an AnthropicProvider when the persona or model routes to it.
 
@@ -1794,7 +1989,7 @@ class Agent:
         return bool(self.settings.get_preference("auto_confirm_edits", False))
 
     async def _maybe_run_agent_loop(
-        self, llm_messages: list[ChatMessage]
+        self, llm_messages: list[ChatMessage], sched: TurnScheduler | None = None
     ) -> str | None:
         """Run the agentic tool loop if enabled and the mode permits tools.
 
@@ -1810,9 +2005,17 @@ class Agent:
             from .tool_registry import run_agent_loop
 
             registry = await self._ensure_tool_registry()
+            self._begin_tool_turn(registry)
             max_iter = int(
                 self.settings.get_preference("agent_loop_max_iterations", 10)
             )
+
+            def on_event(name: str, payload: dict[str, Any]) -> None:
+                if name == "first_token" and sched is not None:
+                    sched.first_token()
+
+            # Streamed model turns (not displayed here) let the turn's timeline
+            # split each call into prefill and decode.
             result = await run_agent_loop(
                 self.llm_client,
                 llm_messages,
@@ -1821,12 +2024,68 @@ class Agent:
                 confirm=self._tool_confirm,
                 allow_tools=True,
                 max_iterations=max_iter,
+                max_parallel_tools=self.settings.agent_loop_max_parallel_tools,
+                on_event=on_event,
+                stream=self.settings.stream_agent_loop,
             )
+            if sched is not None:
+                self._record_loop_usage(sched, result)
             return result.content or ""
         except Exception as e:
             logger.warning(f"Agent loop failed, falling back to single-shot: {e}")
             return None
 
+    def _begin_tool_turn(self, registry: Any) -> None:
+        """Apply ``tool_cache_scope`` to the registry's tool-result cache.
+
+        "turn" (default) starts every user turn with an empty cache, "session"
+        keeps per-file results across turns (still mtime/edit-invalidated) but
+        drops search and index results, which edits made outside the agent
+        can make stale unnoticed; "off" disables memoization.
+        """
+        cache = getattr(registry, "result_cache", None)
+        if cache is None:
+            return
+        scope = self.settings.tool_cache_scope
+        cache.enabled = scope != "off"
+        if scope == "session":
+            cache.clear_project_wide()
+        else:
+            cache.clear()
+
+    @staticmethod
+    def _record_loop_usage(sched: TurnScheduler, result: Any) -> None:
+        """Copy an agent-loop run's token and tool-time telemetry to the turn.
+
+        Only streamed model calls have a measurable decode time; a loop with
+        none reports a zero decode (so no tokens/sec) rather than a figure
+        that mixes in prefill.
+        """
+        decode = getattr(result, "decode_time", None)
+        sched.record_generation(
+            prompt_tokens=getattr(result, "prompt_tokens", 0),
+            completion_tokens=getattr(result, "completion_tokens", 0),
+            model_calls=getattr(result, "model_calls", 0),
+            tool_time=getattr(result, "tool_time", 0.0),
+            prefill=getattr(result, "prefill_time", None),
+            decode=decode if decode is not None else 0.0,
+            decode_tokens=getattr(result, "decode_tokens", 0),
+        )
+
+    def _record_completion(
+        self, sched: TurnScheduler, llm_messages: list[ChatMessage], response: str
+    ) -> None:
+        """Record a single-shot completion's estimated token counts."""
+        from .token_counter import count_messages_tokens, count_tokens
+
+        model = self.settings.current_model or "default"
+        sched.record_generation(
+            prompt_tokens=count_messages_tokens(
+                [{"role": m.role, "content": m.content} for m in llm_messages], model
+            ),
+            completion_tokens=count_tokens(response, model),
+        )
+
     def _agent_loop_active(self) -> bool:
         """True when the tool loop should drive this turn (enabled, mode≠chat)."""
         if not self.settings.get_preference("enable_agent_loop", True):
@@ -1835,7 +2094,7 @@ class Agent:
         return mode != "chat"
 
     async def _run_agent_loop_stream(
-        self, llm_messages: list[ChatMessage]
+        self, llm_messages: list[ChatMessage], sched: TurnScheduler | None = None
     ) -> AsyncGenerator[tuple[str, str, str], None]:
         """Stream the agentic tool loop as (chunk, accumulated, kind) tuples.
 
@@ -1843,18 +2102,25 @@ class Agent:
         tool-call / result status line), or "text" (the final answer). The loop's
         synchronous ``on_event`` callback pushes events onto a queue which this
         generator drains live while the loop runs as a cancellable task, so the
-        UI can show thinking + tool actions as they happen. On cancellation
+        UI can show thinking + tool actions as they happen. With the
+        ``stream_agent_loop`` preference on (default), each model turn is itself
+        streamed, so reasoning and text arrive token by token; text streamed
+        before a tool call is that step's preamble, not the answer. On cancellation
         (Escape) the loop task is cancelled and the error re-raised so the
         caller's existing CancelledError handling fires.
         """
         from .tool_registry import run_agent_loop
 
         registry = await self._ensure_tool_registry()
+        self._begin_tool_turn(registry)
         max_iter = int(self.settings.get_preference("agent_loop_max_iterations", 10))
         queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
 
         def on_event(name: str, payload: dict[str, Any]) -> None:
-            if name == "tool_call":
+            if name == "first_token":
+                if sched is not None:
+                    sched.first_token()
+            elif name == "tool_call":
                 args = payload.get("args") or {}
                 preview = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:3])
                 queue.put_nowait(("tool", f"⚙ {payload.get('name', '?')}({preview})\n"))
@@ -1863,6 +2129,16 @@ class Agent:
                 if len(result) > 100:
                     result = result[:100] + "…"
                 queue.put_nowait(("tool", f"  ↳ {result}\n"))
+            elif name == "tool_cache_hit":
+                args = payload.get("args") or {}
+                preview = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:3])
+                queue.put_nowait(
+                    ("tool", f"⚙ {payload.get('name', '?')}({preview}) [cached]\n")
+                )
+            elif name == "text_delta":
+                queue.put_nowait(("text", payload.get("content", "")))
+            elif name == "reasoning_delta":
+                queue.put_nowait(("reasoning", payload.get("content", "")))
 
         task: asyncio.Task[Any] = asyncio.ensure_future(
             run_agent_loop(
@@ -1873,7 +2149,9 @@ class Agent:
                 confirm=self._tool_confirm,
                 allow_tools=True,
                 max_iterations=max_iter,
+                max_parallel_tools=self.settings.agent_loop_max_parallel_tools,
                 on_event=on_event,
+                stream=self.settings.stream_agent_loop,
             )
         )
         accumulated = ""
@@ -1893,6 +2171,10 @@ class Agent:
                 yield (chunk, accumulated, kind)
 
             result = task.result()
+            if sched is not None:
+                self._record_loop_usage(sched, result)
+            if getattr(result, "streamed", False):
+                return  # text/reasoning already arrived as deltas
             reasoning = getattr(result, "reasoning", "") or ""
             if reasoning:
                 accumulated += reasoning
@@ -1934,27 +2216,70 @@ class Agent:
             async for chunk in self.llm_client.stream_chat(llm_messages):
                 yield chunk
 
+    def _project_context_needed(self) -> bool:
+        """Whether to (re)build project context before this turn.
+
+        Built on the first turn, then only when a file the pinned context was
+        built from changed — rebuilding every turn would break the prompt
+        prefix that local servers cache.
+        """
+        if not self.conversation.project_context_built:
+            return True
+        return self.prompt_layout.is_stale(self._context_fingerprint())
+
+    def _context_fingerprint(self) -> str:
+        """(mtime, size) fingerprint of the files in the last built context."""
+        digest = hashlib.sha1()
+        for path in sorted(self.context_manager.last_context_files):
+            try:
+                st = path.stat()
+                digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size};".encode())
+            except OSError:
+                digest.update(f"{path}:missing;".encode())
+        return digest.hexdigest()
+
     def _prepare_llm_messages(
         self, user_input: str, context_prompt: str = ""
     ) -> list[ChatMessage]:
-        """Prepare messages for LLM with appropriate context."""
+        """Prepare messages for LLM with appropriate context.
+
+        Layout is prefix-stable across turns: system prompt, then the pinned
+        project context (replaced only when ``context_prompt`` is freshly
+        built), then a summary of turns that left the history window, then the
+        recent history verbatim from a window start that moves in jumps.
+        """
         messages = []
 
+        if context_prompt:
+            self.prompt_layout.pin_context(context_prompt, self._context_fingerprint())
+
         # Add system message with context
         system_content = self._build_system_prompt()
-        if context_prompt:
+        if self.prompt_layout.pinned_context:
             # Security: Wrap context in tags to prevent injection
             escaped_context = self.input_validator.escape_for_context(
-                context_prompt, "project_context"
+                self.prompt_layout.pinned_context, "project_context"
             )
             system_content += f"\n\n# Current Project Context\n{escaped_context}"
 
+        # Conversation history, budgeted by tokens (what the system message
+        # leaves of the usable context window).
+        window = self.conversation_window
+        window.budget_tokens = self._history_token_budget(system_content)
+        summary, recent_history = window.select(
+            self.conversation.messages, self._summarize_history
+        )
+        if summary:
+            escaped_summary = self.input_validator.escape_for_context(
+                summary, "conversation_summary"
+            )
+            system_content += f"\n\n# Earlier Conversation\n{escaped_summary}"
+
         messages.append(ChatMessage(role="system", content=system_content))
 
-        # Add conversation history (limit to recent messages to stay within context)
         # Security: Escape historical user messages
         recent_messages = []
-        for msg in self.conversation.messages[-10:]:  # Last 10 messages
+        for msg in recent_history:
             if msg.role == "user":
                 # Wrap user messages in security tags
                 escaped_msg = ChatMessage(
@@ -1969,8 +2294,41 @@ class Agent:
 
         messages.extend(recent_messages)
 
+        self.prompt_layout.record(messages)
         return messages
 
+    def _history_token_budget(self, system_content: str) -> int:
+        """Tokens left for history once the system message is accounted for.
+
+        Never less than a quarter of the usable window, so a large pinned
+        context cannot squeeze the conversation out entirely.
+        """
+        try:
+            context_window = self.llm_client.get_model_context_window(
+                self.settings.current_model or ""
+            )
+        except Exception:
+            context_window = 4096
+        usage = self.settings.get_preference("context_window_usage", 0.8)
+        usable = int(context_window * usage)
+        system_tokens = self.conversation_window.counter.count(system_content)
+        return max(usable - system_tokens, usable // 4)
+
+    async def _summarize_history(
+        self, previous: str, messages: list[ChatMessage]
+    ) -> str | None:
+        """Fold evicted turns into the rolling summary using the local model."""
+        return await self.llm_client.chat(
+            [
+                ChatMessage(role="system", content=SUMMARY_PROMPT),
+                ChatMessage(
+                    role="user", content=render_for_summary(previous, messages)
+                ),
+            ],
+            temperature=0.2,
+            max_tokens=self.conversation_window.summary_tokens,
+        )
+
     def _build_system_prompt(self) -> str:
         """Build system prompt for the LLM with security defenses."""
         base_prompt = """You are GerdsenAI, an intelligent coding assistant with the ability to understand and modify codebases. You can:
@@ -2296,6 +2654,8 @@ How can I help you with your code today?"""
     def get_agent_stats(self) -> dict[str, Any]:
         """Get agent performance statistics."""
         cache_stats = self.context_manager.get_cache_stats()
+        registry = getattr(self, "_tool_registry", None)
+        store = getattr(registry, "observations", None)
 
         return {
             "actions_performed": self.actions_performed,
@@ -2304,6 +2664,15 @@ How can I help you with your code today?"""
             "project_files_indexed": len(self.context_manager.files),
             "conversation_length": len(self.conversation.messages),
             "cache_performance": cache_stats,
+            "prompt_prefix_reuse": self.prompt_layout.stats(),
+            "conversation_window": self.conversation_window.stats(),
+            "local_intent": self.intent_parser.local_classifier.stats()
+            if self.intent_parser.local_classifier
+            else None,
+            "last_turn": self.last_turn_timeline.as_dict()
+            if self.last_turn_timeline
+            else None,
+            "tool_observations": store.stats() if store is not None else {},
             "last_action": self.conversation.last_action.action_type.value
             if self.conversation.last_action
             else None,
@@ -2347,10 +2716,22 @@ How can I help you with your code today?"""
     def clear_conversation(self) -> None:
         """Clear conversation history."""
         self.conversation = ConversationContext()
+        self.conversation_window.reset()
         show_info("Conversation history cleared")
 
+    def _local_classifier(self) -> LocalIntentClassifier | None:
+        """The local intent classifier, unless ``local_intent_classifier`` is off."""
+        if not self.settings.local_intent_classifier:
+            return None
+        return LocalIntentClassifier(
+            threshold=self.settings.local_intent_threshold,
+            examples_path=Path.home() / ".gerdsenai" / "intent_examples.json",
+        )
+
     async def cleanup(self) -> None:
         """Cleanup agent resources and save memory."""
+        if self.intent_parser.local_classifier is not None:
+            self.intent_parser.local_classifier.save()
         try:
             # Save memory to disk
             if self.memory.save():
@@ -2364,5 +2745,6 @@ How can I help you with your code today?"""
         """Refresh project context by rescanning the directory."""
         show_info("Refreshing project context...")
         self.conversation.project_context_built = False
+        self.prompt_layout.clear_context()
         await self._analyze_project_structure()
         show_success("Project context refreshed")
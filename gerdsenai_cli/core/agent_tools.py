@@ -2,36 +2,37 @@
 
 `build_default_registry(agent)` exposes the agent's existing, battle-tested
 primitives — project context, file editor, terminal — as `Tool`s the model can
-call in the agentic loop. Read-only tools (read/search/analyze/semantic) run
+call in the agentic loop. Read-only tools (read/search/analyze/semantic and the
+symbol lookups find_definition/find_references) run
 freely; mutating tools (create/edit/run_command) are marked ``mutating`` so the
 loop routes them through its async ``confirm`` gate. Crucially, the mutating
 tools call the underlying primitives with their own interactive confirmation
 **bypassed** (``apply_edit(force=True)`` / ``execute_command(require_confirmation
 =False)``) — the loop's confirm callback is the single gate, so there's no
 blocking ``Confirm.ask`` inside the async loop and no double-prompt.
+The read-only tools are ``cacheable``: repeated calls are served from the
+registry's ``ToolResultCache`` until the file changes or an edit touches it.
+Large results are not truncated here: the registry's ``ObservationStore`` keeps
+them out of the conversation and the model drills in with ``fetch_observation``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .file_editor import EditOperation
-from .tool_registry import Tool, ToolRegistry
+from .observations import FETCH_TOOL, ObservationStore
+from .tool_registry import Tool, ToolRegistry, ToolResultCache
 
 if TYPE_CHECKING:
     from .agent import Agent
 
 logger = logging.getLogger(__name__)
 
-_MAX_TOOL_RESULT_CHARS = 8000  # keep observations bounded for context budget
-
-
-def _truncate(text: str, limit: int = _MAX_TOOL_RESULT_CHARS) -> str:
-    if len(text) <= limit:
-        return text
-    return text[:limit] + f"\n... [truncated {len(text) - limit} chars]"
+_MAX_SYMBOL_HITS = 50  # cap listed definition/reference sites per query
 
 
 def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRegistry:
@@ -41,7 +42,11 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
     top-level agent is 0. The ``delegate`` tool is added only while below the
     configured depth cap, so a sub-agent at max depth cannot spawn another.
     """
-    reg = ToolRegistry()
+    store = ObservationStore(digest_chars=agent.settings.observation_digest_chars)
+    reg = ToolRegistry(
+        result_cache=ToolResultCache(root=agent.context_manager.project_root),
+        observations=store,
+    )
 
     # -- read-only tools ------------------------------------------------- #
 
@@ -50,7 +55,7 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
         if content is None:
             return f"Could not read file: {path}"
         agent._track_file_access(Path(path), "reading")
-        return _truncate(f"# {path}\n{content}")
+        return f"# {path}\n{content}"
 
     async def search_files(query: str) -> str:
         files = agent.context_manager.get_relevant_files(query=query, max_files=10)
@@ -59,12 +64,46 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
         return "Relevant files:\n" + "\n".join(str(f.relative_path) for f in files)
 
     async def analyze_project() -> str:
-        return _truncate(await agent._handle_project_analysis())
+        return await agent._handle_project_analysis()
 
     async def semantic_search(query: str) -> str:
         result = await agent._retrieve_semantic_context(query)
         return result or "Semantic index unavailable or no matches."
 
+    async def find_definition(name: str) -> str:
+        index = await agent._get_symbol_index()
+        defs = index.find_definitions(name)
+        if not defs:
+            return f"No definition found for: {name}"
+        lines = [d.describe() for d in defs[:_MAX_SYMBOL_HITS]]
+        if len(defs) > _MAX_SYMBOL_HITS:
+            lines.append(f"... and {len(defs) - _MAX_SYMBOL_HITS} more")
+        return f"Definitions of {name}:\n" + "\n".join(lines)
+
+    async def find_references(name: str) -> str:
+        index = await agent._get_symbol_index()
+        sites = index.find_references(name)
+        if not sites:
+            return f"No references found for: {name}"
+        # Reading the matched files is disk I/O; keep it off the event loop.
+        lines = await asyncio.to_thread(
+            _reference_lines,
+            agent.context_manager.project_root,
+            sites[:_MAX_SYMBOL_HITS],
+        )
+        if len(sites) > _MAX_SYMBOL_HITS:
+            lines.append(f"... and {len(sites) - _MAX_SYMBOL_HITS} more")
+        return f"References to {name}:\n" + "\n".join(lines)
+
+    async def fetch_observation(
+        handle: str, start_line: int = 1, end_line: int | None = None
+    ) -> str:
+        # Looked up per call: a delegated sub-agent's registry is given the
+        # parent's store after it is built, and its digests are written there.
+        if reg.observations is None:
+            return f"Unknown observation handle: {handle}"
+        return reg.observations.fetch(handle, start_line, end_line)
+
     # -- mutating tools (gated by the loop's confirm callback) ----------- #
 
     async def create_file(path: str, content: str) -> str:
@@ -101,9 +140,9 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
         result = await executor.execute_command(command, require_confirmation=False)
         parts = [f"$ {command}", f"exit_code={result.exit_code}"]
         if result.stdout:
-            parts.append(_truncate(result.stdout))
+            parts.append(result.stdout)
         if result.stderr:
-            parts.append("stderr:\n" + _truncate(result.stderr))
+            parts.append("stderr:\n" + result.stderr)
         return "\n".join(parts)
 
     reg.register(
@@ -118,6 +157,7 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
                 "required": ["path"],
             },
             func=read_file,
+            cacheable=True,
         )
     )
     reg.register(
@@ -132,6 +172,7 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
                 "required": ["query"],
             },
             func=search_files,
+            cacheable=True,
         )
     )
     reg.register(
@@ -140,6 +181,7 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
             description="Get an overview of the project structure and stats.",
             parameters={"type": "object", "properties": {}},
             func=analyze_project,
+            cacheable=True,
         )
     )
     reg.register(
@@ -157,6 +199,68 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
                 "required": ["query"],
             },
             func=semantic_search,
+            cacheable=True,
+        )
+    )
+    reg.register(
+        Tool(
+            name="find_definition",
+            description=(
+                "Find where a symbol (function, class, method, type) is defined. "
+                "Returns file:line and signature; use 'Class.method' to narrow."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Symbol name"}
+                },
+                "required": ["name"],
+            },
+            func=find_definition,
+            cacheable=True,
+        )
+    )
+    reg.register(
+        Tool(
+            name="find_references",
+            description=(
+                "Find where a symbol is used across the project. Returns "
+                "file:line with the matching source line."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Symbol name"}
+                },
+                "required": ["name"],
+            },
+            func=find_references,
+            cacheable=True,
+        )
+    )
+    reg.register(
+        Tool(
+            name=FETCH_TOOL,
+            description=(
+                "Read a line range of a large tool result that was compressed "
+                "into a digest (the digest names its handle, e.g. 'obs-1')."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "handle": {"type": "string", "description": "Observation handle"},
+                    "start_line": {
+                        "type": "integer",
+                        "description": "First line to return (1-based)",
+                    },
+                    "end_line": {
+                        "type": "integer",
+                        "description": "Last line to return (inclusive)",
+                    },
+                },
+                "required": ["handle"],
+            },
+            func=fetch_observation,
         )
     )
     reg.register(
@@ -211,6 +315,23 @@ def build_default_registry(agent: Agent, *, delegation_depth: int = 0) -> ToolRe
     return reg
 
 
+def _reference_lines(root: Path, sites: list[tuple[str, int]]) -> list[str]:
+    """``path:line: source`` for each reference site, reading each file once."""
+    lines: list[str] = []
+    file_lines: dict[str, list[str]] = {}
+    for rel, line in sites:
+        if rel not in file_lines:
+            try:
+                text = (root / rel).read_text(encoding="utf-8", errors="ignore")
+                file_lines[rel] = text.splitlines()
+            except OSError:
+                file_lines[rel] = []
+        src = file_lines[rel]
+        snippet = src[line - 1].strip()[:160] if 0 < line <= len(src) else ""
+        lines.append(f"{rel}:{line}: {snippet}")
+    return lines
+
+
 def _maybe_register_delegate(reg: ToolRegistry, agent: Agent, depth: int) -> None:
     """Register the ``delegate`` tool, unless disabled or at the depth cap.
 
@@ -42,6 +42,12 @@ class Interpretation:
     example_action: str | None = None
     risks: list[str] = field(default_factory=list)
 
+    def as_text(self) -> str:
+        """Title, description and example action as one line of text."""
+        return " ".join(
+            part for part in (self.title, self.description, self.example_action) if part
+        )
+
 
 @dataclass
 class ClarifyingQuestion:
@@ -453,6 +459,24 @@ Respond with JSON only:
 
         return None
 
+    def chosen_interpretations(self) -> list[tuple[str, Interpretation]]:
+        """``(user_input, chosen interpretation)`` for each helpful record."""
+        choices = []
+        for record in self.history:
+            if not record.was_helpful:
+                continue
+            chosen = next(
+                (
+                    i
+                    for i in record.question.interpretations
+                    if i.id == record.user_choice
+                ),
+                None,
+            )
+            if chosen is not None:
+                choices.append((record.user_input, chosen))
+        return choices
+
     def _are_similar(self, text1: str, text2: str, threshold: float = 0.6) -> bool:
         """
         Check if two texts are similar using simple word overlap.
@@ -5,7 +5,6 @@ This module handles project structure analysis, file filtering, and context buil
 for providing relevant information to the LLM about the current codebase.
 """
 
-import asyncio
 import fnmatch
 import hashlib
 import logging
@@ -16,15 +15,26 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from cachetools import LRUCache
 from rich.console import Console
 from rich.tree import Tree
 
 from ..utils.display import show_error
+from .context_packing import PackItem, Variant, pack
+from .file_cache import get_file_cache
+from .file_summary import summarize_structure
 from .token_counter import get_token_counter
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Context packing: candidates considered per build, how far past the budget to
+# collect them, and when/at what value a summary is offered instead.
+_MAX_PACK_CANDIDATES = 200
+_PACK_CANDIDATE_OVERSUPPLY = 3
+_SUMMARY_MIN_TOKENS = 256
+_SUMMARY_VALUE = 0.4
+
 
 @dataclass
 class FileInfo:
@@ -162,26 +172,30 @@ class GitignoreParser:
 
     def is_ignored(self, file_path: Path, is_directory: bool = False) -> bool:
         """Check if a file path matches any ignore patterns."""
+        return bool(self.match(file_path, is_directory))
+
+    def match(self, file_path: Path, is_directory: bool = False) -> bool | None:
+        """Whether the last matching pattern ignores the path; None if none match."""
         if not self.patterns or not self.base_path:
-            return False
+            return None
 
         try:
             # Get relative path from base
             rel_path = file_path.relative_to(self.base_path)
-            path_str = str(rel_path)
+            path_str = rel_path.as_posix()
 
             # Check against patterns (last match wins)
-            is_ignored = False
+            verdict: bool | None = None
 
             for pattern, is_negation in self.patterns:
                 if self._matches_pattern(path_str, pattern, is_directory):
-                    is_ignored = not is_negation
+                    verdict = not is_negation
 
-            return is_ignored
+            return verdict
 
         except (ValueError, OSError):
             # Path is not relative to base
-            return False
+            return None
 
     def _matches_pattern(self, path: str, pattern: str, is_directory: bool) -> bool:
         """Check if a path matches a specific pattern."""
@@ -304,10 +318,16 @@ class ProjectContext:
             "*.sqlite3",
         }
 
-        # Content cache
-        self.content_cache: dict[str, str] = {}
+        # Content cache (shared with the other context builders)
+        self.content_cache = get_file_cache()
         self.cache_hits = 0
         self.cache_misses = 0
+        # Files whose content went into the last dynamic context build
+        self.last_context_files: list[Path] = []
+        # Value report from the last packed context build
+        self.last_pack_report: dict[str, Any] = {}
+        # Structural summaries keyed by (content hash, budget bucket, suffix)
+        self._summary_cache: LRUCache = LRUCache(maxsize=256)
 
     async def scan_directory(
         self,
@@ -326,7 +346,9 @@ class ProjectContext:
         logger.info(f"Scanning project directory: {self.project_root}")
 
         try:
-            # Load .gitignore if it exists and respect_gitignore is True
+            # Load .gitignore if it exists and respect_gitignore is True.
+            # A fresh parser, so rescans don't accumulate duplicate patterns.
+            self.gitignore = GitignoreParser()
             if respect_gitignore:
                 gitignore_path = self.project_root / ".gitignore"
                 if gitignore_path.exists():
@@ -344,6 +366,7 @@ class ProjectContext:
                 max_depth=max_depth,
                 include_hidden=include_hidden,
                 respect_gitignore=respect_gitignore,
+                gitignores=(self.gitignore,),
             )
 
             # Calculate statistics
@@ -366,8 +389,14 @@ class ProjectContext:
         max_depth: int,
         include_hidden: bool,
         respect_gitignore: bool,
+        gitignores: tuple[GitignoreParser, ...] = (),
     ) -> None:
-        """Recursively scan directory tree."""
+        """Recursively scan directory tree.
+
+        ``gitignores`` holds the parsers of the ``.gitignore`` files from the
+        root down to ``directory``; a deeper file's verdict overrides its
+        parents', as in git.
+        """
         if depth > max_depth:
             return
 
@@ -375,6 +404,12 @@ class ProjectContext:
             # Get directory entries
             entries = list(directory.iterdir())
 
+            # A nested .gitignore applies below its own directory
+            if respect_gitignore and depth > 0:
+                if any(entry.name == ".gitignore" for entry in entries):
+                    nested = GitignoreParser(directory / ".gitignore")
+                    gitignores = (*gitignores, nested)
+
             for entry in entries:
                 try:
                     # Skip hidden files/directories if not included
@@ -394,9 +429,7 @@ class ProjectContext:
                         continue
 
                     # Check gitignore patterns
-                    if respect_gitignore and self.gitignore.is_ignored(
-                        entry, entry.is_dir()
-                    ):
+                    if respect_gitignore and self._is_gitignored(entry, gitignores):
                         self.stats.ignored_files += 1
                         continue
 
@@ -410,6 +443,7 @@ class ProjectContext:
                             max_depth,
                             include_hidden,
                             respect_gitignore,
+                            gitignores,
                         )
 
                 except (PermissionError, OSError) as e:
@@ -419,6 +453,16 @@ class ProjectContext:
         except (PermissionError, OSError) as e:
             logger.warning(f"Cannot access directory {directory}: {e}")
 
+    @staticmethod
+    def _is_gitignored(entry: Path, gitignores: tuple[GitignoreParser, ...]) -> bool:
+        verdict: bool | None = None
+        is_directory = entry.is_dir()
+        for parser in gitignores:
+            match = parser.match(entry, is_directory)
+            if match is not None:
+                verdict = match
+        return bool(verdict)
+
     async def _process_file(self, file_path: Path) -> None:
         """Process a single file and add to index."""
         try:
@@ -507,23 +551,20 @@ class ProjectContext:
                 logger.debug(f"Skipping binary file: {file_path}")
                 return None
 
-            # Generate cache key
-            cache_key = self._generate_cache_key(file_info)
+            if force_reload:
+                self.content_cache.invalidate(file_path)
 
-            # Check cache first
-            if not force_reload and cache_key in self.content_cache:
+            # The shared cache re-validates mtime/size on every read. Content is
+            # not pinned on FileInfo, so the cache's size bound actually holds.
+            content, hit = await self.content_cache.lookup(file_path)
+            if hit:
                 self.cache_hits += 1
-                return self.content_cache[cache_key]
-
-            self.cache_misses += 1
+            else:
+                self.cache_misses += 1
 
-            # Read file content
-            content = await self._read_file_async(file_path)
             if content is not None:
-                # Cache the content
-                self.content_cache[cache_key] = content
-                file_info.cached_content = content
-                file_info.content_hash = cache_key
+                file_info.content_hash = self._generate_cache_key(file_info)
+                file_info.encoding = self.content_cache.encoding_of(file_path)
             else:
                 logger.warning(f"Could not read file content: {file_path}")
                 console.print(
@@ -547,53 +588,6 @@ class ProjectContext:
             console.print(f"[red]Error reading {file_path.name}: {str(e)[:50]}[/red]")
             return None
 
-    async def _read_file_async(self, file_path: Path) -> str | None:
-        """Asynchronously read file content."""
-        try:
-            loop = asyncio.get_event_loop()
-
-            # Try different encodings
-            encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
-
-            for encoding in encodings:
-                try:
-
-                    def read_with_encoding(enc: str = encoding) -> str:
-                        return file_path.read_text(encoding=enc)
-
-                    content = await loop.run_in_executor(None, read_with_encoding)
-
-                    # Update file info with successful encoding
-                    if file_path in self.files:
-                        self.files[file_path].encoding = encoding
-
-                    result: str = content
-                    return result
-
-                except UnicodeDecodeError:
-                    continue
-
-            # If all encodings fail, try reading as binary and decode with errors='ignore'
-            try:
-                binary_content = await loop.run_in_executor(
-                    None, lambda: file_path.read_bytes()
-                )
-                content = binary_content.decode("utf-8", errors="ignore")
-
-                if file_path in self.files:
-                    self.files[file_path].encoding = "utf-8-with-errors"
-
-                result_final: str = content
-                return result_final
-
-            except Exception:
-                logger.debug(f"Cannot read file as text: {file_path}")
-                return None
-
-        except Exception as e:
-            logger.debug(f"Failed to read file {file_path}: {e}")
-            return None
-
     def _generate_cache_key(self, file_info: FileInfo) -> str:
         """Generate cache key for file content."""
         # Use file path, size, and modification time
@@ -814,11 +808,8 @@ class ProjectContext:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "hit_rate_percent": hit_rate,
-            "cached_files": len(self.content_cache),
-            "cache_size_mb": sum(
-                len(content.encode()) for content in self.content_cache.values()
-            )
-            / (1024 * 1024),
+            "cached_files": self.content_cache.stats()["entries"],
+            "cache_size_mb": self.content_cache.stats()["chars"] / (1024 * 1024),
         }
 
     def clear_cache(self) -> None:
@@ -885,6 +876,26 @@ class ProjectContext:
         """
         Prioritize files for context building.
 
+        Args:
+            query: User query to identify relevant files
+            mentioned_files: Files explicitly mentioned in conversation
+            recent_files: Recently accessed files
+
+        Returns:
+            Sorted list of FileInfo objects by priority
+        """
+        scored = self._score_files(query, mentioned_files, recent_files)
+        return [file_info for file_info, _ in scored]
+
+    def _score_files(
+        self,
+        query: str | None = None,
+        mentioned_files: list[Path] | None = None,
+        recent_files: list[Path] | None = None,
+    ) -> list[tuple[FileInfo, float]]:
+        """
+        Score files for context building.
+
         Priority order:
         1. Explicitly mentioned files
         2. Recently accessed/modified files
@@ -897,7 +908,7 @@ class ProjectContext:
             recent_files: Recently accessed files
 
         Returns:
-            Sorted list of FileInfo objects by priority
+            (FileInfo, priority) pairs sorted by priority, highest first
         """
         prioritized: list[tuple[FileInfo, float]] = []
 
@@ -978,7 +989,7 @@ class ProjectContext:
         # Sort by priority (descending)
         prioritized.sort(key=lambda x: x[1], reverse=True)
 
-        return [file_info for file_info, _ in prioritized]
+        return prioritized
 
     async def _smart_context_building(
         self,
@@ -990,7 +1001,10 @@ class ProjectContext:
         """
         Build context using smart prioritization strategy.
 
-        Reads files in priority order until token budget is exhausted.
+        Offers the highest-priority files, in full and (when large) as
+        structural summaries, to a knapsack packer that picks the mix with the
+        most total priority that fits the budget. The value report lands in
+        ``last_pack_report``.
 
         Args:
             max_tokens: Maximum tokens for context
@@ -1024,7 +1038,7 @@ class ProjectContext:
 
         # Prioritize files
         console.print("[dim]Prioritizing files for context...[/dim]")
-        prioritized_files = self._prioritize_files(query, mentioned_files, recent_files)
+        scored_files = self._score_files(query, mentioned_files, recent_files)
 
         # Show prioritization summary
         if mentioned_files:
@@ -1032,53 +1046,83 @@ class ProjectContext:
         if recent_files:
             console.print(f"[dim]  Recent files: {len(recent_files)}[/dim]")
 
-        # Add files until token budget exhausted (reserve 5% for safety)
+        # Pack files into the remaining budget (reserve 5% for safety)
         token_limit = int(max_tokens * 0.95)
-
-        for file_info in prioritized_files:
-            if current_tokens >= token_limit:
+        budget = token_limit - current_tokens
+
+        # Candidates in priority order, each offered in full and (when large)
+        # as a structural summary. Stop collecting once the cheapest variants
+        # alone would overfill the budget a few times over.
+        candidates: list[PackItem] = []
+        candidate_paths: dict[str, Path] = {}
+        candidate_cost = 0
+        for file_info, priority in scored_files:
+            if (
+                len(candidates) >= _MAX_PACK_CANDIDATES
+                or candidate_cost >= budget * _PACK_CANDIDATE_OVERSUPPLY
+            ):
                 break
 
             content = await self.read_file_content(file_info.path)
             if not content:
                 continue
 
-            # Check if file fits
-            file_tokens = self._estimate_tokens(content)
             header = f"\n## File: {file_info.relative_path}\n```\n"
             footer = "\n```"
-            total_tokens = self._estimate_tokens(header + footer) + file_tokens
+            overhead = self._estimate_tokens(header + footer)
+            file_tokens = self._estimate_tokens(content)
+            value = priority + 1.0  # every readable file is worth something
+
+            variants = [Variant("full", file_tokens + overhead, value, content)]
+            if file_tokens > _SUMMARY_MIN_TOKENS and budget > _SUMMARY_MIN_TOKENS:
+                target = max(_SUMMARY_MIN_TOKENS // 2, min(file_tokens, budget) // 4)
+                summary = await self._summarize_file(content, target, file_info.path)
+                variants.append(
+                    Variant(
+                        "summary",
+                        self._estimate_tokens(summary) + overhead,
+                        value * _SUMMARY_VALUE,
+                        summary,
+                    )
+                )
+            candidate_cost += min(v.cost for v in variants)
+            candidates.append(PackItem(str(file_info.relative_path), variants))
+            candidate_paths[str(file_info.relative_path)] = file_info.path
 
-            if current_tokens + total_tokens <= token_limit:
-                # Include full file
-                file_section = f"{header}{content}{footer}"
-                context_parts.append(file_section)
-                current_tokens += total_tokens
+        packed = pack(candidates, budget)
+
+        # Emit in priority order so the most important files come first.
+        for item in candidates:
+            chosen = packed.chosen.get(item.key)
+            if chosen is None:
+                continue
+            context_parts.append(f"\n## File: {item.key}\n```\n{chosen.payload}\n```")
+            current_tokens += chosen.cost
+            self.last_context_files.append(candidate_paths[item.key])
+            if chosen.name == "full":
                 files_included += 1
             else:
-                # Try to summarize/truncate
-                remaining_tokens = (
-                    token_limit
-                    - current_tokens
-                    - self._estimate_tokens(header + footer)
-                )
-                if remaining_tokens > 100:  # Minimum useful content
-                    summarized = await self._summarize_file(content, remaining_tokens)
-                    file_section = f"{header}{summarized}{footer}"
-                    context_parts.append(file_section)
-                    current_tokens += self._estimate_tokens(file_section)
-                    files_summarized += 1
-                break
+                files_summarized += 1
+
+        self.last_pack_report = {"strategy": "smart", **packed.summary()}
 
         # Show completion details
         if files_summarized > 0:
             console.print(
                 f"[dim]  Summarized {files_summarized} large file(s) to fit context[/dim]"
             )
+        if candidates:
+            console.print(
+                f"[dim]  Packed {len(packed.chosen)}/{len(candidates)} candidate files: "
+                f"value {packed.included_value:.0f} included, "
+                f"{packed.dropped_value:.0f} dropped "
+                f"(priority-order walk: {packed.greedy_value:.0f})[/dim]"
+            )
 
         logger.info(
             f"Smart context built: {current_tokens}/{max_tokens} tokens "
-            f"({files_included} files, {files_summarized} summarized)"
+            f"({files_included} files, {files_summarized} summarized; "
+            f"pack {self.last_pack_report})"
         )
 
         return "\n\n".join(context_parts)
@@ -1142,7 +1186,9 @@ class ProjectContext:
                 file_section = f"{header}{content}{footer}"
             else:
                 # Summarize to fit budget
-                summarized = await self._summarize_file(content, tokens_per_file)
+                summarized = await self._summarize_file(
+                    content, tokens_per_file, file_info.path
+                )
                 file_section = f"{header}{summarized}{footer}"
                 files_summarized += 1
 
@@ -1151,6 +1197,7 @@ class ProjectContext:
                 context_parts.append(file_section)
                 current_tokens += section_tokens
                 files_processed += 1
+                self.last_context_files.append(file_info.path)
 
         # Show summary
         console.print(
@@ -1192,23 +1239,53 @@ class ProjectContext:
         )
         return await self._smart_context_building(max_tokens)
 
-    async def _summarize_file(self, content: str, max_tokens: int) -> str:
+    async def _summarize_file(
+        self, content: str, max_tokens: int, file_path: Path | None = None
+    ) -> str:
         """
         Summarize or truncate file content to fit token budget.
 
+        Source files get a structural outline (signatures, docstrings, imports);
+        anything without recognisable structure falls back to keeping its
+        beginning and end. Results are cached per (content hash, budget bucket),
+        so an unchanged file is summarized once, not on every context build.
+
         Args:
             content: Full file content
             max_tokens: Maximum tokens allowed
+            file_path: Path the content came from (selects the outliner)
 
         Returns:
             Summarized/truncated content
         """
-        max_chars = max_tokens * 4  # Approximate characters
-
-        if len(content) <= max_chars:
+        content_tokens = self._estimate_tokens(content)
+        if content_tokens <= max_tokens:
             return content
 
-        # Smart truncation strategies
+        # Power-of-two buckets: nearby budgets share one cached summary, and
+        # summarizing to the bucket floor keeps it within ``max_tokens``.
+        bucket = 1 << (max(max_tokens, 1).bit_length() - 1)
+        key = (
+            hashlib.sha1(content.encode("utf-8", errors="ignore")).hexdigest(),
+            bucket,
+            file_path.suffix.lower() if file_path else "",
+        )
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return str(cached)
+
+        summary = summarize_structure(
+            content, bucket, self._estimate_tokens, file_path
+        ) or self._truncate_content(content, bucket, content_tokens)
+        self._summary_cache[key] = summary
+        return summary
+
+    @staticmethod
+    def _truncate_content(content: str, max_tokens: int, content_tokens: int) -> str:
+        """Keep the beginning and end of ``content`` within ``max_tokens``."""
+        # Budget in characters at this content's own chars-per-token ratio.
+        max_chars = int(len(content) * max_tokens / max(content_tokens, 1))
+
         lines = content.split("\n")
 
         # Strategy 1: Include beginning and end
@@ -1264,6 +1341,7 @@ class ProjectContext:
         """
         if strategy == "off":
             return ""
+        self.last_context_files = []
 
         # User-facing progress message
         console.print(
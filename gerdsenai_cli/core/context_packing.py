@@ -0,0 +1,191 @@
+"""Choose which files (and which version of each) go into the context window.
+
+Context selection is a multiple-choice knapsack: every candidate file offers a
+few variants (full text, structural summary, or nothing), each with a token cost
+and a value derived from the file's priority, and the budget is the context
+window. :func:`pack` solves it approximately with the classic greedy over the
+convex hull of each item's variants, then fills leftover space with the best
+upgrade that still fits. The hull greedy is O(n log n); unlike a prefix walk
+in priority order, it never lets one oversized file crowd out the smaller ones
+behind it. The result is never worse than that prefix walk.
+
+:class:`PackResult` reports included vs. dropped value, plus what the plain
+priority-order walk would have achieved, so strategies can be compared.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Variant:
+    """One way of including an item: ``cost`` tokens for ``value``."""
+
+    name: str  # "full" | "summary" | ...
+    cost: int
+    value: float
+    payload: Any = None
+
+
+@dataclass
+class PackItem:
+    key: str
+    variants: list[Variant]
+
+    @property
+    def best_value(self) -> float:
+        return max((v.value for v in self.variants), default=0.0)
+
+
+@dataclass
+class PackResult:
+    chosen: dict[str, Variant] = field(default_factory=dict)
+    used_tokens: int = 0
+    included_value: float = 0.0
+    dropped_value: float = 0.0
+    greedy_value: float = 0.0  # prefix walk in priority order, for comparison
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "items": len(self.chosen),
+            "summarized": sum(1 for v in self.chosen.values() if v.name != "full"),
+            "used_tokens": self.used_tokens,
+            "included_value": round(self.included_value, 2),
+            "dropped_value": round(self.dropped_value, 2),
+            "greedy_value": round(self.greedy_value, 2),
+        }
+
+
+def _hull(variants: list[Variant]) -> list[Variant]:
+    """Variants on the upper convex hull of (cost, value), cheapest first.
+
+    Starts from an implicit "skip" point at (0, 0); dominated variants (more
+    cost for no more value) and LP-dominated ones are dropped.
+    """
+    points = sorted(
+        (v for v in variants if v.cost >= 0 and v.value > 0),
+        key=lambda v: (v.cost, -v.value),
+    )
+    hull: list[Variant] = []
+    for v in points:
+        if hull and v.value <= hull[-1].value:
+            continue  # dominated
+        while hull:
+            prev_cost = hull[-2].cost if len(hull) > 1 else 0
+            prev_value = hull[-2].value if len(hull) > 1 else 0.0
+            last = hull[-1]
+            # Drop ``last`` if it lies under the segment prev -> v.
+            if (last.value - prev_value) * (v.cost - prev_cost) <= (
+                v.value - prev_value
+            ) * (last.cost - prev_cost):
+                hull.pop()
+            else:
+                break
+        hull.append(v)
+    return hull
+
+
+def _greedy_prefix(
+    items: list[PackItem], budget: int
+) -> tuple[list[Variant | None], int]:
+    """The old strategy: walk in order, full if it fits, else best fit and stop."""
+    chosen: list[Variant | None] = [None] * len(items)
+    used = 0
+    for i, item in enumerate(items):
+        full = max(item.variants, key=lambda v: v.value, default=None)
+        if full is None:
+            continue
+        if used + full.cost <= budget:
+            used += full.cost
+            chosen[i] = full
+            continue
+        fallback = [
+            v for v in item.variants if v is not full and used + v.cost <= budget
+        ]
+        if fallback:
+            pick = max(fallback, key=lambda v: v.value)
+            chosen[i] = pick
+            used += pick.cost
+        break
+    return chosen, used
+
+
+def _value(chosen: list[Variant | None]) -> float:
+    return sum(v.value for v in chosen if v is not None)
+
+
+def pack(items: list[PackItem], budget: int) -> PackResult:
+    """Pick at most one variant per item maximizing value within ``budget``."""
+    result = PackResult()
+    if budget <= 0 or not items:
+        result.dropped_value = sum(i.best_value for i in items)
+        return result
+
+    # Incremental steps along each item's hull, in decreasing efficiency.
+    steps: list[tuple[float, int, int]] = []  # (-efficiency, item index, hull index)
+    hulls = [_hull(item.variants) for item in items]
+    for i, hull in enumerate(hulls):
+        prev_cost, prev_value = 0, 0.0
+        for j, v in enumerate(hull):
+            d_cost = max(v.cost - prev_cost, 0)
+            d_value = v.value - prev_value
+            efficiency = d_value / d_cost if d_cost else float("inf")
+            steps.append((-efficiency, i, j))
+            prev_cost, prev_value = v.cost, v.value
+    steps.sort(key=lambda s: (s[0], s[1], s[2]))
+
+    level = [-1] * len(items)  # chosen hull index per item, -1 = skipped
+    frozen = [False] * len(items)
+    used = 0
+    for _, i, j in steps:
+        if frozen[i] or j != level[i] + 1:
+            continue
+        current = hulls[i][level[i]].cost if level[i] >= 0 else 0
+        new = hulls[i][j]
+        if used - current + new.cost <= budget:
+            used += new.cost - current
+            level[i] = j
+        else:
+            frozen[i] = True
+
+    chosen: list[Variant | None] = [
+        hulls[i][level[i]] if level[i] >= 0 else None for i in range(len(items))
+    ]
+
+    # Fill pass: spend what's left on the best-value upgrade that still fits
+    # (an item frozen above may fit a cheaper non-hull variant).
+    while True:
+        best: tuple[float, int, Variant] | None = None
+        for i, item in enumerate(items):
+            cur = chosen[i]
+            cur_cost, cur_value = (cur.cost, cur.value) if cur else (0, 0.0)
+            for v in item.variants:
+                if v.value > cur_value and used - cur_cost + v.cost <= budget:
+                    gain = v.value - cur_value
+                    if best is None or gain > best[0]:
+                        best = (gain, i, v)
+        if best is None:
+            break
+        _, i, v = best
+        prev = chosen[i]
+        used += v.cost - (prev.cost if prev else 0)
+        chosen[i] = v
+
+    # Hull-greedy has no worst-case guarantee; never do worse than the
+    # priority-order walk it replaces.
+    baseline, baseline_used = _greedy_prefix(items, budget)
+    result.greedy_value = _value(baseline)
+    if result.greedy_value > _value(chosen):
+        chosen, used = baseline, baseline_used
+
+    for item, picked in zip(items, chosen, strict=True):
+        if picked is not None:
+            result.chosen[item.key] = picked
+            result.included_value += picked.value
+            result.dropped_value += item.best_value - picked.value
+        else:
+            result.dropped_value += item.best_value
+    result.used_tokens = used
+    return result
@@ -0,0 +1,229 @@
+"""Token-budgeted conversation history with rolling summaries.
+
+The history sent with each prompt is chosen by token count, not message count:
+
+- Recent turns are kept verbatim. The window start stays put while the
+  verbatim span fits the budget and, once it doesn't, jumps forward far enough
+  to leave ``keep_ratio`` of the budget free. Between jumps each prompt is the
+  previous one plus the new messages, so prefix-caching servers keep reusing
+  their KV cache.
+- Turns that fall out of the window are folded into a rolling summary. The
+  summary is produced in the background by the local model (the caller supplies
+  the ``Summarizer``) and cached by the content it covers, so building a prompt
+  never waits on it. Until a fold finishes, the evicted turns are represented
+  by a short extractive digest.
+- The summary text handed out for prompts changes only when the window jumps.
+  A fold that lands between jumps is held back until the next one, which
+  rewrites the prompt from the summary onwards anyway; otherwise every fold
+  would invalidate the cached history that follows the summary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .llm_client import ChatMessage
+from .token_counter import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+# (previous_summary, newly evicted messages) -> updated summary, or None on failure.
+Summarizer = Callable[[str, list[ChatMessage]], Awaitable[str | None]]
+
+_MESSAGE_OVERHEAD = 4  # formatting tokens per chat message
+_DIGEST_CHARS = 160  # per evicted message while its summary is pending
+
+SUMMARY_PROMPT = (
+    "Update the running summary of an earlier part of a coding conversation. "
+    "Keep decisions made, files and symbols discussed, open questions and the "
+    "user's stated goals; drop pleasantries and code the assistant already "
+    "wrote. Reply with the updated summary only, as terse bullet points."
+)
+
+
+def render_for_summary(previous: str, messages: list[ChatMessage]) -> str:
+    """The user-turn text a ``Summarizer`` sends to the model."""
+    turns = "\n\n".join(f"{m.role.upper()}: {m.content}" for m in messages)
+    if previous:
+        return f"Current summary:\n{previous}\n\nNew turns to fold in:\n{turns}"
+    return f"Turns to summarize:\n{turns}"
+
+
+def _digest(message: ChatMessage) -> str:
+    line = " ".join(message.content.split())
+    if len(line) > _DIGEST_CHARS:
+        line = line[:_DIGEST_CHARS] + "…"
+    return f"- {message.role}: {line}"
+
+
+class ConversationWindow:
+    """Chooses the history for a prompt and maintains the rolling summary."""
+
+    def __init__(
+        self,
+        budget_tokens: int = 4096,
+        *,
+        keep_ratio: float = 0.6,
+        min_recent: int = 2,
+        summary_tokens: int = 512,
+        model: str = "default",
+    ) -> None:
+        """
+        Args:
+            budget_tokens: Tokens available for history (summary included).
+            keep_ratio: Share of the budget left in use right after a jump.
+            min_recent: Messages always kept verbatim, even over budget.
+            summary_tokens: Budget reserved for the summary once one exists.
+            model: Model name for token counting.
+        """
+        self.budget_tokens = budget_tokens
+        self.keep_ratio = keep_ratio
+        self.min_recent = min_recent
+        self.summary_tokens = summary_tokens
+        self.counter = TokenCounter(model=model, cache_size=1024)
+        self._start = 0
+        # Rolling summary of history[:_summary_upto].
+        self._summary = ""
+        self._summary_upto = 0
+        self._summaries: dict[str, str] = {}
+        # Summary text last handed out, and the window start it was built for.
+        self._shown = ""
+        self._shown_start = 0
+        self._task: asyncio.Task[None] | None = None
+        self.folds = 0
+        self.jumps = 0
+
+    # -- token accounting ------------------------------------------------- #
+
+    def _tokens(self, message: ChatMessage) -> int:
+        return self.counter.count(message.content) + _MESSAGE_OVERHEAD
+
+    def _history_budget(self) -> int:
+        reserve = self.summary_tokens if self._summary or self._start else 0
+        return max(self.budget_tokens - reserve, 0)
+
+    # -- window ----------------------------------------------------------- #
+
+    def history_start(self, history: list[ChatMessage]) -> int:
+        """Index of the first message kept verbatim (moves only in jumps)."""
+        if len(history) < self._start or len(history) < self._summary_upto:
+            self.reset()  # conversation was cleared
+        budget = self._history_budget()
+        sizes = [self._tokens(m) for m in history[self._start :]]
+        used = sum(sizes)
+        if used <= budget:
+            return self._start
+
+        target = int(budget * self.keep_ratio)
+        latest = max(len(history) - self.min_recent, self._start)
+        start = self._start
+        while start < latest and used > target:
+            used -= sizes[start - self._start]
+            start += 1
+        # Begin on a user message so the window never opens mid-exchange.
+        while start < latest and history[start].role != "user":
+            start += 1
+        if start != self._start:
+            self.jumps += 1
+            logger.debug(f"History window jumped {self._start} -> {start}")
+        self._start = start
+        return start
+
+    def select(
+        self, history: list[ChatMessage], summarizer: Summarizer | None = None
+    ) -> tuple[str, list[ChatMessage]]:
+        """Return ``(summary, recent_messages)`` for the next prompt.
+
+        ``summary`` covers everything before the verbatim window (empty when
+        nothing has been evicted) and is the same text until the window jumps
+        again. When a ``summarizer`` is given and evicted turns are not yet
+        folded in, a background fold is started; it needs a running event loop
+        and is skipped otherwise.
+        """
+        start = self.history_start(history)
+        if start > self._summary_upto and summarizer is not None:
+            self._schedule_fold(history[self._summary_upto : start], start, summarizer)
+        if start != self._shown_start:
+            self._shown = self.summary_text(history[:start])
+            self._shown_start = start
+        return self._shown, history[start:]
+
+    def summary_text(self, evicted: list[ChatMessage]) -> str:
+        """The rolling summary plus a digest of evicted turns not yet folded."""
+        pending = evicted[self._summary_upto :]
+        parts = [self._summary] if self._summary else []
+        if pending:
+            parts.append("\n".join(_digest(m) for m in pending))
+        return "\n".join(parts)
+
+    # -- background summarization ----------------------------------------- #
+
+    @staticmethod
+    def _cache_key(previous: str, messages: list[ChatMessage]) -> str:
+        digest = hashlib.sha1(previous.encode())
+        for m in messages:
+            digest.update(f"\0{m.role}\0{m.content}".encode())
+        return digest.hexdigest()
+
+    def _schedule_fold(
+        self, messages: list[ChatMessage], upto: int, summarizer: Summarizer
+    ) -> None:
+        if self._task is not None and not self._task.done():
+            return  # one fold at a time; the next select() picks up the rest
+        key = self._cache_key(self._summary, messages)
+        if key in self._summaries:
+            self._apply(self._summaries[key], upto)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._fold(messages, upto, key, summarizer))
+
+    async def _fold(
+        self, messages: list[ChatMessage], upto: int, key: str, summarizer: Summarizer
+    ) -> None:
+        previous_upto = self._summary_upto
+        try:
+            summary = await summarizer(self._summary, messages)
+        except Exception as e:  # a failed fold keeps the digest; never breaks a turn
+            logger.debug(f"History summarization failed: {e}")
+            return
+        if not summary or self._summary_upto != previous_upto:
+            return  # failed, or the conversation was reset meanwhile
+        self._summaries[key] = summary.strip()
+        self._apply(summary.strip(), upto)
+
+    def _apply(self, summary: str, upto: int) -> None:
+        self._summary = summary
+        self._summary_upto = upto
+        self.folds += 1
+
+    async def wait_idle(self) -> None:
+        """Wait for an in-flight summary fold (used at shutdown and in tests)."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def reset(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._start = 0
+        self._summary = ""
+        self._summary_upto = 0
+        self._shown = ""
+        self._shown_start = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "budget_tokens": self.budget_tokens,
+            "window_start": self._start,
+            "summarized_messages": self._summary_upto,
+            "summary_chars": len(self._summary),
+            "folds": self.folds,
+            "jumps": self.jumps,
+        }
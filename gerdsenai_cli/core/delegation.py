@@ -62,6 +62,12 @@ async def run_delegation(agent: Agent, task: str, *, depth: int, max_depth: int)
     # The child registry includes the delegate tool only while still below the
     # cap, so a sub-agent at max depth cannot spawn another.
     child_registry = build_default_registry(agent, delegation_depth=depth)
+    # Share the parent's tool-result cache so the child doesn't repeat its reads
+    # (and the child's edits invalidate the parent's stale entries), and its
+    # observation store so handles in the parent's context stay fetchable.
+    parent_registry = agent._get_tool_registry()
+    child_registry.result_cache = parent_registry.result_cache
+    child_registry.observations = parent_registry.observations
     messages = agent._prepare_llm_messages(task)
     max_iter = int(agent.settings.get_preference("agent_loop_max_iterations", 10))
 
@@ -0,0 +1,400 @@
+"""Persisted module dependency graph (who imports whom).
+
+Replaces per-call regex scanning in ``ProactiveContextBuilder``: imports are
+parsed once per file change and stored as forward edges (file -> files it
+imports) with reverse edges (file -> files importing it) derived on load, so
+"pull in the neighbours of X" is a graph lookup instead of a re-parse.
+
+Resolution:
+- Python: ``ast``-based, absolute and relative (``from .x import y``) imports,
+  ``pkg/__init__.py`` packages, and package roots (the project root, ``src/``,
+  and the directory above a file's outermost package).
+- JS/TS: ``import``/``export ... from``/``require()``/dynamic ``import()``;
+  relative specifiers with extension and ``index.*`` probing, plus bare
+  specifiers under ``baseUrl`` from ``tsconfig.json``/``jsconfig.json``.
+  Unresolvable (third-party) imports are ignored.
+
+The graph is saved next to the vector-index manifests and keyed per file on
+``(mtime, size)``; :meth:`DependencyGraph.refresh` re-parses only what changed.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .repo_index import _IGNORE_DIRS, collection_name_for
+
+logger = logging.getLogger(__name__)
+
+_GRAPH_VERSION = 1
+_MAX_FILE_BYTES = 1_000_000
+
+_PY_EXTS = {".py", ".pyi"}
+_JS_EXTS = (".ts", ".tsx", ".d.ts", ".js", ".jsx", ".mjs", ".cjs")
+_JS_SUFFIXES = {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"}
+
+_JS_IMPORT_PATTERNS = [
+    re.compile(r"""^\s*import\s+(?:[\w*{}\s,$]+\s+from\s+)?['"]([^'"]+)['"]""", re.M),
+    re.compile(r"""^\s*export\s+(?:[\w*{}\s,$]+\s+)?from\s+['"]([^'"]+)['"]""", re.M),
+    re.compile(r"""\brequire\(\s*['"]([^'"]+)['"]\s*\)"""),
+    re.compile(r"""\bimport\(\s*['"]([^'"]+)['"]\s*\)"""),
+]
+
+
+@dataclass
+class _Node:
+    stamp: tuple[float, int]
+    imports: list[str] = field(default_factory=list)  # repo-relative paths
+
+
+def is_source_file(path: Path) -> bool:
+    """Whether the graph tracks imports for this file type."""
+    suffix = path.suffix.lower()
+    return suffix in _PY_EXTS or suffix in _JS_SUFFIXES
+
+
+class DependencyGraph:
+    """Forward/reverse import edges for a project, updated incrementally."""
+
+    def __init__(self, project_root: Path, cache_dir: Path | None = None) -> None:
+        self.project_root = project_root.resolve()
+        base = cache_dir or (Path.home() / ".config" / "gerdsenai-cli" / "index")
+        digest = collection_name_for(self.project_root).removeprefix("repo_")
+        self.cache_path = base / f"deps_{digest}.json"
+        self._nodes: dict[str, _Node] = {}
+        self._reverse: dict[str, set[str]] = {}
+        self._js_base_url: Path | None = None
+        self._loaded = False
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # -- persistence ----------------------------------------------------- #
+
+    def load(self) -> None:
+        """Load the persisted graph (once); a missing/corrupt file starts empty."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.cache_path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _GRAPH_VERSION:
+            return
+        for rel, raw in (data.get("files") or {}).items():
+            try:
+                stamp = (float(raw["stamp"][0]), int(raw["stamp"][1]))
+                imports = [str(i) for i in raw.get("imports", [])]
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            self._nodes[str(rel)] = _Node(stamp, imports)
+        self._rebuild_reverse()
+
+    def save(self) -> None:
+        """Persist the graph if anything changed since the last save."""
+        if not self._dirty:
+            return
+        payload = {
+            "version": _GRAPH_VERSION,
+            "files": {
+                rel: {"stamp": list(node.stamp), "imports": node.imports}
+                for rel, node in self._nodes.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(payload), encoding="utf-8")
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not persist dependency graph: {e}")
+
+    def _rebuild_reverse(self) -> None:
+        self._reverse = {}
+        for rel, node in self._nodes.items():
+            for dep in node.imports:
+                self._reverse.setdefault(dep, set()).add(rel)
+
+    # -- building -------------------------------------------------------- #
+
+    def _rel(self, path: Path) -> str | None:
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def iter_source_files(self) -> list[Path]:
+        """Python/JS/TS files under the root, skipping vendored/build dirs."""
+        files: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [
+                d for d in dirnames if d not in _IGNORE_DIRS and not d.startswith(".")
+            ]
+            for name in filenames:
+                path = Path(dirpath) / name
+                if is_source_file(path):
+                    files.append(path)
+        return files
+
+    def update_file(self, path: Path) -> bool:
+        """Re-parse ``path`` if its (mtime, size) changed. True if re-parsed."""
+        rel = self._rel(path)
+        if rel is None or not is_source_file(path):
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return self._drop(rel)
+        stamp = (st.st_mtime, st.st_size)
+        node = self._nodes.get(rel)
+        if node is not None and node.stamp == stamp:
+            return False
+        imports: list[str] = []
+        if st.st_size <= _MAX_FILE_BYTES:
+            try:
+                source = path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                source = ""
+            imports = self._resolve_imports(path.resolve(), source)
+        self._set_imports(rel, stamp, imports)
+        return True
+
+    def _set_imports(
+        self, rel: str, stamp: tuple[float, int], imports: list[str]
+    ) -> None:
+        old = self._nodes.get(rel)
+        for dep in old.imports if old else []:
+            importers = self._reverse.get(dep)
+            if importers is not None:
+                importers.discard(rel)
+        self._nodes[rel] = _Node(stamp, imports)
+        for dep in imports:
+            self._reverse.setdefault(dep, set()).add(rel)
+        self._dirty = True
+
+    def _drop(self, rel: str) -> bool:
+        node = self._nodes.pop(rel, None)
+        if node is None:
+            return False
+        for dep in node.imports:
+            importers = self._reverse.get(dep)
+            if importers is not None:
+                importers.discard(rel)
+        self._dirty = True
+        return True
+
+    def refresh(self, paths: list[Path] | None = None) -> int:
+        """Sync the graph with the working tree; returns files re-parsed.
+
+        ``paths`` defaults to a walk of the project. Files that disappeared are
+        dropped. Saves the graph when anything changed.
+        """
+        self.load()
+        files = paths if paths is not None else self.iter_source_files()
+        seen: set[str] = set()
+        reparsed = 0
+        for path in files:
+            rel = self._rel(path)
+            if rel is None or not is_source_file(path):
+                continue
+            seen.add(rel)
+            if self.update_file(path):
+                reparsed += 1
+        for rel in [r for r in self._nodes if r not in seen]:
+            self._drop(rel)
+        self.save()
+        return reparsed
+
+    # -- resolution ------------------------------------------------------ #
+
+    def _resolve_imports(self, path: Path, source: str) -> list[str]:
+        if path.suffix.lower() in _PY_EXTS:
+            targets = self._resolve_python(path, source)
+        else:
+            targets = self._resolve_js(path, source)
+        out: list[str] = []
+        for target in targets:
+            rel = self._rel(target)
+            if rel is not None and rel not in out and target != path:
+                out.append(rel)
+        return out
+
+    def _python_roots(self, path: Path) -> list[Path]:
+        roots = [self.project_root]
+        src = self.project_root / "src"
+        if src.is_dir():
+            roots.append(src)
+        # The directory above the file's outermost package is a package root.
+        top = path.parent
+        while (top / "__init__.py").exists() and top != self.project_root:
+            top = top.parent
+        if top not in roots:
+            roots.append(top)
+        return roots
+
+    @staticmethod
+    def _module_file(base: Path, parts: list[str]) -> Path | None:
+        target = base.joinpath(*parts) if parts else base
+        for candidate in (
+            target.with_name(target.name + ".py") if parts else None,
+            target / "__init__.py",
+            target.with_name(target.name + ".pyi") if parts else None,
+        ):
+            if candidate is not None and candidate.is_file():
+                return candidate
+        return None
+
+    def _resolve_python(self, path: Path, source: str) -> list[Path]:
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return []
+        roots: list[Path] | None = None
+        found: list[Path] = []
+
+        def resolve_absolute(dotted: str) -> Path | None:
+            nonlocal roots
+            if roots is None:
+                roots = self._python_roots(path)
+            parts = dotted.split(".")
+            for root in roots:
+                hit = self._module_file(root, parts)
+                if hit is not None:
+                    return hit
+            return None
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    hit = resolve_absolute(alias.name)
+                    if hit is not None:
+                        found.append(hit)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base = path.parent
+                    for _ in range(node.level - 1):
+                        base = base.parent
+                    mod_parts = node.module.split(".") if node.module else []
+                    module = self._module_file(base, mod_parts)
+                    pkg_dir = base.joinpath(*mod_parts)
+                    for alias in node.names:
+                        sub = self._module_file(pkg_dir, [alias.name])
+                        if sub is not None:
+                            found.append(sub)
+                        elif module is not None:
+                            found.append(module)
+                elif node.module:
+                    module = resolve_absolute(node.module)
+                    for alias in node.names:
+                        sub = resolve_absolute(f"{node.module}.{alias.name}")
+                        if sub is not None:
+                            found.append(sub)
+                        elif module is not None:
+                            found.append(module)
+        return found
+
+    def _js_roots(self) -> list[Path]:
+        if self._js_base_url is None:
+            self._js_base_url = self.project_root
+            for name in ("tsconfig.json", "jsconfig.json"):
+                try:
+                    raw = (self.project_root / name).read_text("utf-8")
+                except OSError:
+                    continue
+                # tsconfig allows comments; strip line comments before parsing.
+                raw = re.sub(r"^\s*//.*$", "", raw, flags=re.M)
+                try:
+                    base = json.loads(raw).get("compilerOptions", {}).get("baseUrl")
+                except (ValueError, AttributeError):
+                    base = None
+                if base:
+                    self._js_base_url = (self.project_root / base).resolve()
+                break
+        roots = [self._js_base_url]
+        src = self.project_root / "src"
+        if src.is_dir() and src not in roots:
+            roots.append(src)
+        return roots
+
+    @staticmethod
+    def _js_file(target: Path) -> Path | None:
+        if target.is_file():
+            return target
+        for ext in _JS_EXTS:
+            candidate = target.with_name(target.name + ext)
+            if candidate.is_file():
+                return candidate
+        if target.is_dir():
+            for ext in _JS_EXTS:
+                candidate = target / f"index{ext}"
+                if candidate.is_file():
+                    return candidate
+        return None
+
+    def _resolve_js(self, path: Path, source: str) -> list[Path]:
+        found: list[Path] = []
+        for pattern in _JS_IMPORT_PATTERNS:
+            for spec in pattern.findall(source):
+                if spec.startswith("."):
+                    hit = self._js_file((path.parent / spec).resolve())
+                else:
+                    hit = None
+                    for root in self._js_roots():
+                        hit = self._js_file(root / spec.removeprefix("@/"))
+                        if hit is not None:
+                            break
+                if hit is not None:
+                    found.append(hit)
+        return found
+
+    # -- queries --------------------------------------------------------- #
+
+    def dependencies(self, path: Path) -> list[Path]:
+        """Files ``path`` imports."""
+        rel = self._rel(path)
+        node = self._nodes.get(rel) if rel else None
+        return [self.project_root / dep for dep in node.imports] if node else []
+
+    def dependents(self, path: Path) -> list[Path]:
+        """Files that import ``path``."""
+        rel = self._rel(path)
+        importers = self._reverse.get(rel, set()) if rel else set()
+        return [self.project_root / r for r in sorted(importers)]
+
+    def neighbors(
+        self, path: Path, max_hops: int = 2, include_dependents: bool = True
+    ) -> list[tuple[Path, int]]:
+        """Files within ``max_hops`` import edges of ``path``, nearest first.
+
+        Breadth-first over forward edges (and reverse edges when
+        ``include_dependents``); within a hop, imports come before importers.
+        """
+        start = self._rel(path)
+        if start is None:
+            return []
+        seen = {start}
+        result: list[tuple[Path, int]] = []
+        queue: deque[tuple[str, int]] = deque([(start, 0)])
+        while queue:
+            rel, hops = queue.popleft()
+            if hops >= max_hops:
+                continue
+            node = self._nodes.get(rel)
+            nxt = list(node.imports) if node else []
+            if include_dependents:
+                nxt += sorted(self._reverse.get(rel, ()))
+            for other in nxt:
+                if other in seen:
+                    continue
+                seen.add(other)
+                result.append((self.project_root / other, hops + 1))
+                queue.append((other, hops + 1))
+        return result
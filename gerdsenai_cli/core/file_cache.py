@@ -0,0 +1,127 @@
+"""Shared, size-bounded cache of decoded file contents.
+
+Every context builder (``ProjectContext``, ``ProactiveContextBuilder``) reads
+through one :class:`FileContentCache`, so a file pulled in by several of them in
+the same turn is read and decoded once. Entries are validated against a fresh
+``stat`` on every lookup (mtime + size), so edits are picked up immediately,
+and the cache is an LRU bounded by total characters held, so memory stays flat
+on large repositories. Disk I/O runs in a worker thread, never on the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CHARS = 32 * 1024 * 1024
+_ENCODINGS = ("utf-8", "utf-8-sig", "latin-1", "cp1252")
+
+
+@dataclass(frozen=True)
+class _Entry:
+    mtime_ns: int
+    size: int
+    content: str
+    encoding: str
+
+
+def _decode_file(path: Path) -> tuple[str, str]:
+    """Read ``path`` and decode it with the first encoding that works."""
+    raw = path.read_bytes()
+    for encoding in _ENCODINGS:
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return raw.decode("utf-8", errors="ignore"), "utf-8-with-errors"
+
+
+class FileContentCache:
+    """LRU of file contents keyed by resolved path, bounded by total chars."""
+
+    def __init__(self, max_chars: int = _DEFAULT_MAX_CHARS) -> None:
+        self.max_chars = max_chars
+        self._cache: LRUCache = LRUCache(
+            maxsize=max_chars, getsizeof=lambda entry: max(1, len(entry.content))
+        )
+        self.hits = 0
+        self.misses = 0
+
+    async def read(self, path: Path) -> str | None:
+        """Current content of ``path``, or None if it can't be read."""
+        content, _ = await self.lookup(path)
+        return content
+
+    async def lookup(self, path: Path) -> tuple[str | None, bool]:
+        """Like :meth:`read`, also reporting whether it was a cache hit."""
+        key = str(path.resolve())
+        try:
+            st = await asyncio.to_thread(path.stat)
+        except OSError:
+            self._cache.pop(key, None)
+            return None, False
+
+        entry: _Entry | None = self._cache.get(key)
+        if (
+            entry is not None
+            and entry.mtime_ns == st.st_mtime_ns
+            and entry.size == st.st_size
+        ):
+            self.hits += 1
+            return entry.content, True
+
+        self.misses += 1
+        try:
+            content, encoding = await asyncio.to_thread(_decode_file, path)
+        except OSError as e:
+            logger.debug(f"Could not read {path}: {e}")
+            self._cache.pop(key, None)
+            return None, False
+
+        try:
+            self._cache[key] = _Entry(st.st_mtime_ns, st.st_size, content, encoding)
+        except ValueError:
+            # Larger than the whole cache: serve it, don't keep it.
+            self._cache.pop(key, None)
+        return content, False
+
+    def encoding_of(self, path: Path) -> str | None:
+        """Encoding the cached content of ``path`` was decoded with."""
+        entry: _Entry | None = self._cache.get(str(path.resolve()))
+        return entry.encoding if entry else None
+
+    def invalidate(self, path: Path) -> None:
+        self._cache.pop(str(path.resolve()), None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._cache),
+            "chars": int(self._cache.currsize),
+            "max_chars": self.max_chars,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global cache instance
+_global_cache: FileContentCache | None = None
+
+
+def get_file_cache() -> FileContentCache:
+    """Get or create the process-wide file content cache."""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = FileContentCache()
+    return _global_cache
@@ -0,0 +1,156 @@
+"""Structural summaries of source files that don't fit the context budget.
+
+Instead of keeping the first/last N lines of an oversized file, emit an outline:
+module docstring, imports, constants, and every class/function signature with
+its first docstring line and line number. That keeps the part of a big file an
+LLM actually navigates by at a fraction of the tokens.
+
+Python is outlined with ``ast``; JS/TS, Go and Rust reuse the symbol index's
+declaration patterns. Outlines are built at decreasing levels of detail until
+one fits the budget. Returns None for content with no recognisable structure
+(prose, data files), where callers fall back to plain truncation.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from .symbol_index import (
+    _DEF_PATTERNS,
+    _class_signature,
+    _python_signature,
+    language_for,
+)
+
+# Detail levels, most to least verbose.
+_FULL, _NO_DOCS, _TOP_LEVEL = 0, 1, 2
+
+_PY_DEF_LINE = re.compile(r"^\s*(?:async\s+def|def|class)\s+\w+")
+_IMPORT_LINE = re.compile(
+    r"^\s*(?:import\s|export\s+\*|from\s|use\s|package\s|#include\b|const\s+\w+\s*=\s*require\()"
+)
+
+
+def _first_line(doc: str | None) -> str:
+    if not doc:
+        return ""
+    line = doc.strip().splitlines()[0].strip()
+    return line[:160]
+
+
+def _python_outline(source: str, level: int) -> tuple[list[str], int]:
+    """Outline lines and the number of definitions found."""
+    tree = ast.parse(source)
+    out: list[str] = []
+    definitions = 0
+
+    module_doc = _first_line(ast.get_docstring(tree))
+    if module_doc and level < _TOP_LEVEL:
+        out.append(f'"""{module_doc}"""')
+
+    def emit(body: list[ast.stmt], depth: int) -> None:
+        nonlocal definitions
+        pad = "    " * depth
+        skipped = 0
+        for node in body:
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+                definitions += 1
+                if depth and level >= _TOP_LEVEL:
+                    skipped += 1
+                    continue
+                if level == _FULL:
+                    for deco in node.decorator_list:
+                        out.append(f"{pad}@{ast.unparse(deco)}")
+                if isinstance(node, ast.ClassDef):
+                    out.append(f"{pad}{_class_signature(node)}:  # L{node.lineno}")
+                else:
+                    out.append(f"{pad}{_python_signature(node)}: ...  # L{node.lineno}")
+                doc = _first_line(ast.get_docstring(node))
+                if doc and level == _FULL:
+                    out.append(f'{pad}    """{doc}"""')
+                if isinstance(node, ast.ClassDef):
+                    emit(node.body, depth + 1)
+            elif depth == 0 and isinstance(node, ast.Import | ast.ImportFrom):
+                if level < _TOP_LEVEL:
+                    out.append(ast.unparse(node))
+            elif isinstance(node, ast.Assign | ast.AnnAssign) and level < _TOP_LEVEL:
+                text = ast.unparse(node).splitlines()[0]
+                out.append(f"{pad}{text[:120]}")
+        if skipped:
+            out.append(f"{pad}# ... {skipped} member(s) omitted")
+
+    emit(tree.body, 0)
+    return out, definitions
+
+
+def _regex_outline(source: str, language: str, level: int) -> tuple[list[str], int]:
+    if language == "python":
+        patterns, marker = [_PY_DEF_LINE], "#"
+    else:
+        patterns, marker = [p for p, _ in _DEF_PATTERNS.get(language, [])], "//"
+    out: list[str] = []
+    definitions = 0
+    for lineno, text in enumerate(source.splitlines(), start=1):
+        if any(p.match(text) for p in patterns):
+            definitions += 1
+            if level >= _TOP_LEVEL and text[:1].isspace():
+                continue
+            out.append(f"{text.rstrip().rstrip('{').rstrip()}  {marker} L{lineno}")
+        elif level < _TOP_LEVEL and _IMPORT_LINE.match(text):
+            out.append(text.rstrip())
+    return out, definitions
+
+
+def _outline(source: str, language: str, level: int) -> tuple[list[str], int]:
+    if language == "python":
+        try:
+            return _python_outline(source, level)
+        except (SyntaxError, ValueError, RecursionError):
+            # Half-edited Python: a line scan still finds defs and classes.
+            pass
+    return _regex_outline(source, language, level)
+
+
+def summarize_structure(
+    content: str,
+    max_tokens: int,
+    count_tokens: Callable[[str], int],
+    file_path: Path | None = None,
+) -> str | None:
+    """Outline ``content`` within ``max_tokens``, or None if it has no structure.
+
+    Without a ``file_path`` the content is tried as Python.
+    """
+    language = language_for(file_path) if file_path else "python"
+    if language is None:
+        return None
+    total_lines = content.count("\n") + 1
+
+    header = ""
+    lines: list[str] = []
+    for level in (_FULL, _NO_DOCS, _TOP_LEVEL):
+        lines, definitions = _outline(content, language, level)
+        if not definitions:
+            return None
+        header = (
+            f"# Structural outline of {total_lines} lines "
+            f"({definitions} definitions; bodies omitted)"
+        )
+        summary = "\n".join([header, *lines])
+        if count_tokens(summary) <= max_tokens:
+            return summary
+
+    # Even the top-level outline is too big: keep as many lines as fit.
+    kept = [header]
+    used = count_tokens(header)
+    for i, line in enumerate(lines):
+        cost = count_tokens(line) + 1
+        if used + cost > max_tokens:
+            kept.append(f"# ... {len(lines) - i} more outline lines")
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
@@ -0,0 +1,345 @@
+"""Local intent classifier that answers confident cases without an LLM call.
+
+LLM intent detection costs a full completion per turn, seconds on local
+hardware, yet many inputs ("show me main.py", "give me an overview of the
+project", "thanks!") are unambiguous. :class:`LocalIntentClassifier` is a
+small softmax (multinomial logistic) regression over keyword features —
+lower-cased words, word bigrams and a few shape flags such as "mentions a
+file" — trained in pure Python on a built-in seed set plus examples it learns
+from confident LLM verdicts and from the interpretations users pick when asked
+to clarify. Prediction is a sparse dot product, so it runs in microseconds;
+below ``threshold`` (or when too few of the input's features were seen in
+training) it abstains and the caller falls back to the LLM.
+
+The full fit runs once, off the event loop (:meth:`LocalIntentClassifier.warm`).
+After that, each learned example costs a few SGD steps on that example alone.
+
+Labels are the action names of the LLM intent prompt (``read_and_explain``,
+``whole_repo_analysis``, ``iterative_search``, ``edit_files``,
+``create_files``, ``chat``), so both paths produce the same kind of answer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_FILE_RE = re.compile(r"[\w./-]+\.[a-z0-9]{1,5}\b")
+_QUESTION_WORDS = frozenset(
+    {"what", "why", "how", "who", "when", "which", "is", "are", "can", "should"}
+)
+_MAX_LEARNED = 500
+
+# Seed examples in the style of tests/test_intent_detection_live.py.
+SEED_EXAMPLES: tuple[tuple[str, str], ...] = (
+    ("explain what agent.py does", "read_and_explain"),
+    ("show me the contents of main.py", "read_and_explain"),
+    ("what's in settings.py", "read_and_explain"),
+    ("read the file config.yaml", "read_and_explain"),
+    ("open utils/helpers.py and explain it", "read_and_explain"),
+    ("walk me through llm_client.py", "read_and_explain"),
+    ("display README.md", "read_and_explain"),
+    ("can you read pyproject.toml", "read_and_explain"),
+    ("look at the file tests/test_cli.py", "read_and_explain"),
+    ("what does the function in parser.py do", "read_and_explain"),
+    ("analyze this project", "whole_repo_analysis"),
+    ("give me an overview of the codebase", "whole_repo_analysis"),
+    ("summarize the project structure", "whole_repo_analysis"),
+    ("what is the architecture of this repo", "whole_repo_analysis"),
+    ("how is this project organized", "whole_repo_analysis"),
+    ("explain the overall structure of the repository", "whole_repo_analysis"),
+    ("describe the whole codebase", "whole_repo_analysis"),
+    ("analyze the entire repository", "whole_repo_analysis"),
+    ("give me a summary of this project", "whole_repo_analysis"),
+    ("where is the error handling implemented", "iterative_search"),
+    ("find all uses of the settings class", "iterative_search"),
+    ("search for TODO comments", "iterative_search"),
+    ("where do we call the api", "iterative_search"),
+    ("locate the function that parses arguments", "iterative_search"),
+    ("find where the config is loaded", "iterative_search"),
+    ("grep for logger usage", "iterative_search"),
+    ("which files import requests", "iterative_search"),
+    ("search the codebase for retry logic", "iterative_search"),
+    ("find the definition of the main entry point", "iterative_search"),
+    ("fix the bug in parser.py", "edit_files"),
+    ("add type hints to utils.py", "edit_files"),
+    ("refactor the login function in auth.py", "edit_files"),
+    ("update the version in pyproject.toml", "edit_files"),
+    ("change the timeout in settings.py to 30 seconds", "edit_files"),
+    ("rename the variable in main.py", "edit_files"),
+    ("modify config.py to read from the environment", "edit_files"),
+    ("remove the unused imports from agent.py", "edit_files"),
+    ("add error handling to the download function in client.py", "edit_files"),
+    ("create a new file called helpers.py", "create_files"),
+    ("write a test file for the parser", "create_files"),
+    ("make a new module for logging", "create_files"),
+    ("generate a dockerfile", "create_files"),
+    ("add a new file utils/strings.py with string helpers", "create_files"),
+    ("create a readme for this project", "create_files"),
+    ("scaffold a new cli command module", "create_files"),
+    ("write a github actions workflow file", "create_files"),
+    ("hello", "chat"),
+    ("hi there", "chat"),
+    ("thanks", "chat"),
+    ("thank you, that helps", "chat"),
+    ("what can you do", "chat"),
+    ("what is a python decorator", "chat"),
+    ("how do async generators work in general", "chat"),
+    ("explain the difference between a list and a tuple", "chat"),
+    ("good morning", "chat"),
+    ("who are you", "chat"),
+    ("ok sounds good", "chat"),
+    ("what is dependency injection", "chat"),
+)
+
+
+LABELS = frozenset(label for _, label in SEED_EXAMPLES)
+
+
+def features(text: str) -> list[str]:
+    """Keyword features of ``text``: words, bigrams and shape flags."""
+    lower = text.lower()
+    words = _WORD_RE.findall(_FILE_RE.sub(" ", lower))
+    feats = [f"w:{w}" for w in words]
+    feats += [f"b:{a}_{b}" for a, b in zip(words, words[1:], strict=False)]
+    if _FILE_RE.search(lower):
+        feats.append("has_file")
+    if words and words[0] in _QUESTION_WORDS:
+        feats.append("question")
+    if len(words) <= 3:
+        feats.append("short")
+    return list(dict.fromkeys(feats))
+
+
+_Model = tuple[dict[str, dict[str, float]], dict[str, float], set[str]]
+
+
+def _probabilities(
+    weights: dict[str, dict[str, float]], bias: dict[str, float], feats: list[str]
+) -> dict[str, float]:
+    scores = {
+        label: bias[label] + sum(w.get(f, 0.0) for f in feats)
+        for label, w in weights.items()
+    }
+    top = max(scores.values())
+    exps = {label: math.exp(s - top) for label, s in scores.items()}
+    total = sum(exps.values())
+    return {label: e / total for label, e in exps.items()}
+
+
+def _sgd_step(
+    weights: dict[str, dict[str, float]],
+    bias: dict[str, float],
+    feats: list[str],
+    target: str,
+    learning_rate: float,
+    l2: float,
+) -> None:
+    for label, p in _probabilities(weights, bias, feats).items():
+        grad = p - (1.0 if label == target else 0.0)
+        bias[label] -= learning_rate * grad
+        w = weights[label]
+        for f in feats:
+            old = w.get(f, 0.0)
+            w[f] = old - learning_rate * (grad + l2 * old)
+
+
+class LocalIntentClassifier:
+    """Softmax regression over keyword features, trained on seed + learned examples."""
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        *,
+        examples_path: Path | None = None,
+        epochs: int = 60,
+        learn_steps: int = 5,
+        learning_rate: float = 0.3,
+        l2: float = 1e-3,
+        min_known_features: int = 2,
+    ) -> None:
+        """
+        Args:
+            threshold: Minimum probability to answer locally.
+            examples_path: JSON file holding learned examples (loaded now,
+                written by :meth:`save`); None keeps them in memory only.
+            epochs: Training passes over the examples in the full fit.
+            learn_steps: SGD steps taken on each example learned after it.
+            learning_rate: SGD step size.
+            l2: L2 regularization strength.
+            min_known_features: Abstain when fewer input features were seen
+                in training (an unfamiliar phrasing).
+        """
+        self.threshold = threshold
+        self.examples_path = examples_path
+        self.epochs = epochs
+        self.learn_steps = learn_steps
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.min_known_features = min_known_features
+        self.enabled = True
+        self.learned: list[tuple[str, str]] = self._load()
+        self._weights: dict[str, dict[str, float]] = {}
+        self._bias: dict[str, float] = {}
+        self._vocab: set[str] = set()
+        self._trained = False
+        # Clarifications seen before the first fit, labelled once it is done.
+        self._pending: list[tuple[str, str]] = []
+        self.hits = 0
+        self.fallbacks = 0
+
+    # -- training --------------------------------------------------------- #
+
+    def _load(self) -> list[tuple[str, str]]:
+        if self.examples_path is None or not self.examples_path.exists():
+            return []
+        try:
+            data = json.loads(self.examples_path.read_text(encoding="utf-8"))
+            return [
+                (str(t), str(label))
+                for t, label in data.get("examples", [])
+                if label in LABELS
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to load learned intent examples: {e}")
+            return []
+
+    def save(self) -> None:
+        """Persist learned examples to ``examples_path`` (if set)."""
+        if self.examples_path is None or not self.learned:
+            return
+        try:
+            self.examples_path.parent.mkdir(parents=True, exist_ok=True)
+            self.examples_path.write_text(
+                json.dumps({"examples": self.learned[-_MAX_LEARNED:]}, indent=1),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save learned intent examples: {e}")
+
+    def learn(self, text: str, label: str) -> None:
+        """Add a confirmed example and, once fitted, take a few steps on it."""
+        example = (text.strip(), label)
+        if not example[0] or label not in LABELS or example in self.learned:
+            return
+        self.learned.append(example)
+        del self.learned[:-_MAX_LEARNED]
+        if self._trained:
+            self._update(*example)
+
+    def learn_from_clarification(self, user_input: str, chosen: str) -> None:
+        """Learn ``user_input`` under the label of the interpretation picked for it.
+
+        ``chosen`` is the text of the interpretation the user selected (title,
+        description, example action). It is unambiguous where the input was
+        not, so the model labels it; a confident label becomes an example.
+        """
+        if not self._trained:
+            self._pending.append((user_input, chosen))
+            return
+        label, prob = self.predict(chosen)
+        if prob >= self.threshold:
+            self.learn(user_input, label)
+
+    def _update(self, text: str, label: str) -> None:
+        feats = features(text)
+        self._vocab.update(feats)
+        for _ in range(self.learn_steps):
+            _sgd_step(
+                self._weights, self._bias, feats, label, self.learning_rate, self.l2
+            )
+
+    def _fit(self, learned: list[tuple[str, str]]) -> _Model:
+        """Train from scratch on seed + ``learned``; touches no instance state."""
+        examples = [(features(t), label) for t, label in SEED_EXAMPLES]
+        examples += [(features(t), label) for t, label in learned]
+        labels = sorted({label for _, label in examples})
+        weights: dict[str, dict[str, float]] = {label: {} for label in labels}
+        bias = dict.fromkeys(labels, 0.0)
+        rng = random.Random(0)  # deterministic training order
+        for _ in range(self.epochs):
+            rng.shuffle(examples)
+            for feats, target in examples:
+                _sgd_step(weights, bias, feats, target, self.learning_rate, self.l2)
+        return weights, bias, {f for feats, _ in examples for f in feats}
+
+    def _install(self, model: _Model, fitted: list[tuple[str, str]]) -> None:
+        self._weights, self._bias, self._vocab = model
+        self._trained = True
+        seen = set(fitted)
+        for example in self.learned:  # learned while the fit was running
+            if example not in seen:
+                self._update(*example)
+        pending, self._pending = self._pending, []
+        for user_input, chosen in pending:
+            self.learn_from_clarification(user_input, chosen)
+
+    async def warm(self) -> None:
+        """Run the initial fit in a worker thread so it never blocks the loop."""
+        if self._trained:
+            return
+        learned = list(self.learned)
+        model = await asyncio.to_thread(self._fit, learned)
+        if not self._trained:
+            self._install(model, learned)
+
+    # -- prediction ------------------------------------------------------- #
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Most likely label and its probability (0.0 for unfamiliar input).
+
+        Fits synchronously if :meth:`warm` has not run yet.
+        """
+        if not self._trained:
+            learned = list(self.learned)
+            self._install(self._fit(learned), learned)
+        feats = features(text)
+        if sum(1 for f in feats if f in self._vocab) < self.min_known_features:
+            return "chat", 0.0
+        probs = _probabilities(self._weights, self._bias, feats)
+        label = max(probs, key=probs.__getitem__)
+        return label, probs[label]
+
+    def classify(self, text: str) -> tuple[str, float] | None:
+        """``(label, probability)`` when confident enough, else None.
+
+        The caller reports whether it used the answer via :meth:`record`.
+        """
+        if not self.enabled:
+            return None
+        label, prob = self.predict(text)
+        return (label, prob) if prob >= self.threshold else None
+
+    def record(self, hit: bool) -> None:
+        """Count a local answer (``hit``) or an LLM fallback; logs the hit rate."""
+        if hit:
+            self.hits += 1
+        else:
+            self.fallbacks += 1
+        logger.debug(
+            f"Local intent classifier hit rate {self.hit_rate:.0%} "
+            f"({self.hits}/{self.hits + self.fallbacks})"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.fallbacks
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "hit_rate": round(self.hit_rate, 3),
+            "learned_examples": len(self.learned),
+            "threshold": self.threshold,
+        }
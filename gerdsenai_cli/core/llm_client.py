@@ -11,7 +11,7 @@ import os
 import random
 import time
 from collections.abc import AsyncGenerator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 
 import httpx
@@ -20,7 +20,13 @@ from pydantic import BaseModel
 from ..config.settings import Settings
 from ..utils.display import show_error
 from ..utils.performance import measure_performance
+from ..utils.tracing import traced
 from .errors import GerdsenAIError, NetworkError, classify_exception
+from .model_residency import ModelResidencyManager
+from .providers.pool import PoolConfig, close_all_pools, configure_pools
+
+if TYPE_CHECKING:
+    from .tool_parsing import StreamEvent
 
 logger = logging.getLogger(__name__)
 
@@ -159,10 +165,11 @@ class LLMClient:
         self.settings = settings
         self.base_url = settings.llm_server_url.rstrip("/")
 
-        # Store client configuration (will be used to create client in async context)
-        self._limits = httpx.Limits(
-            max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0
-        )
+        # Store client configuration (will be used to create client in async context).
+        # Provider clients share the same pool limits.
+        self._pool_config = PoolConfig.from_settings(settings)
+        configure_pools(self._pool_config)
+        self._limits = self._pool_config.limits
 
         # Use api_timeout from settings, fallback to default if not set
         self._default_timeout = getattr(
@@ -174,6 +181,8 @@ class LLMClient:
 
         self._is_connected = False
         self._available_models: list[ModelInfo] = []
+        # Ollama model pre-load / keep-alive; set once connect() finds Ollama
+        self.residency: ModelResidencyManager | None = None
         # Effective retry configuration (instance-scoped)
         # Use explicit None check to allow max_retries=0
         max_retries_from_settings = getattr(settings, "max_retries", None)
@@ -211,6 +220,7 @@ class LLMClient:
             headers=headers,
             follow_redirects=True,
             limits=self._limits,
+            http2=self._pool_config.use_http2,
         )
         return self
 
@@ -220,8 +230,11 @@ class LLMClient:
 
     async def close(self) -> None:
         """Close the HTTP client."""
+        if self.residency is not None:
+            await self.residency.close()
         if self.client is not None:
             await self.client.aclose()
+        await close_all_pools()
 
     def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized."""
@@ -388,6 +401,24 @@ class LLMClient:
         if last_exception:
             raise last_exception
 
+    def _enable_residency(self) -> None:
+        """Start managing model residency (the server speaks the Ollama API)."""
+        if self.residency is None:
+            self.residency = ModelResidencyManager(
+                self._ensure_client,
+                self.base_url,
+                keep_alive=getattr(self.settings, "ollama_keep_alive", "30m"),
+            )
+
+    def preload_models(self, models: list[tuple[str, str]]) -> None:
+        """Pre-load ``(model, role)`` pairs in the background (Ollama only)."""
+        if self.residency is not None:
+            self.residency.start([(m, r) for m, r in models if m])
+
+    def _keep_alive(self, model: str | None) -> None:
+        if self.residency is not None:
+            self.residency.touch(model)
+
     @measure_performance("health")
     async def connect(self) -> bool:
         """
@@ -442,6 +473,8 @@ class LLMClient:
                         )
                         logger.debug(f"Connection successful via {endpoint}")
                         self._is_connected = True
+                        if endpoint in ("/api/tags", "/api/version"):
+                            self._enable_residency()
                         return True
                     else:
                         logger.debug(f"Non-200 status code: {response.status_code}")
@@ -668,6 +701,7 @@ class LLMClient:
                 response.raise_for_status()
 
                 data = response.json()
+                self._keep_alive(current_model)
                 return self._parse_chat_response(data)
 
             except httpx.HTTPStatusError as e:
@@ -802,6 +836,7 @@ class LLMClient:
                 url, json=request_data.to_payload(), timeout=timeout
             )
             response.raise_for_status()
+            self._keep_alive(current_model)
             return self._parse_tool_calls(response.json())
 
         try:
@@ -813,6 +848,85 @@ class LLMClient:
             self._handle_failure("Tool chat request", e)
             return ChatResult()
 
+    @traced("llm.stream_chat_with_tools", "llm")
+    async def stream_chat_with_tools(
+        self,
+        messages: list[ChatMessage],
+        tools: list[dict[str, Any]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncGenerator["StreamEvent", None]:
+        """Streaming counterpart of :meth:`chat_with_tools`.
+
+        Yields :class:`~.tool_parsing.StreamEvent` s as the server's SSE deltas
+        arrive: answer text and reasoning as they stream, each tool call as soon
+        as its arguments are complete (OpenAI ``tool_calls`` deltas or Hermes
+        ``<tool_call>`` tags), and a final "done" event carrying the whole turn
+        as a :class:`ChatResult`. A failure only ends the stream, logged at debug
+        level: a stream that ends without a "done" event means the turn failed,
+        and the agent loop retries it with a buffered request, which reports
+        its own errors.
+        """
+        from .tool_parsing import StreamingToolParser
+
+        try:
+            current_model = model or self.settings.current_model
+            if not current_model:
+                available = await self.list_models()
+                if available:
+                    current_model = available[0].id
+                else:
+                    logger.debug("Streaming tool chat: no model available")
+                    return
+
+            request_data = ChatCompletionRequest(
+                model=current_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                tools=tools or None,
+            )
+            url = self._get_endpoint("/v1/chat/completions")
+            parser = StreamingToolParser()
+
+            async with self._ensure_client().stream(
+                "POST", url, json=request_data.to_payload()
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data_str = line[6:]
+                    if data_str.strip() == "[DONE]":
+                        break
+                    try:
+                        data = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        continue
+
+                    choices = data.get("choices") or []
+                    if not choices:
+                        continue
+                    delta = choices[0].get("delta") or {}
+                    reasoning = delta.get("reasoning_content") or delta.get("reasoning")
+                    for event in parser.feed_reasoning(reasoning or ""):
+                        yield event
+                    for event in parser.feed_text(delta.get("content") or ""):
+                        yield event
+                    for event in parser.feed_tool_calls(delta.get("tool_calls") or []):
+                        yield event
+
+            self._keep_alive(current_model)
+            for event in parser.finish():
+                yield event
+
+        except Exception as e:
+            logger.debug(f"Streaming tool chat request failed: {e}")
+
+    @traced("llm.stream_chat", "llm")
     async def stream_chat(
         self,
         messages: list[ChatMessage],
@@ -886,6 +1000,8 @@ class LLMClient:
                             # Skip invalid JSON lines
                             continue
 
+            self._keep_alive(current_model)
+
         except Exception as e:
             self._handle_failure("Streaming chat request", e)
 
@@ -0,0 +1,189 @@
+"""Keep Ollama models resident so the first token doesn't pay a cold load.
+
+Ollama unloads a model ``keep_alive`` after its last request (5 minutes by
+default), and requests through the OpenAI-compatible endpoint reset that timer
+to the server default. :class:`ModelResidencyManager` therefore:
+
+- pre-loads the chat model (and the embedding model, when vector indexing is
+  on) in the background at startup via the native API's empty-prompt load,
+- re-asserts the configured ``keep_alive`` after each completion while the
+  session is active (one tiny request, coalesced per model),
+- reads ``/api/ps`` for the ``/status`` view of what is actually loaded.
+
+Servers without the native Ollama API (LM Studio, vLLM, ...) are detected on
+the first call and the manager turns into a no-op.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Loading a large model from disk can take minutes.
+_LOAD_TIMEOUT = 600.0
+_PS_TIMEOUT = 5.0
+
+
+@dataclass
+class ModelResidency:
+    """Load state of one model as last observed."""
+
+    model: str
+    role: str  # "chat" | "embedding"
+    state: str = "unknown"  # unknown | loading | loaded | unloaded | failed
+    load_seconds: float | None = None
+    expires_at: str | None = None
+    error: str = ""
+
+
+class ModelResidencyManager:
+    """Pre-loads and keeps alive models on an Ollama server."""
+
+    def __init__(
+        self,
+        client_getter: Callable[[], httpx.AsyncClient],
+        base_url: str,
+        keep_alive: str = "30m",
+    ) -> None:
+        self._client_getter = client_getter
+        self.base_url = base_url.rstrip("/")
+        self.keep_alive = keep_alive
+        self.supported: bool | None = None  # None until the first native call
+        self.models: dict[str, ModelResidency] = {}
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._touching: set[str] = set()
+
+    def _track(self, model: str, role: str) -> ModelResidency:
+        entry = self.models.get(model)
+        if entry is None:
+            entry = self.models[model] = ModelResidency(model=model, role=role)
+        return entry
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def preload(self, model: str, role: str = "chat") -> bool:
+        """Load ``model`` into memory now (no-op if already resident)."""
+        if self.supported is False or not model:
+            return False
+        entry = self._track(model, role)
+        entry.state = "loading"
+        started = time.perf_counter()
+        client = self._client_getter()
+        try:
+            if role == "embedding":
+                response = await client.post(
+                    f"{self.base_url}/api/embed",
+                    json={"model": model, "input": "", "keep_alive": self.keep_alive},
+                    timeout=_LOAD_TIMEOUT,
+                )
+                if response.status_code == 404 and "model" not in response.text:
+                    # Pre-0.3 Ollama: only the legacy embeddings endpoint.
+                    response = await client.post(
+                        f"{self.base_url}/api/embeddings",
+                        json={
+                            "model": model,
+                            "prompt": "",
+                            "keep_alive": self.keep_alive,
+                        },
+                        timeout=_LOAD_TIMEOUT,
+                    )
+            else:
+                response = await client.post(
+                    f"{self.base_url}/api/generate",
+                    json={"model": model, "keep_alive": self.keep_alive},
+                    timeout=_LOAD_TIMEOUT,
+                )
+        except httpx.HTTPError as e:
+            entry.state, entry.error = "failed", str(e) or type(e).__name__
+            logger.debug(f"Pre-loading {model} failed: {e}")
+            return False
+
+        if response.status_code == 404 and self.supported is None:
+            if "model" not in response.text:
+                # No native Ollama API here; nothing to manage.
+                self.supported = False
+                self.models.clear()
+                return False
+        if response.status_code != 200:
+            entry.state = "failed"
+            entry.error = f"HTTP {response.status_code}: {response.text[:120]}"
+            return False
+
+        self.supported = True
+        entry.state = "loaded"
+        entry.error = ""
+        entry.load_seconds = time.perf_counter() - started
+        logger.info(f"Model {model} resident ({entry.load_seconds:.1f}s)")
+        return True
+
+    def start(self, models: list[tuple[str, str]]) -> None:
+        """Pre-load ``(model, role)`` pairs in the background, one at a time."""
+
+        async def _run() -> None:
+            for model, role in models:
+                await self.preload(model, role)
+
+        if models:
+            self._spawn(_run())
+
+    def touch(self, model: str | None) -> None:
+        """Re-assert ``keep_alive`` for ``model`` after it served a request.
+
+        Completions through ``/v1`` reset Ollama's unload timer to the server
+        default; this puts the configured one back. Coalesced per model.
+        """
+        if not model or self.supported is False or model in self._touching:
+            return
+        entry = self.models.get(model)
+        role = entry.role if entry else "chat"
+
+        async def _run() -> None:
+            try:
+                await self.preload(model, role)
+            finally:
+                self._touching.discard(model)
+
+        self._touching.add(model)
+        self._spawn(_run())
+
+    async def refresh(self) -> list[ModelResidency]:
+        """Update states from ``/api/ps`` and return them."""
+        if self.supported is False:
+            return []
+        try:
+            response = await self._client_getter().get(
+                f"{self.base_url}/api/ps", timeout=_PS_TIMEOUT
+            )
+            response.raise_for_status()
+            running = {m.get("name"): m for m in response.json().get("models", [])}
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"Could not read loaded models: {e}")
+            return list(self.models.values())
+        self.supported = True
+        for entry in self.models.values():
+            info = running.get(entry.model) or running.get(f"{entry.model}:latest")
+            if info is not None:
+                entry.state = "loaded"
+                entry.expires_at = info.get("expires_at")
+            elif entry.state != "loading":
+                entry.state = "unloaded"
+                entry.expires_at = None
+        return list(self.models.values())
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
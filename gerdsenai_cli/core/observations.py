@@ -0,0 +1,249 @@
+"""Out-of-band storage and compact digests for large tool observations.
+
+A tool result goes back into the loop's conversation and is re-sent on every
+later iteration, so a large ``read_file`` or a noisy ``run_command`` dominates
+the prompt for the rest of the turn. Results over ``digest_chars`` are instead
+kept in an :class:`ObservationStore` under a short handle (``obs-3``) and the
+model gets a digest shaped by the kind of output:
+
+- command output: error/failure lines first, then the head and tail
+- source code: an outline of its definitions with line numbers, then the head
+- anything else: head and tail
+
+Every digest ends with the handle and line count, and the model can read any
+line range of the full text with the ``fetch_observation`` tool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+_ERROR_RE = re.compile(
+    r"(error|exception|traceback|failed|failure|fatal|panic|warning|"
+    r"assert|undefined|not found|denied)",
+    re.IGNORECASE,
+)
+_OUTLINE_RE = re.compile(
+    r"^\s*(?:export\s+)?(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?"
+    r"(?:def|class|function|func|fn|interface|struct|enum|trait|impl|type|"
+    r"module|public|private|protected)\b"
+)
+_CODE_SUFFIXES = frozenset(
+    {".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rs", ".java", ".kt", ".rb",
+     ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".swift", ".php", ".scala"}
+)  # fmt: skip
+FETCH_TOOL = "fetch_observation"
+_MAX_ERROR_LINES = 40
+_MAX_OUTLINE_LINES = 80
+_MAX_LINE_CHARS = 240
+
+
+@dataclass
+class _Observation:
+    tool: str
+    arguments: dict[str, Any]
+    text: str
+
+    @property
+    def lines(self) -> list[str]:
+        return self.text.splitlines()
+
+
+def _clip(line: str) -> str:
+    return line if len(line) <= _MAX_LINE_CHARS else line[:_MAX_LINE_CHARS] + "…"
+
+
+def _numbered(lines: list[str], first: int) -> str:
+    return "\n".join(f"{first + i:>5}| {_clip(s)}" for i, s in enumerate(lines))
+
+
+def _head_tail(lines: list[str], budget: int) -> str:
+    """Numbered head and tail of ``lines`` within roughly ``budget`` chars."""
+    head: list[str] = []
+    used = 0
+    for line in lines:
+        used += min(len(line), _MAX_LINE_CHARS) + 8
+        if used > budget * 2 // 3:
+            break
+        head.append(line)
+    tail: list[str] = []
+    used = 0
+    for line in reversed(lines[len(head) :]):
+        used += min(len(line), _MAX_LINE_CHARS) + 8
+        if used > budget // 3:
+            break
+        tail.insert(0, line)
+    parts = [_numbered(head, 1)] if head else []
+    skipped = len(lines) - len(head) - len(tail)
+    if skipped > 0:
+        parts.append(f"  ... [{skipped} lines omitted] ...")
+    if tail:
+        parts.append(_numbered(tail, len(lines) - len(tail) + 1))
+    return "\n".join(parts)
+
+
+def _is_code(tool: str, arguments: dict[str, Any]) -> bool:
+    path = arguments.get("path")
+    if tool != "read_file" or not isinstance(path, str):
+        return False
+    return any(path.endswith(suffix) for suffix in _CODE_SUFFIXES)
+
+
+def _error_section(lines: list[str]) -> str:
+    hits = [(i, s) for i, s in enumerate(lines, 1) if _ERROR_RE.search(s)]
+    if not hits:
+        return ""
+    shown = "\n".join(f"{i:>5}| {_clip(s)}" for i, s in hits[:_MAX_ERROR_LINES])
+    more = len(hits) - _MAX_ERROR_LINES
+    if more > 0:
+        shown += f"\n  ... and {more} more matching lines"
+    return f"Error/failure lines:\n{shown}"
+
+
+def _outline_section(lines: list[str]) -> str:
+    hits = [(i, s) for i, s in enumerate(lines, 1) if _OUTLINE_RE.match(s)]
+    if not hits:
+        return ""
+    shown = "\n".join(
+        f"{i:>5}| {_clip(s.rstrip())}" for i, s in hits[:_MAX_OUTLINE_LINES]
+    )
+    more = len(hits) - _MAX_OUTLINE_LINES
+    if more > 0:
+        shown += f"\n  ... and {more} more definitions"
+    return f"Outline:\n{shown}"
+
+
+def _fit_lines(section: str, limit: int) -> str:
+    """Cut ``section`` to whole lines within ``limit`` chars, noting the rest."""
+    lines = section.splitlines()
+    kept: list[str] = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > limit:
+            break
+        kept.append(line)
+        used += len(line) + 1
+    return "\n".join(kept) + f"\n  ... and {len(lines) - len(kept)} more lines"
+
+
+def digest(
+    tool: str, arguments: dict[str, Any], text: str, handle: str, budget: int
+) -> str:
+    """A compact view of ``text`` (roughly ``budget`` chars) naming ``handle``."""
+    lines = text.splitlines()
+    if tool == "run_command":
+        kind, section = "command output", _error_section(lines)
+    elif _is_code(tool, arguments):
+        kind, section = "source file", _outline_section(lines)
+    else:
+        kind, section = "output", ""
+    if len(section) > budget // 2:
+        section = _fit_lines(section, budget // 2)
+    body = _head_tail(lines, max(budget - len(section), budget // 3))
+    header = (
+        f"[{kind} compressed: {len(lines)} lines, {len(text)} chars; stored as "
+        f'{handle}. Call {FETCH_TOOL}(handle="{handle}", start_line=N, '
+        f"end_line=M) to read any range.]"
+    )
+    return "\n\n".join(part for part in (header, section, body) if part)
+
+
+class ObservationStore:
+    """Full tool results kept out of the prompt, addressed by handle.
+
+    Identical results share a handle, so re-running a tool (or a cache hit)
+    does not grow the store. The oldest entries are evicted past ``maxsize``.
+    """
+
+    def __init__(self, digest_chars: int = 4000, maxsize: int = 64) -> None:
+        self.digest_chars = digest_chars
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _Observation] = OrderedDict()
+        self._by_content: dict[str, str] = {}
+        self._next = 1
+        self.compressed = 0
+        self.chars_saved = 0
+
+    def compress(self, tool: str, arguments: dict[str, Any], text: str) -> str:
+        """Return ``text`` unchanged if small, else store it and return a digest."""
+        return self.compress_with_handle(tool, arguments, text)[0]
+
+    def compress_with_handle(
+        self, tool: str, arguments: dict[str, Any], text: str
+    ) -> tuple[str, str | None]:
+        """:meth:`compress`, plus the digest's handle (None when not compressed)."""
+        if len(text) <= self.digest_chars or tool == FETCH_TOOL:
+            return text, None
+        handle = self.put(tool, arguments, text)
+        compact = digest(tool, arguments, text, handle, self.digest_chars)
+        self.compressed += 1
+        self.chars_saved += max(len(text) - len(compact), 0)
+        return compact, handle
+
+    def __contains__(self, handle: object) -> bool:
+        return handle in self._entries
+
+    def put(self, tool: str, arguments: dict[str, Any], text: str) -> str:
+        key = hashlib.sha1(f"{tool}\0{text}".encode()).hexdigest()
+        handle = self._by_content.get(key)
+        if handle is not None and handle in self._entries:
+            self._entries.move_to_end(handle)
+            return handle
+        handle = f"obs-{self._next}"
+        self._next += 1
+        self._entries[handle] = _Observation(tool, dict(arguments), text)
+        self._by_content[key] = handle
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return handle
+
+    def get(self, handle: str) -> str | None:
+        entry = self._entries.get(handle)
+        return entry.text if entry is not None else None
+
+    def fetch(
+        self, handle: str, start_line: int = 1, end_line: int | None = None
+    ) -> str:
+        """Numbered lines ``start_line..end_line`` (1-based, inclusive).
+
+        The slice is cut to ``digest_chars`` so a drill-down never turns into
+        the large observation it replaced; the footer says where to resume.
+        """
+        entry = self._entries.get(handle)
+        if entry is None:
+            known = ", ".join(self._entries) or "none"
+            return f"Unknown observation handle: {handle} (available: {known})"
+        lines = entry.lines
+        start = max(int(start_line), 1)
+        end = min(int(end_line) if end_line else len(lines), len(lines))
+        if start > end:
+            return f"{handle} has {len(lines)} lines; requested {start}-{end}."
+        out: list[str] = []
+        used = 0
+        line_no = start
+        while line_no <= end:
+            rendered = f"{line_no:>5}| {lines[line_no - 1][: self.digest_chars]}"
+            if out and used + len(rendered) + 1 > self.digest_chars:
+                break
+            out.append(rendered)
+            used += len(rendered) + 1
+            line_no += 1
+        footer = f"[{handle} lines {start}-{line_no - 1} of {len(lines)}"
+        if line_no <= end:
+            footer += f"; continue with start_line={line_no}"
+        return "\n".join(out) + "\n" + footer + "]"
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_content.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "stored": len(self._entries),
+            "compressed": self.compressed,
+            "chars_saved": self.chars_saved,
+        }
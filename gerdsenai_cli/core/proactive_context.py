@@ -5,11 +5,16 @@ This module automatically reads mentioned files and related dependencies
 to build comprehensive context without requiring explicit /read commands.
 """
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from .dependency_graph import DependencyGraph
+from .file_cache import FileContentCache, get_file_cache
+from .token_counter import get_token_counter
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,27 +49,13 @@ class ProactiveContextBuilder:
     a file, the system automatically reads it and related files.
     """
 
-    # File patterns for different programming languages
-    IMPORT_PATTERNS = {
-        "python": [
-            r"^from\s+([\w.]+)\s+import",  # from x import y
-            r"^import\s+([\w.]+)",  # import x
-        ],
-        "javascript": [
-            r"import\s+.*\s+from\s+['\"]([^'\"]+)['\"]",  # ES6 imports
-            r"require\(['\"]([^'\"]+)['\"]\)",  # CommonJS require
-        ],
-        "typescript": [
-            r"import\s+.*\s+from\s+['\"]([^'\"]+)['\"]",
-            r"import\s+['\"]([^'\"]+)['\"]",  # Side-effect imports
-        ],
-    }
-
     def __init__(
         self,
         project_root: Path,
         max_context_tokens: int = 100000,
         context_usage_ratio: float = 0.7,
+        dependency_graph: DependencyGraph | None = None,
+        content_cache: FileContentCache | None = None,
     ):
         """
         Initialize proactive context builder.
@@ -73,13 +64,18 @@ class ProactiveContextBuilder:
             project_root: Root directory of the project
             max_context_tokens: Maximum tokens to include in context
             context_usage_ratio: Ratio of max tokens to actually use (reserve for response)
+            dependency_graph: Import graph to pull related files from (created
+                lazily for ``project_root`` when omitted)
+            content_cache: File reader to go through (defaults to the shared,
+                size-bounded cache also used by ``ProjectContext``)
         """
         self.project_root = project_root
         self.max_context_tokens = max_context_tokens
         self.context_budget = int(max_context_tokens * context_usage_ratio)
 
-        self.file_cache: dict[Path, str] = {}  # Cache file contents
+        self.content_cache = content_cache or get_file_cache()
         self.read_files: set[Path] = set()  # Track what we've read
+        self.dependency_graph = dependency_graph
 
         logger.info(
             f"ProactiveContextBuilder initialized with {self.context_budget:,} token budget"
@@ -180,28 +176,40 @@ class ProactiveContextBuilder:
                     context_files[str(file_path)] = result
                     current_tokens += result.token_estimate
 
-        # Priority 3: Related files (imports, dependencies) (MEDIUM)
-        # For each file we've read, find its dependencies
-        for file_key in list(context_files.keys()):
-            if current_tokens >= self.context_budget:
-                break
-
-            file_path = Path(file_key)
-            related_files = await self._find_related_files(file_path)
-
-            for related_path in related_files:
+        # Priority 3: Related files from the import graph. Direct imports and
+        # importers (1 hop) are MEDIUM, transitive ones (2 hops) LOW; all seeds'
+        # 1-hop neighbours are read before any 2-hop ones.
+        if context_files and current_tokens < self.context_budget:
+            graph = await self._get_dependency_graph()
+            candidates: dict[Path, tuple[int, str]] = {}
+            for file_key in list(context_files.keys()):
+                file_path = Path(file_key)
+                for related_path, hops in await self._find_related_files(
+                    file_path, graph=graph
+                ):
+                    if (
+                        related_path not in candidates
+                        or hops < candidates[related_path][0]
+                    ):
+                        candidates[related_path] = (hops, file_path.name)
+
+            for related_path, (hops, seed) in sorted(
+                candidates.items(), key=lambda item: item[1][0]
+            ):
                 if current_tokens >= self.context_budget:
                     break
-
-                if str(related_path) not in context_files:
-                    result = await self._read_file_with_priority(
-                        related_path,
-                        ContextPriority.MEDIUM,
-                        f"Related to {file_path.name}",
-                    )
-                    if result:
-                        context_files[str(related_path)] = result
-                        current_tokens += result.token_estimate
+                if str(related_path) in context_files:
+                    continue
+                result = await self._read_file_with_priority(
+                    related_path,
+                    ContextPriority.MEDIUM if hops == 1 else ContextPriority.LOW,
+                    f"Related to {seed}"
+                    if hops == 1
+                    else f"Related to {seed} ({hops} hops)",
+                )
+                if result:
+                    context_files[str(related_path)] = result
+                    current_tokens += result.token_estimate
 
         # Priority 4: Files from conversation history (LOW)
         if conversation_history:
@@ -243,29 +251,20 @@ class ProactiveContextBuilder:
             FileReadResult or None if read failed
         """
         try:
-            # Check if file exists
-            if not file_path.exists():
+            content = await self.content_cache.read(file_path)
+            if content is None:
                 logger.warning(f"File not found: {file_path}")
                 return None
 
-            # Check if already in cache
-            if file_path in self.file_cache:
-                content = self.file_cache[file_path]
-            else:
-                # Read file
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                self.file_cache[file_path] = content
-
-            # Estimate tokens (rough: ~4 characters per token)
-            token_estimate = len(content) // 4
+            token_estimate = get_token_counter().count(content)
 
             # Check if we need to truncate
             truncated = False
-            if (
-                token_estimate > self.context_budget * 0.3
-            ):  # Single file shouldn't be >30%
-                # Truncate: Keep beginning and end
-                truncate_to = int(self.context_budget * 0.3 * 4)  # chars
+            max_file_tokens = int(self.context_budget * 0.3)
+            if token_estimate > max_file_tokens:  # Single file shouldn't be >30%
+                # Truncate: keep beginning and end, sized by this file's own
+                # chars-per-token ratio
+                truncate_to = int(len(content) * max_file_tokens / token_estimate)
                 half = truncate_to // 2
 
                 content = (
@@ -273,7 +272,7 @@ class ProactiveContextBuilder:
                     + f"\n\n... [Truncated {len(content) - truncate_to} characters] ...\n\n"
                     + content[-half:]
                 )
-                token_estimate = len(content) // 4
+                token_estimate = get_token_counter().count(content)
                 truncated = True
 
             self.read_files.add(file_path)
@@ -291,78 +290,52 @@ class ProactiveContextBuilder:
             logger.error(f"Failed to read {file_path}: {e}")
             return None
 
-    async def _find_related_files(self, file_path: Path) -> list[Path]:
+    async def _get_dependency_graph(self) -> DependencyGraph:
+        """Return the import graph, synced with the working tree.
+
+        The first call loads the persisted graph; every call re-stats source
+        files and re-parses only those whose (mtime, size) changed.
         """
-        Find files related to the given file (imports, tests, etc.).
+        if self.dependency_graph is None:
+            self.dependency_graph = DependencyGraph(self.project_root)
+        await asyncio.to_thread(self.dependency_graph.refresh)
+        return self.dependency_graph
+
+    async def _find_related_files(
+        self,
+        file_path: Path,
+        max_hops: int = 2,
+        graph: DependencyGraph | None = None,
+    ) -> list[tuple[Path, int]]:
+        """
+        Find files related to the given file (imports, importers, tests).
 
         Args:
             file_path: Path to analyze
+            max_hops: How many import edges away to look
+            graph: Already-synced graph (avoids a re-stat per seed file)
 
         Returns:
-            List of related file paths
+            List of (related file path, hop distance), nearest first
         """
-        related = []
+        related: list[tuple[Path, int]] = []
 
         try:
-            # Get file content
-            if file_path in self.file_cache:
-                content = self.file_cache[file_path]
-            else:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            # Detect language
-            lang = self._detect_language(file_path)
-
-            # Extract imports based on language
-            if lang in self.IMPORT_PATTERNS:
-                for pattern in self.IMPORT_PATTERNS[lang]:
-                    imports = re.findall(pattern, content, re.MULTILINE)
-
-                    for imp in imports:
-                        # Convert import to file path
-                        import_path = self._import_to_path(imp, file_path, lang)
-                        if import_path and import_path.exists():
-                            related.append(import_path)
+            if graph is None:
+                graph = await self._get_dependency_graph()
+            related.extend(graph.neighbors(file_path, max_hops=max_hops))
 
             # Look for corresponding test file
             test_file = self._find_test_file(file_path)
-            if test_file and test_file.exists():
-                related.append(test_file)
+            if test_file and all(p != test_file for p, _ in related):
+                related.append((test_file, 1))
 
         except Exception as e:
             logger.debug(f"Error finding related files for {file_path}: {e}")
 
+        related.sort(key=lambda item: item[1])
         return related
 
-    def _detect_language(self, file_path: Path) -> str:
-        """Detect programming language from file extension."""
-        ext_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".ts": "typescript",
-            ".tsx": "typescript",
-        }
-        return ext_map.get(file_path.suffix.lower(), "unknown")
-
-    def _import_to_path(
-        self, import_str: str, source_file: Path, lang: str
-    ) -> Path | None:
-        """Convert an import string to a file path."""
-        if lang == "python":
-            # Convert module path to file path (e.g., "foo.bar" -> "foo/bar.py")
-            rel_path = import_str.replace(".", "/") + ".py"
-            return self.project_root / rel_path
-        elif lang in ["javascript", "typescript"]:
-            # Relative import
-            if import_str.startswith("."):
-                return (source_file.parent / import_str).resolve()
-            # Absolute import from project root
-            else:
-                return self.project_root / import_str
-
-        return None
-
     def _find_test_file(self, file_path: Path) -> Path | None:
         """Find corresponding test file for given source file."""
         # Pattern: source.py -> test_source.py or source_test.py
@@ -412,7 +385,8 @@ class ProactiveContextBuilder:
         return None
 
     def clear_cache(self) -> None:
-        """Clear file cache and read history."""
-        self.file_cache.clear()
+        """Drop files this builder read from the shared cache, and read history."""
+        for file_path in self.read_files:
+            self.content_cache.invalidate(file_path)
         self.read_files.clear()
         logger.info("ProactiveContextBuilder cache cleared")
@@ -0,0 +1,104 @@
+"""Prompt layout that keeps a stable prefix across turns.
+
+Local servers (Ollama, vLLM, llama.cpp) reuse their KV cache only for the part
+of a prompt that is byte-identical to the previous request's beginning. The
+layout is therefore append-only wherever possible:
+
+1. system prompt (changes only with persona/skills)
+2. pinned project context: built once and kept verbatim until one of the files
+   it was built from changes on disk
+3. conversation history from a window start that moves in jumps rather than
+   sliding one message per turn, so between jumps each turn's prompt is the
+   previous prompt plus the new messages (chosen by token budget in
+   :mod:`.conversation_window`)
+
+:class:`PromptLayout` also measures how much of each rendered prompt is a
+prefix of the previous one, which is the share a prefix-caching server can skip
+re-prefilling.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .llm_client import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+def _common_prefix_chars(
+    previous: list[ChatMessage], current: list[ChatMessage]
+) -> int:
+    reused = 0
+    for old, new in zip(previous, current, strict=False):
+        if old.role == new.role and old.content == new.content:
+            reused += len(new.content)
+            continue
+        if old.role == new.role:
+            limit = min(len(old.content), len(new.content))
+            i = 0
+            while i < limit and old.content[i] == new.content[i]:
+                i += 1
+            reused += i
+        break
+    return reused
+
+
+class PromptLayout:
+    """Pinned context and prefix-reuse stats."""
+
+    def __init__(self) -> None:
+        self.pinned_context = ""
+        self.context_fingerprint: str | None = None
+        self._previous: list[ChatMessage] = []
+        self.turns = 0
+        self.total_chars = 0
+        self.reused_chars = 0
+        self.last_reuse_ratio = 0.0
+
+    # -- pinned context --------------------------------------------------- #
+
+    def pin_context(self, context: str, fingerprint: str | None) -> None:
+        """Pin ``context`` until :meth:`is_stale` sees a different fingerprint."""
+        if context != self.pinned_context:
+            logger.debug("Pinned project context replaced")
+        self.pinned_context = context
+        self.context_fingerprint = fingerprint
+
+    def is_stale(self, fingerprint: str | None) -> bool:
+        return (
+            self.context_fingerprint is not None
+            and fingerprint != self.context_fingerprint
+        )
+
+    def clear_context(self) -> None:
+        self.pinned_context = ""
+        self.context_fingerprint = None
+
+    # -- measurement ------------------------------------------------------ #
+
+    def record(self, messages: list[ChatMessage]) -> float:
+        """Record a rendered prompt; returns the share reused from the last one."""
+        total = sum(len(m.content) for m in messages)
+        reused = _common_prefix_chars(self._previous, messages) if self._previous else 0
+        self._previous = list(messages)
+        self.turns += 1
+        self.total_chars += total
+        self.reused_chars += reused
+        self.last_reuse_ratio = reused / total if total else 0.0
+        logger.debug(
+            f"Prompt prefix reuse: {reused}/{total} chars ({self.last_reuse_ratio:.0%})"
+        )
+        return self.last_reuse_ratio
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "last_reuse_ratio": round(self.last_reuse_ratio, 3),
+            "overall_reuse_ratio": round(
+                self.reused_chars / self.total_chars if self.total_chars else 0.0, 3
+            ),
+            "reused_chars": self.reused_chars,
+            "total_chars": self.total_chars,
+        }
@@ -10,6 +10,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import httpx
+
+from .pool import ProviderPool
+
 
 class ProviderType(Enum):
     """Types of LLM providers."""
@@ -76,6 +80,16 @@ class LLMProvider(ABC):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.provider_type: ProviderType = ProviderType.OPENAI_COMPATIBLE
+        self.pool = ProviderPool(timeout)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all requests of this provider."""
+        return self.pool.client
+
+    async def aclose(self) -> None:
+        """Close this provider's connection pool."""
+        await self.pool.aclose()
 
     @abstractmethod
     async def detect(self) -> bool:
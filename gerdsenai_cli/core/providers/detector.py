@@ -81,6 +81,7 @@ class ProviderDetector:
                 if await provider.detect():
                     logger.info(f"✅ Detected {provider_class.__name__} at {url}")
                     return provider
+                await provider.aclose()
             except Exception as e:
                 logger.debug(f"Detection failed for {provider_class.__name__}: {e}")
                 continue
@@ -8,8 +8,6 @@ import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
-import httpx
-
 from .base import LLMProvider, ModelInfo, ProviderCapabilities, ProviderType
 
 logger = logging.getLogger(__name__)
@@ -34,18 +32,18 @@ class HuggingFaceProvider(LLMProvider):
         TGI has specific info endpoint.
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Try TGI-specific endpoint
-                response = await client.get(f"{self.base_url}/info")
-                if response.status_code == 200:
-                    data = response.json()
-                    # Check for TGI-specific fields
-                    return "model_id" in data or "model_dtype" in data
-                return False
+            client = self.http
+            # Try TGI-specific endpoint
+            response = await client.get(f"{self.base_url}/info", timeout=5.0)
+            if response.status_code == 200:
+                data = response.json()
+                # Check for TGI-specific fields
+                return "model_id" in data or "model_dtype" in data
+            return False
         except Exception:
             # Try health endpoint
             try:
-                response = await client.get(f"{self.base_url}/health")
+                response = await client.get(f"{self.base_url}/health", timeout=5.0)
                 return response.status_code == 200
             except Exception as e:
                 logger.debug(f"HF TGI detection failed: {e}")
@@ -58,26 +56,26 @@ class HuggingFaceProvider(LLMProvider):
         TGI typically serves one model at a time.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/info")
-                response.raise_for_status()
-
-                data = response.json()
-
-                model_info = ModelInfo(
-                    name=data.get("model_id", "unknown"),
-                    provider=ProviderType.HUGGINGFACE_TGI,
-                    context_length=data.get("max_input_length"),
-                    parameters={
-                        "dtype": data.get("model_dtype"),
-                        "device_type": data.get("model_device_type"),
-                        "max_total_tokens": data.get("max_total_tokens"),
-                        "max_batch_size": data.get("max_batch_total_tokens"),
-                    },
-                    is_loaded=True,
-                )
-
-                return [model_info]
+            client = self.http
+            response = await client.get(f"{self.base_url}/info")
+            response.raise_for_status()
+
+            data = response.json()
+
+            model_info = ModelInfo(
+                name=data.get("model_id", "unknown"),
+                provider=ProviderType.HUGGINGFACE_TGI,
+                context_length=data.get("max_input_length"),
+                parameters={
+                    "dtype": data.get("model_dtype"),
+                    "device_type": data.get("model_device_type"),
+                    "max_total_tokens": data.get("max_total_tokens"),
+                    "max_batch_size": data.get("max_batch_total_tokens"),
+                },
+                is_loaded=True,
+            )
+
+            return [model_info]
 
         except Exception as e:
             logger.error(f"Failed to get HF TGI model info: {e}")
@@ -102,32 +100,30 @@ class HuggingFaceProvider(LLMProvider):
             # Convert messages to text prompt
             prompt = self._messages_to_prompt(messages)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "inputs": prompt,
-                    "parameters": {
-                        "temperature": temperature,
-                        "do_sample": temperature > 0,
-                    },
-                }
+            client = self.http
+            request_data = {
+                "inputs": prompt,
+                "parameters": {
+                    "temperature": temperature,
+                    "do_sample": temperature > 0,
+                },
+            }
 
-                if max_tokens:
-                    request_data["parameters"]["max_new_tokens"] = max_tokens
+            if max_tokens:
+                request_data["parameters"]["max_new_tokens"] = max_tokens
 
-                if stop:
-                    request_data["parameters"]["stop"] = stop
+            if stop:
+                request_data["parameters"]["stop"] = stop
 
-                # Add TGI-specific parameters
-                if kwargs:
-                    request_data["parameters"].update(kwargs)
+            # Add TGI-specific parameters
+            if kwargs:
+                request_data["parameters"].update(kwargs)
 
-                response = await client.post(
-                    f"{self.base_url}/generate", json=request_data
-                )
-                response.raise_for_status()
+            response = await client.post(f"{self.base_url}/generate", json=request_data)
+            response.raise_for_status()
 
-                data = response.json()
-                return data.get("generated_text", "")
+            data = response.json()
+            return data.get("generated_text", "")
 
         except Exception as e:
             logger.error(f"HF TGI completion failed: {e}")
@@ -150,47 +146,47 @@ class HuggingFaceProvider(LLMProvider):
         try:
             prompt = self._messages_to_prompt(messages)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "inputs": prompt,
-                    "parameters": {
-                        "temperature": temperature,
-                        "do_sample": temperature > 0,
-                    },
-                }
+            client = self.http
+            request_data = {
+                "inputs": prompt,
+                "parameters": {
+                    "temperature": temperature,
+                    "do_sample": temperature > 0,
+                },
+            }
 
-                if max_tokens:
-                    request_data["parameters"]["max_new_tokens"] = max_tokens
+            if max_tokens:
+                request_data["parameters"]["max_new_tokens"] = max_tokens
 
-                if stop:
-                    request_data["parameters"]["stop"] = stop
+            if stop:
+                request_data["parameters"]["stop"] = stop
 
-                if kwargs:
-                    request_data["parameters"].update(kwargs)
+            if kwargs:
+                request_data["parameters"].update(kwargs)
 
-                async with client.stream(
-                    "POST", f"{self.base_url}/generate_stream", json=request_data
-                ) as response:
-                    response.raise_for_status()
+            async with client.stream(
+                "POST", f"{self.base_url}/generate_stream", json=request_data
+            ) as response:
+                response.raise_for_status()
 
-                    async for line in response.aiter_lines():
-                        if line.startswith("data:"):
-                            data_str = line[5:].strip()
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        data_str = line[5:].strip()
 
-                            try:
-                                import json
+                        try:
+                            import json
 
-                                data = json.loads(data_str)
+                            data = json.loads(data_str)
 
-                                # TGI returns token info
-                                token = data.get("token", {})
-                                text = token.get("text", "")
+                            # TGI returns token info
+                            token = data.get("token", {})
+                            text = token.get("text", "")
 
-                                if text:
-                                    yield text
+                            if text:
+                                yield text
 
-                            except json.JSONDecodeError:
-                                continue
+                        except json.JSONDecodeError:
+                            continue
 
         except Exception as e:
             logger.error(f"HF TGI streaming failed: {e}")
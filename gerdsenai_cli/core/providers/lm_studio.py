@@ -8,8 +8,6 @@ import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
-import httpx
-
 from .base import LLMProvider, ModelInfo, ProviderCapabilities, ProviderType
 
 logger = logging.getLogger(__name__)
@@ -35,13 +33,13 @@ class LMStudioProvider(LLMProvider):
         LM Studio typically runs on port 1234.
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/v1/models")
-                if response.status_code == 200:
-                    data = response.json()
-                    # LM Studio has specific metadata
-                    return "data" in data and "object" in data
-                return False
+            client = self.http
+            response = await client.get(f"{self.base_url}/v1/models", timeout=5.0)
+            if response.status_code == 200:
+                data = response.json()
+                # LM Studio has specific metadata
+                return "data" in data and "object" in data
+            return False
         except Exception as e:
             logger.debug(f"LM Studio detection failed: {e}")
             return False
@@ -54,29 +52,29 @@ class LMStudioProvider(LLMProvider):
             List of currently loaded models
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/v1/models")
-                response.raise_for_status()
-
-                data = response.json()
-                models = []
-
-                for model_data in data.get("data", []):
-                    model_name = model_data.get("id", "")
-
-                    model_info = ModelInfo(
-                        name=model_name,
-                        provider=ProviderType.LM_STUDIO,
-                        quantization=self._extract_quantization(model_name),
-                        parameters={
-                            "owned_by": model_data.get("owned_by", "lm-studio"),
-                            "created": model_data.get("created"),
-                        },
-                        is_loaded=True,
-                    )
-                    models.append(model_info)
+            client = self.http
+            response = await client.get(f"{self.base_url}/v1/models")
+            response.raise_for_status()
+
+            data = response.json()
+            models = []
+
+            for model_data in data.get("data", []):
+                model_name = model_data.get("id", "")
+
+                model_info = ModelInfo(
+                    name=model_name,
+                    provider=ProviderType.LM_STUDIO,
+                    quantization=self._extract_quantization(model_name),
+                    parameters={
+                        "owned_by": model_data.get("owned_by", "lm-studio"),
+                        "created": model_data.get("created"),
+                    },
+                    is_loaded=True,
+                )
+                models.append(model_info)
 
-                return models
+            return models
 
         except Exception as e:
             logger.error(f"Failed to list LM Studio models: {e}")
@@ -97,30 +95,30 @@ class LMStudioProvider(LLMProvider):
         Uses OpenAI-compatible format.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "stream": False,
-                }
+            client = self.http
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "stream": False,
+            }
 
-                if max_tokens:
-                    request_data["max_tokens"] = max_tokens
+            if max_tokens:
+                request_data["max_tokens"] = max_tokens
 
-                if stop:
-                    request_data["stop"] = stop
+            if stop:
+                request_data["stop"] = stop
 
-                if kwargs:
-                    request_data.update(kwargs)
+            if kwargs:
+                request_data.update(kwargs)
 
-                response = await client.post(
-                    f"{self.base_url}/v1/chat/completions", json=request_data
-                )
-                response.raise_for_status()
+            response = await client.post(
+                f"{self.base_url}/v1/chat/completions", json=request_data
+            )
+            response.raise_for_status()
 
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
 
         except Exception as e:
             logger.error(f"LM Studio chat completion failed: {e}")
@@ -141,44 +139,44 @@ class LMStudioProvider(LLMProvider):
         Uses OpenAI-compatible SSE format.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "stream": True,
-                }
-
-                if max_tokens:
-                    request_data["max_tokens"] = max_tokens
-
-                if stop:
-                    request_data["stop"] = stop
-
-                if kwargs:
-                    request_data.update(kwargs)
-
-                async with client.stream(
-                    "POST", f"{self.base_url}/v1/chat/completions", json=request_data
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:]
-                            if data_str.strip() == "[DONE]":
-                                break
-
-                            try:
-                                import json
-
-                                data = json.loads(data_str)
-                                delta = data["choices"][0]["delta"]
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                            except json.JSONDecodeError:
-                                continue
+            client = self.http
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "stream": True,
+            }
+
+            if max_tokens:
+                request_data["max_tokens"] = max_tokens
+
+            if stop:
+                request_data["stop"] = stop
+
+            if kwargs:
+                request_data.update(kwargs)
+
+            async with client.stream(
+                "POST", f"{self.base_url}/v1/chat/completions", json=request_data
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        data_str = line[6:]
+                        if data_str.strip() == "[DONE]":
+                            break
+
+                        try:
+                            import json
+
+                            data = json.loads(data_str)
+                            delta = data["choices"][0]["delta"]
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue
 
         except Exception as e:
             logger.error(f"LM Studio streaming failed: {e}")
@@ -8,8 +8,6 @@ import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
-import httpx
-
 from .base import LLMProvider, ModelInfo, ProviderCapabilities, ProviderType
 
 logger = logging.getLogger(__name__)
@@ -34,10 +32,10 @@ class OllamaProvider(LLMProvider):
         Checks for Ollama-specific endpoints.
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Try Ollama-specific endpoint
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            client = self.http
+            # Try Ollama-specific endpoint
+            response = await client.get(f"{self.base_url}/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.debug(f"Ollama detection failed: {e}")
             return False
@@ -50,38 +48,34 @@ class OllamaProvider(LLMProvider):
             List of ModelInfo objects with Ollama-specific details
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-
-                data = response.json()
-                models = []
-
-                for model_data in data.get("models", []):
-                    model_info = ModelInfo(
-                        name=model_data.get("name", ""),
-                        provider=ProviderType.OLLAMA,
-                        size=model_data.get("size"),
-                        quantization=self._extract_quantization(
-                            model_data.get("name", "")
+            client = self.http
+            response = await client.get(f"{self.base_url}/api/tags")
+            response.raise_for_status()
+
+            data = response.json()
+            models = []
+
+            for model_data in data.get("models", []):
+                model_info = ModelInfo(
+                    name=model_data.get("name", ""),
+                    provider=ProviderType.OLLAMA,
+                    size=model_data.get("size"),
+                    quantization=self._extract_quantization(model_data.get("name", "")),
+                    context_length=model_data.get("details", {}).get("context_length"),
+                    parameters={
+                        "family": model_data.get("details", {}).get("family"),
+                        "parameter_size": model_data.get("details", {}).get(
+                            "parameter_size"
                         ),
-                        context_length=model_data.get("details", {}).get(
-                            "context_length"
+                        "quantization_level": model_data.get("details", {}).get(
+                            "quantization_level"
                         ),
-                        parameters={
-                            "family": model_data.get("details", {}).get("family"),
-                            "parameter_size": model_data.get("details", {}).get(
-                                "parameter_size"
-                            ),
-                            "quantization_level": model_data.get("details", {}).get(
-                                "quantization_level"
-                            ),
-                        },
-                        is_loaded=True,  # Ollama keeps models loaded
-                    )
-                    models.append(model_info)
-
-                return models
+                    },
+                    is_loaded=True,  # Ollama keeps models loaded
+                )
+                models.append(model_info)
+
+            return models
 
         except Exception as e:
             logger.error(f"Failed to list Ollama models: {e}")
@@ -111,34 +105,32 @@ class OllamaProvider(LLMProvider):
             Generated response text
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Ollama-specific format
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                    },
-                }
+            client = self.http
+            # Ollama-specific format
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "stream": False,
+                "options": {
+                    "temperature": temperature,
+                },
+            }
 
-                if max_tokens:
-                    request_data["options"]["num_predict"] = max_tokens
+            if max_tokens:
+                request_data["options"]["num_predict"] = max_tokens
 
-                if stop:
-                    request_data["options"]["stop"] = stop
+            if stop:
+                request_data["options"]["stop"] = stop
 
-                # Merge additional options
-                if kwargs:
-                    request_data["options"].update(kwargs)
+            # Merge additional options
+            if kwargs:
+                request_data["options"].update(kwargs)
 
-                response = await client.post(
-                    f"{self.base_url}/api/chat", json=request_data
-                )
-                response.raise_for_status()
+            response = await client.post(f"{self.base_url}/api/chat", json=request_data)
+            response.raise_for_status()
 
-                data = response.json()
-                return data.get("message", {}).get("content", "")
+            data = response.json()
+            return data.get("message", {}).get("content", "")
 
         except Exception as e:
             logger.error(f"Ollama chat completion failed: {e}")
@@ -168,41 +160,41 @@ class OllamaProvider(LLMProvider):
             Text chunks
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "stream": True,
-                    "options": {
-                        "temperature": temperature,
-                    },
-                }
-
-                if max_tokens:
-                    request_data["options"]["num_predict"] = max_tokens
-
-                if stop:
-                    request_data["options"]["stop"] = stop
-
-                if kwargs:
-                    request_data["options"].update(kwargs)
-
-                async with client.stream(
-                    "POST", f"{self.base_url}/api/chat", json=request_data
-                ) as response:
-                    response.raise_for_status()
+            client = self.http
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "stream": True,
+                "options": {
+                    "temperature": temperature,
+                },
+            }
+
+            if max_tokens:
+                request_data["options"]["num_predict"] = max_tokens
+
+            if stop:
+                request_data["options"]["stop"] = stop
+
+            if kwargs:
+                request_data["options"].update(kwargs)
+
+            async with client.stream(
+                "POST", f"{self.base_url}/api/chat", json=request_data
+            ) as response:
+                response.raise_for_status()
 
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                import json
+                async for line in response.aiter_lines():
+                    if line:
+                        try:
+                            import json
 
-                                data = json.loads(line)
-                                content = data.get("message", {}).get("content", "")
-                                if content:
-                                    yield content
-                            except json.JSONDecodeError:
-                                continue
+                            data = json.loads(line)
+                            content = data.get("message", {}).get("content", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue
 
         except Exception as e:
             logger.error(f"Ollama streaming failed: {e}")
@@ -267,22 +259,22 @@ class OllamaProvider(LLMProvider):
             Progress updates
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=None
-            ) as client:  # No timeout for downloads
-                async with client.stream(
-                    "POST", f"{self.base_url}/api/pull", json={"name": model_name}
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                import json
-
-                                yield json.loads(line)
-                            except json.JSONDecodeError:
-                                continue
+            async with self.http.stream(
+                "POST",
+                f"{self.base_url}/api/pull",
+                json={"name": model_name},
+                timeout=None,  # No timeout for downloads
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line:
+                        try:
+                            import json
+
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
 
         except Exception as e:
             logger.error(f"Model pull failed: {e}")
@@ -299,12 +291,12 @@ class OllamaProvider(LLMProvider):
             True if successful
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.base_url}/api/delete", json={"name": model_name}
-                )
-                response.raise_for_status()
-                return True
+            client = self.http
+            response = await client.delete(
+                f"{self.base_url}/api/delete", json={"name": model_name}
+            )
+            response.raise_for_status()
+            return True
 
         except Exception as e:
             logger.error(f"Model deletion failed: {e}")
@@ -321,12 +313,12 @@ class OllamaProvider(LLMProvider):
             Model information dict or None
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/show", json={"name": model_name}
-                )
-                response.raise_for_status()
-                return response.json()
+            client = self.http
+            response = await client.post(
+                f"{self.base_url}/api/show", json={"name": model_name}
+            )
+            response.raise_for_status()
+            return response.json()
 
         except Exception as e:
             logger.error(f"Get model info failed: {e}")
@@ -0,0 +1,145 @@
+"""Connection pooling for provider HTTP traffic.
+
+Each provider instance owns one ``httpx.AsyncClient``, created on first use and
+reused for every request after that, so keep-alive connections (and, for remote
+Tailscale peers, TLS sessions) are paid for once rather than per call. HTTP/2 is
+negotiated where the server offers it (via ALPN over TLS) when the optional
+``h2`` package is installed; plain-HTTP local servers stay on HTTP/1.1.
+
+Pool limits come from a process-wide :class:`PoolConfig` that ``LLMClient``
+sets from settings, and every open pool is closed by :func:`close_all_pools`,
+which ``LLMClient.close`` calls on shutdown.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Limits for provider connection pools."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> PoolConfig:
+        defaults = cls()
+        return cls(
+            max_connections=getattr(
+                settings, "http_max_connections", defaults.max_connections
+            ),
+            max_keepalive_connections=getattr(
+                settings,
+                "http_max_keepalive_connections",
+                defaults.max_keepalive_connections,
+            ),
+            keepalive_expiry=getattr(
+                settings, "http_keepalive_expiry", defaults.keepalive_expiry
+            ),
+            http2=getattr(settings, "http2", defaults.http2),
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def use_http2(self) -> bool:
+        return self.http2 and HTTP2_AVAILABLE
+
+
+_default_config = PoolConfig()
+_open_pools: weakref.WeakSet[ProviderPool] = weakref.WeakSet()
+
+
+def configure_pools(config: PoolConfig) -> None:
+    """Set the limits used by pools created from now on."""
+    global _default_config
+    _default_config = config
+
+
+def default_pool_config() -> PoolConfig:
+    return _default_config
+
+
+class ProviderPool:
+    """Lazily created, reusable ``httpx.AsyncClient`` with reuse counters."""
+
+    def __init__(self, timeout: float, config: PoolConfig | None = None) -> None:
+        self.timeout = timeout
+        self.config = config
+        self._client: httpx.AsyncClient | None = None
+        self.requests = 0
+        self.connections_opened = 0
+        self.http2_responses = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client, created on first access."""
+        if self._client is None or self._client.is_closed:
+            config = self.config or _default_config
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=config.limits,
+                http2=config.use_http2,
+                event_hooks={
+                    "request": [self._on_request],
+                    "response": [self._on_response],
+                },
+            )
+            _open_pools.add(self)
+        return self._client
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        request.extensions["trace"] = self._on_trace
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        if response.http_version == "HTTP/2":
+            self.http2_responses += 1
+
+    async def _on_trace(self, event: str, info: dict[str, Any]) -> None:
+        # httpcore emits connect_tcp only when it has to open a new connection.
+        if event == "connection.connect_tcp.started":
+            self.connections_opened += 1
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        _open_pools.discard(self)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": max(self.requests - self.connections_opened, 0),
+            "http2_responses": self.http2_responses,
+        }
+
+
+async def close_all_pools() -> None:
+    """Close every provider pool still open."""
+    for pool in list(_open_pools):
+        try:
+            await pool.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing provider pool: {e}")
@@ -8,8 +8,6 @@ import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
-import httpx
-
 from .base import LLMProvider, ModelInfo, ProviderCapabilities, ProviderType
 
 logger = logging.getLogger(__name__)
@@ -35,15 +33,15 @@ class VLLMProvider(LLMProvider):
         vLLM typically responds to /v1/models endpoint.
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Try OpenAI-compatible endpoint
-                response = await client.get(f"{self.base_url}/v1/models")
-                if response.status_code == 200:
-                    # Check if response looks like vLLM
-                    data = response.json()
-                    # vLLM typically has fewer fields than real OpenAI
-                    return "data" in data
-                return False
+            client = self.http
+            # Try OpenAI-compatible endpoint
+            response = await client.get(f"{self.base_url}/v1/models", timeout=5.0)
+            if response.status_code == 200:
+                # Check if response looks like vLLM
+                data = response.json()
+                # vLLM typically has fewer fields than real OpenAI
+                return "data" in data
+            return False
         except Exception as e:
             logger.debug(f"vLLM detection failed: {e}")
             return False
@@ -56,27 +54,27 @@ class VLLMProvider(LLMProvider):
             List of ModelInfo objects
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/v1/models")
-                response.raise_for_status()
+            client = self.http
+            response = await client.get(f"{self.base_url}/v1/models")
+            response.raise_for_status()
+
+            data = response.json()
+            models = []
+
+            for model_data in data.get("data", []):
+                model_info = ModelInfo(
+                    name=model_data.get("id", ""),
+                    provider=ProviderType.VLLM,
+                    context_length=model_data.get("max_model_len"),
+                    parameters={
+                        "owned_by": model_data.get("owned_by"),
+                        "created": model_data.get("created"),
+                    },
+                    is_loaded=True,  # vLLM loads models at startup
+                )
+                models.append(model_info)
 
-                data = response.json()
-                models = []
-
-                for model_data in data.get("data", []):
-                    model_info = ModelInfo(
-                        name=model_data.get("id", ""),
-                        provider=ProviderType.VLLM,
-                        context_length=model_data.get("max_model_len"),
-                        parameters={
-                            "owned_by": model_data.get("owned_by"),
-                            "created": model_data.get("created"),
-                        },
-                        is_loaded=True,  # vLLM loads models at startup
-                    )
-                    models.append(model_info)
-
-                return models
+            return models
 
         except Exception as e:
             logger.error(f"Failed to list vLLM models: {e}")
@@ -97,31 +95,31 @@ class VLLMProvider(LLMProvider):
         Uses OpenAI-compatible format.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "stream": False,
-                }
-
-                if max_tokens:
-                    request_data["max_tokens"] = max_tokens
-
-                if stop:
-                    request_data["stop"] = stop
-
-                # Add vLLM-specific parameters
-                if kwargs:
-                    request_data.update(kwargs)
-
-                response = await client.post(
-                    f"{self.base_url}/v1/chat/completions", json=request_data
-                )
-                response.raise_for_status()
+            client = self.http
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "stream": False,
+            }
 
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            if max_tokens:
+                request_data["max_tokens"] = max_tokens
+
+            if stop:
+                request_data["stop"] = stop
+
+            # Add vLLM-specific parameters
+            if kwargs:
+                request_data.update(kwargs)
+
+            response = await client.post(
+                f"{self.base_url}/v1/chat/completions", json=request_data
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
 
         except Exception as e:
             logger.error(f"vLLM chat completion failed: {e}")
@@ -142,44 +140,44 @@ class VLLMProvider(LLMProvider):
         Uses OpenAI-compatible SSE format.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                request_data = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "stream": True,
-                }
-
-                if max_tokens:
-                    request_data["max_tokens"] = max_tokens
-
-                if stop:
-                    request_data["stop"] = stop
-
-                if kwargs:
-                    request_data.update(kwargs)
-
-                async with client.stream(
-                    "POST", f"{self.base_url}/v1/chat/completions", json=request_data
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-                            if data_str.strip() == "[DONE]":
-                                break
-
-                            try:
-                                import json
-
-                                data = json.loads(data_str)
-                                delta = data["choices"][0]["delta"]
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                            except json.JSONDecodeError:
-                                continue
+            client = self.http
+            request_data = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "stream": True,
+            }
+
+            if max_tokens:
+                request_data["max_tokens"] = max_tokens
+
+            if stop:
+                request_data["stop"] = stop
+
+            if kwargs:
+                request_data.update(kwargs)
+
+            async with client.stream(
+                "POST", f"{self.base_url}/v1/chat/completions", json=request_data
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        data_str = line[6:]  # Remove "data: " prefix
+                        if data_str.strip() == "[DONE]":
+                            break
+
+                        try:
+                            import json
+
+                            data = json.loads(data_str)
+                            delta = data["choices"][0]["delta"]
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue
 
         except Exception as e:
             logger.error(f"vLLM streaming failed: {e}")
@@ -3,7 +3,8 @@ Smart Router for Natural Language Intent Handling.
 
 This module routes user input intelligently:
 1. Explicit slash commands → CommandParser
-2. Natural language → LLM-based intent detection → ActionHandler
+2. Natural language → local intent classifier, or LLM-based intent detection
+   when it is not confident → ActionHandler
 3. Low confidence → Clarification questions
 
 This eliminates the need for users to learn slash commands while maintaining
@@ -18,6 +19,7 @@ from typing import Any
 
 from ..config.settings import Settings
 from .agent import ActionIntent, ActionType, IntentParser
+from .intent_classifier import LocalIntentClassifier
 from .llm_client import ChatMessage, LLMClient
 
 logger = logging.getLogger(__name__)
@@ -61,6 +63,7 @@ class SmartRouter:
         llm_client: LLMClient,
         settings: Settings,
         command_parser: Any = None,
+        local_classifier: LocalIntentClassifier | None = None,
     ):
         """
         Initialize the smart router.
@@ -69,11 +72,13 @@ class SmartRouter:
             llm_client: LLM client for intent detection
             settings: Application settings
             command_parser: Optional command parser for slash commands
+            local_classifier: Local intent classifier to consult before the
+                LLM; pass the Agent's so both learn into (and save) one store
         """
         self.llm_client = llm_client
         self.settings = settings
         self.command_parser = command_parser
-        self.intent_parser = IntentParser()
+        self.intent_parser = IntentParser(local_classifier=local_classifier)
 
         # Track conversation context for better intent detection
         self.conversation_history: list[ChatMessage] = []
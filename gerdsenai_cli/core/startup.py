@@ -0,0 +1,165 @@
+"""Staged, concurrent application startup.
+
+Startup has a few steps the first prompt depends on (connecting to the LLM
+server, loading the model list, initializing the agent) and several it does
+not (plugin registration, skills discovery, smart routing, an opt-in eager
+project scan). :class:`StartupScheduler` starts every step as a task as soon
+as its dependencies have finished, so independent steps overlap. The caller
+waits only for the required steps and leaves the optional ones running
+behind their readiness futures; each feature becomes available when its step
+finishes.
+
+Every step is recorded as a :class:`StageSpan` (from the turn scheduler), and
+:meth:`StartupScheduler.status_lines` formats them for ``/status``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from .turn_scheduler import StageSpan
+
+logger = logging.getLogger(__name__)
+
+
+class StartupScheduler:
+    """Runs startup steps concurrently and keeps a readiness future for each.
+
+    Usage::
+
+        startup = StartupScheduler()
+        startup.start("connect", client.connect)
+        startup.start("models", client.list_models, after=("connect",))
+        startup.start("plugins", init_plugins)  # optional: not awaited
+        connected = await startup.result("connect", default=False)
+        models = await startup.result("models", default=[])
+        startup.mark_interactive()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._t0 = clock()
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._spans: dict[str, StageSpan] = {}
+        self.interactive_at: float | None = None
+
+    def _now(self) -> float:
+        return self._clock() - self._t0
+
+    def start(
+        self,
+        name: str,
+        work: Callable[[], Awaitable[Any]],
+        *,
+        after: Sequence[str] = (),
+    ) -> asyncio.Task[Any]:
+        """Start step ``name`` running ``work()`` once ``after`` have finished.
+
+        Unlike a turn stage, a startup step is skipped when a dependency did
+        not succeed: a model list is pointless without a connection.
+        """
+        span = self._spans[name] = StageSpan(name)
+        deps = [d for d in after if d in self._tasks]
+
+        async def run() -> Any:
+            if deps:
+                await asyncio.wait([self._tasks[d] for d in deps])
+                if not all(self.ready(d) for d in deps):
+                    span.status = "skipped"
+                    span.start = span.end = self._now()
+                    return None
+            span.start = self._now()
+            span.status = "running"
+            try:
+                result = await work()
+            except asyncio.CancelledError:
+                span.status = "cancelled"
+                raise
+            except Exception as e:
+                # Logged, not raised: nobody may ever await an optional step.
+                span.status = "failed"
+                logger.warning(f"Startup step '{name}' failed: {e}")
+                return None
+            finally:
+                span.end = self._now()
+            span.status = "done"
+            return result
+
+        task = asyncio.create_task(run(), name=f"startup:{name}")
+        self._tasks[name] = task
+        return task
+
+    def ready(self, name: str) -> bool:
+        """True once step ``name`` has finished successfully."""
+        span = self._spans.get(name)
+        return span is not None and span.status == "done"
+
+    async def result(self, name: str, default: Any = None) -> Any:
+        """Wait for step ``name``; ``default`` if it failed, was skipped or
+        cancelled, or was never started. Time spent here counts as blocking."""
+        task = self._tasks.get(name)
+        if task is None:
+            return default
+        began = self._now()
+        try:
+            value = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # the caller itself was cancelled
+            return default
+        finally:
+            self._spans[name].waited += self._now() - began
+        return value if self.ready(name) else default
+
+    async def wait_all(self) -> None:
+        """Wait for every step, e.g. before a one-shot headless turn."""
+        for name in list(self._tasks):
+            await self.result(name)
+
+    def mark_interactive(self) -> None:
+        """Record when the required steps were done and input was accepted."""
+        self.interactive_at = self._now()
+
+    async def aclose(self) -> None:
+        """Cancel steps that are still running (on shutdown)."""
+        pending = [t for t in self._tasks.values() if not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    @property
+    def spans(self) -> list[StageSpan]:
+        return sorted(self._spans.values(), key=lambda s: s.start)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "interactive_after": (
+                round(self.interactive_at, 4)
+                if self.interactive_at is not None
+                else None
+            ),
+            "stages": [s.as_dict() for s in self.spans],
+        }
+
+    def status_lines(self) -> list[str]:
+        """One line per step for ``/status``: duration, start offset, state."""
+        lines = []
+        if self.interactive_at is not None:
+            lines.append(f"Interactive after {self.interactive_at * 1000:.0f}ms")
+        for span in self.spans:
+            if span.status == "pending":
+                timing = "waiting"
+            elif span.status == "running":
+                timing = f"{(self._now() - span.start) * 1000:.0f}ms so far"
+            else:
+                timing = f"{span.duration * 1000:.0f}ms"
+            blocking = " (blocked startup)" if span.waited > 0 else ""
+            lines.append(
+                f"{span.name:<14} {timing:>8} at +{span.start * 1000:.0f}ms "
+                f"{span.status}{blocking}"
+            )
+        return lines
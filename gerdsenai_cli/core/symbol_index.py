@@ -0,0 +1,358 @@
+"""Symbol index: where is a name defined, and where is it used.
+
+Backs the agent's ``find_definition`` / ``find_references`` tools so a "where is
+X" question costs one small tool result instead of several whole-file reads.
+
+Python files are parsed with ``ast`` (precise definitions with signatures, and
+Load-context name/attribute references). JS/TS, Go and Rust use regex heuristics:
+definitions come from a handful of declaration patterns, references from an
+identifier scan. Everything is per-file and keyed on ``(mtime, size)``, so
+:meth:`SymbolIndex.refresh` only re-parses files that changed since the last
+call — the index stays warm across turns without a rebuild.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAX_FILE_BYTES = 1_000_000  # same ceiling as the vector index
+
+_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+}
+
+# (pattern, kind) per language; group 1 is the symbol name. Patterns run per line.
+_DEF_PATTERNS: dict[str, list[tuple[re.Pattern[str], str]]] = {
+    "javascript": [
+        (
+            re.compile(
+                r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\*?\s+(\w+)\s*\("
+            ),
+            "function",
+        ),
+        (re.compile(r"^\s*(?:export\s+)?(?:default\s+)?class\s+(\w+)"), "class"),
+        (
+            re.compile(
+                r"^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*=>|\w+\s*=>)"
+            ),
+            "function",
+        ),
+    ],
+    "typescript": [
+        (
+            re.compile(
+                r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\*?\s+(\w+)\s*[<(]"
+            ),
+            "function",
+        ),
+        (
+            re.compile(
+                r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(\w+)"
+            ),
+            "class",
+        ),
+        (re.compile(r"^\s*(?:export\s+)?interface\s+(\w+)"), "interface"),
+        (re.compile(r"^\s*(?:export\s+)?type\s+(\w+)\s*(?:<[^>]*>)?\s*="), "type"),
+        (re.compile(r"^\s*(?:export\s+)?(?:const\s+)?enum\s+(\w+)"), "enum"),
+        (
+            re.compile(
+                r"^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::[^=]+)?=\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*(?::[^=]+)?=>|\w+\s*=>)"
+            ),
+            "function",
+        ),
+    ],
+    "go": [
+        (re.compile(r"^func\s+(?:\([^)]*\)\s*)?(\w+)\s*[\[(]"), "function"),
+        (re.compile(r"^type\s+(\w+)\s+(?:struct|interface)\b"), "class"),
+        (re.compile(r"^type\s+(\w+)\s+\w"), "type"),
+    ],
+    "rust": [
+        (
+            re.compile(
+                r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+(\w+)"
+            ),
+            "function",
+        ),
+        (
+            re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|union)\s+(\w+)"),
+            "class",
+        ),
+        (re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?trait\s+(\w+)"), "interface"),
+        (re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?type\s+(\w+)"), "type"),
+        (re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?mod\s+(\w+)"), "module"),
+    ],
+}
+
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+
+@dataclass
+class SymbolDef:
+    """A definition site."""
+
+    name: str
+    kind: str  # function | method | class | variable | interface | type | ...
+    path: str  # repo-relative
+    line: int
+    signature: str
+    container: str = ""  # enclosing class for methods, else ""
+
+    def describe(self) -> str:
+        where = f"{self.path}:{self.line}"
+        owner = f" (in {self.container})" if self.container else ""
+        return f"{where}  {self.kind}{owner}  {self.signature}"
+
+
+@dataclass
+class _FileEntry:
+    """Everything indexed for one file, plus the stamp it was built from."""
+
+    stamp: tuple[float, int]
+    language: str
+    definitions: list[SymbolDef] = field(default_factory=list)
+    # identifier -> line numbers where it is referenced (excludes def sites)
+    references: dict[str, list[int]] = field(default_factory=dict)
+
+
+def language_for(path: Path) -> str | None:
+    """Indexed language for a path, or None if the extension isn't supported."""
+    return _LANGUAGES.get(path.suffix.lower())
+
+
+# -- Python (ast) ---------------------------------------------------------- #
+
+
+def _python_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    sig = f"{prefix} {node.name}({ast.unparse(node.args)})"
+    if node.returns is not None:
+        sig += f" -> {ast.unparse(node.returns)}"
+    return sig
+
+
+def _class_signature(node: ast.ClassDef) -> str:
+    bases = [ast.unparse(b) for b in node.bases]
+    bases += [ast.unparse(k) for k in node.keywords]
+    return f"class {node.name}({', '.join(bases)})" if bases else f"class {node.name}"
+
+
+def _index_python(source: str, rel: str, entry: _FileEntry) -> None:
+    tree = ast.parse(source)
+    def_sites: set[tuple[str, int]] = set()
+
+    def visit_body(body: list[ast.stmt], container: str) -> None:
+        for node in body:
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                entry.definitions.append(
+                    SymbolDef(
+                        node.name,
+                        "method" if container else "function",
+                        rel,
+                        node.lineno,
+                        _python_signature(node),
+                        container,
+                    )
+                )
+                def_sites.add((node.name, node.lineno))
+            elif isinstance(node, ast.ClassDef):
+                entry.definitions.append(
+                    SymbolDef(
+                        node.name,
+                        "class",
+                        rel,
+                        node.lineno,
+                        _class_signature(node),
+                        container,
+                    )
+                )
+                def_sites.add((node.name, node.lineno))
+                visit_body(node.body, node.name)
+            elif not container and isinstance(node, ast.Assign | ast.AnnAssign):
+                targets = (
+                    node.targets if isinstance(node, ast.Assign) else [node.target]
+                )
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        line = ast.get_source_segment(source, node) or target.id
+                        entry.definitions.append(
+                            SymbolDef(
+                                target.id,
+                                "variable",
+                                rel,
+                                node.lineno,
+                                line.splitlines()[0][:120],
+                            )
+                        )
+                        def_sites.add((target.id, node.lineno))
+
+    visit_body(tree.body, "")
+
+    for node in ast.walk(tree):
+        name: str | None = None
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            name = node.id
+        elif isinstance(node, ast.Attribute):
+            name = node.attr
+        elif isinstance(node, ast.alias):
+            name = node.asname or node.name.split(".")[-1]
+        if name is None:
+            continue
+        line = getattr(node, "lineno", 0)
+        if (name, line) in def_sites:
+            continue
+        entry.references.setdefault(name, []).append(line)
+
+
+# -- regex languages ------------------------------------------------------- #
+
+
+def _index_regex(source: str, rel: str, entry: _FileEntry) -> None:
+    patterns = _DEF_PATTERNS.get(entry.language, [])
+    def_sites: set[tuple[str, int]] = set()
+    for lineno, text in enumerate(source.splitlines(), start=1):
+        stripped = text.strip()
+        if stripped.startswith(("//", "/*", "*")):
+            continue
+        for pattern, kind in patterns:
+            match = pattern.match(text)
+            if match:
+                name = match.group(1)
+                entry.definitions.append(
+                    SymbolDef(
+                        name, kind, rel, lineno, stripped.rstrip("{").strip()[:160]
+                    )
+                )
+                def_sites.add((name, lineno))
+                break
+        for ident in set(_IDENTIFIER.findall(text)):
+            if (ident, lineno) not in def_sites:
+                entry.references.setdefault(ident, []).append(lineno)
+
+
+class SymbolIndex:
+    """Incrementally maintained definitions/references index for a repository."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root.resolve()
+        self._files: dict[str, _FileEntry] = {}
+        self.parse_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(path.resolve().relative_to(self.repo_root))
+        except ValueError:
+            return str(path)
+
+    def update_file(self, path: Path) -> bool:
+        """(Re)index one file if it changed. Returns True when it was re-parsed."""
+        language = language_for(path)
+        rel = self._rel(path)
+        if language is None:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            self._files.pop(rel, None)
+            return False
+        stamp = (st.st_mtime, st.st_size)
+        current = self._files.get(rel)
+        if current is not None and current.stamp == stamp:
+            return False
+        if st.st_size > _MAX_FILE_BYTES:
+            self._files.pop(rel, None)
+            return False
+        try:
+            source = path.read_text(encoding="utf-8", errors="ignore")
+        except OSError as e:
+            logger.debug(f"Symbol index could not read {path}: {e}")
+            self._files.pop(rel, None)
+            return False
+
+        entry = _FileEntry(stamp=stamp, language=language)
+        try:
+            if language == "python":
+                _index_python(source, rel, entry)
+            else:
+                _index_regex(source, rel, entry)
+        except (SyntaxError, ValueError, RecursionError) as e:
+            # Half-edited Python: keep the file findable via the regex scan of
+            # identifiers rather than dropping it.
+            logger.debug(f"Symbol index parse failed for {rel}: {e}")
+            self.parse_errors += 1
+            entry = _FileEntry(stamp=stamp, language=language)
+            _index_regex(source, rel, entry)
+        self._files[rel] = entry
+        return True
+
+    def remove_file(self, path: Path) -> None:
+        self._files.pop(self._rel(path), None)
+
+    def refresh(self, paths: Iterable[Path]) -> int:
+        """Bring the index in line with ``paths``; returns files re-parsed.
+
+        Files no longer present in ``paths`` are dropped, unchanged files are a
+        single ``stat`` each.
+        """
+        seen: set[str] = set()
+        reparsed = 0
+        for path in paths:
+            if language_for(path) is None:
+                continue
+            seen.add(self._rel(path))
+            if self.update_file(path):
+                reparsed += 1
+        for rel in list(self._files):
+            if rel not in seen:
+                del self._files[rel]
+        return reparsed
+
+    # -- queries --------------------------------------------------------- #
+
+    def find_definitions(self, name: str) -> list[SymbolDef]:
+        """All definitions of ``name``; ``Class.method`` narrows to a container."""
+        container = ""
+        if "." in name:
+            container, name = name.rsplit(".", 1)
+        found = [
+            d
+            for entry in self._files.values()
+            for d in entry.definitions
+            if d.name == name and (not container or d.container == container)
+        ]
+        found.sort(key=lambda d: (d.path, d.line))
+        return found
+
+    def find_references(self, name: str) -> list[tuple[str, int]]:
+        """``(path, line)`` sites that reference ``name`` (definitions excluded)."""
+        name = name.rsplit(".", 1)[-1]
+        sites = {
+            (rel, line)
+            for rel, entry in self._files.items()
+            for line in entry.references.get(name, ())
+        }
+        return sorted(sites)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "files": len(self._files),
+            "definitions": sum(len(e.definitions) for e in self._files.values()),
+            "parse_errors": self.parse_errors,
+        }
@@ -9,6 +9,8 @@ import logging
 from functools import lru_cache
 from typing import Any
 
+from ..utils.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 # Try to import tiktoken
@@ -120,6 +122,7 @@ def estimate_tokens_heuristic(text: str) -> int:
     return len(text) // 4
 
 
+@traced("tokens.count_messages", "tokens")
 def count_messages_tokens(
     messages: list[dict[str, str]], model: str = "default"
 ) -> int:
@@ -18,6 +18,9 @@ stripping that first, a think block would be mistaken for a final answer.
 
 This module gives the loop one entry point, ``parse_model_output``, that copes
 with all of the above and returns the same provider-agnostic ``ChatResult``.
+``StreamingToolParser`` does the same job incrementally for streamed turns, so
+text and reasoning reach the UI as they arrive and each tool call is surfaced
+the moment its arguments are complete.
 """
 
 from __future__ import annotations
@@ -25,6 +28,9 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from .llm_client import ChatResult, ToolCall
 
@@ -34,6 +40,11 @@ _THINK_RE = re.compile(r"<think>(.*?)</think>", re.DOTALL | re.IGNORECASE)
 _THINK_OPEN_UNCLOSED_RE = re.compile(r"<think>(.*)\Z", re.DOTALL | re.IGNORECASE)
 _TOOL_CALL_RE = re.compile(r"<tool_call>\s*(.*?)\s*</tool_call>", re.DOTALL)
 
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+_TOOL_OPEN = "<tool_call>"
+_TOOL_CLOSE = "</tool_call>"
+
 
 def strip_reasoning(text: str, reasoning_content: str | None = None) -> tuple[str, str]:
     """Split model text into (clean_text, reasoning).
@@ -74,27 +85,30 @@ def _parse_hermes_tool_calls(text: str) -> list[ToolCall]:
     """
     calls: list[ToolCall] = []
     for raw in _TOOL_CALL_RE.findall(text):
-        try:
-            obj = json.loads(raw.strip())
-        except json.JSONDecodeError:
-            logger.debug(f"Skipping malformed Hermes tool_call block: {raw[:80]!r}")
-            continue
-        if not isinstance(obj, dict):
-            continue
-        name = obj.get("name") or obj.get("tool") or ""
-        args = obj.get("arguments", obj.get("args", {}))
-        if not name:
-            continue
-        calls.append(
-            ToolCall(
-                id=f"hermes_{len(calls)}",
-                name=str(name),
-                arguments=args if isinstance(args, dict) else {},
-            )
-        )
+        call = _hermes_block_to_call(raw, f"hermes_{len(calls)}")
+        if call is not None:
+            calls.append(call)
     return calls
 
 
+def _hermes_block_to_call(raw: str, call_id: str) -> ToolCall | None:
+    """Parse the JSON body of one ``<tool_call>`` block, or None if malformed."""
+    try:
+        obj = json.loads(raw.strip())
+    except json.JSONDecodeError:
+        logger.debug(f"Skipping malformed Hermes tool_call block: {raw[:80]!r}")
+        return None
+    if not isinstance(obj, dict):
+        return None
+    name = obj.get("name") or obj.get("tool") or ""
+    args = obj.get("arguments", obj.get("args", {}))
+    if not name:
+        return None
+    return ToolCall(
+        id=call_id, name=str(name), arguments=args if isinstance(args, dict) else {}
+    )
+
+
 def _strip_tool_call_tags(text: str) -> str:
     """Remove Hermes ``<tool_call>`` blocks, leaving any surrounding prose."""
     return _TOOL_CALL_RE.sub("", text).strip()
@@ -161,3 +175,219 @@ def detect_tool_format(model: str | None) -> str:
     if any(tag in name for tag in ("qwen", "hermes", "qwq")):
         return "hermes"
     return "openai"
+
+
+@dataclass
+class StreamEvent:
+    """One incremental piece of a streamed tool-aware turn.
+
+    ``kind`` is "text" (answer prose), "reasoning" (chain-of-thought, display
+    only), "tool_call" (a call whose arguments are complete) or "done" (end of
+    stream; ``result`` carries the turn parsed exactly as the non-streaming path
+    would parse it).
+    """
+
+    kind: str
+    text: str = ""
+    tool_call: ToolCall | None = None
+    result: ChatResult | None = None
+
+
+def _partial_tag_len(text: str, tags: tuple[str, ...]) -> int:
+    """Length of the longest suffix of ``text`` that could begin one of ``tags``.
+
+    That suffix is held back so a tag split across two deltas is never emitted
+    as prose.
+    """
+    lowered = text.lower()
+    for size in range(min(len(lowered), max(len(t) for t in tags) - 1), 0, -1):
+        if any(t.startswith(lowered[-size:]) for t in tags):
+            return size
+    return 0
+
+
+@dataclass
+class _ServerCall:
+    """An OpenAI ``tool_calls`` entry being assembled from stream deltas."""
+
+    index: int
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+    parsed: dict[str, Any] | None = None
+    emitted: bool = False
+
+    def try_complete(self) -> bool:
+        """True once the name is known and the arguments form a JSON object.
+
+        A complete JSON object cannot be extended into a longer valid one, so
+        the first successful parse means the arguments are final.
+        """
+        if self.parsed is not None:
+            return bool(self.name)
+        if not self.arguments.strip():
+            return False
+        try:
+            value = json.loads(self.arguments)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(value, dict):
+            return False
+        self.parsed = value
+        return bool(self.name)
+
+    def to_call(self) -> ToolCall:
+        return ToolCall(
+            id=self.id or f"call_{self.index}",
+            name=self.name,
+            arguments=self.parsed or {},
+        )
+
+
+class StreamingToolParser:
+    """Incremental counterpart of :func:`parse_model_output`.
+
+    Feed it content deltas (``feed_text``), server reasoning deltas
+    (``feed_reasoning``) and OpenAI ``tool_calls`` deltas (``feed_tool_calls``);
+    each returns the :class:`StreamEvent` s that became available. ``<think>``
+    blocks are routed to reasoning and Hermes ``<tool_call>`` blocks are parsed
+    as soon as their closing tag arrives. ``finish`` flushes what is left and
+    ends with a "done" event whose result matches the non-streaming parse, so
+    the streamed and buffered paths never disagree about a turn.
+    """
+
+    def __init__(self) -> None:
+        self._raw: list[str] = []
+        self._reasoning_content: list[str] = []
+        self._pending = ""  # text not yet classified (may end in a partial tag)
+        self._state = "text"  # "text" | "think" | "tool"
+        self._hermes_count = 0
+        self._server_calls: dict[int, _ServerCall] = {}
+
+    def feed_text(self, delta: str) -> list[StreamEvent]:
+        """Consume a content delta, splitting out reasoning and Hermes calls."""
+        if not delta:
+            return []
+        self._raw.append(delta)
+        self._pending += delta
+        events: list[StreamEvent] = []
+        while self._pending:
+            if self._state == "text":
+                consumed = self._scan(
+                    (_THINK_OPEN, _TOOL_OPEN), "text", events, on_tag=self._open
+                )
+            elif self._state == "think":
+                consumed = self._scan(
+                    (_THINK_CLOSE,), "reasoning", events, on_tag=self._close
+                )
+            else:
+                consumed = self._scan_tool_call(events)
+            if not consumed:
+                break
+        return events
+
+    def feed_reasoning(self, delta: str) -> list[StreamEvent]:
+        """Consume a server-separated reasoning delta (``reasoning_content``)."""
+        if not delta:
+            return []
+        self._reasoning_content.append(delta)
+        return [StreamEvent("reasoning", text=delta)]
+
+    def feed_tool_calls(self, deltas: list[dict[str, Any]]) -> list[StreamEvent]:
+        """Consume OpenAI ``delta.tool_calls`` entries, emitting completed calls."""
+        events: list[StreamEvent] = []
+        for raw in deltas:
+            index = raw.get("index", len(self._server_calls))
+            call = self._server_calls.setdefault(index, _ServerCall(index=index))
+            call.id = raw.get("id") or call.id
+            fn = raw.get("function") or {}
+            call.name += fn.get("name") or ""
+            args = fn.get("arguments")
+            if isinstance(args, dict):
+                # Some servers (Ollama) send arguments pre-parsed, in one piece.
+                call.parsed = args
+            elif args:
+                call.arguments += args
+            if not call.emitted and call.try_complete():
+                call.emitted = True
+                events.append(StreamEvent("tool_call", tool_call=call.to_call()))
+        return events
+
+    def finish(self) -> list[StreamEvent]:
+        """Flush buffered text and return the closing events (ending in "done")."""
+        events: list[StreamEvent] = []
+        if self._pending:
+            if self._state == "text":
+                events.append(StreamEvent("text", text=self._pending))
+            elif self._state == "think":
+                # Unterminated <think> (truncated stream): it was still reasoning.
+                events.append(StreamEvent("reasoning", text=self._pending))
+            self._pending = ""
+
+        server_calls: list[ToolCall] = []
+        for index in sorted(self._server_calls):
+            call = self._server_calls[index]
+            if not call.name:
+                continue
+            if not call.try_complete():
+                logger.warning(
+                    f"Tool call '{call.name}' had unparseable arguments; "
+                    "passing empty dict"
+                )
+            tool_call = call.to_call()
+            server_calls.append(tool_call)
+            if not call.emitted:
+                call.emitted = True
+                events.append(StreamEvent("tool_call", tool_call=tool_call))
+
+        result = parse_model_output(
+            "".join(self._raw),
+            server_tool_calls=server_calls or None,
+            reasoning_content="".join(self._reasoning_content) or None,
+        )
+        events.append(StreamEvent("done", result=result))
+        return events
+
+    def _scan(
+        self,
+        tags: tuple[str, ...],
+        kind: str,
+        events: list[StreamEvent],
+        on_tag: Callable[[str], None],
+    ) -> bool:
+        """Emit ``kind`` text up to the first of ``tags``; True if a tag was hit."""
+        lowered = self._pending.lower()
+        hits = [(lowered.find(t), t) for t in tags if t in lowered]
+        if hits:
+            pos, tag = min(hits)
+            if pos:
+                events.append(StreamEvent(kind, text=self._pending[:pos]))
+            self._pending = self._pending[pos + len(tag) :]
+            on_tag(tag)
+            return True
+        keep = _partial_tag_len(self._pending, tags)
+        emit = self._pending[: len(self._pending) - keep]
+        if emit:
+            events.append(StreamEvent(kind, text=emit))
+        self._pending = self._pending[len(emit) :]
+        return False
+
+    def _scan_tool_call(self, events: list[StreamEvent]) -> bool:
+        """Inside ``<tool_call>``: wait for the closing tag, then parse the body."""
+        pos = self._pending.find(_TOOL_CLOSE)
+        if pos < 0:
+            return False
+        body = self._pending[:pos]
+        self._pending = self._pending[pos + len(_TOOL_CLOSE) :]
+        self._state = "text"
+        call = _hermes_block_to_call(body, f"hermes_{self._hermes_count}")
+        if call is not None:
+            self._hermes_count += 1
+            events.append(StreamEvent("tool_call", tool_call=call))
+        return True
+
+    def _open(self, tag: str) -> None:
+        self._state = "think" if tag == _THINK_OPEN else "tool"
+
+    def _close(self, tag: str) -> None:
+        self._state = "text"
@@ -15,17 +15,40 @@ Design notes:
 - Autonomy is gated by a ``confirm`` callback, not baked in: read-only tools run
   freely; mutating tools (edit/create/run_command) are routed through ``confirm``
   so ExecutionMode / the existing ConfirmationEngine stays the guardrail.
+- With ``stream=True`` (and a client exposing ``stream_chat_with_tools``) each
+  model turn is streamed: text/reasoning deltas are forwarded to ``on_event`` as
+  they arrive, and read-only tools start running as soon as their call is
+  complete, while the model is still generating. Mutating tools wait for the
+  turn to end so a confirm prompt never races the stream.
+- Read-only calls issued in the same turn run concurrently (bounded by
+  ``max_parallel_tools``); a mutating call is a barrier — it runs alone, after
+  the reads issued before it and before the calls issued after it.
+  Observations are always appended in the order the model issued the calls.
+- A registry may carry a ``ToolResultCache``: results of ``cacheable`` tools
+  are memoized on (tool name, canonical arguments), revalidated against the
+  file's mtime when the call names a ``path``, and dropped when a mutating tool
+  touches that path (or, for results not tied to one path, on any mutation).
+- A registry may also carry an ``ObservationStore``: results too large to
+  re-send every iteration are stored out of the conversation and the model
+  gets a digest plus a handle it can drill into (``fetch_observation``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import inspect
+import json
 import logging
+import os
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from .llm_client import ChatMessage, ChatResult, LLMClient
+from .llm_client import ChatMessage, ChatResult, LLMClient, ToolCall
+from .observations import ObservationStore
+from .token_counter import count_tokens
 from .tool_shim import chat_with_tools_shim
 
 logger = logging.getLogger(__name__)
@@ -45,6 +68,7 @@ class Tool:
     parameters: dict[str, Any]  # JSON-schema for the arguments object
     func: ToolFunc
     mutating: bool = False  # if True, routed through the confirm gate
+    cacheable: bool = False  # read-only result may be memoized (ToolResultCache)
 
     def to_schema(self) -> dict[str, Any]:
         """Render as an OpenAI-shape function tool schema."""
@@ -62,11 +86,143 @@ class Tool:
         return await self.func(**arguments)
 
 
+@dataclass
+class _CachedResult:
+    observation: str  # as sent to the model: the digest for a large result
+    path: str | None
+    mtime: float | None
+    handle: str | None = None  # ObservationStore handle the digest points at
+
+
+class ToolResultCache:
+    """Memoized results of read-only tools, shared across loop iterations.
+
+    Keyed on the tool name plus its arguments serialized canonically (sorted
+    keys), so ``read_file(path="a")`` issued twice — or by a sub-agent that
+    shares this cache — runs once. An entry for a call with a ``path`` argument
+    records the file's mtime and is discarded if the file has changed since.
+    ``invalidate`` is called after every mutating tool: it drops entries for
+    the touched path and every entry not tied to a single path (search and
+    index results may depend on any file). A mutating call without a path
+    (``run_command``) clears everything.
+
+    Large results are cached already compressed, with their observation
+    handle; an entry whose handle has been evicted from the store is a miss.
+
+    Scope is up to the owner: clear it at the start of each user turn for a
+    per-turn cache, or keep it for the session. Nothing can tell when a
+    search or index result goes stale through an edit made outside the agent,
+    so a session-scoped owner calls ``clear_project_wide`` each turn instead.
+    """
+
+    def __init__(self, root: Path | None = None, maxsize: int = 256) -> None:
+        self.root = root
+        self.maxsize = maxsize
+        self.enabled = True
+        self._entries: dict[tuple[str, str], _CachedResult] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        return name, json.dumps(arguments, sort_keys=True, default=str)
+
+    def _resolve(self, path: str) -> str:
+        p = Path(path).expanduser()
+        if not p.is_absolute() and self.root is not None:
+            p = self.root / p
+        return os.path.normpath(p)
+
+    @staticmethod
+    def _mtime(path: str) -> float | None:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _path_of(self, arguments: dict[str, Any]) -> str | None:
+        path = arguments.get("path")
+        return self._resolve(path) if isinstance(path, str) and path else None
+
+    def get(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+        observations: ObservationStore | None = None,
+    ) -> str | None:
+        """The memoized observation, or None on a miss or stale entry.
+
+        ``observations`` is the store cached digests point into; an entry
+        whose handle it no longer holds is treated as stale.
+        """
+        if not self.enabled:
+            return None
+        key = self._key(name, arguments)
+        entry = self._entries.get(key)
+        if entry is not None and (
+            (entry.path is not None and self._mtime(entry.path) != entry.mtime)
+            or (
+                entry.handle is not None
+                and observations is not None
+                and entry.handle not in observations
+            )
+        ):
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.observation
+
+    def put(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+        observation: str,
+        handle: str | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        path = self._path_of(arguments)
+        self._entries[self._key(name, arguments)] = _CachedResult(
+            observation, path, self._mtime(path) if path else None, handle
+        )
+
+    def invalidate(self, arguments: dict[str, Any]) -> None:
+        """Drop what a mutating call with ``arguments`` may have made stale."""
+        path = self._path_of(arguments)
+        if path is None:
+            self._entries.clear()
+            return
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if entry.path not in (None, path)
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def clear_project_wide(self) -> None:
+        """Drop entries not tied to one file (searches, index lookups)."""
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if entry.path is not None
+        }
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
 @dataclass
 class ToolRegistry:
     """A named collection of tools."""
 
     tools: dict[str, Tool] = field(default_factory=dict)
+    result_cache: ToolResultCache | None = None
+    observations: ObservationStore | None = None
 
     def register(self, tool: Tool) -> None:
         self.tools[tool.name] = tool
@@ -90,6 +246,16 @@ class LoopResult:
     tool_calls_made: int
     stopped_reason: str  # "final" | "max_iterations" | "error" | "empty"
     reasoning: str = ""  # chain-of-thought from the final model turn (display-only)
+    streamed: bool = False  # final turn's text/reasoning already sent via on_event
+    parallel_time_saved: float = 0.0  # seconds saved by overlapping read-only calls
+    model_calls: int = 0
+    prompt_tokens: int = 0  # estimated, summed over model calls
+    completion_tokens: int = 0  # estimated
+    tool_time: float = 0.0  # wall-clock seconds with at least one tool running
+    # Summed over streamed model calls; None when no call was streamed.
+    prefill_time: float | None = None  # request -> first delta
+    decode_time: float | None = None  # first delta -> end of stream
+    decode_tokens: int = 0  # completion tokens of the streamed calls
 
 
 async def _supports_native_tools(client: LLMClient) -> bool:
@@ -110,6 +276,285 @@ async def _supports_native_tools(client: LLMClient) -> bool:
         return False
 
 
+EventFunc = Callable[[str, dict[str, Any]], None]
+
+
+async def _execute_call(
+    call: ToolCall,
+    registry: ToolRegistry,
+    confirm: ConfirmFunc | None,
+    on_event: EventFunc | None,
+) -> str:
+    """Run one tool call through the confirm gate; return the observation text."""
+    tool = registry.get(call.name)
+    if tool is None:
+        return f"Error: unknown tool '{call.name}'."
+    cache = registry.result_cache
+    cacheable = tool.cacheable and not tool.mutating
+    if cache is not None and cacheable:
+        cached = cache.get(call.name, call.arguments, registry.observations)
+        if cached is not None:
+            if on_event:
+                on_event("tool_cache_hit", {"name": call.name, "args": call.arguments})
+            return cached
+    if (
+        tool.mutating
+        and confirm is not None
+        and not await confirm(call.name, call.arguments)
+    ):
+        return (
+            f"The user declined to run '{call.name}'. "
+            "Do not retry it; consider an alternative or ask the user."
+        )
+    if on_event:
+        on_event("tool_call", {"name": call.name, "args": call.arguments})
+    failed = False
+    try:
+        observation = await tool.run(call.arguments)
+    except Exception as e:  # a tool failing must not kill the loop
+        logger.warning(f"Tool '{call.name}' raised: {e}")
+        observation = f"Error running '{call.name}': {e}"
+        failed = True
+    if cache is not None and tool.mutating:
+        cache.invalidate(call.arguments)
+    observation, handle = _compress(registry, call, observation)
+    if cache is not None and cacheable and not failed:
+        cache.put(call.name, call.arguments, observation, handle)
+    if on_event:
+        on_event("tool_result", {"name": call.name, "result": observation})
+    return observation
+
+
+def _compress(
+    registry: ToolRegistry, call: ToolCall, observation: str
+) -> tuple[str, str | None]:
+    """Swap a large observation for a digest; also return the digest's handle."""
+    store = registry.observations
+    if store is None:
+        return observation, None
+    return store.compress_with_handle(call.name, call.arguments, observation)
+
+
+def _is_mutating(registry: ToolRegistry, call: ToolCall) -> bool:
+    tool = registry.get(call.name)
+    return tool is not None and tool.mutating
+
+
+async def _timed_call(
+    call: ToolCall,
+    registry: ToolRegistry,
+    confirm: ConfirmFunc | None,
+    on_event: EventFunc | None,
+    semaphore: asyncio.Semaphore,
+    spans: list[tuple[float, float]],
+) -> str:
+    """``_execute_call`` under the concurrency bound, recording its time span."""
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            return await _execute_call(call, registry, confirm, on_event)
+        finally:
+            spans.append((start, time.perf_counter()))
+
+
+def _overlap_saved(spans: list[tuple[float, float]]) -> float:
+    """Seconds saved by running ``spans`` overlapped instead of back to back."""
+    total = sum(end - start for start, end in spans)
+    return max(total - _covered(spans), 0.0)
+
+
+def _covered(spans: list[tuple[float, float]]) -> float:
+    """Wall-clock seconds during which at least one of ``spans`` was running."""
+    covered = 0.0
+    run_start = run_end = None
+    for start, end in sorted(spans):
+        if run_end is None or start > run_end:
+            if run_start is not None and run_end is not None:
+                covered += run_end - run_start
+            run_start, run_end = start, end
+        else:
+            run_end = max(run_end, end)
+    if run_start is not None and run_end is not None:
+        covered += run_end - run_start
+    return covered
+
+
+def _message_tokens(message: ChatMessage) -> int:
+    """Estimated prompt tokens of one message (content plus framing)."""
+    tokens = count_tokens(message.content or "") + 4
+    if message.tool_calls:
+        tokens += count_tokens(json.dumps(message.tool_calls))
+    return tokens
+
+
+@dataclass
+class _CallTiming:
+    """Prefill and decode time of the loop's streamed model calls.
+
+    Each call is timed separately (request -> first delta -> end of stream),
+    so tools running between or alongside calls are never counted as either.
+    A call that fails mid-stream is not committed.
+    """
+
+    prefill: float | None = None
+    decode: float | None = None
+    tokens: int = 0
+    _start: float = 0.0
+    _first: float | None = None
+    _end: float | None = None
+
+    def begin(self) -> None:
+        self._start = time.perf_counter()
+        self._first = self._end = None
+
+    def delta(self) -> bool:
+        """Mark a streamed delta; True if it is the call's first."""
+        if self._first is not None:
+            return False
+        self._first = time.perf_counter()
+        return True
+
+    def finish(self) -> None:
+        self._end = time.perf_counter()
+
+    def commit(self, tokens: int) -> None:
+        if self._first is None or self._end is None:
+            return
+        self.prefill = (self.prefill or 0.0) + self._first - self._start
+        self.decode = (self.decode or 0.0) + self._end - self._first
+        self.tokens += tokens
+
+
+def _output_tokens(result: ChatResult | None, calls: list[ToolCall]) -> int:
+    """Estimated tokens the model generated in one turn."""
+    if result is None:
+        return 0
+    tokens = count_tokens(result.content) + count_tokens(result.reasoning)
+    for call in calls:
+        tokens += count_tokens(call.name) + count_tokens(json.dumps(call.arguments))
+    return tokens
+
+
+async def _run_calls(
+    calls: list[ToolCall],
+    registry: ToolRegistry,
+    confirm: ConfirmFunc | None,
+    on_event: EventFunc | None,
+    semaphore: asyncio.Semaphore,
+    spans: list[tuple[float, float]],
+) -> dict[str, str]:
+    """Execute one turn's calls; return observations keyed by call id.
+
+    Consecutive read-only calls are gathered concurrently; each mutating call
+    waits for the reads before it and runs alone through the confirm gate.
+    """
+    observations: dict[str, str] = {}
+    batch: list[ToolCall] = []
+
+    async def flush() -> None:
+        results = await asyncio.gather(
+            *(
+                _timed_call(c, registry, confirm, on_event, semaphore, spans)
+                for c in batch
+            )
+        )
+        observations.update(zip((c.id for c in batch), results, strict=True))
+        batch.clear()
+
+    for call in calls:
+        if _is_mutating(registry, call):
+            await flush()
+            observations[call.id] = await _timed_call(
+                call, registry, confirm, on_event, semaphore, spans
+            )
+        else:
+            batch.append(call)
+    await flush()
+    return observations
+
+
+async def _streamed_turn(
+    client: LLMClient,
+    convo: list[ChatMessage],
+    schemas: list[dict[str, Any]],
+    registry: ToolRegistry,
+    *,
+    model: str | None,
+    confirm: ConfirmFunc | None,
+    on_event: EventFunc | None,
+    semaphore: asyncio.Semaphore,
+    spans: list[tuple[float, float]],
+    timing: _CallTiming,
+) -> tuple[ChatResult | None, list[ToolCall], dict[str, str]]:
+    """Stream one model turn, executing tool calls as soon as they complete.
+
+    A worker task overlapping the rest of the stream starts each read-only call
+    as it arrives (concurrently, under ``semaphore``). A mutating call waits for
+    the reads issued before it and for the stream to end before it reaches the
+    confirm gate; calls issued after it wait for it in turn.
+
+    Returns ``(result, calls, observations)``: the parsed turn (None if the
+    stream failed before completing), every call issued in order, and the
+    observations of the calls already executed, keyed by call id.
+    """
+    queue: asyncio.Queue[ToolCall | None] = asyncio.Queue()
+    stream_done = asyncio.Event()
+    calls: list[ToolCall] = []
+    observations: dict[str, str] = {}
+
+    running: list[asyncio.Future[None]] = []
+
+    async def run(call: ToolCall) -> None:
+        observations[call.id] = await _timed_call(
+            call, registry, confirm, on_event, semaphore, spans
+        )
+
+    async def worker() -> None:
+        while (call := await queue.get()) is not None:
+            if _is_mutating(registry, call):
+                await asyncio.gather(*running)
+                running.clear()
+                await stream_done.wait()
+                await run(call)
+            else:
+                running.append(asyncio.ensure_future(run(call)))
+        await asyncio.gather(*running)
+
+    def dispatch(call: ToolCall) -> None:
+        if all(c.id != call.id for c in calls):
+            calls.append(call)
+            queue.put_nowait(call)
+
+    result: ChatResult | None = None
+    task = asyncio.ensure_future(worker())
+    timing.begin()
+    try:
+        async for event in client.stream_chat_with_tools(
+            convo, tools=schemas, model=model
+        ):
+            if timing.delta() and on_event:
+                on_event("first_token", {})
+            if event.kind == "text" and on_event:
+                on_event("text_delta", {"content": event.text})
+            elif event.kind == "reasoning" and on_event:
+                on_event("reasoning_delta", {"content": event.text})
+            elif event.kind == "tool_call" and event.tool_call is not None:
+                dispatch(event.tool_call)
+            elif event.kind == "done":
+                result = event.result
+        timing.finish()
+        for call in result.tool_calls if result is not None else []:
+            dispatch(call)
+        stream_done.set()
+        queue.put_nowait(None)
+        await task
+    finally:
+        for pending in [task, *running]:
+            if not pending.done():
+                pending.cancel()
+    return result, calls, observations
+
+
 async def run_agent_loop(
     client: LLMClient,
     messages: list[ChatMessage],
@@ -120,7 +565,9 @@ async def run_agent_loop(
     allow_tools: bool = True,
     max_iterations: int = 10,
     use_native_tools: bool | None = None,
-    on_event: Callable[[str, dict[str, Any]], None] | None = None,
+    on_event: EventFunc | None = None,
+    stream: bool = False,
+    max_parallel_tools: int = 4,
 ) -> LoopResult:
     """Drive the model in a bounded tool-use loop.
 
@@ -136,21 +583,37 @@ async def run_agent_loop(
             no tools — pure conversation.
         max_iterations: Safety cap on tool round-trips.
         use_native_tools: Force native (True) / shim (False); auto-detect if None.
-        on_event: Optional observer for ("tool_call"|"tool_result"|"final", data).
+        on_event: Optional observer for ("tool_call"|"tool_result"|"final", data),
+            "tool_cache_hit" when a memoized result is reused,
+            "first_token" when each model call's first output arrives, plus
+            "text_delta"/"reasoning_delta" while streaming.
+        stream: Stream each model turn (native tools only, and only when the
+            client has ``stream_chat_with_tools``); falls back to the buffered
+            call for the rest of the run if a stream fails.
+        max_parallel_tools: Cap on read-only calls running at once.
 
     Returns:
         LoopResult with the final assistant text and loop telemetry.
     """
     convo = list(messages)
+    # Prompt size of the next model call, grown as messages are appended
+    # rather than recounted every iteration.
+    context_tokens = sum(_message_tokens(m) for m in convo) + 3
+    model_calls = prompt_tokens = completion_tokens = 0
 
     # CHAT mode / no tools: a single plain completion, no loop.
     if not allow_tools or len(registry) == 0:
         text = await client.chat(convo, model=model) or ""
+        if on_event:
+            on_event("first_token", {})
         return LoopResult(
             content=text,
             iterations=0,
             tool_calls_made=0,
             stopped_reason="final" if text else "empty",
+            model_calls=1,
+            prompt_tokens=context_tokens,
+            completion_tokens=count_tokens(text),
         )
 
     native = (
@@ -161,70 +624,106 @@ async def run_agent_loop(
     schemas = registry.schemas()
     tool_calls_made = 0
 
+    streaming = stream and native and hasattr(client, "stream_chat_with_tools")
+    semaphore = asyncio.Semaphore(max(1, max_parallel_tools))
+    time_saved = 0.0
+    tool_time = 0.0
+    timing = _CallTiming()
+
     for iteration in range(1, max_iterations + 1):
-        if native:
-            result: ChatResult = await client.chat_with_tools(
-                convo, tools=schemas, model=model
+        result: ChatResult | None = None
+        calls: list[ToolCall] = []
+        observations: dict[str, str] = {}
+        spans: list[tuple[float, float]] = []
+        if streaming:
+            result, calls, observations = await _streamed_turn(
+                client,
+                convo,
+                schemas,
+                registry,
+                model=model,
+                confirm=confirm,
+                on_event=on_event,
+                semaphore=semaphore,
+                spans=spans,
+                timing=timing,
             )
-        else:
-            result = await chat_with_tools_shim(client, convo, schemas, model=model)
-
-        if not result.has_tool_calls:
+            if result is None and not calls:
+                logger.info("Streaming tool turn failed; using buffered requests")
+                streaming = False
+        if result is None and not calls:
+            if native:
+                result = await client.chat_with_tools(convo, tools=schemas, model=model)
+            else:
+                result = await chat_with_tools_shim(client, convo, schemas, model=model)
+            calls = list(result.tool_calls)
+            if on_event:
+                on_event("first_token", {})
+        elif streaming:
+            timing.commit(_output_tokens(result, calls))
+        content = result.content if result is not None else ""
+        model_calls += 1
+        prompt_tokens += context_tokens
+        completion_tokens += _output_tokens(result, calls)
+
+        if not calls:
             # The model gave a final answer (or nothing).
-            if on_event and result.content:
-                on_event("final", {"content": result.content})
+            if on_event and content:
+                on_event("final", {"content": content})
             return LoopResult(
-                content=result.content,
+                content=content,
                 iterations=iteration,
                 tool_calls_made=tool_calls_made,
-                stopped_reason="final" if result.content else "empty",
-                reasoning=result.reasoning,
+                stopped_reason="final" if content else "empty",
+                reasoning=result.reasoning if result is not None else "",
+                streamed=streaming,
+                parallel_time_saved=time_saved,
+                tool_time=tool_time,
+                model_calls=model_calls,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                prefill_time=timing.prefill,
+                decode_time=timing.decode,
+                decode_tokens=timing.tokens,
             )
 
         # Record the assistant's tool-call turn so the model sees its own calls.
         convo.append(
             ChatMessage(
                 role="assistant",
-                content=result.content,
+                content=content,
                 tool_calls=[
                     {
                         "id": tc.id,
                         "type": "function",
                         "function": {"name": tc.name, "arguments": tc.arguments},
                     }
-                    for tc in result.tool_calls
+                    for tc in calls
                 ],
             )
         )
 
-        for call in result.tool_calls:
+        observations.update(
+            await _run_calls(
+                [c for c in calls if c.id not in observations],
+                registry,
+                confirm,
+                on_event,
+                semaphore,
+                spans,
+            )
+        )
+        time_saved += _overlap_saved(spans)
+        tool_time += _covered(spans)
+        context_tokens += _message_tokens(convo[-1])
+        for call in calls:
             tool_calls_made += 1
-            tool = registry.get(call.name)
-            if tool is None:
-                observation = f"Error: unknown tool '{call.name}'."
-            elif (
-                tool.mutating
-                and confirm is not None
-                and not await confirm(call.name, call.arguments)
-            ):
-                observation = (
-                    f"The user declined to run '{call.name}'. "
-                    "Do not retry it; consider an alternative or ask the user."
-                )
-            else:
-                if on_event:
-                    on_event("tool_call", {"name": call.name, "args": call.arguments})
-                try:
-                    observation = await tool.run(call.arguments)
-                except Exception as e:  # a tool failing must not kill the loop
-                    logger.warning(f"Tool '{call.name}' raised: {e}")
-                    observation = f"Error running '{call.name}': {e}"
-                if on_event:
-                    on_event("tool_result", {"name": call.name, "result": observation})
-
             convo.append(
-                ChatMessage(role="tool", content=observation, tool_call_id=call.id)
+                ChatMessage(
+                    role="tool", content=observations[call.id], tool_call_id=call.id
+                )
             )
+            context_tokens += _message_tokens(convo[-1])
 
     # Hit the iteration cap without a final answer.
     logger.info(f"Agent loop hit max_iterations={max_iterations}")
@@ -233,4 +732,12 @@ async def run_agent_loop(
         iterations=max_iterations,
         tool_calls_made=tool_calls_made,
         stopped_reason="max_iterations",
+        parallel_time_saved=time_saved,
+        tool_time=tool_time,
+        model_calls=model_calls,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        prefill_time=timing.prefill,
+        decode_time=timing.decode,
+        decode_tokens=timing.tokens,
     )
@@ -0,0 +1,336 @@
+"""Concurrent pre-completion stages for a single user turn.
+
+Before the main completion a turn may need a project scan, intent detection,
+context assembly and semantic retrieval. Only some of these depend on each
+other (intent detection and context assembly both need the scanned file list;
+semantic retrieval needs nothing), so :class:`TurnScheduler` starts each stage
+as a task as soon as its dependencies allow and the turn awaits results only
+where it needs them. Work that turns out to be unneeded — context for a turn
+answered directly by an action — is cancelled.
+
+Every stage is recorded as a :class:`StageSpan`: when it ran, how it ended and
+how long the turn was blocked waiting on it. The blocked time is the turn's
+critical path; the rest of each stage's run time overlapped other work.
+Stages are also traced as spans (see :mod:`..utils.tracing`).
+
+The completion itself is broken down in :class:`GenerationStats`:
+time to first token, prompt and completion tokens, decode rate and the time
+spent running tools inside the agent loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..utils.tracing import Span, tracer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageSpan:
+    """One stage of a turn, with times relative to the turn's start."""
+
+    name: str
+    start: float = 0.0
+    end: float | None = None
+    status: str = "pending"  # "pending" | "running" | "done" | "failed" | "cancelled"
+    waited: float = 0.0  # seconds the turn was blocked on this stage
+
+    @property
+    def duration(self) -> float:
+        return (self.end - self.start) if self.end is not None else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start": round(self.start, 4),
+            "duration": round(self.duration, 4),
+            "waited": round(self.waited, 4),
+            "status": self.status,
+        }
+
+
+@dataclass
+class GenerationStats:
+    """Where a turn's completion stage spent its time, and how many tokens.
+
+    Token counts come from the local token counter (the servers this CLI
+    talks to do not reliably report usage when streaming). For a single
+    completion, prefill and decode split its duration at the first token.
+    The agent loop times each streamed model call itself and reports the
+    sums, so tool time between or during calls is not part of either.
+    """
+
+    model_calls: int = 0
+    prompt_tokens: int = 0  # summed over model calls (each resends the prompt)
+    completion_tokens: int = 0
+    tool_time: float = 0.0  # wall-clock seconds tools were running
+    ttft: float | None = None  # turn start -> first streamed token
+    prefill: float | None = None  # waiting for first tokens, summed per call
+    completion_time: float = 0.0  # duration of the completion stage
+    decode: float | None = None  # measured decode time (agent loop)
+    decode_tokens: int | None = None  # completion tokens generated in ``decode``
+
+    @property
+    def decode_time(self) -> float:
+        """Completion time spent generating: no prefill wait, no tools."""
+        if self.decode is not None:
+            return self.decode
+        return max(self.completion_time - self.tool_time - (self.prefill or 0.0), 0.0)
+
+    @property
+    def tokens_per_sec(self) -> float | None:
+        tokens = (
+            self.decode_tokens
+            if self.decode_tokens is not None
+            else self.completion_tokens
+        )
+        if not tokens or self.decode_time <= 0:
+            return None
+        return tokens / self.decode_time
+
+    def as_dict(self) -> dict[str, Any]:
+        def secs(value: float | None) -> float | None:
+            return round(value, 4) if value is not None else None
+
+        rate = self.tokens_per_sec
+        return {
+            "model_calls": self.model_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "ttft": secs(self.ttft),
+            "prefill": secs(self.prefill),
+            "decode": secs(self.decode_time),
+            "tool_time": secs(self.tool_time),
+            "tokens_per_sec": round(rate, 1) if rate is not None else None,
+        }
+
+
+@dataclass
+class TurnTimeline:
+    """Stages of a finished turn and where its wall-clock time went."""
+
+    spans: list[StageSpan] = field(default_factory=list)
+    total: float = 0.0
+    generation: GenerationStats = field(default_factory=GenerationStats)
+
+    @property
+    def critical_path(self) -> list[StageSpan]:
+        """Stages the turn blocked on, in start order."""
+        return [s for s in self.spans if s.waited > 0]
+
+    @property
+    def overlap_saved(self) -> float:
+        """Run time of finished stages that did not block the turn."""
+        return sum(
+            max(s.duration - s.waited, 0.0) for s in self.spans if s.status == "done"
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total": round(self.total, 4),
+            "overlap_saved": round(self.overlap_saved, 4),
+            "critical_path": [s.name for s in self.critical_path],
+            "stages": [s.as_dict() for s in self.spans],
+            "generation": self.generation.as_dict(),
+        }
+
+    def breakdown_lines(self) -> list[str]:
+        """Human-readable breakdown for ``/perf last``."""
+        lines = [f"Turn: {self.total * 1000:.0f}ms"]
+        for span in self.spans:
+            blocked = f", blocked {span.waited * 1000:.0f}ms" if span.waited else ""
+            lines.append(
+                f"  {span.name:<12} {span.duration * 1000:>7.0f}ms "
+                f"at +{span.start * 1000:.0f}ms {span.status}{blocked}"
+            )
+        gen = self.generation
+        if gen.model_calls:
+            if gen.ttft is not None:
+                lines.append(
+                    f"Time to first token: {gen.ttft * 1000:.0f}ms "
+                    f"(prefill {(gen.prefill or 0.0) * 1000:.0f}ms)"
+                )
+            rate = gen.tokens_per_sec
+            lines.append(
+                f"Tokens: {gen.prompt_tokens} prompt, {gen.completion_tokens} "
+                f"completion over {gen.model_calls} call(s)"
+                + (f", {rate:.1f} tok/s" if rate is not None else "")
+            )
+            if gen.tool_time:
+                lines.append(f"Tool time: {gen.tool_time * 1000:.0f}ms")
+        return lines
+
+
+class TurnScheduler:
+    """Runs a turn's stages concurrently and records their timeline.
+
+    Usage::
+
+        sched = TurnScheduler()
+        sched.start("scan", scan)
+        sched.start("context", build_context, after=("scan",))
+        ...
+        context = await sched.result("context", default="")
+        sched.begin("completion")
+        ...
+        timeline = await sched.close()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._t0 = clock()
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._spans: dict[str, StageSpan] = {}
+        self._inline: str | None = None
+        self._inline_trace: Span | None = None
+        self.generation = GenerationStats()
+
+    def _now(self) -> float:
+        return self._clock() - self._t0
+
+    def has(self, name: str) -> bool:
+        return name in self._tasks
+
+    def start(
+        self,
+        name: str,
+        work: Callable[[], Awaitable[Any]],
+        *,
+        after: Sequence[str] = (),
+    ) -> None:
+        """Start stage ``name`` running ``work()`` once ``after`` have finished.
+
+        A dependency that fails or is cancelled does not stop the stage; each
+        stage handles a missing input itself (as it would sequentially).
+        """
+        span = self._spans[name] = StageSpan(name)
+        deps = [self._tasks[d] for d in after if d in self._tasks]
+
+        async def run() -> Any:
+            if deps:
+                await asyncio.wait(deps)
+            span.start = self._now()
+            span.status = "running"
+            try:
+                with tracer.span(name, "stage"):
+                    result = await work()
+            except asyncio.CancelledError:
+                span.status = "cancelled"
+                raise
+            except Exception:
+                span.status = "failed"
+                raise
+            finally:
+                span.end = self._now()
+            span.status = "done"
+            return result
+
+        self._tasks[name] = asyncio.create_task(run(), name=f"turn:{name}")
+
+    async def result(self, name: str, default: Any = None) -> Any:
+        """Wait for stage ``name``; ``default`` if it failed, was cancelled or
+        was never started."""
+        task = self._tasks.get(name)
+        if task is None:
+            return default
+        began = self._now()
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # the turn itself was cancelled
+            return default
+        except Exception as e:
+            logger.warning(f"Turn stage '{name}' failed: {e}")
+            return default
+        finally:
+            self._spans[name].waited += self._now() - began
+
+    def cancel(self, *names: str) -> None:
+        """Cancel speculative stages whose results are no longer needed."""
+        for name in names:
+            task = self._tasks.get(name)
+            if task is not None and not task.done():
+                task.cancel()
+                span = self._spans[name]
+                if span.status == "pending":
+                    span.status = "cancelled"
+                    span.start = span.end = self._now()
+
+    def begin(self, name: str) -> None:
+        """Start inline work the turn runs itself (it is all critical path).
+
+        The stage ends at the next :meth:`begin` or at :meth:`close`.
+        """
+        self._end_inline()
+        self._spans[name] = StageSpan(name, start=self._now(), status="running")
+        self._inline = name
+        self._inline_trace = tracer.begin(name, "stage")
+
+    def _end_inline(self) -> None:
+        if self._inline is None:
+            return
+        span = self._spans[self._inline]
+        span.end = self._now()
+        span.status = "done"
+        span.waited = span.duration
+        self._inline = None
+        tracer.end(self._inline_trace)
+        self._inline_trace = None
+
+    def first_token(self) -> None:
+        """Mark the first streamed token of the turn (later calls are ignored)."""
+        gen = self.generation
+        if gen.ttft is not None:
+            return
+        gen.ttft = self._now()
+        completion = self._spans.get("completion")
+        if completion is not None:
+            gen.prefill = gen.ttft - completion.start
+
+    def record_generation(
+        self,
+        *,
+        prompt_tokens: int,
+        completion_tokens: int,
+        model_calls: int = 1,
+        tool_time: float = 0.0,
+        prefill: float | None = None,
+        decode: float | None = None,
+        decode_tokens: int = 0,
+    ) -> None:
+        """Add the token counts and tool time of the turn's model call(s).
+
+        ``prefill`` and ``decode`` are per-call timings measured by the caller
+        (summed over its calls); a measured ``prefill`` replaces the estimate
+        :meth:`first_token` made from the completion stage's start.
+        """
+        gen = self.generation
+        gen.model_calls += model_calls
+        gen.prompt_tokens += prompt_tokens
+        gen.completion_tokens += completion_tokens
+        gen.tool_time += tool_time
+        if prefill is not None:
+            gen.prefill = prefill
+        if decode is not None:
+            gen.decode = (gen.decode or 0.0) + decode
+            gen.decode_tokens = (gen.decode_tokens or 0) + decode_tokens
+
+    async def close(self) -> TurnTimeline:
+        """Cancel stages nobody waited for and return the turn's timeline."""
+        self._end_inline()
+        completion = self._spans.get("completion")
+        if completion is not None:
+            self.generation.completion_time = completion.duration
+        self.cancel(*(n for n, t in self._tasks.items() if not t.done()))
+        # Also retrieves exceptions of failed stages nobody waited for.
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        spans = sorted(self._spans.values(), key=lambda s: s.start)
+        return TurnTimeline(spans=spans, total=self._now(), generation=self.generation)
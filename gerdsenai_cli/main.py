@@ -6,6 +6,8 @@ This module contains the core application logic and interactive loop.
 
 import asyncio
 import contextlib
+import functools
+import json
 import logging
 import os
 import sys
@@ -17,79 +19,21 @@ if TYPE_CHECKING:
     from .ui.prompt_toolkit_tui import PromptToolkitTUI
 
 from rich.console import Console
-from rich.prompt import Prompt
-
-from .core.capabilities import CapabilityDetector, ModelCapabilities
 
 logger = logging.getLogger(__name__)
 
-from .commands.agent import (
-    AgentConfigCommand,
-    AgentStatusCommand,
-    ChatCommand,
-    RefreshContextCommand,
-    ResetCommand,
-)
-from .commands.anthropic_cmd import AnthropicCommand
-from .commands.audio_commands import (
-    AudioStatusCommand,
-    SpeakCommand,
-    TranscribeCommand,
-)
-from .commands.delegate import DelegateCommand
-from .commands.discover import DiscoverCommand
-from .commands.files import (
-    CreateFileCommand,
-    EditFileCommand,
-    FilesCommand,
-    ReadCommand,
-    SearchFilesCommand,
-    SessionCommand,
-)
-from .commands.index import IndexCommand
-from .commands.mcp import MCPCommand
-from .commands.model import (
-    ListModelsCommand,
-    ModelInfoCommand,
-    ModelStatsCommand,
-    SwitchModelCommand,
-)
-
-# Import command system
+# Command classes are imported on first use (see commands/catalog.py), so
+# startup and headless runs don't pay for every command module.
+from .commands.catalog import BUILTIN_COMMANDS
 from .commands.parser import CommandParser
-from .commands.persona import PersonaCommand
-from .commands.system import (
-    AboutCommand,
-    ConfigCommand,
-    CopyCommand,
-    DebugCommand,
-    DoctorCommand,
-    ExitCommand,
-    HelpCommand,
-    InitCommand,
-    SetupCommand,
-    StatusCommand,
-    ToolsCommand,
-    TuiCommand,
-)
-from .commands.terminal import (
-    ClearHistoryCommand,
-    HistoryCommand,
-    RunCommand,
-    TerminalStatusCommand,
-    WorkingDirectoryCommand,
-)
-from .commands.vision_commands import (
-    ImageCommand,
-    OCRCommand,
-    VisionStatusCommand,
-)
 from .config.manager import ENV_SERVER_URL, ConfigManager, apply_env_overrides
 from .config.settings import Settings
 from .core.agent import Agent
+from .core.capabilities import CapabilityDetector, ModelCapabilities
 from .core.errors import GerdsenAIError
 from .core.llm_client import LLMClient
 from .core.modes import ExecutionMode
+from .core.startup import StartupScheduler
 from .plugins.registry import plugin_registry
 from .utils.conversation_io import ConversationManager
 from .utils.display import (
@@ -99,6 +43,7 @@ from .utils.display import (
     show_success,
     show_warning,
 )
+from .utils.tracing import tracer
 
 console = Console()
 
@@ -146,6 +91,8 @@ class GerdsenAICLI:
         self.conversation_manager = ConversationManager()
 
         # Smart routing components (Phase 8d)
+        self.startup: StartupScheduler | None = None  # initialize() steps
+
         self.smart_router: Any | None = None  # SmartRouter instance
         self.proactive_context: Any | None = None  # ProactiveContextBuilder instance
 
@@ -156,6 +103,7 @@ class GerdsenAICLI:
         Returns:
             True if initialization successful, False otherwise
         """
+        self.startup = startup = StartupScheduler()
         try:
             # Load or create configuration
             self.settings = await self.config_manager.load_settings()
@@ -193,93 +141,46 @@ class GerdsenAICLI:
                         show_error("Setup cancelled or failed.")
                         return False
 
+            tracer.configure(
+                enabled=self.settings.tracing,
+                sample_rate=self.settings.trace_sample_rate,
+                capacity=self.settings.trace_buffer_spans,
+                memory=self.settings.trace_memory,
+            )
+
             # Initialize LLM client with async context manager
             self.llm_client = LLMClient(self.settings)
             await self.llm_client.__aenter__()  # Enter async context
 
-            # Test connection to LLM server
-            show_info("Testing connection to LLM server...")
-            connected = await self.llm_client.connect()
-
-            if not connected:
-                show_warning(
-                    "Could not connect to LLM server. Please check your configuration."
-                )
-                return False
-
-            # Load available models
-            models = await self.llm_client.list_models()
-            if not models:
-                show_warning("No models found on the LLM server.")
-            else:
-                show_info(f"Found {len(models)} available models")
-
-                # Set current model if not already set
-                if not self.settings.current_model and models:
-                    self.settings.current_model = models[0].id
-                    await self.config_manager.save_settings(self.settings)
-                    show_info(f"Set default model to: {models[0].id}")
-
-            # Initialize AI agent with agentic capabilities
+            # Independent startup steps run concurrently. Only the connection
+            # and model list are awaited here; the rest finish in the
+            # background and each feature becomes available when its step does.
             self.agent = Agent(self.llm_client, self.settings)
-            agent_ready = await self.agent.initialize()
 
-            if not agent_ready:
-                show_warning(
-                    "Agent initialization failed, some features may be limited"
-                )
-
-            # Auto-refresh workspace context (like Claude CLI or Gemini CLI)
-            # This ensures ARCHITECT mode can see repository files without manual commands
-            if agent_ready and self.agent.context_manager:
-                try:
-                    logger.debug("Checking workspace context...")
-                    # The project scan is lazy (runs on the first turn that needs
-                    # context), so files is typically empty here -- report only
-                    # when an eager scan has already populated it.
-                    context_files = len(self.agent.context_manager.files)
-                    if context_files > 0:
-                        show_info(f"📂 Loaded {context_files} files into context")
-                    else:
-                        logger.debug(
-                            "Project context will load on first use (lazy scan)"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to report workspace context: {e}")
+            show_info("Testing connection to LLM server...")
+            startup.start("connect", self.llm_client.connect)
+            startup.start("models", self._load_models, after=("connect",))
+            startup.start("agent", self._initialize_agent)
 
-            # Initialize command system
+            # Command registration is cheap (modules load on first use), so it
+            # runs inline; skills discovery and plugins are optional steps.
             await self._initialize_commands()
-
-            # Initialize plugin system (Frontier AI)
-            await self._initialize_plugins()
-
-            # Initialize SmartRouter and ProactiveContextBuilder (Phase 8d)
+            startup.start("skills", self._initialize_skills)
+            startup.start("plugins", self._initialize_plugins)
             if self.settings.enable_smart_routing:
-                from .core.proactive_context import ProactiveContextBuilder
-                from .core.smart_router import SmartRouter
-
-                self.smart_router = SmartRouter(
-                    llm_client=self.llm_client,
-                    settings=self.settings,
-                    command_parser=self.command_parser,
-                )
-
-                # Get project root and context window for ProactiveContextBuilder
-                project_root = Path.cwd()
-                max_tokens = self.settings.model_context_window or 4096
-
-                self.proactive_context = ProactiveContextBuilder(
-                    project_root=project_root,
-                    max_context_tokens=max_tokens,
-                    context_usage_ratio=self.settings.context_window_usage,
-                )
-
-                show_info(
-                    "🧠 Smart routing enabled - natural language commands supported!"
-                )
+                startup.start("smart_router", self._initialize_smart_router)
             else:
                 logger.info("SmartRouter disabled via configuration")
 
+            if not await startup.result("connect", default=False):
+                show_warning(
+                    "Could not connect to LLM server. Please check your configuration."
+                )
+                await startup.aclose()
+                return False
+            await startup.result("models")
+            startup.mark_interactive()
+
             show_success("GerdsenAI CLI initialized successfully!")
             return True
 
@@ -287,8 +188,84 @@ class GerdsenAICLI:
             show_error(f"Failed to initialize: {e}")
             if self.debug:
                 console.print_exception()
+            await startup.aclose()
             return False
 
+    async def _load_models(self) -> None:
+        """Startup step: list models, pick a default and start preloading."""
+        assert self.llm_client is not None and self.settings is not None
+        models = await self.llm_client.list_models()
+        if not models:
+            show_warning("No models found on the LLM server.")
+        else:
+            show_info(f"Found {len(models)} available models")
+
+            # Set current model if not already set
+            if not self.settings.current_model and models:
+                self.settings.current_model = models[0].id
+                await self.config_manager.save_settings(self.settings)
+                show_info(f"Set default model to: {models[0].id}")
+
+        # Warm the models up while the rest of startup runs, so the first
+        # prompt doesn't wait on a cold load (Ollama only)
+        if self.settings.preload_models:
+            to_load = [(self.settings.current_model, "chat")]
+            if self.settings.enable_vector_index:
+                to_load.append((self.settings.embedding_model, "embedding"))
+            self.llm_client.preload_models(to_load)
+
+    async def _initialize_agent(self) -> bool:
+        """Startup step: initialize the agent (and its opt-in eager scan)."""
+        assert self.agent is not None
+        agent_ready = bool(await self.agent.initialize())
+
+        if not agent_ready:
+            show_warning("Agent initialization failed, some features may be limited")
+
+        # Auto-refresh workspace context (like Claude CLI or Gemini CLI)
+        # This ensures ARCHITECT mode can see repository files without manual commands
+        if agent_ready and self.agent.context_manager:
+            try:
+                logger.debug("Checking workspace context...")
+                # The project scan is lazy (runs on the first turn that needs
+                # context), so files is typically empty here -- report only
+                # when an eager scan has already populated it.
+                context_files = len(self.agent.context_manager.files)
+                if context_files > 0:
+                    show_info(f"📂 Loaded {context_files} files into context")
+                else:
+                    logger.debug("Project context will load on first use (lazy scan)")
+            except Exception as e:
+                logger.warning(f"Failed to report workspace context: {e}")
+        return agent_ready
+
+    async def _initialize_smart_router(self) -> None:
+        """Startup step: SmartRouter and ProactiveContextBuilder (Phase 8d)."""
+        assert self.llm_client is not None and self.settings is not None
+        from .core.proactive_context import ProactiveContextBuilder
+        from .core.smart_router import SmartRouter
+
+        self.smart_router = SmartRouter(
+            llm_client=self.llm_client,
+            settings=self.settings,
+            command_parser=self.command_parser,
+            local_classifier=(
+                self.agent.intent_parser.local_classifier if self.agent else None
+            ),
+        )
+
+        # Get project root and context window for ProactiveContextBuilder
+        project_root = Path.cwd()
+        max_tokens = self.settings.model_context_window or 4096
+
+        self.proactive_context = ProactiveContextBuilder(
+            project_root=project_root,
+            max_context_tokens=max_tokens,
+            context_usage_ratio=self.settings.context_window_usage,
+        )
+
+        show_info("🧠 Smart routing enabled - natural language commands supported!")
+
     async def _initialize_commands(self) -> None:
         """Initialize the command parser and register all commands."""
         self.command_parser = CommandParser()
@@ -300,78 +277,19 @@ class GerdsenAICLI:
             "settings": self.settings,
             "config_manager": self.config_manager,
             "console": console,
+            "startup": self.startup,
         }
         self.command_parser.set_context(command_context)
 
-        # Register system commands
-        self.command_parser.register_command(HelpCommand())
-        self.command_parser.register_command(ExitCommand())
-        self.command_parser.register_command(StatusCommand())
-        self.command_parser.register_command(ConfigCommand())
-        self.command_parser.register_command(DebugCommand())
-        self.command_parser.register_command(SetupCommand())
-        self.command_parser.register_command(AboutCommand())
-        self.command_parser.register_command(CopyCommand())
-        self.command_parser.register_command(InitCommand())
-        self.command_parser.register_command(ToolsCommand())
-        self.command_parser.register_command(TuiCommand())
-        self.command_parser.register_command(MCPCommand())
-        self.command_parser.register_command(DoctorCommand())
-
-        # Register model commands
-        self.command_parser.register_command(ListModelsCommand())
-        self.command_parser.register_command(SwitchModelCommand())
-        self.command_parser.register_command(ModelInfoCommand())
-        self.command_parser.register_command(ModelStatsCommand())
-        self.command_parser.register_command(DiscoverCommand())
-        self.command_parser.register_command(IndexCommand())
-        self.command_parser.register_command(AnthropicCommand())
-        self.command_parser.register_command(PersonaCommand())
-
-        # Register agent commands
-        self.command_parser.register_command(AgentStatusCommand())
-        self.command_parser.register_command(ChatCommand())
-        self.command_parser.register_command(RefreshContextCommand())
-        self.command_parser.register_command(ResetCommand())
-        self.command_parser.register_command(AgentConfigCommand())
-        self.command_parser.register_command(DelegateCommand())
-        if self.agent:
-            # Register Phase 8d intelligence features
-            from .commands.memory import MemoryCommand
-            from .commands.planning import PlanCommand
-
-            self.command_parser.register_command(PlanCommand(self.agent))
-            self.command_parser.register_command(MemoryCommand(self.agent))
-
-        # Register file commands
-        self.command_parser.register_command(FilesCommand())
-        self.command_parser.register_command(ReadCommand())
-        self.command_parser.register_command(EditFileCommand())
-        self.command_parser.register_command(CreateFileCommand())
-        self.command_parser.register_command(SearchFilesCommand())
-        self.command_parser.register_command(SessionCommand())
-
-        # Register terminal commands (Phase 6)
-        self.command_parser.register_command(RunCommand())
-        self.command_parser.register_command(HistoryCommand())
-        self.command_parser.register_command(ClearHistoryCommand())
-        self.command_parser.register_command(WorkingDirectoryCommand())
-        self.command_parser.register_command(TerminalStatusCommand())
-
-        # Register vision commands (Frontier AI Phase 2)
-        self.command_parser.register_command(ImageCommand())
-        self.command_parser.register_command(OCRCommand())
-        self.command_parser.register_command(VisionStatusCommand())
-
-        # Register audio commands (Frontier AI Phase 3)
-        self.command_parser.register_command(TranscribeCommand())
-        self.command_parser.register_command(SpeakCommand())
-        self.command_parser.register_command(AudioStatusCommand())
-
-        # Register imported skills/agent files (.claude/skills, .claude/agents,
-        # AGENTS.md) as slash commands and fold a summary into the agent's
-        # system prompt. Read-only; no-op when none are present.
-        self._register_imported_skills()
+        # Register the built-in commands from the static catalog; each
+        # module is imported when its command first runs.
+        for spec in BUILTIN_COMMANDS:
+            if not spec.needs_agent:
+                self.command_parser.register_lazy(spec)
+            elif self.agent:
+                self.command_parser.register_lazy(
+                    spec, functools.partial(spec.load, self.agent)
+                )
 
         # Apply the active agent profile (persona + model), if one is set.
         self._apply_active_persona()
@@ -384,18 +302,23 @@ class GerdsenAICLI:
         if profile and self.agent is not None and profile.system_prompt:
             self.agent.persona_context = profile.system_prompt
 
-    def _register_imported_skills(self) -> None:
-        """Discover external skill/agent files and expose them."""
+    async def _initialize_skills(self) -> None:
+        """Startup step: discover external skill/agent files and expose them.
+
+        Imported skills/agent files (.claude/skills, .claude/agents, AGENTS.md)
+        become slash commands and a summary is folded into the agent's system
+        prompt. Read-only; no-op when none are present.
+        """
         from .commands.skills import SkillCommand, SkillsCommand
         from .core.skill_loader import build_skills_context, discover_skills
 
         if self.command_parser is None:
             return
 
-        skills = discover_skills()
+        skills = await asyncio.to_thread(discover_skills)
         for skill in skills:
             # Never clobber a built-in command of the same name.
-            if self.command_parser.registry.get_command(skill.command_name) is None:
+            if skill.command_name not in self.command_parser.registry.get_all_names():
                 self.command_parser.register_command(SkillCommand(skill))
         self.command_parser.register_command(SkillsCommand(skills))
 
@@ -464,6 +387,8 @@ class GerdsenAICLI:
         Returns:
             Settings object if setup successful, None otherwise
         """
+        from rich.prompt import Prompt
+
         try:
             console.print("\n[SETUP] [bold cyan]GerdsenAI CLI Setup[/bold cyan]\n")
 
@@ -752,6 +677,8 @@ class GerdsenAICLI:
                 console.print_exception()
         finally:
             # Clean up resources
+            if self.startup:
+                await self.startup.aclose()
             if self.agent:
                 await self.agent.cleanup()
             if self.llm_client:
@@ -797,6 +724,50 @@ class GerdsenAICLI:
                     else:
                         return "Error: Settings not initialized"
 
+            elif command == "/status":
+                from .commands.system import residency_lines
+
+                current = (
+                    self.settings.current_model
+                    if self.settings and self.settings.current_model
+                    else "not set"
+                )
+                lines = [f"Model: {current}"]
+                loaded = await residency_lines(self.llm_client)
+                if loaded:
+                    lines += ["", "Model residency:"]
+                    lines += [f"  {line}" for line in loaded]
+                if self.startup:
+                    lines += ["", "Startup:"]
+                    lines += [f"  {line}" for line in self.startup.status_lines()]
+                return "\n".join(lines)
+
+            elif command == "/perf":
+                from .commands.system import last_turn_breakdown
+
+                action = args[0].lower() if args else "last"
+                if action not in ("last", "json"):
+                    return "Usage: /perf [last|json]"
+                return last_turn_breakdown(self.agent, as_json=action == "json")
+
+            elif command == "/trace":
+                from .commands.system import TraceCommand, trace_action
+
+                try:
+                    parsed = TraceCommand().parse_arguments(" ".join(args))
+                except ValueError as e:
+                    return str(e)
+                return trace_action(parsed["action"], parsed["path"])
+
+            elif command == "/profile":
+                from .commands.system import ProfileCommand, profile_action
+
+                try:
+                    parsed = ProfileCommand().parse_arguments(" ".join(args))
+                    return profile_action(parsed["action"], parsed["value"])
+                except (ValueError, OSError) as e:
+                    return f"Profiler: {e}"
+
             elif command == "/save":
                 if not args:
                     return "Usage: /save <filename>\n\nExample: /save my_conversation"
@@ -1037,7 +1008,8 @@ class GerdsenAICLI:
             return
 
         # Create prompt_toolkit TUI with true embedded input
-        tui = PromptToolkitTUI()
+        target_fps = self.settings.tui_target_fps if self.settings else 30.0
+        tui = PromptToolkitTUI(target_fps=target_fps)
 
         # Set up logging handler to capture warnings and route to system footer
         class TUILogHandler(logging.Handler):
@@ -1812,7 +1784,9 @@ class GerdsenAICLI:
             if self.debug:
                 console.print_exception()
 
-    async def run_headless(self, prompt: str, mode: str = "execute") -> int:
+    async def run_headless(
+        self, prompt: str, mode: str = "execute", perf_json: str | None = None
+    ) -> int:
         """Run a single agent turn non-interactively, print the answer, and exit.
 
         Backs ``gerdsenai -p``/``--stdin``. Returns a process exit code: 0 on
@@ -1821,6 +1795,9 @@ class GerdsenAICLI:
         Consent stays sacred: there is no interactive confirm callback here, so
         mutating tools remain gated by ``auto_confirm_edits`` (default False) /
         LLVL — headless runs are read-only-safe unless explicitly opted in.
+
+        With ``perf_json`` the turn's latency breakdown (see
+        :meth:`_write_perf_json`) is written to that file, or to stderr for "-".
         """
         from .utils.display import set_quiet_mode
 
@@ -1835,6 +1812,10 @@ class GerdsenAICLI:
         with contextlib.redirect_stdout(sys.stderr):
             if not await self.initialize():
                 return 1
+            # One turn and exit: let the background startup steps (skills
+            # context, smart routing) finish so the turn sees all of them.
+            if self.startup:
+                await self.startup.wait_all()
 
             # Honor the requested mode (default 'execute' so the tool loop runs;
             # pass --mode chat for pure Q&A). Mutations still gate on
@@ -1856,13 +1837,34 @@ class GerdsenAICLI:
                 show_error(str(e))
                 return 1
             finally:
+                if perf_json:
+                    self._write_perf_json(perf_json)
                 await self._headless_cleanup()
 
         print(answer)
         return 0
 
+    def _write_perf_json(self, target: str) -> None:
+        """Write the headless turn's timeline and startup steps as JSON."""
+        timeline = getattr(self.agent, "last_turn_timeline", None)
+        report = {
+            "model": self.settings.current_model if self.settings else None,
+            "turn": timeline.as_dict() if timeline else None,
+            "startup": self.startup.as_dict() if self.startup else None,
+        }
+        text = json.dumps(report, indent=2)
+        try:
+            if target == "-":
+                print(text, file=sys.stderr)
+            else:
+                Path(target).expanduser().write_text(text + "\n", encoding="utf-8")
+        except OSError as e:
+            show_error(f"Could not write performance report: {e}")
+
     async def _headless_cleanup(self) -> None:
         """Release agent + LLM client resources after a headless run."""
+        if self.startup:
+            await self.startup.aclose()
         if self.agent:
             await self.agent.cleanup()
         if self.llm_client:
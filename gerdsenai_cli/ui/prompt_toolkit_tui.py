@@ -30,7 +30,10 @@ Key features:
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import shutil
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -40,7 +43,6 @@ from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.document import Document
 from prompt_toolkit.formatted_text import (
     FormattedText,
-    fragment_list_to_text,
     to_formatted_text,
 )
 from prompt_toolkit.key_binding import KeyBindings
@@ -72,6 +74,8 @@ except ImportError:
 
 from ..core.modes import ExecutionMode, ModeManager
 from .animations import AnimationFrames, PlanCapture, StatusAnimation
+from .render_scheduler import RenderScheduler
+from .scrollback import ScrollbackArchive
 
 # Set up logging
 log_dir = Path.home() / ".gerdsenai" / "logs"
@@ -332,43 +336,160 @@ class FormattedBufferControl(BufferControl):
         Returns:
             List of formatted text lines
         """
-        lines = []
-        line = []
-
-        for format_item in formatted_text:
-            style, text, *_ = format_item
-            word = []
-
-            for char in text:
-                if char != "\n":
-                    word.append(char)
-                    continue
-
-                # Found newline - finish current word and line
-                if word:
-                    line.append((style, "".join(word)))
-                    lines.append(line)
-                elif line:
-                    lines.append(line)
-                else:
-                    lines.append([("", "")])
+        return _split_formatted_lines(formatted_text) or [[("", "")]]
+
+
+# Style of each streamed segment kind (see ConversationControl.append_streaming).
+_STREAM_STYLES = {
+    "text": "class:ai-text",
+    "reasoning": "class:dim",
+    "tool": "class:tool-status",
+}
+
+Fragments = list[tuple[str, str]]
+FormattedLines = list[Fragments]
 
-                line = []
-                word = []
 
-            # Add remaining word to current line
-            if word:
-                line.append((style, "".join(word)))
+def _terminal_width() -> int:
+    """Current terminal width in columns (80 if it cannot be determined)."""
+    try:
+        return shutil.get_terminal_size(fallback=(80, 24)).columns
+    except Exception:
+        return 80
+
+
+def _split_formatted_lines(fragments: Iterable[tuple[Any, ...]]) -> FormattedLines:
+    """Split newline-terminated fragments into per-line fragment lists.
+
+    Fragments that end on a newline split the same way on their own as inside
+    a longer list, so rendered pieces of the conversation can be split once
+    and concatenated.
+    """
+    lines: FormattedLines = []
+    line: Fragments = []
+    for style, text, *_ in fragments:
+        parts = text.split("\n")
+        for part in parts[:-1]:
+            if part:
+                line.append((style, part))
+            lines.append(line or [("", "")])
+            line = []
+        if parts[-1]:
+            line.append((style, parts[-1]))
+    if line:
+        lines.append(line)
+    return lines
+
+
+@dataclass
+class _RenderedBlock:
+    """Fragments of part of the conversation with their plain text and lines."""
+
+    fragments: Fragments
+    text: str
+    lines: FormattedLines
+
+    @classmethod
+    def of(cls, fragments: Fragments) -> "_RenderedBlock":
+        return cls(
+            fragments,
+            "".join(text for _, text in fragments),
+            _split_formatted_lines(fragments),
+        )
+
+    @classmethod
+    def join(cls, blocks: list["_RenderedBlock"]) -> "_RenderedBlock":
+        return cls(
+            [f for b in blocks for f in b.fragments],
+            "".join(b.text for b in blocks),
+            [line for b in blocks for line in b.lines],
+        )
+
+
+class _StreamTail:
+    """Incremental rendering of the in-flight streaming message.
+
+    Consecutive segments of the same kind flow together; a change of kind
+    starts a new line. Completed lines are rendered once and only the open
+    (last) line is re-rendered, so feeding a chunk costs O(chunk). The plain
+    text of completed lines is collected in a list and joined only when
+    :attr:`text` is read.
+    """
 
-        # Add final line if any
+    def __init__(self, segments: list[tuple[str, str]], started: datetime) -> None:
+        self.segments = segments
+        self.fed = 0
+        self.kind: str | None = None
+        self.open = ""  # unterminated last line of the current run
+        header: Fragments = [
+            (
+                "class:ai-label",
+                f"\n  GerdsenAI · {started.strftime('%H:%M:%S')} [streaming]\n",
+            ),
+            ("class:ai-border", "  " + "─" * 70 + "\n"),
+        ]
+        self.fragments: Fragments = list(header)
+        self._parts = [text for _, text in header]
+        self._text: str | None = None
+        self.lines: FormattedLines = _split_formatted_lines(header)
+
+    @property
+    def text(self) -> str:
+        """Plain text of the header and completed lines."""
+        if self._text is None:
+            self._text = "".join(self._parts)
+            self._parts = [self._text]
+        return self._text
+
+    def sync(self, segments: list[tuple[str, str]]) -> bool:
+        """Feed segments appended since the last sync.
+
+        Returns False when ``segments`` is not the list this tail was built
+        from (or shrank), in which case the tail must be rebuilt.
+        """
+        if segments is not self.segments or len(segments) < self.fed:
+            return False
+        for kind, chunk in segments[self.fed :]:
+            self._feed(kind, chunk)
+        self.fed = len(segments)
+        return True
+
+    def _feed(self, kind: str, chunk: str) -> None:
+        if self.kind is not None and kind != self.kind:
+            self._close(self.open)
+            self.open = ""
+        self.kind = kind
+        *done, self.open = (self.open + chunk).split("\n")
+        for line in done:
+            self._close(line)
+
+    def _close(self, line: str) -> None:
+        style = _STREAM_STYLES.get(self.kind or "text", "class:ai-text")
         if line:
-            lines.append(line)
+            self.fragments.append((style, f"  {line}\n"))
+            self._parts.append(f"  {line}\n")
+            self.lines.append([(style, f"  {line}")])
+        else:
+            self.fragments.append((style, "\n"))
+            self._parts.append("\n")
+            self.lines.append([("", "")])
+        self._text = None
 
-        return lines if lines else [[("", "")]]
+    def open_fragments(self) -> Fragments:
+        """The open line followed by the streaming cursor."""
+        style = _STREAM_STYLES.get(self.kind or "text", "class:ai-text")
+        line = (style, f"  {self.open}\n" if self.open else "\n")
+        return [line, ("class:cursor", "  ▌"), ("", "\n")]
 
 
 class ConversationControl:
-    """Manages conversation messages for display with BufferControl backend."""
+    """Manages conversation messages for display with BufferControl backend.
+
+    Rendering is incremental: each finished message is rendered once per
+    terminal width and cached, and while a response streams only its tail is
+    re-rendered (see :class:`_StreamTail`), so a streamed chunk no longer
+    re-converts the whole history.
+    """
 
     def __init__(self) -> None:
         self.messages: list[
@@ -384,6 +505,28 @@ class ConversationControl:
         self.system_info: str | None = None  # For model info, warnings, etc.
         self.debug_mode: bool = False  # Debug mode flag for enhanced logging
 
+        # Render caches: finished messages by position (valid while the same
+        # message tuple sits there at the same width), the rendered history
+        # ("head") and the streaming tail.
+        self._message_cache: dict[
+            int, tuple[tuple[str, str, datetime], int, _RenderedBlock]
+        ] = {}
+        self._head: _RenderedBlock | None = None
+        self._head_key: tuple[Any, ...] | None = None
+        self._tail: _StreamTail | None = None
+        self._stream_started = datetime.now()
+        self._stable_lines = 0  # formatted lines that precede the open line
+
+        # Virtualized scrollback: older messages live compressed in
+        # ``scrollback`` and only a window of about ``view_lines`` rendered
+        # lines (the visible page plus a margin) is materialized in the buffer.
+        self.scrollback = ScrollbackArchive()
+        self.view_lines = 1500
+        self._view_start = 0  # global index of the first rendered message
+        self._view_end: int | None = None  # None: follow the newest message
+        self._offsets: dict[int, int] = {}  # message index -> offset in text
+        self._cursor_shift = 0  # pending cursor move after the window moved
+
         # Initialize Rich converter if available
         self.converter: RichToFormattedTextConverter | None
         if RICH_AVAILABLE:
@@ -416,14 +559,19 @@ class ConversationControl:
             if role == "assistant":
                 content = strip_emoji(content)
             self.messages.append((role, content, datetime.now()))
+            self._jump_to_tail()
             self._update_buffer(move_to_end=True)  # Move cursor to end for new messages
 
     def clear_messages(self) -> None:
         """Clear all conversation messages."""
         count = len(self.messages)
         self.messages.clear()
+        self.scrollback.clear()
         self.streaming_message = None
         self.streaming_role = None
+        self._message_cache.clear()
+        self._view_start, self._view_end = 0, None
+        self._offsets = {}
         logger.info(f"Cleared {count} messages from conversation")
         self._update_buffer()
 
@@ -432,14 +580,20 @@ class ConversationControl:
         self.streaming_role = role
         self.streaming_message = ""
         self.streaming_segments = []
+        self._stream_started = datetime.now()
+        self._tail = None
 
-    def append_streaming(self, chunk: str, kind: str = "text") -> None:
+    def append_streaming(
+        self, chunk: str, kind: str = "text", *, render: bool = True
+    ) -> None:
         """Append content to the currently streaming message.
 
         ``kind`` selects styling: "text" (the assistant answer, also accumulated
         into ``streaming_message``), "reasoning" (dim), or "tool" (status line).
         Only "text" feeds ``streaming_message`` so finalize keeps the answer-only
-        contract; reasoning/tool segments are display-only.
+        contract; reasoning/tool segments are display-only. With ``render=False``
+        the display is left for a later :meth:`refresh_stream` (the TUI's frame
+        scheduler draws many chunks at once).
         """
         if self.streaming_message is not None:
             # Strip emoji from assistant answer text only.
@@ -448,7 +602,13 @@ class ConversationControl:
             self.streaming_segments.append((kind, chunk))
             if kind == "text":
                 self.streaming_message += chunk
-            self._update_buffer()
+            if render:
+                self._update_stream()
+
+    def refresh_stream(self) -> None:
+        """Draw streamed chunks appended with ``render=False``."""
+        if self._is_streaming():
+            self._update_stream()
 
     def finish_streaming(self) -> None:
         """Finish streaming and add message to conversation history."""
@@ -457,15 +617,236 @@ class ConversationControl:
             self.streaming_message = None
             self.streaming_role = None
             self.streaming_segments = []
+            self._tail = None
             # Note: add_message already calls _update_buffer()
 
-    def get_formatted_text(self) -> FormattedText:
-        """Generate formatted text for all messages.
+    # -- rendering ------------------------------------------------------- #
 
-        Returns FormattedText compatible with prompt_toolkit display.
+    def _is_streaming(self) -> bool:
+        return self.streaming_message is not None and self.streaming_role is not None
+
+    def _render_message(
+        self, role: str, content: str, timestamp: datetime, width: int
+    ) -> Fragments:
+        """Formatted fragments of one finished message."""
+        result: Fragments = []
+        time_str = timestamp.strftime("%H:%M:%S")
+
+        if role == "ascii":
+            # ASCII art displayed at startup - dim gray with timestamp
+            result.append(("class:dim", f"\n  GerdsenAI · {time_str}\n"))
+            result.append(("class:dim", "  " + "─" * 70 + "\n"))
+            # Display ASCII art with dim styling
+            for line in content.split("\n"):
+                result.append(("class:dim", f"  {line}\n"))
+
+        elif role == "user":
+            result.append(("class:user-label", f"\n  You · {time_str}\n"))
+            result.append(("class:user-border", "  " + "─" * 70 + "\n"))
+            # Add padding to content lines
+            for line in content.split("\n"):
+                result.append(("class:user-text", f"  {line}\n"))
+
+        elif role == "assistant":
+            result.append(("class:ai-label", f"\n  GerdsenAI · {time_str}\n"))
+            result.append(("class:ai-border", "  " + "─" * 70 + "\n"))
+
+            # Try Rich rendering if available
+            if self.converter:
+                try:
+                    formatted = self.converter.convert_markdown(content, width)
+                    # Add padding to each formatted line
+                    for style, text in formatted:
+                        # Add padding to the beginning of each line
+                        padded_text = "\n".join(
+                            f"  {line}" if line else "" for line in text.split("\n")
+                        )
+                        result.append((style, padded_text))
+                except Exception as e:
+                    # Fallback to plain text on error
+                    logger.warning(f"Rich rendering failed, using plain text: {e}")
+                    for line in content.split("\n"):
+                        result.append(("class:ai-text", f"  {line}\n"))
+            else:
+                # Plain text fallback when Rich not available
+                for line in content.split("\n"):
+                    result.append(("class:ai-text", f"  {line}\n"))
+
+        elif role == "command":
+            result.append(("class:command-label", f"\n  Command Result · {time_str}\n"))
+            result.append(("class:command-border", "  " + "─" * 70 + "\n"))
+            # Add padding to command result lines
+            for line in content.split("\n"):
+                result.append(("class:command-text", f"  {line}\n"))
+
+        return result
+
+    def _message_block(
+        self, index: int, message: tuple[str, str, datetime], width: int
+    ) -> _RenderedBlock:
+        """Rendered ``message``, from the cache unless it or the width changed."""
+        cached = self._message_cache.get(index)
+        if (
+            cached is not None
+            and cached[1] == width
+            and (cached[0] is message or cached[0] == message)
+        ):
+            return cached[2]
+        block = _RenderedBlock.of(self._render_message(*message, width))
+        self._message_cache[index] = (message, width, block)
+        return block
+
+    # -- scrollback window ----------------------------------------------- #
+    #
+    # Messages are addressed by a global index: archived messages (in
+    # ``scrollback``) come first, then the live ``messages``. Only the window
+    # [start, end) is rendered into the buffer. While following the newest
+    # output the window ends at the last message; its start jumps forward once
+    # it holds more than twice ``view_lines`` lines.
+
+    @property
+    def following(self) -> bool:
+        """True while the view ends at the newest message."""
+        return self._view_end is None
+
+    def _total(self) -> int:
+        return len(self.scrollback) + len(self.messages)
+
+    def _messages_between(
+        self, start: int, end: int
+    ) -> list[tuple[str, str, datetime]]:
+        archived = len(self.scrollback)
+        out = (
+            self.scrollback.slice(start, min(end, archived)) if start < archived else []
+        )
+        out.extend(self.messages[max(start - archived, 0) : max(end - archived, 0)])
+        return out
+
+    def _line_count(self, index: int, width: int) -> int:
+        cached = self._message_cache.get(index)
+        if cached is not None and cached[1] == width:
+            return len(cached[2].lines)
+        message = self._messages_between(index, index + 1)[0]
+        return len(self._message_block(index, message, width).lines)
+
+    def _start_for(self, end: int, lines: int, width: int) -> int:
+        """Earliest start before ``end`` whose messages fit in ``lines``."""
+        start, used = end, 0
+        while start > 0:
+            used += self._line_count(start - 1, width)
+            if used > lines and start < end:
+                break
+            start -= 1
+        return start
+
+    def _end_for(self, start: int, lines: int, width: int) -> int:
+        """Latest end after ``start`` whose messages fit in ``lines``."""
+        total = self._total()
+        end, used = start, 0
+        while end < total:
+            used += self._line_count(end, width)
+            if used > lines and end > start:
+                break
+            end += 1
+        return end
+
+    def _window(self, width: int) -> tuple[int, int]:
+        total = self._total()
+        end = total if self._view_end is None else min(self._view_end, total)
+        start = min(self._view_start, end)
+        if self._view_end is None:
+            lines = sum(self._line_count(i, width) for i in range(start, end))
+            if lines > 2 * self.view_lines:
+                start = self._start_for(end, self.view_lines, width)
+        self._view_start = start
+        return start, end
+
+    def _jump_to_tail(self) -> None:
+        if self._view_end is not None:
+            self._view_end = None
+            self._view_start = self._start_for(
+                self._total(), self.view_lines, _terminal_width()
+            )
+
+    def follow(self) -> None:
+        """Jump the view to the newest output (auto-scroll)."""
+        if self._view_end is not None:
+            self._jump_to_tail()
+            self._update_buffer(move_to_end=True)
+
+    def load_earlier(self) -> bool:
+        """Extend the view backwards by about half a window (on scroll-up).
+
+        Older messages come from the scrollback archive as needed. The view
+        is trimmed at the bottom so it stays bounded; the cursor keeps its
+        place in the text. Returns False at the start of the conversation.
+        """
+        width = _terminal_width()
+        start, end = self._window(width)
+        if start == 0:
+            return False
+        start = self._start_for(start, self.view_lines // 2, width)
+        new_end = self._end_for(start, self.view_lines * 3 // 2, width)
+        if new_end < end:
+            self._view_end = new_end
+        self._view_start = start
+        self._update_buffer()
+        return True
+
+    def load_later(self) -> bool:
+        """Extend the view forwards (on scroll-down); resumes following at
+        the newest message. Returns False if already following."""
+        if self._view_end is None:
+            return False
+        width = _terminal_width()
+        start, end = self._window(width)
+        end = self._end_for(end, self.view_lines // 2, width)
+        self._view_end = None if end >= self._total() else end
+        self._view_start = max(
+            start, self._start_for(end, self.view_lines * 3 // 2, width)
+        )
+        self._update_buffer()
+        return True
+
+    def archive_oldest(self, count: int) -> None:
+        """Move the oldest ``count`` live messages to the scrollback archive.
+
+        They stay in the conversation (scrolling up loads them back) but are
+        held compressed, and on disk once the archive grows large.
         """
-        result = []
+        count = min(count, len(self.messages))
+        if count <= 0:
+            return
+        self.scrollback.extend(self.messages[:count])
+        self.messages = self.messages[count:]
+        self._update_buffer()
 
+    def all_messages(self) -> list[tuple[str, str, datetime]]:
+        """Every message, archived ones included (for save/export/copy)."""
+        return [*self.scrollback, *self.messages]
+
+    def _head_signature(self, width: int) -> tuple[Any, ...]:
+        """Cheap key that changes whenever the rendered history would."""
+        last = self.messages[-1] if self.messages else None
+        return (
+            id(self.messages),
+            len(self.messages),
+            id(last),
+            len(self.scrollback),
+            self.system_info,
+            width,
+            self._is_streaming(),
+            self._view_start,
+            self._view_end,
+            self.view_lines,
+        )
+
+    def _render_head(self, width: int) -> _RenderedBlock:
+        """Rendered system info and the windowed messages (or the empty state)."""
+        if self._head is not None and self._head_key == self._head_signature(width):
+            return self._head
+
+        result: Fragments = []
         # System info (model info, warnings, recovery/error notes) is set via
         # add_message("system", ...) but was previously never shown. Render it as
         # a labelled block so those notes are actually visible to the user.
@@ -475,103 +856,104 @@ class ConversationControl:
             for line in self.system_info.split("\n"):
                 result.append(("class:system-text", f"  {line}\n" if line else "\n"))
 
+        total = self._total()
         # Show empty state if no messages
-        if not self.messages and self.streaming_message is None:
-            if not self.system_info:
-                result.append(("class:dim", "\n"))
-                result.append(("class:dim", "  No messages yet.\n"))
-                result.append(
-                    (
-                        "class:dim",
-                        "  Type your message below and press Enter to start.\n",
-                    )
-                )
-                result.append(
-                    ("class:dim", "  Type /help to see available commands.\n")
-                )
-                result.append(("class:dim", "\n"))
-            return FormattedText(result)
-
-        # Display all complete messages
-        for role, content, timestamp in self.messages:
-            time_str = timestamp.strftime("%H:%M:%S")
-
-            if role == "ascii":
-                # ASCII art displayed at startup - dim gray with timestamp
-                result.append(("class:dim", f"\n  GerdsenAI · {time_str}\n"))
-                result.append(("class:dim", "  " + "─" * 70 + "\n"))
-                # Display ASCII art with dim styling
-                for line in content.split("\n"):
-                    result.append(("class:dim", f"  {line}\n"))
-
-            elif role == "user":
-                result.append(("class:user-label", f"\n  You · {time_str}\n"))
-                result.append(("class:user-border", "  " + "─" * 70 + "\n"))
-                # Add padding to content lines
-                for line in content.split("\n"):
-                    result.append(("class:user-text", f"  {line}\n"))
-
-            elif role == "assistant":
-                result.append(("class:ai-label", f"\n  GerdsenAI · {time_str}\n"))
-                result.append(("class:ai-border", "  " + "─" * 70 + "\n"))
-
-                # Try Rich rendering if available
-                if self.converter:
-                    try:
-                        formatted = self.converter.convert_markdown(content)
-                        # Add padding to each formatted line
-                        for style, text in formatted:
-                            # Add padding to the beginning of each line
-                            padded_text = "\n".join(
-                                f"  {line}" if line else "" for line in text.split("\n")
-                            )
-                            result.append((style, padded_text))
-                    except Exception as e:
-                        # Fallback to plain text on error
-                        logger.warning(f"Rich rendering failed, using plain text: {e}")
-                        for line in content.split("\n"):
-                            result.append(("class:ai-text", f"  {line}\n"))
-                else:
-                    # Plain text fallback when Rich not available
-                    for line in content.split("\n"):
-                        result.append(("class:ai-text", f"  {line}\n"))
-
-            elif role == "command":
-                result.append(
-                    ("class:command-label", f"\n  Command Result · {time_str}\n")
-                )
-                result.append(("class:command-border", "  " + "─" * 70 + "\n"))
-                # Add padding to command result lines
-                for line in content.split("\n"):
-                    result.append(("class:command-text", f"  {line}\n"))
+        if not total and not self._is_streaming() and not self.system_info:
+            result.append(("class:dim", "\n"))
+            result.append(("class:dim", "  No messages yet.\n"))
+            result.append(
+                ("class:dim", "  Type your message below and press Enter to start.\n")
+            )
+            result.append(("class:dim", "  Type /help to see available commands.\n"))
+            result.append(("class:dim", "\n"))
 
-        # Display streaming message if active
-        if self.streaming_message is not None and self.streaming_role is not None:
-            time_str = datetime.now().strftime("%H:%M:%S")
+        start, end = self._window(width)
+        if start > 0:
             result.append(
-                ("class:ai-label", f"\n  GerdsenAI · {time_str} [streaming]\n")
+                ("class:dim", f"\n  ↑ {start} earlier messages (Page Up to load)\n")
             )
-            result.append(("class:ai-border", "  " + "─" * 70 + "\n"))
-            # Render styled segments (reasoning dim, tool status, answer text).
-            # Falls back to the plain accumulated text if no segments were
-            # recorded (e.g. legacy single-shot stream).
-            style_for = {
-                "text": "class:ai-text",
-                "reasoning": "class:dim",
-                "tool": "class:tool-status",
-            }
-            if self.streaming_segments:
-                for kind, text in self.streaming_segments:
-                    style = style_for.get(kind, "class:ai-text")
-                    for line in text.split("\n"):
-                        result.append((style, f"  {line}\n" if line else "\n"))
-            else:
-                for line in self.streaming_message.split("\n"):
-                    result.append(("class:ai-text", f"  {line}\n"))
-            result.append(("class:cursor", "  ▌"))  # Streaming cursor
+        blocks = [_RenderedBlock.of(result)]
+        blocks += [
+            self._message_block(start + i, message, width)
+            for i, message in enumerate(self._messages_between(start, end))
+        ]
+        if end < total:
+            blocks.append(
+                _RenderedBlock.of(
+                    [
+                        (
+                            "class:dim",
+                            f"\n  ↓ {total - end} newer messages (Page Down)\n",
+                        )
+                    ]
+                )
+            )
+        for stale in [i for i in self._message_cache if not start <= i < end]:
+            del self._message_cache[stale]
+
+        # Offsets of each message in the text, to keep the cursor on the same
+        # message when the window moves.
+        offsets: dict[int, int] = {}
+        offset = len(blocks[0].text)
+        for i, block in enumerate(blocks[1 : 1 + end - start]):
+            offsets[start + i] = offset
+            offset += len(block.text)
+        common = next((i for i in offsets if i in self._offsets), None)
+        if common is not None:
+            self._cursor_shift += offsets[common] - self._offsets[common]
+        self._offsets = offsets
+
+        self._head = _RenderedBlock.join(blocks)
+        self._head_key = self._head_signature(width)
+        return self._head
+
+    def _render_tail(self) -> tuple[_RenderedBlock | None, Fragments]:
+        """Rendered streaming message: its finished lines and the volatile rest.
+
+        The volatile fragments (open line, cursor and trailing newline) change
+        with every chunk; finished lines never do.
+        """
+        if not self._is_streaming() or not self.following:
+            if not self._total() and not self.system_info:
+                return None, []  # the empty state has no trailing newline
+            return None, [("", "\n")]
+
+        if not self.streaming_segments:
+            # No styled segments recorded (e.g. legacy single-shot stream):
+            # render the plain accumulated text.
+            self._tail = None
+            fragments: Fragments = [
+                (
+                    "class:ai-label",
+                    f"\n  GerdsenAI · {self._stream_started.strftime('%H:%M:%S')}"
+                    " [streaming]\n",
+                ),
+                ("class:ai-border", "  " + "─" * 70 + "\n"),
+            ]
+            for line in (self.streaming_message or "").split("\n"):
+                fragments.append(("class:ai-text", f"  {line}\n"))
+            fragments += [("class:cursor", "  ▌"), ("", "\n")]
+            return None, fragments
+
+        if self._tail is None or not self._tail.sync(self.streaming_segments):
+            self._tail = _StreamTail(self.streaming_segments, self._stream_started)
+            self._tail.sync(self.streaming_segments)
+        tail = self._tail
+        return _RenderedBlock(tail.fragments, tail.text, tail.lines), (
+            tail.open_fragments()
+        )
 
-        result.append(("", "\n"))
-        return FormattedText(result)
+    def get_formatted_text(self) -> FormattedText:
+        """Generate formatted text for all messages.
+
+        Returns FormattedText compatible with prompt_toolkit display.
+        """
+        head = self._render_head(_terminal_width())
+        tail, volatile = self._render_tail()
+        result = list(head.fragments)
+        if tail is not None:
+            result += tail.fragments
+        return FormattedText(result + volatile)
 
     def _update_buffer(self, move_to_end: bool = False) -> None:
         """Update buffer content and formatted lines when conversation changes.
@@ -581,16 +963,65 @@ class ConversationControl:
                         If False, preserve current cursor position (for streaming updates)
 
         This method:
-        1. Generates formatted text from current messages
-        2. Extracts plain text for the buffer
+        1. Renders the history (from the per-message cache) and streaming tail
+        2. Joins their plain text for the buffer
         3. Updates formatted_lines in the control for the processor
         """
-        # Get current formatted text
-        formatted_text = self.get_formatted_text()
+        head = self._render_head(_terminal_width())
+        tail, volatile = self._render_tail()
+        lines = list(head.lines)
+        plain_text = head.text
+        if tail is not None:
+            lines += tail.lines
+            plain_text += tail.text
+        self._stable_lines = len(lines)
+        end = _RenderedBlock.of(volatile)
+        lines += end.lines
+        self._set_document(plain_text + end.text, move_to_end)
+
+        # Update formatted lines in the control for the processor
+        self.control.formatted_lines = lines or [[("", "")]]
+
+    def _update_stream(self) -> None:
+        """Refresh the display after a streamed chunk.
+
+        Only the tail's new lines are rendered and spliced into the control's
+        formatted lines; anything else (history changed, width changed, a
+        replaced segment list) falls back to a full :meth:`_update_buffer`.
+
+        The buffer's document is rebuilt only when lines were completed. A
+        chunk that just extends the open line changes neither the number of
+        lines nor any displayed line but the open one (the display reads
+        ``formatted_lines``), so it swaps that line's fragments and leaves the
+        document alone; its plain text for the open line catches up at the
+        next line break or when the stream finishes.
+        """
+        if not self.following:
+            return  # the stream is below the scrolled-back window
+        head = self._head
+        tail = self._tail
+        if (
+            head is None
+            or self._head_key != self._head_signature(_terminal_width())
+            or tail is None
+            or not tail.sync(self.streaming_segments)
+        ):
+            self._update_buffer()
+            return
 
-        # Convert to plain text for the buffer
-        plain_text = fragment_list_to_text(formatted_text)
+        lines = self.control.formatted_lines
+        done = len(head.lines) + len(tail.lines)
+        end = _RenderedBlock.of(tail.open_fragments())
+        if done == self._stable_lines:
+            lines[done:] = end.lines
+            return
+        del lines[self._stable_lines :]
+        lines.extend(tail.lines[self._stable_lines - len(head.lines) :])
+        self._stable_lines = done
+        lines.extend(end.lines)
+        self._set_document(head.text + tail.text + end.text, move_to_end=False)
 
+    def _set_document(self, plain_text: str, move_to_end: bool) -> None:
         # Determine cursor position
         if move_to_end:
             # Move to end for new messages
@@ -598,18 +1029,15 @@ class ConversationControl:
         else:
             # Preserve cursor position (don't reset to 0)
             # This allows auto-scroll logic to work correctly
-            current_cursor = self.buffer.cursor_position
+            # (shifted when the scrollback window moved above it)
+            current_cursor = max(self.buffer.cursor_position + self._cursor_shift, 0)
             # Clamp cursor to valid range
             cursor_pos = min(current_cursor, len(plain_text))
+        self._cursor_shift = 0
 
         # Update buffer with plain text
         self.buffer.set_document(Document(plain_text, cursor_pos), bypass_readonly=True)
 
-        # Update formatted lines in the control for the processor
-        self.control.formatted_lines = self.control._parse_formatted_text(
-            formatted_text
-        )
-
 
 class PromptToolkitTUI:
     """prompt_toolkit-based TUI with embedded input.
@@ -621,7 +1049,7 @@ class PromptToolkitTUI:
     - Conversation uses Claude CLI-style sticky-bottom scrolling
     """
 
-    def __init__(self) -> None:
+    def __init__(self, target_fps: float = 30.0) -> None:
         self.conversation = ConversationControl()
         self.input_buffer = Buffer(multiline=True)  # Support multiline input
         self.status_text = "Ready. Type your message and press Enter."
@@ -638,6 +1066,9 @@ class PromptToolkitTUI:
         # Streaming configuration for smooth animation
         self.streaming_chunk_delay = 0.01  # 10ms default delay between chunks
         self.streaming_refresh_interval = 3  # Refresh every N chunks
+        # Streamed chunks are drawn in frames of at most target_fps per second.
+        self.render_scheduler = RenderScheduler(self._draw_stream, fps=target_fps)
+        self._redraw_started: float | None = None
 
         # Animation and approval state
         self.current_animation: StatusAnimation | None = None
@@ -674,6 +1105,9 @@ class PromptToolkitTUI:
             full_screen=True,
             mouse_support=True,
         )
+        # Time terminal redraws so the frame rate backs off on slow terminals.
+        self.app.before_render += self._on_before_render
+        self.app.after_render += self._on_after_render
 
     def _load_ascii_art(self) -> None:
         """Load and display the packaged ASCII logo at startup."""
@@ -973,6 +1407,10 @@ class PromptToolkitTUI:
                     0, current_pos - (lines_to_move * 50)
                 )  # Approximate chars per line
                 self.conversation.buffer.cursor_position = new_pos
+                # Near the top of the rendered window: load earlier messages.
+                document = self.conversation.buffer.document
+                if document.cursor_position_row < lines_to_move:
+                    self.conversation.load_earlier()
                 event.app.invalidate()
 
         @kb.add("pagedown")
@@ -999,8 +1437,21 @@ class PromptToolkitTUI:
                 )  # Approximate chars per line
                 self.conversation.buffer.cursor_position = new_pos
 
+                # Near the bottom of a scrolled-back window: load later messages.
+                document = self.conversation.buffer.document
+                if (
+                    not self.conversation.following
+                    and document.line_count - document.cursor_position_row
+                    <= lines_to_move
+                ):
+                    self.conversation.load_later()
+                    text_length = len(self.conversation.buffer.text)
+                    new_pos = self.conversation.buffer.cursor_position
+
                 # Re-enable auto-scroll if we've reached the bottom
-                if new_pos >= text_length - 10:  # Within 10 chars of end
+                if (
+                    self.conversation.following and new_pos >= text_length - 10
+                ):  # Within 10 chars of end
                     self.auto_scroll_enabled = True
 
                 event.app.invalidate()
@@ -1241,7 +1692,7 @@ class PromptToolkitTUI:
             # Convert conversation to markdown
             markdown_lines = ["# GerdsenAI Conversation", ""]
 
-            for role, content, timestamp in self.conversation.messages:
+            for role, content, timestamp in self.conversation.all_messages():
                 time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
                 if role == "ascii":
@@ -1429,6 +1880,7 @@ class PromptToolkitTUI:
         BufferControl to scroll naturally to show the cursor position.
         """
         if self.auto_scroll_enabled and self.conversation.buffer:
+            self.conversation.follow()
             # Move cursor to end of buffer text
             text_length = len(self.conversation.buffer.text)
             self.conversation.buffer.cursor_position = text_length
@@ -1477,15 +1929,44 @@ class PromptToolkitTUI:
         # Honor the /thinking toggle: drop reasoning chunks when disabled.
         if kind == "reasoning" and not self.thinking_enabled:
             return
-        self.conversation.append_streaming(chunk, kind)
+        # The chunk is recorded now and drawn with the next frame.
+        self.conversation.append_streaming(chunk, kind, render=False)
+        self.render_scheduler.request()
+
+    def _draw_stream(self) -> None:
+        """Render one frame of streamed output (called by the scheduler)."""
+        self.conversation.refresh_stream()
         self._auto_scroll_to_bottom()
         self.app.invalidate()
 
+    def _on_before_render(self, _app: Any) -> None:
+        self._redraw_started = time.perf_counter()
+
+    def _on_after_render(self, _app: Any) -> None:
+        if self._redraw_started is not None and self._is_streaming():
+            self.render_scheduler.record_cost(
+                time.perf_counter() - self._redraw_started
+            )
+        self._redraw_started = None
+        # Scrolled (e.g. by mouse wheel) to the top of the rendered window:
+        # load earlier messages from the scrollback.
+        window = self.conversation_window
+        if (
+            window is not None
+            and window.render_info is not None
+            and window.vertical_scroll == 0
+            and not self.auto_scroll_enabled
+            and self.conversation.load_earlier()
+        ):
+            self.app.invalidate()
+
     def finish_streaming_response(self) -> None:
         """Complete the streaming AI response.
 
         Converts streaming message to a complete message in conversation history.
+        Pending frames are dropped: finishing renders the whole message at once.
         """
+        self.render_scheduler.cancel()
         self.conversation.finish_streaming()
         self.status_text = "Ready. Type your message and press Enter."
         self._auto_scroll_to_bottom()
@@ -0,0 +1,133 @@
+"""Frame-rate-limited redraws for streamed TUI output.
+
+A fast local model emits hundreds of small deltas per second. Rendering the
+conversation and invalidating the prompt_toolkit application for each one
+spends the event loop on layout and redraw instead of reading the stream.
+:class:`RenderScheduler` sits between the stream and the redraw: a chunk only
+marks the display dirty, and the render callback runs at most once per frame,
+so every chunk that arrived in between is drawn together.
+
+The frame interval adapts to how long frames actually take. The scheduler
+times its own render callback, and the TUI reports each terminal redraw via
+:meth:`RenderScheduler.record_cost`. When frames get slow, the interval
+stretches to keep rendering to about half of the event loop's time, down to
+``min_fps``. :meth:`RenderScheduler.flush` draws pending output immediately,
+for example when a stream ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_COST_SMOOTHING = 0.2  # weight of the newest frame in the cost average
+_RENDER_SHARE = 0.5  # aim to spend at most this share of time rendering
+
+
+class RenderScheduler:
+    """Coalesce display updates into frames at a target frame rate."""
+
+    def __init__(
+        self,
+        render: Callable[[], None],
+        *,
+        fps: float = 30.0,
+        min_fps: float = 5.0,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Args:
+            render: Draws the current state; called once per frame.
+            fps: Target frame rate.
+            min_fps: Lowest rate the adaptive interval may fall to.
+            clock: Monotonic clock in seconds (injectable for tests).
+        """
+        self._render = render
+        self.fps = fps
+        self.min_fps = min(min_fps, fps)
+        self._clock = clock
+        self._handle: asyncio.Handle | None = None
+        self._dirty = False
+        self._last_frame = float("-inf")
+        self.frame_cost = 0.0  # smoothed seconds per frame (render + redraw)
+        self.requests = 0
+        self.frames = 0
+
+    @property
+    def interval(self) -> float:
+        """Current seconds between frames."""
+        target = 1.0 / self.fps
+        adaptive = self.frame_cost / _RENDER_SHARE
+        return min(max(target, adaptive), 1.0 / self.min_fps)
+
+    @property
+    def pending(self) -> bool:
+        return self._dirty
+
+    def request(self) -> None:
+        """Note that the display changed; draw it at the next frame.
+
+        Without a running event loop (headless use, tests) the frame is drawn
+        immediately.
+        """
+        self.requests += 1
+        self._dirty = True
+        if self._handle is not None:
+            return  # a frame is already scheduled and will include this
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._frame()
+            return
+        delay = self._last_frame + self.interval - self._clock()
+        if delay <= 0:
+            self._handle = loop.call_soon(self._frame)
+        else:
+            self._handle = loop.call_later(delay, self._frame)
+
+    def flush(self) -> None:
+        """Draw any pending update now (e.g. at the end of a stream)."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._dirty:
+            self._frame()
+
+    def cancel(self) -> None:
+        """Drop a scheduled frame without drawing it."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._dirty = False
+
+    def record_cost(self, seconds: float) -> None:
+        """Fold a measured frame cost (e.g. a terminal redraw) into the average."""
+        self.frame_cost += _COST_SMOOTHING * (seconds - self.frame_cost)
+
+    def _frame(self) -> None:
+        self._handle = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        started = self._clock()
+        self._last_frame = started
+        try:
+            self._render()
+        except Exception as e:
+            logger.error(f"Render frame failed: {e}", exc_info=True)
+        self.frames += 1
+        self.record_cost(self._clock() - started)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "frames": self.frames,
+            "coalesced": self.requests - self.frames,
+            "interval_ms": round(self.interval * 1000, 2),
+            "frame_cost_ms": round(self.frame_cost * 1000, 3),
+        }
@@ -0,0 +1,164 @@
+"""Compressed storage for conversation messages scrolled out of the TUI.
+
+A multi-hour session can hold thousands of messages and megabytes of tool
+output. Keeping all of them as live strings, and rendering all of them into
+the conversation document, makes scrolling and redraws slow. The TUI keeps
+recent messages live and moves older ones into a :class:`ScrollbackArchive`.
+There they are stored in zlib-compressed blocks of ``block_size`` messages.
+Once the compressed blocks exceed ``memory_bytes``, the oldest are spilled to
+an anonymous temporary file. Reading a message decompresses only its block.
+A few recently read blocks are kept decoded, so scrolling back through a
+region does not decompress it again on every page.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import tempfile
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+Message = tuple[str, str, datetime]
+
+_DECODED_BLOCKS = 4  # recently read blocks kept decompressed
+
+
+@dataclass
+class _Block:
+    count: int
+    data: bytes | None  # compressed payload while in memory
+    offset: int = 0  # position in the spill file once spilled
+    length: int = 0
+
+
+class ScrollbackArchive:
+    """Append-only message store: compressed in memory, spilled to disk."""
+
+    def __init__(
+        self,
+        block_size: int = 50,
+        memory_bytes: int = 8 * 1024 * 1024,
+        spill_dir: Path | None = None,
+    ) -> None:
+        """
+        Args:
+            block_size: Messages per compressed block.
+            memory_bytes: Compressed bytes kept in memory before the oldest
+                blocks are written to the spill file.
+            spill_dir: Directory for the spill file (system temp if None).
+        """
+        self.block_size = block_size
+        self.memory_bytes = memory_bytes
+        self.spill_dir = spill_dir
+        self._blocks: list[_Block] = []
+        self._starts: list[int] = []  # global index of each block's first message
+        self._count = 0
+        self._memory = 0
+        self._spill: IO[bytes] | None = None
+        self._decoded: OrderedDict[int, list[Message]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, messages: list[Message]) -> None:
+        """Append ``messages`` (oldest first) to the archive."""
+        for i in range(0, len(messages), self.block_size):
+            chunk = messages[i : i + self.block_size]
+            payload = json.dumps(
+                [[role, content, ts.isoformat()] for role, content, ts in chunk]
+            ).encode()
+            data = zlib.compress(payload)
+            self._starts.append(self._count)
+            self._blocks.append(_Block(len(chunk), data))
+            self._count += len(chunk)
+            self._memory += len(data)
+        self._spill_oldest()
+
+    def __getitem__(self, index: int) -> Message:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        b = bisect.bisect_right(self._starts, index) - 1
+        return self._block(b)[index - self._starts[b]]
+
+    def slice(self, start: int, end: int) -> list[Message]:
+        """Messages ``start..end-1``, decompressing each block once."""
+        start, end = max(start, 0), min(end, self._count)
+        out: list[Message] = []
+        index = start
+        while index < end:
+            b = bisect.bisect_right(self._starts, index) - 1
+            block = self._block(b)
+            first = self._starts[b]
+            out.extend(block[index - first : end - first])
+            index = first + len(block)
+        return out
+
+    def __iter__(self) -> Iterator[Message]:
+        for b in range(len(self._blocks)):
+            yield from self._block(b)
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._starts.clear()
+        self._decoded.clear()
+        self._count = self._memory = 0
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "messages": self._count,
+            "blocks": len(self._blocks),
+            "memory_bytes": self._memory,
+            "spilled_blocks": sum(1 for b in self._blocks if b.data is None),
+        }
+
+    def _block(self, b: int) -> list[Message]:
+        decoded = self._decoded.get(b)
+        if decoded is not None:
+            self._decoded.move_to_end(b)
+            return decoded
+        block = self._blocks[b]
+        data = block.data
+        if data is None:
+            assert self._spill is not None
+            self._spill.seek(block.offset)
+            data = self._spill.read(block.length)
+        decoded = [
+            (role, content, datetime.fromisoformat(ts))
+            for role, content, ts in json.loads(zlib.decompress(data))
+        ]
+        self._decoded[b] = decoded
+        while len(self._decoded) > _DECODED_BLOCKS:
+            self._decoded.popitem(last=False)
+        return decoded
+
+    def _spill_oldest(self) -> None:
+        for block in self._blocks:
+            if self._memory <= self.memory_bytes:
+                return
+            if block.data is None:
+                continue
+            try:
+                if self._spill is None:
+                    self._spill = tempfile.TemporaryFile(
+                        prefix="gerdsenai-scrollback-", dir=self.spill_dir
+                    )
+                self._spill.seek(0, 2)
+                block.offset = self._spill.tell()
+                block.length = self._spill.write(block.data)
+            except OSError as e:
+                logger.warning(f"Scrollback spill failed, keeping in memory: {e}")
+                return
+            self._memory -= len(block.data)
+            block.data = None
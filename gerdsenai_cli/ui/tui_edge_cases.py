@@ -183,7 +183,10 @@ class ConversationMemoryManager:
         if self.archived_count == 0:
             return ""
 
-        return f"\n📦 {self.archived_count} older messages archived to save memory.\n"
+        return (
+            f"\n📦 {self.archived_count} older messages archived to save memory "
+            "(scroll up to load them).\n"
+        )
 
 
 class StreamRecoveryHandler:
@@ -504,11 +507,11 @@ class TUIEdgeCaseHandler:
         """
         if self.memory_manager.should_archive(messages):
             # Archive old messages
-            trimmed, archived = self.memory_manager.archive_old_messages(messages)
+            _, archived = self.memory_manager.archive_old_messages(messages)
 
-            # Update conversation
-            tui_conversation.messages = trimmed
-            tui_conversation._update_buffer()
+            # Move them to the conversation's compressed scrollback, where
+            # scrolling up loads them back, instead of dropping them.
+            tui_conversation.archive_oldest(archived)
 
             # Return notice
             return self.memory_manager.get_archive_notice()
@@ -3,23 +3,29 @@ Performance monitoring and instrumentation for GerdsenAI CLI.
 
 This module provides utilities for tracking execution time, memory usage,
 and performance metrics across all components.
+
+Durations are measured with ``time.perf_counter``. Sampling process memory
+costs a system call per measurement, so it is opt-in
+(``PerformanceTracker(sample_memory=True)``). Every measurement is also
+recorded as a span on the global :data:`~.tracing.tracer` when tracing is on.
 """
 
 import asyncio
 import functools
 import time
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, ParamSpec, TypeVar, cast
 
-import psutil
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ..constants import PerformanceTargets
+from .tracing import tracer
 
 console = Console()
 
@@ -51,12 +57,12 @@ class PerformanceMetric:
 class PerformanceTracker:
     """Global performance tracking and monitoring."""
 
-    def __init__(self) -> None:
-        self.metrics: list[PerformanceMetric] = []
+    def __init__(self, sample_memory: bool = False) -> None:
+        self.metrics: deque[PerformanceMetric] = deque(maxlen=1000)
         self.operation_stack: list[dict[str, Any]] = []
-        self.process = psutil.Process()
+        self.sample_memory = sample_memory
+        self._process: Any = None
         self.startup_time: float | None = None
-        self.max_metrics = 1000  # Limit stored metrics
 
         # Performance targets (using centralized constants)
         self.targets = {
@@ -69,13 +75,29 @@ class PerformanceTracker:
             "file_editing": PerformanceTargets.FILE_EDITING,
         }
 
+    @property
+    def max_metrics(self) -> int:
+        """Number of metrics kept; the oldest are dropped first."""
+        return self.metrics.maxlen or 0
+
+    @max_metrics.setter
+    def max_metrics(self, value: int) -> None:
+        self.metrics = deque(self.metrics, maxlen=value)
+
     def get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
         try:
-            return self.process.memory_info().rss / 1024 / 1024
+            if self._process is None:
+                import psutil
+
+                self._process = psutil.Process()
+            return float(self._process.memory_info().rss) / 1024 / 1024
         except Exception:
             return 0.0
 
+    def _memory_sample(self) -> float:
+        return self.get_memory_usage() if self.sample_memory else 0.0
+
     def mark_startup(self) -> None:
         """Mark the application startup time."""
         self.startup_time = time.time()
@@ -90,25 +112,26 @@ class PerformanceTracker:
     def measure_sync(self, operation: str, **metadata: Any) -> Iterator[None]:
         """Context manager for measuring synchronous operations."""
         start_time = time.time()
-        memory_before = self.get_memory_usage()
+        memory_before = self._memory_sample()
+        started = time.perf_counter()
         success = True
 
         try:
-            yield
+            with tracer.span(operation, "perf"):
+                yield
         except Exception as e:
             success = False
             metadata["error"] = str(e)
             raise
         finally:
-            end_time = time.time()
-            memory_after = self.get_memory_usage()
-            duration = end_time - start_time
+            duration = time.perf_counter() - started
+            memory_after = self._memory_sample()
             memory_delta = memory_after - memory_before
 
             metric = PerformanceMetric(
                 operation=operation,
                 start_time=start_time,
-                end_time=end_time,
+                end_time=start_time + duration,
                 duration=duration,
                 memory_before=memory_before,
                 memory_after=memory_after,
@@ -125,25 +148,26 @@ class PerformanceTracker:
     ) -> AsyncIterator[None]:
         """Context manager for measuring asynchronous operations."""
         start_time = time.time()
-        memory_before = self.get_memory_usage()
+        memory_before = self._memory_sample()
+        started = time.perf_counter()
         success = True
 
         try:
-            yield
+            with tracer.span(operation, "perf"):
+                yield
         except Exception as e:
             success = False
             metadata["error"] = str(e)
             raise
         finally:
-            end_time = time.time()
-            memory_after = self.get_memory_usage()
-            duration = end_time - start_time
+            duration = time.perf_counter() - started
+            memory_after = self._memory_sample()
             memory_delta = memory_after - memory_before
 
             metric = PerformanceMetric(
                 operation=operation,
                 start_time=start_time,
-                end_time=end_time,
+                end_time=start_time + duration,
                 duration=duration,
                 memory_before=memory_before,
                 memory_after=memory_after,
@@ -155,13 +179,9 @@ class PerformanceTracker:
             self._add_metric(metric)
 
     def _add_metric(self, metric: PerformanceMetric) -> None:
-        """Add a metric to the collection."""
+        """Add a metric to the collection (bounded by ``max_metrics``)."""
         self.metrics.append(metric)
 
-        # Limit the number of stored metrics
-        if len(self.metrics) > self.max_metrics:
-            self.metrics = self.metrics[-self.max_metrics :]
-
     def get_metrics(
         self,
         operation: str | None = None,
@@ -169,7 +189,7 @@ class PerformanceTracker:
         since: datetime | None = None,
     ) -> list[PerformanceMetric]:
         """Get metrics with optional filtering."""
-        filtered_metrics = self.metrics
+        filtered_metrics = list(self.metrics)
 
         if operation:
             filtered_metrics = [m for m in filtered_metrics if m.operation == operation]
@@ -321,7 +341,7 @@ class PerformanceTracker:
         if show_details:
             console.print("\n" + "=" * 50)
             console.print("Recent Operations (Last 10):")
-            recent_metrics = self.metrics[-10:]
+            recent_metrics = list(self.metrics)[-10:]
             for metric in recent_metrics:
                 status_icon = "OK" if metric.success else "FAIL"
                 status_color = "green" if metric.success else "red"
@@ -0,0 +1,248 @@
+"""In-process sampling profiler for live sessions.
+
+Tracing spans (:mod:`.tracing`) only time the code paths that were marked
+ahead of time. This module finds the hot code wherever it is, without
+restarting the CLI under an external profiler.
+
+A daemon thread wakes every ``interval`` seconds and reads the profiled
+thread's current stack with :func:`sys._current_frames`. If an event loop is
+attached, it also asks the loop which asyncio task is running. Each sample is
+counted under its task (``event loop`` when no task is running, i.e. the loop
+is idle or running callbacks; the thread's name when there is no loop), so
+concurrent turn stages show up as separate roots. The profiled thread runs no
+profiler code at all; the cost is one stack walk per sample, taken while the
+sampler holds the GIL.
+
+Results are written in the collapsed-stack format (``root;caller;callee
+count`` per line) that ``flamegraph.pl``, inferno and https://speedscope.app
+turn into flame graphs. :meth:`ProfileResult.hotspots` gives the top-N table
+shown by ``/profile stop``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+
+# Where ``/profile stop`` writes its output.
+PROFILES_DIR = Path.home() / ".gerdsenai" / "profiles"
+
+_IDLE = "event loop"
+
+
+@dataclass
+class Hotspot:
+    """One function's share of the samples."""
+
+    name: str
+    self_samples: int  # samples with this function on top of the stack
+    total_samples: int  # samples with this function anywhere on the stack
+
+
+@dataclass
+class ProfileResult:
+    """Aggregated stacks from one profiling session."""
+
+    stacks: Counter[tuple[str, ...]] = field(default_factory=Counter)
+    duration: float = 0.0
+    interval: float = 0.0
+    path: Path | None = None
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        """Stacks in collapsed format, root (task) first, heaviest first."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def hotspots(self, limit: int = 15) -> list[Hotspot]:
+        """Functions ranked by self samples (time spent in their own code)."""
+        own: Counter[str] = Counter()
+        total: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack[1:]  # drop the task root
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        return [
+            Hotspot(name, count, total[name]) for name, count in own.most_common(limit)
+        ]
+
+    def tasks(self) -> Counter[str]:
+        """Samples per asyncio task."""
+        by_task: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            by_task[stack[0]] += count
+        return by_task
+
+    def save(self, directory: Path | None = None) -> Path:
+        """Write :meth:`collapsed` to a timestamped file and return its path."""
+        target = (directory or PROFILES_DIR).expanduser()
+        target.mkdir(parents=True, exist_ok=True)
+        path = target / f"profile-{datetime.now():%Y%m%d-%H%M%S}.collapsed"
+        path.write_text(self.collapsed(), encoding="utf-8")
+        self.path = path
+        return path
+
+    def format_table(self, limit: int = 15) -> str:
+        """Plain-text summary and top-N hotspot table."""
+        samples = self.samples
+        lines = [
+            f"Profiled {self.duration:.1f}s: {samples} samples "
+            f"every {self.interval * 1000:g} ms"
+        ]
+        if self.path is not None:
+            lines.append(f"Collapsed stacks: {self.path}")
+        if not samples:
+            return "\n".join(lines)
+        busiest = ", ".join(
+            f"{name} {count / samples:.0%}"
+            for name, count in self.tasks().most_common(4)
+        )
+        lines += [f"Tasks: {busiest}", "", f"{'self':>6} {'total':>6}  function"]
+        for spot in self.hotspots(limit):
+            lines.append(
+                f"{spot.self_samples / samples:>6.1%} "
+                f"{spot.total_samples / samples:>6.1%}  {spot.name}"
+            )
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """Samples one thread's stacks from a background thread."""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128) -> None:
+        """
+        Args:
+            interval: Seconds between samples.
+            max_depth: Innermost frames kept per sample.
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self._labels: dict[CodeType, str] = {}
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._result = ProfileResult()
+        self._target = 0
+        self._target_name = ""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._started = 0.0
+        self._samples = 0  # readable while sampling, unlike the stacks Counter
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(
+        self,
+        interval: float | None = None,
+        *,
+        thread_id: int | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Start sampling ``thread_id`` (default: the calling thread).
+
+        ``loop`` defaults to the calling thread's running event loop, if any;
+        with a loop, samples are grouped by the asyncio task that was running.
+
+        Raises:
+            RuntimeError: If the profiler is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Profiler is already running")
+        if interval is not None:
+            self.interval = interval
+        if loop is None and thread_id is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self._target = thread_id or threading.get_ident()
+        self._target_name = next(
+            (t.name for t in threading.enumerate() if t.ident == self._target),
+            f"thread {self._target}",
+        )
+        self._loop = loop
+        self._result = ProfileResult(interval=self.interval)
+        self._samples = 0
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="gerdsenai-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> ProfileResult:
+        """Stop sampling and return what was collected."""
+        thread = self._thread
+        if thread is None:
+            return self._result
+        self._stop.set()
+        thread.join()
+        self._thread = None
+        self._result.duration = time.perf_counter() - self._started
+        return self._result
+
+    def status(self) -> dict[str, float | int | bool]:
+        elapsed = time.perf_counter() - self._started if self.running else 0.0
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "elapsed": elapsed,
+            "samples": self._samples,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:  # the profiled thread exited
+                return
+            self._record(frame)
+
+    def _record(self, frame: FrameType | None) -> None:
+        labels = self._labels
+        stack: list[str] = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = _label(code)
+            stack.append(label)
+            frame = frame.f_back
+        stack.append(self._lane())
+        stack.reverse()
+        self._result.stacks[tuple(stack)] += 1
+        self._samples += 1
+
+    def _lane(self) -> str:
+        if self._loop is None:
+            return self._target_name
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        return task.get_name() if task is not None else _IDLE
+
+
+def _label(code: CodeType) -> str:
+    """``qualname (dir/file.py:line)``, safe for the collapsed format."""
+    parts = code.co_filename.replace("\\", "/").rsplit("/", 2)
+    where = "/".join(parts[-2:]) if len(parts) > 1 else code.co_filename
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({where}:{code.co_firstlineno})".replace(";", ":")
+
+
+# Global profiler driven by the /profile command.
+profiler = SamplingProfiler()
@@ -0,0 +1,394 @@
+"""Low-overhead tracing spans with Chrome trace-event export.
+
+:class:`PerformanceTracker` samples process memory twice per measured call,
+which is too heavy for hot paths such as token counting or per-chunk
+streaming. A :class:`Tracer` span costs two ``perf_counter_ns`` reads, a
+context-variable swap and an append to a ring buffer. When tracing is off,
+``span()`` returns a shared no-op context manager.
+
+Spans nest through a :class:`contextvars.ContextVar`. An asyncio task copies
+the context of the code that created it, so the stages a turn starts as
+tasks become children of the turn's span even though they run concurrently.
+Each task is drawn on its own track in the export.
+
+Sampling is decided once per root span, and its children follow that
+decision, so a sampled trace is always complete. Spans shorter than
+``min_duration_us`` are dropped. Sampling process memory (RSS before and
+after each span) is opt-in.
+
+:meth:`Tracer.to_chrome_trace` produces the Trace Event Format JSON that
+Perfetto (ui.perfetto.dev) and ``chrome://tracing`` load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar, cast
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class Span:
+    """One timed operation. Times are ``perf_counter_ns`` values."""
+
+    __slots__ = (
+        "name",
+        "cat",
+        "args",
+        "span_id",
+        "parent_id",
+        "lane",
+        "start_ns",
+        "end_ns",
+        "rss_before",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        cat: str,
+        args: dict[str, Any],
+        span_id: int,
+        parent_id: int | None,
+        lane: tuple[int, str],
+    ) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.lane = lane  # (key, label) of the task or thread it ran on
+        self.start_ns = 0
+        self.end_ns = 0
+        self.rss_before = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+# The innermost open span of the current task; _UNSAMPLED marks a trace whose
+# root was not sampled, so its children skip recording cheaply.
+_UNSAMPLED = Span("", "", {}, 0, None, (0, ""))
+_current: ContextVar[Span | None] = ContextVar("gerdsenai_span", default=None)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _ActiveSpan:
+    """Context manager that times a span and makes it current while open."""
+
+    __slots__ = ("_tracer", "_span", "_token", "_parent")
+
+    def __init__(self, tracer: Tracer, span: Span) -> None:
+        self._tracer = tracer
+        self._span = span
+
+    def __enter__(self) -> Span:
+        span = self._span
+        self._parent = _current.get()
+        self._token = _current.set(span)
+        if span is not _UNSAMPLED:
+            if self._tracer.memory:
+                span.rss_before = _rss()
+            span.start_ns = time.perf_counter_ns()
+        return span
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        span = self._span
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            # Closed from another context (e.g. a coroutine finalized
+            # elsewhere): restore the parent by hand.
+            _current.set(self._parent)
+        if span is _UNSAMPLED:
+            return
+        span.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            span.args["error"] = exc_type.__name__
+        self._tracer.finish(span)
+
+
+def _rss() -> int:
+    try:
+        import psutil  # only when memory sampling is on
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        return 0
+
+
+def _lane() -> tuple[int, str]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return id(task), task.get_name()
+    thread = threading.current_thread()
+    return thread.ident or 0, thread.name
+
+
+class Tracer:
+    """Collects spans into a ring buffer; off by default."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        capacity: int = 20_000,
+        sample_rate: float = 1.0,
+        min_duration_us: float = 0.0,
+        memory: bool = False,
+    ) -> None:
+        """
+        Args:
+            enabled: Record spans at all.
+            capacity: Finished spans kept; the oldest are dropped first.
+            sample_rate: Fraction of root spans (traces) recorded.
+            min_duration_us: Drop spans shorter than this.
+            memory: Record process RSS before and after each span.
+        """
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.min_duration_us = min_duration_us
+        self.memory = memory
+        self.spans: deque[Span] = deque(maxlen=capacity)
+        self.dropped = 0
+        self._ids = itertools.count(1)
+        self._random = random.random
+
+    @property
+    def capacity(self) -> int:
+        return self.spans.maxlen or 0
+
+    def configure(self, **options: Any) -> None:
+        """Update ``enabled``, ``capacity``, ``sample_rate``,
+        ``min_duration_us`` or ``memory``."""
+        capacity = options.pop("capacity", None)
+        if capacity is not None and capacity != self.capacity:
+            self.spans = deque(self.spans, maxlen=int(capacity))
+        for key, value in options.items():
+            if key not in ("enabled", "sample_rate", "min_duration_us", "memory"):
+                raise TypeError(f"Unknown tracer option: {key}")
+            setattr(self, key, value)
+
+    def span(self, name: str, cat: str = "app", **args: Any) -> Any:
+        """Context manager timing ``name``; nests under the current span.
+
+        Usable from sync and async code alike.
+        """
+        if not self.enabled:
+            return _NOOP
+        return _ActiveSpan(self, self._new(name, cat, args))
+
+    def begin(self, name: str, cat: str = "app", **args: Any) -> Span | None:
+        """Start a span that is not a context manager; close it with :meth:`end`.
+
+        The span is a child of the current one but does not become current,
+        so it can cover work that starts and ends in different places.
+        """
+        if not self.enabled:
+            return None
+        span = self._new(name, cat, args)
+        if span is _UNSAMPLED:
+            return None
+        span.start_ns = time.perf_counter_ns()
+        return span
+
+    def end(self, span: Span | None) -> None:
+        if span is not None:
+            span.end_ns = time.perf_counter_ns()
+            self.finish(span)
+
+    def _new(self, name: str, cat: str, args: dict[str, Any]) -> Span:
+        parent = _current.get()
+        if parent is _UNSAMPLED:
+            return _UNSAMPLED
+        if parent is None and self.sample_rate < 1.0:
+            if self._random() >= self.sample_rate:
+                return _UNSAMPLED
+        return Span(
+            name,
+            cat,
+            args,
+            next(self._ids),
+            parent.span_id if parent is not None else None,
+            _lane(),
+        )
+
+    def finish(self, span: Span) -> None:
+        """Store a finished span (subject to ``min_duration_us``)."""
+        if (span.end_ns - span.start_ns) < self.min_duration_us * 1000:
+            return
+        if self.memory and span.rss_before:
+            span.args["rss_delta_mb"] = round(
+                (_rss() - span.rss_before) / 1024 / 1024, 3
+            )
+        if len(self.spans) == self.spans.maxlen:
+            self.dropped += 1
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+        self.dropped = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "spans": len(self.spans),
+            "capacity": self.capacity,
+            "dropped": self.dropped,
+            "sample_rate": self.sample_rate,
+            "memory": self.memory,
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """The recorded spans as a Chrome Trace Event Format document."""
+        pid = os.getpid()
+        spans = list(self.spans)
+        origin = min((s.start_ns for s in spans), default=0)
+        tids: dict[int, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            key, label = span.lane
+            tid = tids.get(key)
+            if tid is None:
+                tid = tids[key] = len(tids) + 1
+                events.append(
+                    {
+                        "ph": "M",
+                        "name": "thread_name",
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"name": label},
+                    }
+                )
+            args = dict(span.args, span_id=span.span_id)
+            if span.parent_id is not None:
+                args["parent_id"] = span.parent_id
+            events.append(
+                {
+                    "ph": "X",
+                    "name": span.name,
+                    "cat": span.cat,
+                    "ts": (span.start_ns - origin) / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """Write :meth:`to_chrome_trace` to ``path`` and return it."""
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8"
+        )
+        return target
+
+
+# Global tracer, configured from settings at startup (see main.py).
+tracer = Tracer()
+
+
+def traced(
+    name: str | None = None, cat: str = "app"
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator recording each call of a function as a span.
+
+    Works on sync functions, coroutine functions and async generators (the
+    span then covers the whole iteration, e.g. a streamed completion). A
+    generator's span is current only while the generator itself runs, not
+    while its consumer handles an item, so spans the consumer opens between
+    items keep their own parent.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        span_name = name or func.__qualname__
+
+        if inspect.isasyncgenfunction(func):
+
+            async def iterate(
+                agen: AsyncGenerator[Any, Any],
+            ) -> AsyncGenerator[Any, Any]:
+                span = tracer._new(span_name, cat, {})
+                sampled = span is not _UNSAMPLED
+                if sampled:
+                    if tracer.memory:
+                        span.rss_before = _rss()
+                    span.start_ns = time.perf_counter_ns()
+                try:
+                    while True:
+                        token = _current.set(span)
+                        try:
+                            item = await agen.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            _current.reset(token)
+                        yield item
+                except BaseException as e:
+                    if sampled and not isinstance(e, GeneratorExit):
+                        span.args["error"] = type(e).__name__
+                    raise
+                finally:
+                    await agen.aclose()
+                    if sampled:
+                        span.end_ns = time.perf_counter_ns()
+                        tracer.finish(span)
+
+            @functools.wraps(func)
+            def agen_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                agen = cast(Any, func)(*args, **kwargs)
+                return iterate(agen) if tracer.enabled else agen
+
+            return cast(Callable[P, R], agen_wrapper)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with tracer.span(span_name, cat):
+                    return await cast(Any, func)(*args, **kwargs)
+
+            return cast(Callable[P, R], async_wrapper)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, cat):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
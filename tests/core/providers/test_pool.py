@@ -0,0 +1,83 @@
+"""Tests for pooled provider HTTP clients."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gerdsenai_cli.core.providers import OllamaProvider
+from gerdsenai_cli.core.providers.pool import (
+    PoolConfig,
+    ProviderPool,
+    close_all_pools,
+)
+
+
+class _TagsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"models": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TagsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def test_provider_reuses_one_connection(server_url):
+    provider = OllamaProvider(server_url, timeout=5.0)
+    try:
+        assert await provider.detect()
+        for _ in range(4):
+            assert await provider.list_models() == []
+        stats = provider.pool.stats()
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert provider.http is provider.http
+    finally:
+        await provider.aclose()
+
+
+async def test_close_all_pools_closes_open_clients(server_url):
+    provider = OllamaProvider(server_url, timeout=5.0)
+    await provider.list_models()
+    client = provider.http
+
+    await close_all_pools()
+
+    assert client.is_closed
+    # The next request transparently opens a fresh pool.
+    await provider.list_models()
+    assert not provider.http.is_closed
+    await provider.aclose()
+
+
+def test_pool_config_from_settings_applies_limits():
+    class _Settings:
+        http_max_connections = 4
+        http_max_keepalive_connections = 2
+        http_keepalive_expiry = 5.0
+        http2 = False
+
+    config = PoolConfig.from_settings(_Settings())
+    pool = ProviderPool(timeout=1.0, config=config)
+    limits = config.limits
+    assert (limits.max_connections, limits.max_keepalive_connections) == (4, 2)
+    assert limits.keepalive_expiry == 5.0
+    assert not config.use_http2
+    assert pool.stats()["connections_reused"] == 0
@@ -33,9 +33,7 @@ class TestOllamaProvider:
             mock_response.status_code = 200
             mock_response.json.return_value = {"models": []}
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await provider.detect()
             assert result is True
@@ -46,7 +44,7 @@ class TestOllamaProvider:
         provider = OllamaProvider("http://localhost:11434")
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=httpx.ConnectError("Connection refused")
             )
 
@@ -79,9 +77,7 @@ class TestOllamaProvider:
             mock_http_response.json.return_value = mock_response
             mock_http_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_http_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_http_response)
 
             models = await provider.list_models()
 
@@ -107,9 +103,7 @@ class TestOllamaProvider:
             mock_http_response.json.return_value = mock_response
             mock_http_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_http_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_http_response)
 
             response = await provider.chat_completion(messages, model="llama2")
 
@@ -141,9 +135,7 @@ class TestOllamaProvider:
             mock_stream.__aenter__ = AsyncMock(return_value=mock_stream)
             mock_stream.__aexit__ = AsyncMock(return_value=None)
 
-            mock_client.return_value.__aenter__.return_value.stream = MagicMock(
-                return_value=mock_stream
-            )
+            mock_client.return_value.stream = MagicMock(return_value=mock_stream)
 
             chunks = []
             async for chunk in provider.stream_completion(messages, model="llama2"):
@@ -184,9 +176,7 @@ class TestVLLMProvider:
             mock_response.status_code = 200
             mock_response.json.return_value = {"data": []}
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await provider.detect()
             assert result is True
@@ -218,9 +208,7 @@ class TestVLLMProvider:
             mock_stream.__aenter__ = AsyncMock(return_value=mock_stream)
             mock_stream.__aexit__ = AsyncMock(return_value=None)
 
-            mock_client.return_value.__aenter__.return_value.stream = MagicMock(
-                return_value=mock_stream
-            )
+            mock_client.return_value.stream = MagicMock(return_value=mock_stream)
 
             chunks = []
             async for chunk in provider.stream_completion(messages, model="test"):
@@ -264,9 +252,7 @@ class TestLMStudioProvider:
             mock_http_response.json.return_value = mock_response
             mock_http_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_http_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_http_response)
 
             models = await provider.list_models()
 
@@ -300,9 +286,7 @@ class TestHuggingFaceProvider:
                 "model_dtype": "float16",
             }
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await provider.detect()
             assert result is True
@@ -342,9 +326,7 @@ class TestProviderDetector:
             mock_response.status_code = 200
             mock_response.json.return_value = {"models": []}
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             provider = await detector.detect_provider("http://localhost:11434")
 
@@ -418,9 +400,7 @@ class TestEdgeCases:
             mock_response.json.return_value = {"models": []}
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             models = await provider.list_models()
             assert models == []
@@ -436,9 +416,7 @@ class TestEdgeCases:
             mock_response.json.side_effect = ValueError("Invalid JSON")
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             models = await provider.list_models()
             assert models == []  # Should return empty list, not crash
@@ -449,7 +427,7 @@ class TestEdgeCases:
         provider = OllamaProvider(timeout=0.001)  # Very short timeout
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Timeout")
             )
 
@@ -464,7 +442,7 @@ class TestEdgeCases:
         provider = OllamaProvider("http://localhost:99999")  # Invalid port
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=httpx.ConnectError("Connection refused")
             )
 
@@ -483,9 +461,7 @@ class TestEdgeCases:
                 "Not found", request=None, response=mock_response
             )
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             with pytest.raises(httpx.HTTPStatusError):
                 await provider.chat_completion(
@@ -511,9 +487,7 @@ class TestEdgeCases:
             mock_stream.__aenter__ = AsyncMock(return_value=mock_stream)
             mock_stream.__aexit__ = AsyncMock(return_value=None)
 
-            mock_client.return_value.__aenter__.return_value.stream = MagicMock(
-                return_value=mock_stream
-            )
+            mock_client.return_value.stream = MagicMock(return_value=mock_stream)
 
             chunks = []
             with pytest.raises(httpx.NetworkError):
@@ -548,9 +522,7 @@ class TestIntegration:
                     response.status_code = 404
                 return response
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=mock_get
-            )
+            mock_client.return_value.get = AsyncMock(side_effect=mock_get)
 
             # Detect provider
             provider = await detector.detect_provider("http://localhost:11434")
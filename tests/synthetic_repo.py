@@ -0,0 +1,307 @@
+"""Deterministic synthetic repositories for scale tests and benchmarks.
+
+``generate_repo`` writes a project of an exact file count under a root, shaped
+by a :class:`RepoSpec`:
+
+- source files spread over a random directory tree of bounded depth under
+  ``src/``, in a configurable language mix;
+- an import graph: each Python/TypeScript module imports a few earlier
+  modules of its language, in a form ``DependencyGraph`` resolves;
+- a root ``.gitignore`` plus nested ones, with files they exclude (including a
+  negated pattern that re-includes one file);
+- binary blobs, and text files larger than the scanner's size limit.
+
+The returned :class:`SyntheticRepo` is the manifest: every file written, which
+ones a ``.gitignore`` excludes, the import edges and where each class is
+defined. Tests assert scan, index and graph results against it rather than
+against hand-counted fixtures. The same seed always produces the same tree.
+
+Usage::
+
+    repo = generate_repo(tmp_path / "proj", RepoSpec(files=2000, depth=5))
+    context = ProjectContext(repo.root)
+    await context.scan_directory()
+    assert {...relative paths...} == repo.scannable()
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Directory names; none of them is in the scanner's default ignore list.
+_WORDS = (
+    "core",
+    "api",
+    "models",
+    "services",
+    "handlers",
+    "views",
+    "store",
+    "utils",
+    "common",
+    "plugins",
+)
+_ROOT_GITIGNORE = "# Synthetic project\n/artifacts/\n*.snap\n"
+_NESTED_GITIGNORE = "generated/\n*.cache.json\n!keep.cache.json\n"
+_BINARY_EXTS = (".bin", ".dat", ".woff2")
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    """Shape of a generated repository.
+
+    ``files`` is the exact number of files written, every kind included.
+    """
+
+    files: int = 1000
+    depth: int = 4  # maximum directory nesting below src/
+    files_per_dir: int = 20  # average source files per directory
+    languages: dict[str, float] = field(
+        default_factory=lambda: {
+            "py": 0.5,
+            "ts": 0.2,
+            "go": 0.1,
+            "md": 0.1,
+            "json": 0.1,
+        }
+    )
+    imports_per_file: int = 3
+    gitignore_fraction: float = 0.1  # directories with their own .gitignore
+    ignored_fraction: float = 0.1  # files excluded by a .gitignore
+    binary_fraction: float = 0.02
+    large_files: int = 2
+    large_file_bytes: int = 2 * 1024 * 1024
+    seed: int = 0
+
+
+@dataclass
+class SyntheticRepo:
+    """What ``generate_repo`` wrote (paths are POSIX, relative to ``root``)."""
+
+    root: Path
+    spec: RepoSpec
+    files: list[str] = field(default_factory=list)
+    ignored: set[str] = field(default_factory=set)
+    binaries: list[str] = field(default_factory=list)
+    large: list[str] = field(default_factory=list)
+    modules: list[str] = field(default_factory=list)  # source files, in order
+    imports: dict[str, list[str]] = field(default_factory=dict)
+    symbols: dict[str, str] = field(default_factory=dict)  # class -> file
+
+    def visible(self) -> set[str]:
+        """Files no ``.gitignore`` excludes."""
+        return set(self.files) - self.ignored
+
+    def scannable(self, max_file_size: int = 1024 * 1024) -> set[str]:
+        """Files a scan with this size limit should index."""
+        files = self.visible()
+        if self.spec.large_file_bytes > max_file_size:
+            files -= set(self.large)
+        return files
+
+
+class _Writer:
+    def __init__(self, spec: RepoSpec, repo: SyntheticRepo) -> None:
+        self.spec = spec
+        self.repo = repo
+        self.rng = random.Random(spec.seed)
+        self.dirs: list[str] = []
+        self.by_language: dict[str, list[str]] = {}
+
+    def write(self, rel: str, content: str | bytes) -> None:
+        path = self.repo.root / rel
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        self.repo.files.append(rel)
+
+    def make_dirs(self, count: int) -> None:
+        self.dirs = ["src"]
+        eligible = ["src"]
+        for i in range(1, count):
+            parent = self.rng.choice(eligible)
+            rel = f"{parent}/{_WORDS[i % len(_WORDS)]}{i}"
+            self.dirs.append(rel)
+            if rel.count("/") < self.spec.depth:
+                eligible.append(rel)
+        for rel in self.dirs:
+            (self.repo.root / rel).mkdir(parents=True, exist_ok=True)
+
+    def source(self, n: int, directory: str, language: str) -> None:
+        names = {"md": f"notes_{n}.md", "json": f"config_{n}.json"}
+        rel = f"{directory}/{names.get(language, f'mod_{n}.{language}')}"
+        earlier = self.by_language.setdefault(language, [])
+        imports: list[str] = []
+        if language in ("py", "ts") and earlier:
+            k = min(len(earlier), self.spec.imports_per_file)
+            imports = self.rng.sample(earlier, k)
+        extra = self.rng.randint(0, 6)
+        if language == "py":
+            content = _python(n, imports, extra)
+        elif language == "ts":
+            content = _typescript(n, rel, imports, extra)
+        elif language == "go":
+            content = _go(n, directory.rsplit("/", 1)[-1], extra)
+        elif language == "md":
+            content = f"# Notes {n}\n\nDesign notes for `Component{n}`.\n" * (extra + 1)
+        else:
+            content = json.dumps({"id": n, "dir": directory, "enabled": True}) + "\n"
+        self.write(rel, content)
+        if language in ("py", "ts", "go"):
+            self.repo.modules.append(rel)
+            self.repo.symbols[f"Component{n}"] = rel
+        if imports:
+            self.repo.imports[rel] = imports
+        earlier.append(rel)
+
+
+def _python(n: int, imports: list[str], extra: int) -> str:
+    lines = [f'"""Synthetic module {n}."""', ""]
+    for target in imports:
+        dotted = target.removeprefix("src/").removesuffix(".py").replace("/", ".")
+        number = target.rsplit("_", 1)[-1].removesuffix(".py")
+        lines.append(f"from {dotted} import Component{number}")
+    lines += [
+        "",
+        "",
+        f"class Component{n}:",
+        f'    """Component {n}."""',
+        "",
+        "    def __init__(self, name: str) -> None:",
+        "        self.name = name",
+        "",
+        "    def run(self, items: list[str]) -> list[str]:",
+        "        return [item.upper() for item in items if item]",
+    ]
+    for i in range(extra + 1):
+        lines += [
+            "",
+            "",
+            f"def helper_{n}_{i}(value: int) -> int:",
+            f"    return value * {i + 2} + {n % 97}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _typescript(n: int, rel: str, imports: list[str], extra: int) -> str:
+    depth = rel.count("/")
+    lines = []
+    for target in imports:
+        up = "../" * (depth - 1) or "./"
+        spec = (up + target.removeprefix("src/")).removesuffix(".ts")
+        number = target.rsplit("_", 1)[-1].removesuffix(".ts")
+        lines.append(f'import {{ Component{number} }} from "{spec}";')
+    lines += [
+        "",
+        f"export class Component{n} {{",
+        "  constructor(public name: string) {}",
+        "",
+        "  run(items: string[]): string[] {",
+        "    return items.filter(Boolean).map((item) => item.toUpperCase());",
+        "  }",
+        "}",
+    ]
+    for i in range(extra + 1):
+        lines += [
+            "",
+            f"export function helper{n}_{i}(value: number): number {{",
+            f"  return value * {i + 2} + {n % 97};",
+            "}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _go(n: int, package: str, extra: int) -> str:
+    lines = [
+        f"package {package}",
+        "",
+        f"// Component{n} is synthetic component {n}.",
+        f"type Component{n} struct {{",
+        "\tName string",
+        "}",
+    ]
+    for i in range(extra + 1):
+        lines += [
+            "",
+            f"func Helper{n}_{i}(value int) int {{",
+            f"\treturn value*{i + 2} + {n % 97}",
+            "}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_repo(root: Path, spec: RepoSpec | None = None) -> SyntheticRepo:
+    """Write a synthetic repository under ``root`` and return its manifest.
+
+    Raises:
+        ValueError: If ``spec.files`` is too small for the requested ignored,
+            binary and large files.
+    """
+    spec = spec or RepoSpec()
+    repo = SyntheticRepo(root=root, spec=spec)
+    w = _Writer(spec, repo)
+    rng = w.rng
+
+    ignored = round(spec.files * spec.ignored_fraction)
+    binaries = round(spec.files * spec.binary_fraction)
+    budget = spec.files - 2 - ignored - binaries - spec.large_files
+    ndirs = max(1, budget // max(1, spec.files_per_dir))
+    nested = round(ndirs * spec.gitignore_fraction) if ignored else 0
+    sources = budget - nested
+    if sources < 1:
+        raise ValueError(f"RepoSpec(files={spec.files}) is too small for its mix")
+
+    root.mkdir(parents=True, exist_ok=True)
+    w.make_dirs(ndirs)
+    w.write("README.md", "# Synthetic project\n")
+    w.write(".gitignore", _ROOT_GITIGNORE)
+
+    languages = list(spec.languages)
+    weights = list(spec.languages.values())
+    for n in range(sources):
+        language = rng.choices(languages, weights)[0]
+        w.source(n, rng.choice(w.dirs), language)
+
+    # Nested .gitignore files, then the files they (and the root one) exclude.
+    ignore_dirs = rng.sample(w.dirs, nested)
+    for directory in ignore_dirs:
+        w.write(f"{directory}/.gitignore", _NESTED_GITIGNORE)
+    kept = 0
+    for i in range(ignored):
+        if ignore_dirs and i % 4:
+            directory = ignore_dirs[i % len(ignore_dirs)]
+            if i % 4 == 1:
+                (root / directory / "generated").mkdir(exist_ok=True)
+                rel = f"{directory}/generated/out_{i}.py"
+            elif i % 4 == 2 and kept < len(ignore_dirs):
+                # Re-included by the negated pattern: written, not ignored.
+                rel = f"{ignore_dirs[kept]}/keep.cache.json"
+                kept += 1
+                w.write(rel, "{}\n")
+                continue
+            else:
+                rel = f"{directory}/data_{i}.cache.json"
+        elif i % 2:
+            rel = f"{rng.choice(w.dirs)}/view_{i}.snap"
+        else:
+            (root / "artifacts").mkdir(exist_ok=True)
+            rel = f"artifacts/report_{i}.json"
+        w.write(rel, f"// ignored output {i}\n")
+        repo.ignored.add(rel)
+
+    for i in range(binaries):
+        rel = f"{rng.choice(w.dirs)}/blob_{i}{_BINARY_EXTS[i % len(_BINARY_EXTS)]}"
+        w.write(rel, rng.randbytes(rng.randint(256, 4096)))
+        repo.binaries.append(rel)
+
+    for i in range(spec.large_files):
+        rel = f"{rng.choice(w.dirs)}/fixture_{i}.sql"
+        row = f"INSERT INTO events VALUES ({i}, 'synthetic row payload');\n"
+        w.write(rel, row * (spec.large_file_bytes // len(row) + 1))
+        repo.large.append(rel)
+
+    return repo
@@ -8,6 +8,7 @@ reasoning / final-answer events as (chunk, accumulated, kind) tuples.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -97,3 +98,57 @@ async def test_every_event_is_a_three_tuple(tmp_path: Path) -> None:
         assert isinstance(chunk, str)
         assert isinstance(accumulated, str)
         assert kind in {"text", "reasoning", "tool"}
+
+
+class _StreamingClient(ScriptedLLMClient):
+    """Streams scripted raw model turns through the real incremental parser."""
+
+    def __init__(self, turns: list[str]) -> None:
+        super().__init__([])
+        self._turns = list(turns)
+        self.log: list[str] = []
+
+    async def stream_chat_with_tools(self, messages, tools, **kw):
+        from gerdsenai_cli.core.tool_parsing import StreamingToolParser
+
+        parser = StreamingToolParser()
+        for piece in self._turns.pop(0).split("|"):
+            self.log.append(f"delta:{piece[:12]}")
+            for event in parser.feed_text(piece):
+                yield event
+            await asyncio.sleep(0.01)  # let the tool worker run between deltas
+        for event in parser.finish():
+            yield event
+
+
+@pytest.mark.asyncio
+async def test_streamed_loop_runs_tool_before_turn_finishes(tmp_path: Path) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("x = 1\n")
+    call = f'{{"name": "read_file", "arguments": {{"path": "{target}"}}}}'
+    client = _StreamingClient(
+        [
+            f"Let me look.|<tool_call>{call}</tool_call>|<think>trailing</think>",
+            "<think>Easy.</think>|It sets |x to 1.",
+        ]
+    )
+    agent = build_agent(tmp_path, client, mode="execute")
+    original = agent._get_tool_registry().get("read_file").func
+
+    async def traced(**kw):
+        client.log.append("tool:read_file")
+        return await original(**kw)
+
+    agent._get_tool_registry().get("read_file").func = traced
+
+    events = await _drain(agent, "what does a.py do")
+
+    # The read ran while the first turn was still streaming.
+    assert client.log.index("tool:read_file") < client.log.index("delta:<think>trail")
+    text = [c for c, _a, k in events if k == "text"]
+    assert text[-2:] == ["It sets ", "x to 1."]  # answer arrived incrementally
+    assert "Easy." in "".join(c for c, _a, k in events if k == "reasoning")
+    assistant = [
+        m.content for m in agent.conversation.messages if m.role == "assistant"
+    ]
+    assert assistant == ["It sets x to 1."]
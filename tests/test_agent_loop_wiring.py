@@ -123,3 +123,28 @@ async def test_disabling_loop_uses_single_shot(tmp_path: Path) -> None:
 
     out = await agent.process_user_input("hello")
     assert out == "single-shot answer"
+
+
+@pytest.mark.asyncio
+async def test_loop_options_come_from_typed_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The agent loop uses the Settings fields that /config set writes."""
+    from gerdsenai_cli.core import tool_registry
+
+    seen: dict[str, Any] = {}
+
+    async def fake_loop(*args: Any, **kwargs: Any) -> tool_registry.LoopResult:
+        seen.update(kwargs)
+        return tool_registry.LoopResult(
+            content="done", iterations=1, tool_calls_made=0, stopped_reason="final"
+        )
+
+    monkeypatch.setattr(tool_registry, "run_agent_loop", fake_loop)
+    agent = build_agent(tmp_path, ScriptedLLMClient([]), mode="execute")
+    agent.settings.agent_loop_max_parallel_tools = 2
+    agent.settings.stream_agent_loop = False
+
+    assert await agent.process_user_input("hello") == "done"
+    assert seen["max_parallel_tools"] == 2
+    assert seen["stream"] is False
@@ -0,0 +1,89 @@
+"""Knapsack-style context packing.
+
+Each file offers full/summary variants with token costs and priority-derived
+values; the packer maximizes total value within the budget and is never worse
+than the old walk-in-priority-order strategy, which it reports for comparison.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from gerdsenai_cli.core.context_packing import PackItem, Variant, pack
+
+
+def _item(key: str, cost: int, value: float, summary: int | None = None) -> PackItem:
+    variants = [Variant("full", cost, value)]
+    if summary is not None:
+        variants.append(Variant("summary", summary, value * 0.4))
+    return PackItem(key, variants)
+
+
+def test_large_file_no_longer_blocks_smaller_ones() -> None:
+    items = [
+        _item("big", 900, 100.0, summary=150),
+        _item("a", 200, 60.0),
+        _item("b", 200, 55.0),
+        _item("c", 300, 50.0),
+    ]
+    result = pack(items, 1000)
+    # The old walk: "big" fits alone, then nothing else.
+    assert result.greedy_value == 100.0
+    assert set(result.chosen) == {"big", "a", "b", "c"}
+    assert result.chosen["big"].name == "summary"
+    assert result.used_tokens <= 1000
+    assert result.included_value == pytest.approx(40.0 + 60.0 + 55.0 + 50.0)
+    assert result.dropped_value == pytest.approx(60.0)
+
+
+def test_never_worse_than_priority_walk() -> None:
+    # Classic greedy trap: one dense tiny item vs. one valuable item filling
+    # the whole budget.
+    items = [_item("whole", 100, 100.0), _item("tiny", 1, 2.0)]
+    result = pack(items, 100)
+    assert result.included_value == 100.0
+    assert set(result.chosen) == {"whole"}
+
+
+def test_summary_used_when_full_never_fits() -> None:
+    result = pack([_item("huge", 5000, 10.0, summary=300)], 1000)
+    assert result.chosen["huge"].name == "summary"
+    assert result.summary()["summarized"] == 1
+
+
+def test_empty_budget_drops_everything() -> None:
+    result = pack([_item("a", 10, 3.0)], 0)
+    assert result.chosen == {} and result.dropped_value == 3.0
+
+
+@pytest.mark.asyncio
+async def test_smart_build_packs_and_reports(tmp_path: Path) -> None:
+    big = "".join(
+        f"def function_{i}(value: int) -> int:\n"
+        f'    """Doubles value #{i}."""\n'
+        + "    x = value * 2\n" * 20
+        + "    return x\n\n"
+        for i in range(60)
+    )
+    (tmp_path / "main.py").write_text(big)
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / f"{name}.py").write_text(f"def {name}():\n    return 1\n")
+
+    ctx = ProjectContext(project_root=tmp_path)
+    await ctx.scan_directory()
+    context = await ctx._smart_context_building(
+        max_tokens=2500, mentioned_files=[tmp_path / "main.py"]
+    )
+
+    # main.py (highest priority) is summarized rather than crowding out the rest.
+    assert "## File: main.py\n```\n# Structural outline" in context
+    for name in ("alpha", "beta", "gamma"):
+        assert f"## File: {name}.py" in context
+    assert context.index("## File: main.py") < context.index("## File: alpha.py")
+    report = ctx.last_pack_report
+    assert report["strategy"] == "smart"
+    assert report["summarized"] == 1
+    assert report["included_value"] >= report["greedy_value"]
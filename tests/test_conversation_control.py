@@ -191,3 +191,86 @@ def test_empty_state_shown_without_system_info(conv: ConversationControl) -> Non
     formatted = conv.get_formatted_text()
     rendered = "".join(text for _style, text in formatted)
     assert "No messages yet" in rendered
+
+
+# --------------------------------------------------------------------------- #
+# incremental rendering
+# --------------------------------------------------------------------------- #
+
+
+def _buffer_state(conv: ConversationControl) -> tuple[str, list]:
+    return conv.buffer.text, list(conv.control.formatted_lines)
+
+
+def test_streamed_chunks_do_not_rerender_history(
+    conv: ConversationControl, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(5):
+        conv.add_message("user", f"question {i}")
+        conv.add_message("assistant", f"**answer** {i}")
+    assert conv.converter is not None
+    calls: list[str] = []
+    original = conv.converter.convert_markdown
+
+    def counting(text, width=None):
+        calls.append(text)
+        return original(text, width)
+
+    monkeypatch.setattr(conv.converter, "convert_markdown", counting)
+    conv.start_streaming("assistant")
+    for word in ["streamed ", "answer ", "in ", "chunks"]:
+        conv.append_streaming(word, "text")
+    assert calls == []
+    # A new width re-renders each assistant message once.
+    monkeypatch.setattr(
+        "gerdsenai_cli.ui.prompt_toolkit_tui._terminal_width", lambda: 123
+    )
+    conv.append_streaming("!", "text")
+    assert len(calls) == 5
+
+
+def test_incremental_stream_matches_full_render(conv: ConversationControl) -> None:
+    conv.add_message("user", "hi")
+    conv.start_streaming("assistant")
+    for chunk, kind in [
+        ("let me ", "reasoning"),
+        ("think\nmore", "reasoning"),
+        ("calling read_file\n", "tool"),
+        ("The ", "text"),
+        ("answer\n\nis ", "text"),
+        ("42", "text"),
+    ]:
+        conv.append_streaming(chunk, kind)
+        text, lines = _buffer_state(conv)
+        conv._update_buffer()
+        full_text, full_lines = _buffer_state(conv)
+        assert lines == full_lines
+        # The document is only rebuilt when a line completes; until then its
+        # copy of the open line may lag, but the line structure matches.
+        assert text.count("\n") == full_text.count("\n")
+        if chunk.endswith("\n"):
+            assert text == full_text
+
+
+def test_open_line_chunk_leaves_the_document_alone(
+    conv: ConversationControl,
+) -> None:
+    conv.add_message("user", "hi")
+    conv.start_streaming("assistant")
+    conv.append_streaming("first line\nsecond", "text")
+    document = conv.buffer.document
+    conv.append_streaming(" line", "text")
+    assert conv.buffer.document is document
+    assert conv.control.formatted_lines[-2] == [("class:ai-text", "  second line")]
+    conv.append_streaming(" done\n", "text")
+    assert conv.buffer.document is not document
+    assert "  second line done\n" in conv.buffer.text
+
+
+def test_same_kind_chunks_flow_on_one_line(conv: ConversationControl) -> None:
+    conv.start_streaming("assistant")
+    conv.append_streaming("Hel", "text")
+    conv.append_streaming("lo", "text")
+    conv.append_streaming("status", "tool")
+    rendered = "".join(text for _style, text in conv.get_formatted_text())
+    assert "  Hello\n  status\n" in rendered
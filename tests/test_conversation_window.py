@@ -0,0 +1,102 @@
+"""Tests for token-budgeted conversation history.
+
+The verbatim window stays put while it fits and jumps forward (to a user
+message) once it doesn't; evicted turns are folded into a rolling summary in
+the background, with a digest standing in until the fold lands; the summary
+a prompt sees only changes when the window jumps.
+"""
+
+from gerdsenai_cli.core.conversation_window import ConversationWindow
+from gerdsenai_cli.core.llm_client import ChatMessage
+
+
+def _turns(n: int, words: int = 40) -> list[ChatMessage]:
+    msgs: list[ChatMessage] = []
+    for i in range(n):
+        msgs.append(
+            ChatMessage(role="user", content=f"question {i} " + "word " * words)
+        )
+        msgs.append(
+            ChatMessage(role="assistant", content=f"answer {i} " + "word " * words)
+        )
+    return msgs
+
+
+def test_window_moves_in_jumps_and_keeps_prefix() -> None:
+    window = ConversationWindow(budget_tokens=1000, summary_tokens=50)
+    history = _turns(2)
+    assert window.history_start(history) == 0
+
+    starts = []
+    for _ in range(20):
+        history = history + _turns(1)
+        starts.append(window.history_start(history))
+    # Only a few distinct starts: the window jumps rather than sliding.
+    assert len(set(starts)) < len(starts) / 2
+    assert window.jumps >= 1
+    start = starts[-1]
+    assert history[start].role == "user"
+    assert start <= len(history) - window.min_recent
+
+
+def test_summary_folds_in_background() -> None:
+    import asyncio
+
+    seen: list[tuple[str, int]] = []
+
+    async def summarizer(previous: str, messages: list[ChatMessage]) -> str:
+        seen.append((previous, len(messages)))
+        return f"summary of {len(messages)} messages"
+
+    async def run() -> None:
+        window = ConversationWindow(budget_tokens=300, summary_tokens=50)
+        history = _turns(8)
+        summary, recent = window.select(history, summarizer)
+        start = len(history) - len(recent)
+        assert start > 0
+        # The fold hasn't run yet: evicted turns appear as a digest.
+        assert summary.startswith("- user: question 0")
+        await window.wait_idle()
+        assert seen == [("", start)]
+        assert window.stats()["folds"] == 1
+        # Until the window jumps again the prompt keeps the same summary text,
+        # so the history after it stays a cacheable prefix.
+        assert window.select(history, summarizer)[0] == summary
+        history = history + _turns(1)
+        assert window.select(history, summarizer)[0] == summary
+        while window.history_start(history) == start:
+            history = history + _turns(1)
+        summary, _ = window.select(history, summarizer)
+        assert summary.startswith(f"summary of {start} messages\n- user:")
+
+    asyncio.run(run())
+
+
+def test_failed_fold_keeps_digest() -> None:
+    import asyncio
+
+    async def broken(previous: str, messages: list[ChatMessage]) -> str | None:
+        raise RuntimeError("model unavailable")
+
+    async def run() -> None:
+        window = ConversationWindow(budget_tokens=300, summary_tokens=50)
+        history = _turns(8)
+        window.select(history, broken)
+        await window.wait_idle()
+        summary, _ = window.select(history, None)
+        assert "question 0" in summary
+        assert window.stats()["folds"] == 0
+
+    asyncio.run(run())
+
+
+def test_reset_after_clear() -> None:
+    window = ConversationWindow(budget_tokens=300, summary_tokens=50)
+    history = _turns(8)
+    window.select(history)
+    assert window.stats()["window_start"] > 0
+    # A shorter history than the window start means the conversation was cleared.
+    summary, recent = window.select(_turns(1))
+    assert summary == ""
+    assert len(recent) == 2
+    assert window.stats()["window_start"] == 0
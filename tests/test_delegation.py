@@ -117,3 +117,38 @@ async def test_child_run_command_still_confirms_in_execute(tmp_path: Path) -> No
 
     assert "run_command" in seen  # the child's shell command hit the gate
     assert "delegate" not in seen  # EXECUTE auto-allowed the spawn itself
+
+
+@pytest.mark.asyncio
+async def test_child_can_fetch_its_own_observation_handles(tmp_path: Path) -> None:
+    """Digests the child produces land in the shared store it fetches from."""
+    target = tmp_path / "big.py"
+    target.write_text("".join(f"value_{i} = {i}\n" for i in range(400)))
+    seen: list[str] = []
+
+    class RecordingClient(ScriptedLLMClient):
+        async def chat_with_tools(self, messages, tools, **kw):  # type: ignore[no-untyped-def]
+            seen.extend(m.content for m in messages if m.role == "tool")
+            return await super().chat_with_tools(messages, tools, **kw)
+
+    client = RecordingClient(
+        [
+            tool_call("delegate", task="inspect big.py"),
+            # --- child loop ---
+            tool_call("read_file", path=str(target)),
+            tool_call("fetch_observation", handle="obs-1", start_line=390),
+            final("value_399 is 399."),
+            # --- parent resumes ---
+            final("done"),
+        ]
+    )
+    agent = build_agent(tmp_path, client, mode="execute")
+    agent.settings.observation_digest_chars = 500
+    assert agent._get_tool_registry().observations.digest_chars == 500
+    await agent.context_manager.scan_directory()
+
+    await agent.process_user_input("delegate the inspection")
+
+    assert any("obs-1" in text for text in seen)  # the read was compressed
+    assert any("value_399 = 399" in text for text in seen)
+    assert not any("Unknown observation handle" in text for text in seen)
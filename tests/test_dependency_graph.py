@@ -0,0 +1,166 @@
+"""Import graph behind ProactiveContextBuilder's related-file lookup.
+
+Python imports resolve through packages (``__init__.py``), relative imports and
+``src/`` layouts; JS/TS through extension/index probing and tsconfig ``baseUrl``.
+The graph persists to disk and re-parses only files whose (mtime, size) changed.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.dependency_graph import DependencyGraph
+from gerdsenai_cli.core.proactive_context import (
+    ContextPriority,
+    ProactiveContextBuilder,
+)
+
+
+def _write(root: Path, rel: str, text: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _rels(graph: DependencyGraph, paths: list[Path]) -> list[str]:
+    return sorted(p.relative_to(graph.project_root).as_posix() for p in paths)
+
+
+@pytest.fixture
+def py_project(tmp_path: Path) -> Path:
+    root = tmp_path / "proj"
+    _write(root, "src/app/__init__.py", "from .core import run\n")
+    _write(root, "src/app/core.py", "from . import util\nfrom .models import User\n")
+    _write(root, "src/app/util.py", "import json\n")
+    _write(root, "src/app/models/__init__.py", "from app.models.user import User\n")
+    _write(root, "src/app/models/user.py", "class User: ...\n")
+    _write(root, "scripts/cli.py", "import app.core\nfrom app import util\n")
+    return root
+
+
+def test_python_resolution(py_project: Path, tmp_path: Path) -> None:
+    graph = DependencyGraph(py_project, cache_dir=tmp_path / "cache")
+    graph.refresh()
+
+    core = py_project / "src/app/core.py"
+    assert _rels(graph, graph.dependencies(core)) == [
+        "src/app/models/__init__.py",
+        "src/app/util.py",
+    ]
+    models = py_project / "src/app/models/__init__.py"
+    assert _rels(graph, graph.dependencies(models)) == ["src/app/models/user.py"]
+    # Absolute imports from outside the package resolve via the src/ root;
+    # stdlib imports are ignored.
+    assert _rels(graph, graph.dependents(core)) == [
+        "scripts/cli.py",
+        "src/app/__init__.py",
+    ]
+    assert graph.dependencies(py_project / "src/app/util.py") == []
+
+
+def test_neighbors_by_hop(py_project: Path, tmp_path: Path) -> None:
+    graph = DependencyGraph(py_project, cache_dir=tmp_path / "cache")
+    graph.refresh()
+    hops = {
+        p.relative_to(graph.project_root).as_posix(): h
+        for p, h in graph.neighbors(py_project / "src/app/models/__init__.py")
+    }
+    assert hops["src/app/models/user.py"] == 1
+    assert hops["src/app/core.py"] == 1
+    assert hops["src/app/util.py"] == 2
+    assert hops["scripts/cli.py"] == 2
+
+    forward = graph.neighbors(
+        py_project / "src/app/core.py", max_hops=1, include_dependents=False
+    )
+    assert [h for _, h in forward] == [1, 1]
+
+
+def test_js_ts_resolution(tmp_path: Path) -> None:
+    root = tmp_path / "web"
+    _write(
+        root,
+        "tsconfig.json",
+        '{\n  // comment\n  "compilerOptions": {"baseUrl": "src"}\n}',
+    )
+    _write(
+        root,
+        "src/main.ts",
+        "import { a } from './lib/a'\n"
+        "import './styles'\n"
+        "export * from './components'\n"
+        "const b = require('../legacy.js')\n"
+        "import React from 'react'\n"
+        "import { cfg } from 'config/settings'\n"
+        "const lazy = () => import('./lazy')\n",
+    )
+    _write(root, "src/lib/a.tsx")
+    _write(root, "src/styles.js")
+    _write(root, "src/components/index.ts")
+    _write(root, "legacy.js")
+    _write(root, "src/config/settings.ts")
+    _write(root, "src/lazy.mjs")
+
+    graph = DependencyGraph(root, cache_dir=tmp_path / "cache")
+    graph.refresh()
+    assert _rels(graph, graph.dependencies(root / "src/main.ts")) == [
+        "legacy.js",
+        "src/components/index.ts",
+        "src/config/settings.ts",
+        "src/lazy.mjs",
+        "src/lib/a.tsx",
+        "src/styles.js",
+    ]
+
+
+def test_persisted_and_incremental(py_project: Path, tmp_path: Path) -> None:
+    cache = tmp_path / "cache"
+    graph = DependencyGraph(py_project, cache_dir=cache)
+    assert graph.refresh() == 6
+    assert graph.cache_path.exists()
+
+    # A fresh instance loads the saved graph and re-parses nothing.
+    reloaded = DependencyGraph(py_project, cache_dir=cache)
+    assert reloaded.refresh() == 0
+    assert _rels(reloaded, reloaded.dependents(py_project / "src/app/util.py")) == [
+        "scripts/cli.py",
+        "src/app/core.py",
+    ]
+
+    core = py_project / "src/app/core.py"
+    core.write_text("from .models import User\n")
+    st = core.stat()
+    os.utime(core, (st.st_atime, st.st_mtime + 5))
+    assert reloaded.refresh() == 1
+    assert _rels(reloaded, reloaded.dependents(py_project / "src/app/util.py")) == [
+        "scripts/cli.py"
+    ]
+
+    (py_project / "scripts/cli.py").unlink()
+    reloaded.refresh()
+    assert reloaded.dependents(py_project / "src/app/util.py") == []
+    assert len(reloaded) == 5
+
+
+@pytest.mark.asyncio
+async def test_proactive_builder_pulls_graph_neighbours(
+    py_project: Path, tmp_path: Path
+) -> None:
+    graph = DependencyGraph(py_project, cache_dir=tmp_path / "cache")
+    builder = ProactiveContextBuilder(py_project, dependency_graph=graph)
+
+    files = await builder.build_smart_context(
+        "look at it", explicitly_mentioned=["src/app/models/__init__.py"]
+    )
+    by_rel = {
+        Path(k).relative_to(py_project.resolve()).as_posix(): v
+        for k, v in files.items()
+    }
+    assert by_rel["src/app/models/user.py"].priority == ContextPriority.MEDIUM
+    assert by_rel["src/app/core.py"].priority == ContextPriority.MEDIUM
+    assert by_rel["src/app/util.py"].priority == ContextPriority.LOW
+    assert "2 hops" in by_rel["src/app/util.py"].read_reason
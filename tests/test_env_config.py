@@ -224,6 +224,9 @@ class _FakeLLMClient:
     async def list_models(self):
         return [_FakeModel()]
 
+    def preload_models(self, models) -> None:
+        return None
+
 
 class _FakeAgent:
     def __init__(self, llm_client, settings):
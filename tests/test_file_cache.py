@@ -0,0 +1,85 @@
+"""Shared file content cache used by the context builders.
+
+Reads are validated against a fresh stat (mtime + size), the cache is an LRU
+bounded by total characters, and ProjectContext / ProactiveContextBuilder both
+read through it.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from gerdsenai_cli.core.file_cache import FileContentCache
+from gerdsenai_cli.core.proactive_context import ProactiveContextBuilder
+from gerdsenai_cli.core.token_counter import get_token_counter
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+
+
+@pytest.mark.asyncio
+async def test_hit_then_invalidated_by_edit(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    path.write_text("one")
+    cache = FileContentCache()
+
+    assert await cache.lookup(path) == ("one", False)
+    assert await cache.lookup(path) == ("one", True)
+
+    path.write_text("two")
+    _bump_mtime(path)
+    assert await cache.read(path) == "two"
+    assert cache.stats()["misses"] == 2
+
+    path.unlink()
+    assert await cache.read(path) is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bounded_by_total_chars(tmp_path: Path) -> None:
+    cache = FileContentCache(max_chars=100)
+    for i in range(5):
+        (tmp_path / f"{i}.txt").write_text("x" * 40)
+        await cache.read(tmp_path / f"{i}.txt")
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["chars"] <= 100
+
+    # A file bigger than the whole cache is served but not kept.
+    big = tmp_path / "big.txt"
+    big.write_text("y" * 500)
+    assert await cache.read(big) == "y" * 500
+    assert cache.stats()["chars"] <= 100
+
+
+@pytest.mark.asyncio
+async def test_encoding_fallback(tmp_path: Path) -> None:
+    path = tmp_path / "latin.txt"
+    path.write_bytes("café".encode("latin-1"))
+    cache = FileContentCache()
+    assert await cache.read(path) == "café"
+    assert cache.encoding_of(path) == "latin-1"
+
+
+@pytest.mark.asyncio
+async def test_context_builders_share_reads(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text("def f():\n    return 1\n")
+    cache = FileContentCache()
+
+    project = ProjectContext(tmp_path)
+    project.content_cache = cache
+    await project.scan_directory()
+    assert await project.read_file_content(path.resolve()) is not None
+
+    builder = ProactiveContextBuilder(tmp_path, content_cache=cache)
+    result = await builder._read_file_with_priority(path.resolve(), 10, "test")
+    assert result is not None
+    assert result.token_estimate == get_token_counter().count(result.content)
+    assert (cache.hits, cache.misses) == (1, 1)
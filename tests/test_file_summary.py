@@ -0,0 +1,92 @@
+"""Structural summaries for files that don't fit the context budget.
+
+Python is outlined via ``ast`` (signatures, first docstring lines, imports,
+constants), other languages via declaration patterns; detail drops level by
+level until the outline fits. ``ProjectContext._summarize_file`` caches the
+result per (content hash, budget bucket).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from gerdsenai_cli.core.file_summary import summarize_structure
+from gerdsenai_cli.core.token_counter import get_token_counter
+
+
+def _count(text: str) -> int:
+    return get_token_counter().count(text)
+
+
+def _big_module(n_classes: int = 30) -> str:
+    parts = ['"""Service layer for widgets."""\n', "import os\n", "LIMIT = 10\n"]
+    for i in range(n_classes):
+        parts.append(
+            f"\n\nclass Widget{i}(Base):\n"
+            f'    """Widget number {i}.\n\n    Longer description.\n    """\n\n'
+            f"    def render(self, size: int = {i}) -> str:\n"
+            f'        """Render it."""\n'
+            + "".join(f"        x{j} = size * {j}\n" for j in range(15))
+            + "        return str(size)\n"
+        )
+    return "".join(parts)
+
+
+def test_python_outline_keeps_signatures_and_docs() -> None:
+    source = _big_module()
+    summary = summarize_structure(source, 2000, _count, Path("svc.py"))
+    assert summary is not None
+    assert summary.startswith("# Structural outline of")
+    assert '"""Service layer for widgets."""' in summary
+    assert "import os" in summary and "LIMIT = 10" in summary
+    assert "class Widget3(Base):  # L" in summary
+    assert "    def render(self, size: int=3) -> str: ...  # L" in summary
+    assert '        """Render it."""' in summary
+    assert "x5 = size" not in summary
+    assert _count(summary) <= 2000 < _count(source)
+
+
+def test_detail_drops_until_it_fits() -> None:
+    source = _big_module()
+    summary = summarize_structure(source, 300, _count, Path("svc.py"))
+    assert summary is not None and _count(summary) <= 300
+    assert "class Widget0(Base)" in summary
+    # Methods are the first thing to go at the tightest level.
+    assert "def render" not in summary
+    assert "member(s) omitted" in summary
+
+
+def test_regex_languages_and_unstructured_content() -> None:
+    ts = "import { x } from './x'\n" + "".join(
+        f"export function fn{i}(a: number) {{\n  return a\n}}\n" for i in range(50)
+    )
+    summary = summarize_structure(ts, 2000, _count, Path("mod.ts"))
+    assert summary is not None
+    assert "import { x } from './x'" in summary
+    assert "export function fn7(a: number)  // L" in summary
+
+    assert summarize_structure("just prose\n" * 100, 50, _count, Path("a.md")) is None
+    assert summarize_structure("line\n" * 100, 50, _count) is None
+
+
+@pytest.mark.asyncio
+async def test_summarize_file_uses_outline_and_caches(tmp_path: Path) -> None:
+    ctx = ProjectContext(project_root=tmp_path)
+    source = _big_module()
+
+    first = await ctx._summarize_file(source, 1500, Path("svc.py"))
+    assert first.startswith("# Structural outline of")
+    assert _count(first) <= 1500
+
+    # Same content, nearby budget (same bucket): served from the cache.
+    assert len(ctx._summary_cache) == 1
+    assert await ctx._summarize_file(source, 1900, Path("svc.py")) is first
+    assert len(ctx._summary_cache) == 1
+
+    # Prose still gets the beginning/end treatment.
+    prose = "some notes here\n"
+    text = await ctx._summarize_file(prose * 200, 300, Path("notes.md"))
+    assert "lines omitted" in text
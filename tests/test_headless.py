@@ -103,3 +103,54 @@ async def test_run_headless_returns_one_when_no_model(monkeypatch, tmp_path):
     code = await cli.run_headless("hello")
     assert code == 1
     assert fake_agent.called is False  # never dispatched with an empty model
+
+
+@pytest.mark.asyncio
+async def test_run_headless_writes_perf_json(monkeypatch, tmp_path, capsys):
+    """--perf-json writes the turn timeline to a file, or to stderr for '-'."""
+    import json
+
+    from gerdsenai_cli.core.turn_scheduler import TurnScheduler
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    cli = GerdsenAICLI(config_path=None, interactive=False)
+
+    class _FakeAgent:
+        def __init__(self) -> None:
+            self.settings = Settings(current_model="fake-model")
+            self.last_turn_timeline = None
+
+        async def process_user_input(self, text: str) -> str:
+            sched = TurnScheduler()
+            sched.begin("completion")
+            sched.record_generation(prompt_tokens=12, completion_tokens=3)
+            self.last_turn_timeline = await sched.close()
+            return "ok"
+
+        async def cleanup(self) -> None:
+            return None
+
+    class _FakeClient:
+        async def __aexit__(self, *exc) -> None:
+            return None
+
+    async def _fake_init() -> bool:
+        cli.settings = Settings(current_model="fake-model")
+        cli.agent = _FakeAgent()
+        cli.llm_client = _FakeClient()
+        return True
+
+    monkeypatch.setattr(cli, "initialize", _fake_init)
+
+    target = tmp_path / "perf.json"
+    assert await cli.run_headless("hi", perf_json=str(target)) == 0
+    report = json.loads(target.read_text())
+    assert report["model"] == "fake-model"
+    assert report["turn"]["generation"]["prompt_tokens"] == 12
+    assert report["turn"]["stages"][0]["name"] == "completion"
+
+    capsys.readouterr()
+    assert await cli.run_headless("hi", perf_json="-") == 0
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "ok"
+    assert '"completion_tokens": 3' in captured.err
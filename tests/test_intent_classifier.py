@@ -0,0 +1,180 @@
+"""Tests for the local intent classifier.
+
+Confident, familiar inputs are answered without an LLM call; unfamiliar ones
+fall back to the LLM, whose confident verdicts become training examples.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gerdsenai_cli.core.agent import ActionType, IntentParser
+from gerdsenai_cli.core.intent_classifier import LocalIntentClassifier
+
+PROJECT_FILES = ["gerdsenai_cli/core/agent.py", "README.md"]
+
+
+class _IntentLLM:
+    """Fake client answering intent prompts with a fixed JSON verdict."""
+
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.calls = 0
+
+    async def chat(self, messages: Any, **_kw: Any) -> str:
+        self.calls += 1
+        return self.reply
+
+
+@pytest.mark.parametrize(
+    ("text", "label"),
+    [
+        ("show me the contents of agent.py", "read_and_explain"),
+        ("give me an overview of this project", "whole_repo_analysis"),
+        ("where is the retry logic implemented", "iterative_search"),
+        ("create a new file called foo.py", "create_files"),
+        ("hello", "chat"),
+    ],
+)
+def test_confident_on_familiar_phrasing(text: str, label: str) -> None:
+    verdict = LocalIntentClassifier().classify(text)
+    assert verdict is not None
+    assert verdict[0] == label
+
+
+def test_abstains_on_unfamiliar_input() -> None:
+    assert LocalIntentClassifier().classify("lgtm ship") is None
+
+
+def test_learns_from_confirmed_examples(tmp_path: Path) -> None:
+    path = tmp_path / "intent_examples.json"
+    clf = LocalIntentClassifier(examples_path=path)
+    assert clf.classify("bump deps in the lockfile") is None
+    for text in (
+        "bump deps in the lockfile",
+        "bump the deps in requirements",
+        "bump deps to latest",
+    ):
+        clf.learn(text, "edit_files")
+    clf.learn("ignored", "not_a_label")
+    assert clf.predict("bump deps in the lockfile")[0] == "edit_files"
+
+    clf.save()
+    reloaded = LocalIntentClassifier(examples_path=path)
+    assert len(reloaded.learned) == 3
+
+
+@pytest.mark.asyncio
+async def test_fit_runs_once_off_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    clf = LocalIntentClassifier()
+    fits: list[int] = []
+    fit = clf._fit
+
+    def recording_fit(learned: list[tuple[str, str]]) -> Any:
+        fits.append(threading.get_ident())
+        return fit(learned)
+
+    monkeypatch.setattr(clf, "_fit", recording_fit)
+    await clf.warm()
+    assert fits and threading.get_ident() not in fits
+
+    # Later examples are folded in with a few SGD steps, not a refit.
+    for text in ("bump deps in the lockfile", "bump the deps in requirements"):
+        clf.learn(text, "edit_files")
+    assert clf.predict("bump deps in the lockfile")[0] == "edit_files"
+    await clf.warm()
+    assert len(fits) == 1
+
+
+def test_learns_from_clarification_choices() -> None:
+    clf = LocalIntentClassifier()
+    # Queued until the first fit, then labelled from the chosen interpretation.
+    clf.learn_from_clarification(
+        "do the usual for the docs", "Generate a readme: create a readme file"
+    )
+    clf.learn_from_clarification("hmm", "something unrelated entirely")
+    assert clf.learned == []
+    clf.predict("hello")
+    assert clf.learned == [("do the usual for the docs", "create_files")]
+
+
+@pytest.mark.asyncio
+async def test_parser_skips_llm_for_confident_local_answer() -> None:
+    llm = _IntentLLM('{"action": "chat", "confidence": 0.9}')
+    parser = IntentParser(local_classifier=LocalIntentClassifier())
+    intent = await parser.detect_intent_with_llm(
+        llm,  # type: ignore[arg-type]
+        "show me the contents of README.md",
+        PROJECT_FILES,
+    )
+    assert llm.calls == 0
+    assert intent.action_type == ActionType.READ_FILE
+    assert intent.parameters["file_path"] == "README.md"
+    assert parser.local_classifier.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_parser_falls_back_and_learns() -> None:
+    llm = _IntentLLM('{"action": "iterative_search", "confidence": 0.95, "files": []}')
+    clf = LocalIntentClassifier()
+    parser = IntentParser(local_classifier=clf)
+
+    # Reading needs a known file, so a local read verdict without one falls back.
+    intent = await parser.detect_intent_with_llm(
+        llm,  # type: ignore[arg-type]
+        "show me the contents of missing.py",
+        PROJECT_FILES,
+    )
+    assert llm.calls == 1
+    assert intent.action_type == ActionType.SEARCH_FILES
+    assert clf.stats() | {"learned_examples": 1, "hits": 0, "fallbacks": 1} == (
+        clf.stats()
+    )
+
+
+@pytest.mark.asyncio
+async def test_parser_without_classifier_always_asks_llm() -> None:
+    llm = _IntentLLM('{"action": "chat", "confidence": 0.9}')
+    await IntentParser().detect_intent_with_llm(
+        llm,  # type: ignore[arg-type]
+        "hello",
+        [],
+    )
+    assert llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_router_shares_the_agents_classifier(tmp_path: Path) -> None:
+    from gerdsenai_cli.core.smart_router import SmartRouter
+
+    from .harness import ScriptedLLMClient, build_agent
+
+    llm = _IntentLLM('{"action": "chat", "confidence": 0.9}')
+    agent = build_agent(tmp_path, ScriptedLLMClient([]))
+    clf = agent.intent_parser.local_classifier
+    assert clf is not None
+    router = SmartRouter(llm, agent.settings, local_classifier=clf)  # type: ignore[arg-type]
+
+    await router.intent_parser.detect_intent_with_llm(
+        llm,  # type: ignore[arg-type]
+        "show me the contents of README.md",
+        PROJECT_FILES,
+    )
+    # Router lookups count in the stats the agent reports and saves.
+    assert agent.get_agent_stats()["local_intent"]["hits"] == 1
+
+
+def test_agent_classifier_follows_typed_settings(tmp_path: Path) -> None:
+    from .harness import ScriptedLLMClient, build_agent
+
+    agent = build_agent(tmp_path, ScriptedLLMClient([]))
+    agent.settings.local_intent_threshold = 0.95
+    clf = agent._local_classifier()
+    assert clf is not None and clf.threshold == 0.95
+
+    agent.settings.local_intent_classifier = False
+    assert agent._local_classifier() is None
@@ -7,6 +7,7 @@ or eagerly only when the ``eager_project_scan`` preference is set.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -106,3 +107,23 @@ async def test_first_turn_intent_detection_sees_scanned_files(
     # The scan ran before intent detection, so it received the project files.
     assert captured.get("project_files"), "intent detection got an empty file list"
     assert any("a.py" in f for f in captured["project_files"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scans_share_one_pass(tmp_path: Path, monkeypatch) -> None:
+    """A background startup scan and a turn's scan run the filesystem walk once."""
+    _project(tmp_path)
+    agent = Agent(FakeLLMClient(), Settings(), project_root=tmp_path)
+    calls: list[int] = []
+    original = agent.context_manager.scan_directory
+
+    async def counting_scan(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(agent.context_manager, "scan_directory", counting_scan)
+    await asyncio.gather(
+        agent._analyze_project_structure(), agent._analyze_project_structure()
+    )
+    assert calls == [1]
+    assert len(agent.context_manager.files) > 0
@@ -0,0 +1,159 @@
+"""Startup stays cheap: commands load on first use, entry points import little.
+
+The command catalog must match the command classes it stands in for, the
+registry must route, list and describe catalog entries without importing
+them, and ``gerdsenai --version`` / headless ``-p`` must not import the
+modules they never need (read from ``python -X importtime``). Their import
+time is measured by ``benchmarks/bench_startup.py``: wall-clock budgets are
+too noisy on a loaded machine to gate the test suite.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.commands.base import BaseCommand, CommandCategory, CommandResult
+from gerdsenai_cli.commands.catalog import BUILTIN_COMMANDS, CommandSpec
+from gerdsenai_cli.commands.parser import CommandParser
+
+# Never needed to print the version or answer one headless prompt.
+HEADLESS_FORBIDDEN = (
+    "prompt_toolkit",
+    "rich.markdown",
+    "gerdsenai_cli.ui.prompt_toolkit_tui",
+    "gerdsenai_cli.commands.audio_commands",
+    "gerdsenai_cli.commands.vision_commands",
+    "gerdsenai_cli.commands.mcp",
+    "gerdsenai_cli.commands.anthropic_cmd",
+    "gerdsenai_cli.commands.system",
+)
+VERSION_FORBIDDEN = (*HEADLESS_FORBIDDEN, "rich", "gerdsenai_cli.main", "pydantic")
+
+
+class _Probe(BaseCommand):
+    @property
+    def name(self) -> str:
+        return "probe"
+
+    @property
+    def description(self) -> str:
+        return "Probe command"
+
+    @property
+    def category(self) -> CommandCategory:
+        return CommandCategory.SYSTEM
+
+    @property
+    def aliases(self) -> list[str]:
+        return ["pr"]
+
+    async def execute(self, args, context=None) -> CommandResult:
+        return CommandResult(success=True, message="ran")
+
+
+PROBE = CommandSpec(
+    "probe", "system", "_Probe", CommandCategory.SYSTEM, "Probe command", ("pr",)
+)
+
+
+def _lazy_parser() -> tuple[CommandParser, list[int]]:
+    loads: list[int] = []
+
+    def factory() -> BaseCommand:
+        loads.append(1)
+        return _Probe()
+
+    parser = CommandParser()
+    parser.register_lazy(PROBE, factory)
+    return parser, loads
+
+
+@pytest.mark.parametrize("spec", BUILTIN_COMMANDS, ids=lambda s: s.name)
+def test_catalog_matches_command_class(spec: CommandSpec) -> None:
+    command = spec.load(object()) if spec.needs_agent else spec.load()
+    assert command.name == spec.name
+    assert tuple(command.aliases) == spec.aliases
+    assert command.category == spec.category
+    assert command.description == spec.description
+
+
+async def test_lazy_command_loads_on_first_use_only() -> None:
+    parser, loads = _lazy_parser()
+    assert "pr" in parser.registry.get_all_names()
+    parser.show_help()  # listing uses the catalog entry
+    assert loads == []
+
+    result = await parser.execute_command("/pr")
+    assert result.message == "ran"
+    await parser.execute_command("/probe")
+    assert loads == [1]
+
+
+def test_lazy_command_names_conflict_and_unregister() -> None:
+    parser, loads = _lazy_parser()
+    with pytest.raises(ValueError):
+        parser.register_command(_Probe())
+    assert parser.get_status()["total_commands"] == 1
+    assert parser.registry.unregister("probe")
+    assert parser.registry.get_command("pr") is None
+    assert loads == []
+
+
+def _imports(args: list[str], home: Path) -> tuple[float, set[str]]:
+    """Run ``python -X importtime <args>``: (ms spent importing, modules)."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("GERDSENAI_")}
+    env["HOME"] = str(home)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    total = 0.0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):  # top level: not nested in another
+            total += int(cumulative) / 1000
+    return total, modules
+
+
+def test_version_startup_imports(tmp_path: Path) -> None:
+    _, modules = _imports(["-m", "gerdsenai_cli.cli", "--version"], tmp_path)
+    assert "gerdsenai_cli" in modules
+    assert not modules.intersection(VERSION_FORBIDDEN)
+
+
+def test_headless_startup_imports(tmp_path: Path) -> None:
+    # No config in the temporary HOME: the run fails fast, but only after
+    # importing the application modules a real -p run needs.
+    _, modules = _imports(["-m", "gerdsenai_cli.cli", "-p", "hi"], tmp_path)
+    assert "gerdsenai_cli.core.agent" in modules
+    assert not modules.intersection(HEADLESS_FORBIDDEN)
+
+
+def test_failed_lazy_load_keeps_the_command() -> None:
+    attempts: list[int] = []
+
+    def flaky() -> BaseCommand:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ImportError("optional dependency missing")
+        return _Probe()
+
+    parser = CommandParser()
+    parser.register_lazy(PROBE, flaky)
+    with pytest.raises(ImportError):
+        parser.registry.get_command("probe")
+    assert "probe" in parser.registry.get_all_names()
+    assert parser.registry.get_command("pr") is not None
+    assert attempts == [1, 1]
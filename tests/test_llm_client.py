@@ -180,6 +180,64 @@ class TestLLMClient:
             assert len(content_parts) == 3
             assert "".join(content_parts) == "Hello there!"
 
+    @pytest.mark.asyncio
+    async def test_streaming_tool_call_deltas(self) -> None:
+        """Tool-call deltas are assembled and surfaced before the stream ends."""
+        mock_lines = [
+            'data: {"choices": [{"delta": {"reasoning_content": "need a file"}}]}',
+            'data: {"choices": [{"delta": {"tool_calls": [{"index": 0, "id": "c1", '
+            '"function": {"name": "read_file", "arguments": "{\\"path\\": "}}]}}]}',
+            'data: {"choices": [{"delta": {"tool_calls": [{"index": 0, '
+            '"function": {"arguments": "\\"a.py\\"}"}}]}}]}',
+            'data: {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]}',
+            "data: [DONE]",
+        ]
+
+        async def async_lines() -> AsyncGenerator[str, None]:
+            for line in mock_lines:
+                yield line
+
+        with patch.object(self.client.client, "stream") as mock_stream:
+            mock_response = MagicMock()
+            mock_response.aiter_lines.return_value = async_lines()
+            mock_response.raise_for_status.return_value = None
+            mock_stream.return_value.__aenter__.return_value = mock_response
+
+            messages = [ChatMessage(role="user", content="Read a.py")]
+            events = [
+                e
+                async for e in self.client.stream_chat_with_tools(
+                    messages=messages, tools=[], model="llama2:7b"
+                )
+            ]
+
+        assert [e.kind for e in events] == ["reasoning", "tool_call", "done"]
+        assert events[1].tool_call.arguments == {"path": "a.py"}
+        assert events[2].result.reasoning == "need a file"
+        assert [c.id for c in events[2].result.tool_calls] == ["c1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_tool_stream_ends_quietly(self) -> None:
+        """The loop falls back to a buffered call, so no error is shown here."""
+        from httpx import ConnectError
+
+        with (
+            patch.object(self.client.client, "stream") as mock_stream,
+            patch("gerdsenai_cli.core.llm_client.show_error") as mock_show,
+        ):
+            mock_stream.side_effect = ConnectError("Connection failed")
+            events = [
+                e
+                async for e in self.client.stream_chat_with_tools(
+                    messages=[ChatMessage(role="user", content="hi")],
+                    tools=[],
+                    model="llama2:7b",
+                )
+            ]
+
+        assert events == []
+        mock_show.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_timeout_configuration(self) -> None:
         """Test that timeouts are properly configured."""
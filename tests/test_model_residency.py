@@ -0,0 +1,96 @@
+"""Tests for Ollama model pre-loading and keep-alive management."""
+
+import asyncio
+import json
+
+import httpx
+
+from gerdsenai_cli.core.model_residency import ModelResidencyManager
+
+
+def _manager(handler, keep_alive="30m"):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ModelResidencyManager(lambda: client, "http://ollama:11434", keep_alive)
+
+
+async def test_preload_uses_native_load_with_keep_alive():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"done": True})
+
+    manager = _manager(handler, keep_alive="1h")
+    assert await manager.preload("qwen2.5-coder", "chat")
+    assert await manager.preload("nomic-embed-text", "embedding")
+
+    assert seen[0] == ("/api/generate", {"model": "qwen2.5-coder", "keep_alive": "1h"})
+    assert seen[1][0] == "/api/embed"
+    assert seen[1][1]["keep_alive"] == "1h"
+    assert manager.supported is True
+    entry = manager.models["qwen2.5-coder"]
+    assert entry.state == "loaded" and entry.load_seconds is not None
+
+
+async def test_non_ollama_server_turns_manager_off():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(404, text="404 page not found")
+
+    manager = _manager(handler)
+    assert not await manager.preload("some-model")
+    assert manager.supported is False
+    assert manager.models == {}
+
+    manager.touch("some-model")
+    assert await manager.refresh() == []
+    assert calls == ["/api/generate"]
+
+
+async def test_refresh_reports_loaded_and_unloaded_models():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/ps":
+            return httpx.Response(
+                200,
+                json={
+                    "models": [
+                        {
+                            "name": "qwen2.5-coder:latest",
+                            "expires_at": "2026-10-18T12:30:00Z",
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(200, json={})
+
+    manager = _manager(handler)
+    await manager.preload("qwen2.5-coder")
+    await manager.preload("llama3.2")
+
+    states = {e.model: e for e in await manager.refresh()}
+    assert states["qwen2.5-coder"].state == "loaded"
+    assert states["qwen2.5-coder"].expires_at == "2026-10-18T12:30:00Z"
+    assert states["llama3.2"].state == "unloaded"
+
+
+async def test_touch_is_coalesced_per_model():
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await release.wait()
+        return httpx.Response(200, json={})
+
+    manager = _manager(handler)
+    manager.touch("qwen2.5-coder")
+    manager.touch("qwen2.5-coder")
+    manager.touch("qwen2.5-coder")
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert calls == ["/api/generate"]
+    await manager.close()
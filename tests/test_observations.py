@@ -0,0 +1,68 @@
+"""Tests for out-of-band tool observations.
+
+Large tool results are stored under a handle and replaced by a digest shaped
+by the kind of output (errors first for commands, an outline for code); the
+full text stays reachable a line range at a time.
+"""
+
+from gerdsenai_cli.core.observations import FETCH_TOOL, ObservationStore
+
+
+def _command_output() -> str:
+    lines = [f"collecting item {i}" for i in range(500)]
+    lines[250] = "FAILED tests/test_x.py::test_y - AssertionError: 1 != 2"
+    return "$ pytest\nexit_code=1\n" + "\n".join(lines)
+
+
+def test_small_results_pass_through() -> None:
+    store = ObservationStore(digest_chars=1000)
+    assert store.compress("read_file", {"path": "a.py"}, "x = 1") == "x = 1"
+    assert store.stats()["stored"] == 0
+
+
+def test_command_digest_puts_errors_first() -> None:
+    store = ObservationStore(digest_chars=1500)
+    text = _command_output()
+    digest = store.compress("run_command", {"command": "pytest"}, text)
+    assert len(digest) < 2000
+    assert "stored as obs-1" in digest
+    errors_at = digest.index("Error/failure lines:")
+    assert "FAILED tests/test_x.py" in digest[errors_at:]
+    assert errors_at < digest.index("$ pytest")
+    # The tail of the output survives too.
+    assert "collecting item 499" in digest
+    assert store.get("obs-1") == text
+
+
+def test_code_digest_has_outline() -> None:
+    body = "\n".join(f"def func_{i}(x):\n    return x + {i}\n" for i in range(300))
+    store = ObservationStore(digest_chars=2000)
+    digest = store.compress("read_file", {"path": "big.py"}, body)
+    assert "Outline:" in digest
+    assert "def func_0(x):" in digest
+    assert "... and" in digest  # more definitions than the outline shows
+
+
+def test_identical_results_share_a_handle() -> None:
+    store = ObservationStore(digest_chars=100)
+    text = "line\n" * 100
+    store.compress("read_file", {"path": "a"}, text)
+    store.compress("read_file", {"path": "a"}, text)
+    assert store.stats()["stored"] == 1
+
+
+def test_fetch_returns_bounded_line_ranges() -> None:
+    store = ObservationStore(digest_chars=500)
+    handle = store.put("run_command", {}, "\n".join(f"row {i}" for i in range(1, 201)))
+    page = store.fetch(handle, 10, 12)
+    assert page.splitlines()[:3] == ["   10| row 10", "   11| row 11", "   12| row 12"]
+    assert page.endswith(f"[{handle} lines 10-12 of 200]")
+
+    long_page = store.fetch(handle, 1, 200)
+    assert len(long_page) < 600
+    assert "continue with start_line=" in long_page
+    # A drill-down is never compressed again.
+    assert store.compress(FETCH_TOOL, {"handle": handle}, long_page * 3) == (
+        long_page * 3
+    )
+    assert store.fetch("obs-99").startswith("Unknown observation handle")
@@ -0,0 +1,83 @@
+"""Tests for the in-process sampling profiler and ``/profile``.
+
+Samples land on the function that is burning CPU, are grouped by the asyncio
+task that was running, and ``/profile stop`` writes collapsed stacks and
+prints a hotspot table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.commands.system import ProfileCommand, profile_action
+from gerdsenai_cli.utils.profiler import SamplingProfiler
+
+
+def _spin(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def test_samples_find_the_hot_function() -> None:
+    profiler = SamplingProfiler(interval=0.002)
+    profiler.start()
+    _spin(0.3)
+    result = profiler.stop()
+
+    assert result.samples > 10
+    assert result.duration >= 0.3
+    hottest = result.hotspots(3)
+    assert any("_spin" in spot.name for spot in hottest)
+    spin = next(spot for spot in hottest if "_spin" in spot.name)
+    assert spin.total_samples >= spin.self_samples
+    line = result.collapsed().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) > 0 and "test_profiler.py" in stack
+
+
+async def test_samples_are_grouped_by_task() -> None:
+    async def work(seconds: float) -> None:
+        for _ in range(int(seconds / 0.02)):
+            _spin(0.02)
+            await asyncio.sleep(0)
+
+    profiler = SamplingProfiler(interval=0.002)
+    profiler.start()
+    await asyncio.gather(
+        asyncio.create_task(work(0.2), name="alpha"),
+        asyncio.create_task(work(0.2), name="beta"),
+    )
+    result = profiler.stop()
+
+    tasks = result.tasks()
+    assert tasks["alpha"] > 0 and tasks["beta"] > 0
+    assert all(stack[0] in tasks for stack in result.stacks)
+
+
+async def test_profile_action_writes_collapsed_stacks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr("gerdsenai_cli.utils.profiler.PROFILES_DIR", tmp_path)
+    assert "not running" in profile_action("status")
+    assert "every 2 ms" in profile_action("start", "2")
+    assert "already running" in profile_action("start")
+    _spin(0.1)
+    table = profile_action("stop", "5")
+
+    written = list(tmp_path.glob("profile-*.collapsed"))
+    assert len(written) == 1 and written[0].read_text()
+    assert str(written[0]) in table
+    assert "_spin" in table
+    assert "not running" in profile_action("stop")
+
+    with pytest.raises(ValueError):
+        ProfileCommand().parse_arguments("begin")
+    with pytest.raises(ValueError):
+        profile_action("start", "-1")
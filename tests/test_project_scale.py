@@ -0,0 +1,86 @@
+"""Scale tests for the context pipeline over generated repositories.
+
+The synthetic generator is deterministic; a scan indexes exactly the files
+its manifest says are visible (nested ``.gitignore`` files and negations
+included, oversized files skipped); the dependency graph recovers the
+generated import edges; and scan time grows near-linearly with file count.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from pathlib import Path
+
+from gerdsenai_cli.core.context_manager import ProjectContext
+from gerdsenai_cli.core.dependency_graph import DependencyGraph
+
+from .synthetic_repo import RepoSpec, generate_repo
+
+
+def _digest(root: Path, files: list[str]) -> str:
+    h = hashlib.sha256()
+    for rel in files:
+        h.update(rel.encode())
+        h.update((root / rel).read_bytes())
+    return h.hexdigest()
+
+
+def _scanned(context: ProjectContext) -> set[str]:
+    return {p.relative_to(context.project_root).as_posix() for p in context.files}
+
+
+def test_generator_is_deterministic(tmp_path: Path) -> None:
+    spec = RepoSpec(files=300, large_files=1, large_file_bytes=4096)
+    a = generate_repo(tmp_path / "a", spec)
+    b = generate_repo(tmp_path / "b", spec)
+    assert len(a.files) == len(set(a.files)) == 300
+    assert a.files == b.files and a.imports == b.imports
+    assert _digest(a.root, a.files) == _digest(b.root, b.files)
+
+    other = generate_repo(tmp_path / "c", RepoSpec(files=300, seed=1))
+    assert other.files != a.files
+
+
+async def test_scan_matches_manifest(tmp_path: Path) -> None:
+    repo = generate_repo(tmp_path / "proj", RepoSpec(files=1500, depth=5))
+    nested = [f for f in repo.files if f.endswith("/.gitignore")]
+    kept = [f for f in repo.files if f.endswith("/keep.cache.json")]
+    assert nested and kept and repo.binaries and repo.large
+
+    context = ProjectContext(repo.root)
+    await context.scan_directory()
+    assert _scanned(context) == repo.scannable(context.max_file_size)
+
+    # Rescanning doesn't accumulate .gitignore patterns.
+    patterns = len(context.gitignore.patterns)
+    await context.scan_directory()
+    assert len(context.gitignore.patterns) == patterns
+
+
+def test_dependency_graph_recovers_imports(tmp_path: Path) -> None:
+    repo = generate_repo(tmp_path / "proj", RepoSpec(files=800))
+    graph = DependencyGraph(repo.root, cache_dir=tmp_path / "cache")
+    graph.refresh()
+    assert any(rel.endswith(".ts") for rel in repo.imports)
+    for rel, targets in repo.imports.items():
+        deps = graph.dependencies(repo.root / rel)
+        found = sorted(p.relative_to(graph.project_root).as_posix() for p in deps)
+        assert found == sorted(targets), rel
+
+
+def test_scan_time_is_near_linear(tmp_path: Path) -> None:
+    def best_scan(files: int) -> float:
+        repo = generate_repo(tmp_path / str(files), RepoSpec(files=files))
+        timings = []
+        for _ in range(3):
+            context = ProjectContext(repo.root)
+            start = time.perf_counter()
+            asyncio.run(context.scan_directory())
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    small, large = best_scan(500), best_scan(2000)
+    # 4x the files: linear is ~4x, quadratic ~16x; allow 2x slack for noise.
+    assert large / small < 8, (small, large)
@@ -0,0 +1,57 @@
+"""Prefix-stable prompt layout.
+
+The system prompt and pinned project context stay byte-identical across turns
+(until a file behind the context changes), and each render records how much of
+the previous prompt it reused as a prefix. The jump-aligned history window is
+covered in test_conversation_window.py.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from gerdsenai_cli.core.llm_client import ChatMessage
+from gerdsenai_cli.core.prompt_layout import PromptLayout
+from tests.harness import ScriptedLLMClient, build_agent
+
+
+def test_reuse_measured_as_common_prefix() -> None:
+    layout = PromptLayout()
+    system = ChatMessage(role="system", content="S" * 100)
+    first = [system, ChatMessage(role="user", content="hi")]
+    assert layout.record(first) == 0.0
+
+    second = [*first, ChatMessage(role="assistant", content="yo")]
+    assert layout.record(second) == 1 - 2 / 104
+
+    changed = [ChatMessage(role="system", content="S" * 50 + "X" * 50)]
+    assert layout.record(changed) == 0.5
+    assert layout.stats()["turns"] == 3
+
+
+def test_agent_keeps_pinned_context_and_prefix(tmp_path: Path) -> None:
+    src = tmp_path / "app.py"
+    src.write_text("print('hi')\n")
+    agent = build_agent(tmp_path, ScriptedLLMClient())
+    agent.context_manager.last_context_files = [src]
+
+    agent.conversation.messages.append(ChatMessage(role="user", content="one"))
+    first = agent._prepare_llm_messages("one", "PROJECT CONTEXT")
+    assert "PROJECT CONTEXT" in first[0].content
+
+    agent.conversation.messages.append(ChatMessage(role="assistant", content="ok"))
+    agent.conversation.messages.append(ChatMessage(role="user", content="two"))
+    assert not agent._project_context_needed()
+    second = agent._prepare_llm_messages("two")
+
+    # Same system message (context still pinned); the rest is appended.
+    assert second[: len(first)] == first
+    assert agent.prompt_layout.last_reuse_ratio > 0.9
+    assert agent.get_agent_stats()["prompt_prefix_reuse"]["turns"] == 2
+
+    # Editing a file the context was built from makes it stale.
+    src.write_text("print('changed')\n")
+    st = src.stat()
+    os.utime(src, (st.st_atime, st.st_mtime + 5))
+    assert agent._project_context_needed()
@@ -0,0 +1,74 @@
+"""Tests for frame-rate-limited stream rendering.
+
+Chunks only mark the display dirty; the render callback runs at most once per
+frame, backs off when frames are slow, and runs immediately on flush or when
+no event loop is running.
+"""
+
+import asyncio
+
+from gerdsenai_cli.ui.prompt_toolkit_tui import PromptToolkitTUI
+from gerdsenai_cli.ui.render_scheduler import RenderScheduler
+
+
+def test_without_event_loop_renders_immediately() -> None:
+    drawn: list[int] = []
+    sched = RenderScheduler(lambda: drawn.append(1))
+    sched.request()
+    sched.request()
+    assert len(drawn) == 2
+    assert not sched.pending
+
+
+async def test_chunks_coalesce_into_frames() -> None:
+    drawn: list[int] = []
+    sched = RenderScheduler(lambda: drawn.append(1), fps=20)
+    for _ in range(200):
+        sched.request()
+        await asyncio.sleep(0)
+    assert len(drawn) <= 2  # the first frame plus at most one more in 50ms
+    sched.flush()
+    assert not sched.pending
+    assert sched.stats()["coalesced"] >= 197
+
+
+async def test_flush_draws_pending_and_cancel_drops_it() -> None:
+    drawn: list[int] = []
+    sched = RenderScheduler(lambda: drawn.append(1), fps=1)
+    sched.request()
+    await asyncio.sleep(0)
+    sched.request()  # falls inside the 1s frame interval
+    assert len(drawn) == 1
+    sched.flush()
+    assert len(drawn) == 2
+    sched.request()
+    sched.cancel()
+    await asyncio.sleep(0)
+    assert len(drawn) == 2
+
+
+def test_interval_adapts_to_slow_frames() -> None:
+    sched = RenderScheduler(lambda: None, fps=60, min_fps=5)
+    assert sched.interval == 1 / 60
+    for _ in range(50):
+        sched.record_cost(0.05)  # 50ms redraws
+    assert 0.09 < sched.interval <= 0.1
+    for _ in range(50):
+        sched.record_cost(1.0)
+    assert sched.interval == 1 / 5
+
+
+async def test_tui_stream_draws_in_frames() -> None:
+    tui = PromptToolkitTUI(target_fps=30)
+    tui.start_streaming_response()
+    for i in range(100):
+        tui.append_streaming_chunk(f"tok{i} ")
+        await asyncio.sleep(0)
+    # Data is recorded at once; the buffer catches up by the next frame.
+    assert tui.conversation.streaming_message.endswith("tok99 ")
+    tui.render_scheduler.flush()
+    shown = tui.conversation.control.formatted_lines
+    assert any("tok99" in text for line in shown for _style, text in line)
+    assert tui.render_scheduler.frames < 10
+    tui.finish_streaming_response()
+    assert tui.conversation.messages[-1][1].endswith("tok99 ")
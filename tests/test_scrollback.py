@@ -0,0 +1,101 @@
+"""Tests for the compressed scrollback archive and the windowed TUI view.
+
+Archived messages round-trip through compressed (and spilled) blocks; the
+conversation view renders only a bounded window of messages, loads older
+ones back on scroll-up and keeps the cursor on the same text while the
+window moves.
+"""
+
+from datetime import datetime
+
+from gerdsenai_cli.ui.prompt_toolkit_tui import ConversationControl
+from gerdsenai_cli.ui.scrollback import ScrollbackArchive
+from gerdsenai_cli.ui.tui_edge_cases import TUIEdgeCaseHandler
+
+
+def _messages(n: int, start: int = 0) -> list[tuple[str, str, datetime]]:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return [("user", f"message {i}\n" + "x" * 200, now) for i in range(start, n)]
+
+
+def test_archive_round_trips_and_spills_to_disk(tmp_path) -> None:
+    archive = ScrollbackArchive(block_size=10, memory_bytes=200, spill_dir=tmp_path)
+    messages = _messages(95)
+    archive.extend(messages[:40])
+    archive.extend(messages[40:])
+    assert len(archive) == 95
+    stats = archive.stats()
+    assert stats["blocks"] == 10
+    assert stats["spilled_blocks"] > 0
+    assert stats["memory_bytes"] <= 200
+    assert archive[0] == messages[0]
+    assert archive[94] == messages[94]
+    assert archive.slice(35, 62) == messages[35:62]
+    assert list(archive) == messages
+    archive.clear()
+    assert len(archive) == 0
+
+
+def _conversation(n: int, view_lines: int = 40) -> ConversationControl:
+    conv = ConversationControl()
+    conv.view_lines = view_lines
+    for i in range(n):
+        conv.add_message("command", f"result {i}")
+    return conv
+
+
+def test_view_renders_bounded_window_of_long_session() -> None:
+    conv = _conversation(200)
+    lines = conv.buffer.document.line_count
+    assert lines <= 2 * conv.view_lines + 10
+    assert "result 199" in conv.buffer.text
+    assert "result 0\n" not in conv.buffer.text
+    assert "earlier messages" in conv.buffer.text
+
+
+def test_load_earlier_keeps_cursor_on_same_message() -> None:
+    conv = _conversation(200)
+    text = conv.buffer.text
+    first = text.index("result ")
+    conv.buffer.cursor_position = first
+    marker = text[first : text.index("\n", first)]
+
+    assert conv.load_earlier()
+    assert not conv.following
+    text = conv.buffer.text
+    pos = conv.buffer.cursor_position
+    assert text[pos : text.index("\n", pos)] == marker
+    assert "newer messages" in text
+    # Loading back to the start, then forward again resumes following.
+    while conv.load_earlier():
+        pass
+    assert "result 0\n" in conv.buffer.text
+    while conv.load_later():
+        pass
+    assert conv.following
+    assert "result 199" in conv.buffer.text
+
+
+def test_archived_messages_load_back_on_scroll_up() -> None:
+    conv = _conversation(120)
+    conv.archive_oldest(100)
+    assert len(conv.messages) == 20
+    assert len(conv.all_messages()) == 120
+    while conv.load_earlier():
+        pass
+    assert "result 0\n" in conv.buffer.text
+    # New output snaps the view back to the newest messages.
+    conv.add_message("command", "latest")
+    assert conv.following
+    assert "latest" in conv.buffer.text
+
+
+def test_memory_manager_archives_into_scrollback() -> None:
+    conv = _conversation(0)
+    conv.messages = _messages(850)
+    handler = TUIEdgeCaseHandler()
+    notice = handler.manage_conversation_memory(conv.messages, conv)
+    assert notice
+    assert len(conv.messages) == 100
+    assert len(conv.scrollback) == 750
+    assert conv.all_messages()[0][1].startswith("message 0")
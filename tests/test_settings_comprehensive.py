@@ -179,6 +179,16 @@ class TestSettingsValidation:
         settings = Settings(protocol="HTTP")
         assert settings.protocol == "http"
 
+    def test_tool_cache_scope_validation(self):
+        """Test tool cache scope accepts only turn/session/off."""
+        assert Settings().tool_cache_scope == "turn"
+        assert Settings(tool_cache_scope=" Session ").tool_cache_scope == "session"
+        with pytest.raises(ValidationError):
+            Settings(tool_cache_scope="sesion")
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.tool_cache_scope = "always"  # type: ignore[assignment]
+
     def test_host_validation_empty(self):
         """Test host validation for empty string."""
         with pytest.raises(ValidationError):
@@ -0,0 +1,125 @@
+"""Tests for the staged startup scheduler and non-blocking initialize().
+
+Independent startup steps overlap, a step whose dependency did not succeed is
+skipped, failures are logged rather than raised, and initialize() returns once
+the connection and model list are ready while optional steps keep running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from gerdsenai_cli.config.settings import Settings
+from gerdsenai_cli.core.startup import StartupScheduler
+from gerdsenai_cli.main import GerdsenAICLI
+
+
+async def test_independent_steps_overlap() -> None:
+    startup = StartupScheduler()
+
+    async def step() -> str:
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    startup.start("a", step)
+    startup.start("b", step)
+    assert await startup.result("a") == "ok"
+    assert await startup.result("b") == "ok"
+    a, b = startup.spans
+    assert b.start < a.end  # b began before a finished
+    assert startup.ready("a") and startup.ready("b")
+
+
+async def test_failed_dependency_skips_step() -> None:
+    startup = StartupScheduler()
+    ran: list[str] = []
+
+    async def fail() -> None:
+        raise RuntimeError("no server")
+
+    async def after() -> None:
+        ran.append("after")
+
+    startup.start("connect", fail)
+    startup.start("models", after, after=("connect",))
+    assert await startup.result("connect", default=False) is False
+    assert await startup.result("models", default=[]) == []
+    assert ran == []
+    statuses = {s.name: s.status for s in startup.spans}
+    assert statuses == {"connect": "failed", "models": "skipped"}
+
+
+async def test_status_lines_and_close() -> None:
+    startup = StartupScheduler()
+    release = asyncio.Event()
+    startup.start("fast", lambda: asyncio.sleep(0))
+    startup.start("slow", release.wait)
+    await startup.result("fast")
+    startup.mark_interactive()
+
+    lines = startup.status_lines()
+    assert lines[0].startswith("Interactive after")
+    assert any("slow" in line and "running" in line for line in lines)
+    assert any("fast" in line and "blocked startup" in line for line in lines)
+
+    await startup.aclose()
+    assert not startup.ready("slow")
+    assert startup.as_dict()["stages"][-1]["status"] == "cancelled"
+
+
+class _FakeModel:
+    id = "listed-model"
+
+
+class _FakeLLMClient:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+    async def __aenter__(self) -> _FakeLLMClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def connect(self) -> bool:
+        return True
+
+    async def list_models(self) -> list[_FakeModel]:
+        return [_FakeModel()]
+
+    def preload_models(self, models: object) -> None:
+        return None
+
+
+async def test_initialize_returns_before_optional_steps(
+    monkeypatch, tmp_path: Path
+) -> None:
+    settings = Settings(current_model="m", enable_smart_routing=False)
+    monkeypatch.setattr("gerdsenai_cli.main.LLMClient", _FakeLLMClient)
+    monkeypatch.chdir(tmp_path)
+
+    plugins_release = asyncio.Event()
+
+    async def slow_plugins() -> None:
+        await plugins_release.wait()
+
+    cli = GerdsenAICLI(interactive=False)
+
+    async def load_settings() -> Settings:
+        return settings
+
+    monkeypatch.setattr(cli.config_manager, "load_settings", load_settings)
+    monkeypatch.setattr(cli, "_initialize_plugins", slow_plugins)
+
+    assert await cli.initialize() is True
+    assert cli.startup is not None
+    assert cli.startup.ready("connect") and cli.startup.ready("models")
+    assert not cli.startup.ready("plugins")
+
+    plugins_release.set()
+    await cli.startup.wait_all()
+    assert cli.startup.ready("plugins")
+    assert cli.command_parser is not None
+    assert "skills" in cli.command_parser.registry.get_all_names()
+    await cli.startup.aclose()
@@ -0,0 +1,228 @@
+"""Symbol index behind the find_definition / find_references tools.
+
+Python goes through ``ast`` (signatures, methods with their class, Load-context
+references); JS/TS/Go/Rust through regex heuristics. The index is refreshed per
+file on (mtime, size), so unchanged files are never re-parsed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gerdsenai_cli.core.symbol_index import SymbolIndex
+from tests.harness import ScriptedLLMClient, build_agent
+
+PY_SOURCE = """\
+import os
+
+LIMIT = 10
+
+
+class Greeter(Base):
+    def greet(self, name: str) -> str:
+        return helper(name)
+
+
+async def helper(name: str, *, loud: bool = False) -> str:
+    return name.upper() if loud else name
+
+
+def main() -> None:
+    Greeter().greet("x")
+"""
+
+
+def _write(root: Path, rel: str, text: str) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_python_definitions_have_signatures(tmp_path: Path) -> None:
+    path = _write(tmp_path, "pkg/mod.py", PY_SOURCE)
+    index = SymbolIndex(tmp_path)
+    index.refresh([path])
+
+    (helper,) = index.find_definitions("helper")
+    assert helper.path == "pkg/mod.py"
+    assert helper.line == 11
+    assert helper.signature == (
+        "async def helper(name: str, *, loud: bool=False) -> str"
+    )
+
+    (greet,) = index.find_definitions("Greeter.greet")
+    assert greet.kind == "method" and greet.container == "Greeter"
+    assert index.find_definitions("Greeter")[0].signature == "class Greeter(Base)"
+    assert index.find_definitions("LIMIT")[0].kind == "variable"
+
+
+def test_python_references_exclude_definition_site(tmp_path: Path) -> None:
+    path = _write(tmp_path, "mod.py", PY_SOURCE)
+    index = SymbolIndex(tmp_path)
+    index.refresh([path])
+
+    assert index.find_references("helper") == [("mod.py", 8)]
+    assert index.find_references("greet") == [("mod.py", 16)]
+    assert index.find_references("Greeter.greet") == [("mod.py", 16)]
+
+
+@pytest.mark.parametrize(
+    ("rel", "source", "name", "kind"),
+    [
+        (
+            "web/app.ts",
+            "export async function loadUser(id: string) {}\n",
+            "loadUser",
+            "function",
+        ),
+        (
+            "web/app.ts",
+            "export interface User {\n  id: string\n}\n",
+            "User",
+            "interface",
+        ),
+        ("web/ui.jsx", "const Button = (props) => <b/>;\n", "Button", "function"),
+        (
+            "srv/main.go",
+            "func (s *Server) Handle(w Writer) {\n}\n",
+            "Handle",
+            "function",
+        ),
+        ("srv/main.go", "type Server struct {\n}\n", "Server", "class"),
+        (
+            "core/lib.rs",
+            "pub(crate) async fn parse(input: &str) -> u8 {\n}\n",
+            "parse",
+            "function",
+        ),
+        ("core/lib.rs", "pub trait Visitor {\n}\n", "Visitor", "interface"),
+    ],
+)
+def test_regex_languages(
+    tmp_path: Path, rel: str, source: str, name: str, kind: str
+) -> None:
+    path = _write(tmp_path, rel, source)
+    index = SymbolIndex(tmp_path)
+    index.refresh([path])
+    (found,) = index.find_definitions(name)
+    assert (found.path, found.line, found.kind) == (rel, 1, kind)
+
+
+def test_regex_references(tmp_path: Path) -> None:
+    a = _write(tmp_path, "a.ts", "export function total(xs) {\n  return 1\n}\n")
+    b = _write(
+        tmp_path, "b.ts", "import { total } from './a'\nconsole.log(total([]))\n"
+    )
+    index = SymbolIndex(tmp_path)
+    index.refresh([a, b])
+    assert index.find_references("total") == [("b.ts", 1), ("b.ts", 2)]
+
+
+def test_refresh_reparses_only_changed_files(tmp_path: Path) -> None:
+    a = _write(tmp_path, "a.py", "def one():\n    pass\n")
+    b = _write(tmp_path, "b.py", "def two():\n    pass\n")
+    index = SymbolIndex(tmp_path)
+    assert index.refresh([a, b]) == 2
+    assert index.refresh([a, b]) == 0  # warm: nothing re-parsed
+
+    b.write_text("def two_renamed():\n    pass\n")
+    st = b.stat()
+    os.utime(b, (st.st_atime, st.st_mtime + 5))
+    assert index.refresh([a, b]) == 1
+    assert index.find_definitions("two") == []
+    assert index.find_definitions("two_renamed")
+
+    # A file that drops out of the project is dropped from the index.
+    index.refresh([a])
+    assert index.find_definitions("two_renamed") == []
+    assert len(index) == 1
+
+
+def test_syntax_error_keeps_file_searchable(tmp_path: Path) -> None:
+    path = _write(tmp_path, "broken.py", "def ok(:\n    call_me()\n")
+    index = SymbolIndex(tmp_path)
+    index.refresh([path])
+    assert index.stats()["parse_errors"] == 1
+    assert index.find_references("call_me") == [("broken.py", 2)]
+
+
+@pytest.mark.asyncio
+async def test_tools_registered_and_answer_from_index(tmp_path: Path) -> None:
+    _write(tmp_path, "mod.py", PY_SOURCE)
+    agent = build_agent(tmp_path, ScriptedLLMClient())
+    registry = agent._get_tool_registry()
+
+    find_def = registry.get("find_definition")
+    find_refs = registry.get("find_references")
+    assert find_def is not None and not find_def.mutating
+    assert find_refs is not None and not find_refs.mutating
+
+    out = await find_def.run({"name": "helper"})
+    assert "mod.py:11" in out and "async def helper(" in out
+
+    out = await find_refs.run({"name": "helper"})
+    assert "mod.py:8: return helper(name)" in out
+
+    assert "No definition found" in await find_def.run({"name": "missing"})
+
+
+@pytest.mark.asyncio
+async def test_reference_snippets_are_read_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write(tmp_path, "mod.py", PY_SOURCE)
+    agent = build_agent(tmp_path, ScriptedLLMClient())
+    find_refs = agent._get_tool_registry().get("find_references")
+    assert find_refs is not None
+    await agent._get_symbol_index()  # build first; only the snippet reads count
+
+    readers: list[int] = []
+    read_text = Path.read_text
+
+    def recording_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        readers.append(threading.get_ident())
+        return read_text(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_text", recording_read_text)
+    assert "mod.py:8" in await find_refs.run({"name": "helper"})
+    assert readers and threading.get_ident() not in readers
+
+
+@pytest.mark.asyncio
+async def test_parallel_lookups_share_one_refresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write(tmp_path, "mod.py", PY_SOURCE)
+    agent = build_agent(tmp_path, ScriptedLLMClient())
+    registry = agent._get_tool_registry()
+    find_def = registry.get("find_definition")
+    find_refs = registry.get("find_references")
+    assert find_def is not None and find_refs is not None
+
+    active: list[int] = []
+    overlapped = False
+    refresh = SymbolIndex.refresh
+
+    def slow_refresh(self: SymbolIndex, paths: list[Path]) -> int:
+        nonlocal overlapped
+        active.append(1)
+        overlapped = overlapped or len(active) > 1
+        time.sleep(0.05)
+        try:
+            return refresh(self, paths)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(SymbolIndex, "refresh", slow_refresh)
+    defs, refs = await asyncio.gather(
+        find_def.run({"name": "helper"}), find_refs.run({"name": "helper"})
+    )
+    assert "mod.py:11" in defs and "mod.py:8" in refs
+    assert not overlapped
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from gerdsenai_cli.core.llm_client import ToolCall
 from gerdsenai_cli.core.tool_parsing import (
+    StreamEvent,
+    StreamingToolParser,
     detect_tool_format,
     parse_model_output,
     strip_reasoning,
@@ -148,3 +150,67 @@ def test_detect_tool_format_default_openai() -> None:
     assert detect_tool_format("llama3.1:8b") == "openai"
     assert detect_tool_format("gpt-oss") == "openai"
     assert detect_tool_format(None) == "openai"
+
+
+# --------------------------------------------------------------------------- #
+# Incremental (streaming) parsing
+# --------------------------------------------------------------------------- #
+
+
+def _feed_chars(parser: StreamingToolParser, text: str) -> list[StreamEvent]:
+    """Feed one character at a time — the worst case for split tags."""
+    events: list[StreamEvent] = []
+    for ch in text:
+        events.extend(parser.feed_text(ch))
+    return events + parser.finish()
+
+
+def test_stream_splits_think_from_text_across_deltas() -> None:
+    events = _feed_chars(StreamingToolParser(), "<think>plan it</think>Answer.")
+    reasoning = "".join(e.text for e in events if e.kind == "reasoning")
+    text = "".join(e.text for e in events if e.kind == "text")
+    assert reasoning == "plan it"
+    assert text == "Answer."
+    assert events[-1].kind == "done"
+    assert events[-1].result.content == "Answer."
+
+
+def test_stream_emits_hermes_call_when_tag_closes() -> None:
+    parser = StreamingToolParser()
+    events = parser.feed_text('Reading.<tool_call>{"name": "read_file", ')
+    assert all(e.kind != "tool_call" for e in events)
+    events = parser.feed_text('"arguments": {"path": "a.py"}}</tool_call>')
+    calls = [e.tool_call for e in events if e.kind == "tool_call"]
+    assert [(c.id, c.name, c.arguments) for c in calls] == [
+        ("hermes_0", "read_file", {"path": "a.py"})
+    ]
+    done = parser.finish()[-1].result
+    assert [c.id for c in done.tool_calls] == ["hermes_0"]
+    assert done.content == "Reading."
+
+
+def test_stream_openai_tool_call_completes_before_stream_ends() -> None:
+    parser = StreamingToolParser()
+    first = parser.feed_tool_calls(
+        [{"index": 0, "id": "c1", "function": {"name": "read_file", "arguments": ""}}]
+    )
+    partial = parser.feed_tool_calls(
+        [{"index": 0, "function": {"arguments": '{"path": "a'}}]
+    )
+    complete = parser.feed_tool_calls(
+        [{"index": 0, "function": {"arguments": '.py"}'}}]
+    )
+    assert first == [] and partial == []
+    assert complete[0].tool_call == ToolCall(
+        id="c1", name="read_file", arguments={"path": "a.py"}
+    )
+    # Finishing does not emit the same call twice.
+    tail = parser.finish()
+    assert [e.kind for e in tail] == ["done"]
+    assert tail[0].result.tool_calls[0].id == "c1"
+
+
+def test_stream_matches_buffered_parse() -> None:
+    raw = '<think>hmm</think>ok <tool_call>{"name": "x", "arguments": {}}</tool_call>'
+    done = _feed_chars(StreamingToolParser(), raw)[-1].result
+    assert done == parse_model_output(raw)
@@ -7,14 +7,17 @@ respects CHAT mode, and stops safely on the iteration cap / errors.
 
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import Any
 
 import pytest
 
-from gerdsenai_cli.core.llm_client import ChatMessage
+from gerdsenai_cli.core.llm_client import ChatMessage, ChatResult, ToolCall
 from gerdsenai_cli.core.tool_registry import (
     Tool,
     ToolRegistry,
+    ToolResultCache,
     run_agent_loop,
 )
 from tests.harness import ScriptedLLMClient as ScriptedClient
@@ -79,6 +82,11 @@ async def test_multi_step_tool_use_in_one_turn() -> None:
     assert result.stopped_reason == "final"
     assert result.tool_calls_made == 2
     assert "edited b.py" in result.content
+    # Three model calls; each resends the growing conversation.
+    assert result.model_calls == 3
+    assert result.prompt_tokens > 3 * 5
+    assert result.completion_tokens > 0
+    assert result.tool_time >= 0
 
 
 @pytest.mark.asyncio
@@ -265,3 +273,256 @@ def test_registry_schemas_and_len() -> None:
 
 async def _noop_tool() -> str:
     return ""
+
+
+def _timed_registry(log: list[str], delay: float = 0.05) -> ToolRegistry:
+    """Read/write tools that sleep, logging start/end so overlap is observable."""
+    reg = ToolRegistry()
+
+    async def read_file(path: str) -> str:
+        log.append(f"start:{path}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{path}")
+        return f"contents of {path}"
+
+    async def write_file(path: str) -> str:
+        log.append(f"write:{path}")
+        return f"wrote {path}"
+
+    reg.register(Tool("read_file", "Read", {"type": "object"}, read_file))
+    reg.register(
+        Tool("write_file", "Write", {"type": "object"}, write_file, mutating=True)
+    )
+    return reg
+
+
+def _calls(*specs: tuple[str, str]) -> ChatResult:
+    return ChatResult(
+        tool_calls=[
+            ToolCall(id=f"c{i}", name=name, arguments={"path": path})
+            for i, (name, path) in enumerate(specs)
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_only_calls_run_concurrently_in_call_order() -> None:
+    log: list[str] = []
+    client = ScriptedClient(
+        [
+            _calls(("read_file", "a"), ("read_file", "b"), ("read_file", "c")),
+            _final("done"),
+        ]
+    )
+    result = await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read three files")],
+        _timed_registry(log),
+        use_native_tools=True,
+    )
+    # All three started before any finished.
+    assert log[:3] == ["start:a", "start:b", "start:c"]
+    assert result.parallel_time_saved > 0.05
+    tool_msgs = [m for m in client.last_messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_msgs] == ["c0", "c1", "c2"]
+    assert [m.content for m in tool_msgs] == [
+        "contents of a",
+        "contents of b",
+        "contents of c",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mutating_call_is_a_barrier_between_reads() -> None:
+    log: list[str] = []
+    confirmed: list[str] = []
+
+    async def confirm(name: str, args: dict[str, Any]) -> bool:
+        confirmed.append(name)
+        return True
+
+    client = ScriptedClient(
+        [
+            _calls(("read_file", "a"), ("write_file", "a"), ("read_file", "b")),
+            _final("done"),
+        ]
+    )
+    result = await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="edit then re-read")],
+        _timed_registry(log),
+        confirm=confirm,
+        use_native_tools=True,
+    )
+    assert log == ["start:a", "end:a", "write:a", "start:b", "end:b"]
+    assert confirmed == ["write_file"]
+    assert result.parallel_time_saved == 0.0
+
+
+@pytest.mark.asyncio
+async def test_max_parallel_tools_bounds_concurrency() -> None:
+    log: list[str] = []
+    client = ScriptedClient(
+        [_calls(("read_file", "a"), ("read_file", "b")), _final("done")]
+    )
+    result = await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read two")],
+        _timed_registry(log),
+        use_native_tools=True,
+        max_parallel_tools=1,
+    )
+    assert log == ["start:a", "end:a", "start:b", "end:b"]
+    assert result.parallel_time_saved == 0.0
+
+
+def _cached_registry(tmp_path: Any, record: list[str]) -> ToolRegistry:
+    reg = _registry(record)
+    reg.get("read_file").cacheable = True
+    reg.result_cache = ToolResultCache(root=tmp_path)
+    return reg
+
+
+@pytest.mark.asyncio
+async def test_repeated_read_is_served_from_cache(tmp_path: Any) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n")
+    record: list[str] = []
+    events: list[str] = []
+    client = ScriptedClient(
+        [
+            _call("read_file", path="a.py"),
+            _call("read_file", path="a.py"),
+            _final("done"),
+        ]
+    )
+    reg = _cached_registry(tmp_path, record)
+    await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read a twice")],
+        reg,
+        use_native_tools=True,
+        on_event=lambda name, _data: events.append(name),
+    )
+    assert record == ["read:a.py"]
+    assert "tool_cache_hit" in events
+    assert reg.result_cache.stats()["hits"] == 1
+    tool_msgs = [m.content for m in client.last_messages if m.role == "tool"]
+    assert tool_msgs == ["contents of a.py", "contents of a.py"]
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_by_edit_to_same_path(tmp_path: Any) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n")
+    record: list[str] = []
+    client = ScriptedClient(
+        [
+            _call("read_file", path="a.py"),
+            _call("write_file", path=str(tmp_path / "a.py"), content="x = 2\n"),
+            _call("read_file", path="a.py"),
+            _final("done"),
+        ]
+    )
+    await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read, edit, re-read")],
+        _cached_registry(tmp_path, record),
+        use_native_tools=True,
+    )
+    assert record == ["read:a.py", f"write:{tmp_path / 'a.py'}", "read:a.py"]
+
+
+def test_cache_entry_dropped_when_file_mtime_changes(tmp_path: Any) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("x = 1\n")
+    cache = ToolResultCache(root=tmp_path)
+    cache.put("read_file", {"path": "a.py"}, "old")
+    assert cache.get("read_file", {"path": "a.py"}) == "old"
+
+    stat = target.stat()
+    os.utime(target, (stat.st_atime, stat.st_mtime + 5))
+    assert cache.get("read_file", {"path": "a.py"}) is None
+    # Argument order does not matter for the key.
+    cache.put("search_files", {"query": "q", "limit": 3}, "hits")
+    assert cache.get("search_files", {"limit": 3, "query": "q"}) == "hits"
+
+
+@pytest.mark.asyncio
+async def test_large_observation_sent_as_digest() -> None:
+    from gerdsenai_cli.core.observations import ObservationStore
+
+    reg = ToolRegistry(observations=ObservationStore(digest_chars=500))
+
+    async def dump(path: str) -> str:
+        return "\n".join(f"line {i}" for i in range(1000))
+
+    reg.register(
+        Tool(
+            name="read_file",
+            description="Read a file",
+            parameters={"type": "object", "properties": {"path": {"type": "string"}}},
+            func=dump,
+        )
+    )
+    client = ScriptedClient([_call("read_file", path="big.txt"), _final("done")])
+    await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read it")],
+        reg,
+        use_native_tools=True,
+    )
+    (tool_msg,) = [m.content for m in client.last_messages if m.role == "tool"]
+    assert len(tool_msg) < 800
+    assert "obs-1" in tool_msg
+    assert reg.observations.get("obs-1").count("\n") == 999
+
+
+def test_session_turn_drops_only_project_wide_entries(tmp_path: Any) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n")
+    cache = ToolResultCache(root=tmp_path)
+    cache.put("read_file", {"path": "a.py"}, "x = 1")
+    cache.put("search_files", {"query": "x"}, "a.py")
+    cache.clear_project_wide()
+    assert cache.get("read_file", {"path": "a.py"}) == "x = 1"
+    assert cache.get("search_files", {"query": "x"}) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_digest_is_reused_until_its_handle_is_evicted(
+    tmp_path: Any,
+) -> None:
+    from gerdsenai_cli.core.observations import ObservationStore
+
+    (tmp_path / "big.txt").write_text("x\n")
+    record: list[str] = []
+    reg = _cached_registry(tmp_path, record)
+    reg.observations = ObservationStore(digest_chars=500, maxsize=1)
+
+    async def dump(path: str) -> str:
+        record.append(path)
+        return "\n".join(f"{path} line {i}" for i in range(1000))
+
+    reg.get("read_file").func = dump
+    client = ScriptedClient(
+        [
+            _call("read_file", path="big.txt"),
+            _call("read_file", path="big.txt"),
+            _final("done"),
+        ]
+    )
+    await run_agent_loop(
+        client,  # type: ignore[arg-type]
+        [ChatMessage(role="user", content="read it twice")],
+        reg,
+        use_native_tools=True,
+    )
+    first, second = [m.content for m in client.last_messages if m.role == "tool"]
+    assert first == second and "obs-1" in first
+    assert record == ["big.txt"]
+    assert reg.observations.stats()["compressed"] == 1
+
+    # Once the store evicts the handle, the cached digest would point nowhere.
+    reg.observations.put("run_command", {}, "other")
+    assert "obs-1" not in reg.observations
+    assert (
+        reg.result_cache.get("read_file", {"path": "big.txt"}, reg.observations) is None
+    )
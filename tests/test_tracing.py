@@ -0,0 +1,156 @@
+"""Tests for tracing spans and their Chrome trace-event export.
+
+Spans nest across asyncio tasks through the context, the ring buffer keeps
+only the newest spans, sampling drops whole traces, a disabled tracer records
+nothing, and the export is valid Trace Event Format JSON.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from gerdsenai_cli.commands.system import trace_action
+from gerdsenai_cli.core.turn_scheduler import TurnScheduler
+from gerdsenai_cli.utils.tracing import Tracer, traced, tracer
+
+
+async def test_spans_nest_across_tasks() -> None:
+    t = Tracer(enabled=True)
+
+    async def stage(name: str) -> None:
+        with t.span(name):
+            await asyncio.sleep(0.01)
+
+    with t.span("turn"):
+        await asyncio.gather(
+            asyncio.create_task(stage("a"), name="a"),
+            asyncio.create_task(stage("b"), name="b"),
+        )
+
+    spans = {s.name: s for s in t.spans}
+    turn = spans["turn"]
+    assert turn.parent_id is None
+    assert spans["a"].parent_id == spans["b"].parent_id == turn.span_id
+    assert spans["a"].start_ns < spans["b"].end_ns  # ran concurrently
+    assert spans["a"].lane != spans["b"].lane != turn.lane
+
+
+def test_ring_buffer_keeps_newest() -> None:
+    t = Tracer(enabled=True, capacity=3)
+    for i in range(5):
+        with t.span(f"s{i}"):
+            pass
+    assert [s.name for s in t.spans] == ["s2", "s3", "s4"]
+    assert t.stats()["dropped"] == 2
+
+
+def test_sampling_is_decided_per_trace() -> None:
+    t = Tracer(enabled=True, sample_rate=0.5)
+    decisions = iter([0.9, 0.1])  # first trace dropped, second kept
+    t._random = lambda: next(decisions)
+    for _ in range(2):
+        with t.span("root"):
+            with t.span("child"):
+                pass
+    assert [s.name for s in t.spans] == ["child", "root"]
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    t = Tracer()
+
+    @traced("work")
+    def work() -> int:
+        return 1
+
+    with t.span("outer"):
+        assert t.begin("inline") is None
+    assert work() == 1
+    assert len(t.spans) == 0
+
+
+async def test_chrome_trace_export(tmp_path: Path) -> None:
+    t = Tracer(enabled=True)
+    with t.span("turn", "turn", model="m"):
+        try:
+            with t.span("fails"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+    path = t.export_chrome_trace(tmp_path / "trace.json")
+    doc = json.loads(path.read_text())
+
+    complete = [e for e in doc["traceEvents"] if e["ph"] == "X"]
+    meta = [e for e in doc["traceEvents"] if e["ph"] == "M"]
+    assert {e["name"] for e in complete} == {"turn", "fails"}
+    assert meta and meta[0]["name"] == "thread_name"
+    by_name = {e["name"]: e for e in complete}
+    assert by_name["turn"]["args"]["model"] == "m"
+    assert by_name["fails"]["args"]["error"] == "RuntimeError"
+    assert by_name["fails"]["args"]["parent_id"] == by_name["turn"]["args"]["span_id"]
+    assert by_name["turn"]["ts"] <= by_name["fails"]["ts"]
+    assert by_name["turn"]["dur"] >= by_name["fails"]["dur"]
+
+
+async def test_turn_stages_are_traced(monkeypatch) -> None:
+    t = Tracer(enabled=True)
+    monkeypatch.setattr("gerdsenai_cli.core.turn_scheduler.tracer", t)
+
+    async def scan() -> list[str]:
+        return ["a.py"]
+
+    with t.span("turn"):
+        sched = TurnScheduler()
+        sched.start("scan", scan)
+        await sched.result("scan")
+        sched.begin("completion")
+        await sched.close()
+
+    spans = {s.name: s for s in t.spans}
+    assert spans["scan"].cat == spans["completion"].cat == "stage"
+    assert spans["scan"].parent_id == spans["turn"].span_id
+    assert spans["completion"].parent_id == spans["turn"].span_id
+
+
+async def test_async_generator_span_is_not_current_between_items(
+    monkeypatch,
+) -> None:
+    t = Tracer(enabled=True)
+    monkeypatch.setattr("gerdsenai_cli.utils.tracing.tracer", t)
+
+    @traced("llm.stream", "llm")
+    async def stream():
+        for i in range(2):
+            with t.span(f"parse{i}"):
+                await asyncio.sleep(0)
+            yield i
+
+    with t.span("turn"):
+        async for i in stream():
+            with t.span(f"tool{i}"):
+                await asyncio.sleep(0)
+        with t.span("after"):
+            pass
+
+    spans = {s.name: s for s in t.spans}
+    turn, llm = spans["turn"].span_id, spans["llm.stream"]
+    assert llm.parent_id == turn
+    # Work inside the generator nests under it; the consumer's does not.
+    assert spans["parse0"].parent_id == spans["parse1"].parent_id == llm.span_id
+    assert spans["tool0"].parent_id == spans["tool1"].parent_id == turn
+    assert spans["after"].parent_id == turn
+    assert llm.end_ns >= spans["tool1"].end_ns
+
+
+def test_trace_action_toggles_and_saves(tmp_path: Path) -> None:
+    try:
+        assert "Tracing on" in trace_action("on")
+        with tracer.span("x"):
+            pass
+        message = trace_action("save", str(tmp_path / "t.json"))
+        assert "t.json" in message
+        assert json.loads((tmp_path / "t.json").read_text())["traceEvents"]
+    finally:
+        trace_action("off")
+        trace_action("clear")
@@ -286,3 +286,26 @@ async def test_unknown_command(cli_instance, mock_tui):
 
     assert "unknown command" in response.lower()
     assert "/unknown" in response
+
+
+@pytest.mark.asyncio
+async def test_status_command_shows_model_residency(cli_instance, mock_tui):
+    """Test /status in the TUI lists pre-loaded models and their load state."""
+    import httpx
+
+    from gerdsenai_cli.core.model_residency import ModelResidencyManager
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/ps":
+            return httpx.Response(200, json={"models": [{"name": "test-model"}]})
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    residency = ModelResidencyManager(lambda: client, "http://ollama:11434", "30m")
+    await residency.preload("test-model")
+    cli_instance.llm_client = Mock(residency=residency)
+
+    response = await cli_instance._handle_tui_command("/status", [], tui=mock_tui)
+
+    assert "Model: test-model" in response
+    assert "test-model (chat): loaded" in response
@@ -0,0 +1,223 @@
+"""Tests for the per-turn stage scheduler.
+
+Independent stages run concurrently, dependent ones wait for their inputs,
+unneeded speculative work is cancelled, and each turn leaves a timeline whose
+critical path is the time it actually spent blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gerdsenai_cli.core.agent import ActionIntent, ActionType
+from gerdsenai_cli.core.turn_scheduler import TurnScheduler
+from tests.harness import ScriptedLLMClient, build_agent, final, tool_call
+
+
+async def _after(delay: float, value: Any, log: list[str] | None = None) -> Any:
+    if log is not None:
+        log.append(f"start:{value}")
+    await asyncio.sleep(delay)
+    if log is not None:
+        log.append(f"end:{value}")
+    return value
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap() -> None:
+    sched = TurnScheduler()
+    sched.start("a", lambda: _after(0.05, "a"))
+    sched.start("b", lambda: _after(0.05, "b"))
+    assert await sched.result("a") == "a"
+    assert await sched.result("b") == "b"
+    timeline = await sched.close()
+    # Both ran in about the time of one.
+    assert timeline.total < 0.09
+    assert timeline.overlap_saved > 0.03
+
+
+@pytest.mark.asyncio
+async def test_dependent_stage_waits_for_its_input() -> None:
+    log: list[str] = []
+    sched = TurnScheduler()
+    sched.start("scan", lambda: _after(0.02, "scan", log))
+    sched.start("context", lambda: _after(0.0, "context", log), after=("scan",))
+    sched.start("semantic", lambda: _after(0.0, "semantic", log))
+    await sched.result("context")
+    await sched.close()
+    assert log.index("end:scan") < log.index("start:context")
+    assert log.index("start:semantic") < log.index("end:scan")
+
+
+@pytest.mark.asyncio
+async def test_unneeded_and_failed_stages() -> None:
+    async def boom() -> str:
+        raise RuntimeError("no index")
+
+    sched = TurnScheduler()
+    sched.start("slow", lambda: _after(5, "slow"))
+    sched.start("broken", boom)
+    assert await sched.result("broken", default="") == ""
+    assert await sched.result("missing", default="x") == "x"
+    sched.begin("completion")
+    timeline = await sched.close()  # cancels "slow" without waiting for it
+    status = {s.name: s.status for s in timeline.spans}
+    assert status == {"slow": "cancelled", "broken": "failed", "completion": "done"}
+    assert [s.name for s in timeline.critical_path][-1] == "completion"
+    assert timeline.total < 1
+
+
+@pytest.mark.asyncio
+async def test_direct_action_cancels_speculative_context(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n")
+    agent = build_agent(
+        tmp_path,
+        ScriptedLLMClient([final("unused")]),
+        preferences={"enable_llm_intent_detection": True},
+    )
+    agent.conversation.project_context_built = False
+    started: list[str] = []
+
+    async def detect(**_kw: Any) -> ActionIntent:
+        started.append("intent")
+        await asyncio.sleep(0.05)
+        return ActionIntent(
+            action_type=ActionType.READ_FILE,
+            confidence=0.95,
+            parameters={"file_path": "a.py"},
+        )
+
+    async def build_context(user_query: str, *, semantic: bool = True) -> str:
+        started.append("context")
+        await asyncio.sleep(5)
+        return "context"
+
+    async def execute(*_args: Any) -> str:
+        return "x = 1"
+
+    monkeypatch.setattr(agent.intent_parser, "detect_intent_with_llm", detect)
+    monkeypatch.setattr(agent, "_build_project_context", build_context)
+    monkeypatch.setattr(agent, "_execute_action", execute)
+
+    assert await agent.process_user_input("show me a.py") == "x = 1"
+    # Context assembly started alongside intent detection, then was dropped.
+    assert sorted(started) == ["context", "intent"]
+    timeline = agent.last_turn_timeline
+    assert timeline is not None
+    status = {s.name: s.status for s in timeline.spans}
+    assert status["intent"] == "done"
+    assert status["context"] == "cancelled"
+    assert timeline.total < 1
+    assert agent.get_agent_stats()["last_turn"]["critical_path"][-1] == "intent"
+
+
+@pytest.mark.asyncio
+async def test_streamed_turn_records_generation_breakdown(tmp_path: Path) -> None:
+    client = ScriptedLLMClient(chat_reply="a streamed answer of some length")
+    agent = build_agent(tmp_path, client, mode="chat")
+    chunks = [c async for c, _acc, _kind in agent.process_user_input_stream("hi")]
+    assert "".join(chunks) == client.chat_reply
+
+    timeline = agent.last_turn_timeline
+    assert timeline is not None
+    gen = timeline.generation
+    assert gen.model_calls == 1
+    assert gen.prompt_tokens > 0 and gen.completion_tokens > 0
+    assert gen.ttft is not None and gen.prefill is not None
+    assert 0 <= gen.prefill <= gen.ttft <= timeline.total
+    assert (
+        timeline.as_dict()["generation"]["completion_tokens"] == gen.completion_tokens
+    )
+    lines = timeline.breakdown_lines()
+    assert lines[0].startswith("Turn:")
+    assert any(line.startswith("Time to first token") for line in lines)
+    assert any("completion over 1 call(s)" in line for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_loop_usage_and_tool_time_reach_the_timeline() -> None:
+    sched = TurnScheduler()
+    sched.begin("completion")
+    sched.first_token()
+    await asyncio.sleep(0.02)
+    sched.record_generation(
+        prompt_tokens=100, completion_tokens=40, model_calls=2, tool_time=0.01
+    )
+    gen = (await sched.close()).generation
+    assert (gen.model_calls, gen.prompt_tokens, gen.completion_tokens) == (2, 100, 40)
+    assert gen.completion_time >= 0.02
+    assert gen.decode_time == pytest.approx(
+        gen.completion_time - 0.01 - (gen.prefill or 0.0)
+    )
+    assert gen.tokens_per_sec is not None and gen.tokens_per_sec > 0
+
+
+class _StreamingClient(ScriptedLLMClient):
+    """Streams scripted model turns, one ``|``-separated delta every 20ms."""
+
+    def __init__(self, turns: list[str]) -> None:
+        super().__init__([])
+        self._turns = list(turns)
+
+    async def stream_chat_with_tools(self, messages, tools, **kw):  # type: ignore[no-untyped-def]
+        from gerdsenai_cli.core.tool_parsing import StreamingToolParser
+
+        parser = StreamingToolParser()
+        for piece in self._turns.pop(0).split("|"):
+            await asyncio.sleep(0.02)
+            for event in parser.feed_text(piece):
+                yield event
+        for event in parser.finish():
+            yield event
+
+
+@pytest.mark.asyncio
+async def test_tool_first_loop_times_each_model_call(tmp_path: Path) -> None:
+    """Tool time between model calls is neither prefill nor decode."""
+    call = '{"name": "read_file", "arguments": {"path": "a.py"}}'
+    client = _StreamingClient(
+        [f"<tool_call>{call}</tool_call>", "The answer |is that |x is |one."]
+    )
+    agent = build_agent(tmp_path, client, mode="execute")
+
+    async def slow_read(**_kw: Any) -> str:
+        await asyncio.sleep(0.3)
+        return "x = 1"
+
+    agent._get_tool_registry().get("read_file").func = slow_read
+
+    await agent.process_user_input("what is x")
+
+    timeline = agent.last_turn_timeline
+    assert timeline is not None
+    gen = timeline.generation
+    assert gen.model_calls == 2 and gen.tool_time >= 0.3
+    # The buffered (non-displayed) loop still marks the first token.
+    assert gen.ttft is not None and gen.ttft < gen.tool_time
+    assert gen.prefill is not None and gen.prefill < 0.1
+    # Decode is the streaming time of both calls, with the tool run left out.
+    assert 0.05 < gen.decode_time < 0.25
+    assert gen.decode_tokens and gen.decode_tokens <= gen.completion_tokens
+    assert gen.tokens_per_sec is not None
+    assert timeline.as_dict()["generation"]["ttft"] is not None
+
+
+@pytest.mark.asyncio
+async def test_buffered_loop_reports_ttft_but_no_decode_rate(tmp_path: Path) -> None:
+    client = ScriptedLLMClient([tool_call("search_files", query="x"), final("done")])
+    agent = build_agent(tmp_path, client, mode="execute")
+
+    await agent.process_user_input("find x")
+
+    timeline = agent.last_turn_timeline
+    assert timeline is not None
+    gen = timeline.generation
+    assert gen.model_calls == 2 and gen.ttft is not None
+    # Nothing was streamed, so prefill and decode cannot be told apart.
+    assert gen.tokens_per_sec is None